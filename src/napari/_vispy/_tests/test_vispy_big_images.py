@@ -67,3 +67,38 @@ def test_downsample_value(make_napari_viewer, shape):
             layer.get_value(viewer.cursor.position, world=True)
             == expected_value
         )
+
+
+def test_tiled_image_node_uploads_changed_tiles(monkeypatch):
+    """Test that only changed tiles are uploaded when the origin moves."""
+    image = np.random.random((12, 12)).astype(np.float32)
+    node = TiledImageNode(image[:8, :8], tile_size=4)
+    node.set_data(image[:8, :8], origin=(0, 0))
+    assert len(node.adopted_children) == 4
+    # children by position in the whole image
+    previous = dict(
+        zip(node._tile_positions, node.adopted_children, strict=True)
+    )
+
+    uploads = []
+    for child in node.adopted_children:
+        monkeypatch.setattr(
+            child, 'set_data', lambda data, ch=child: uploads.append(ch)
+        )
+
+    # pan by one tile to the right: the right column of tiles is reused
+    node.set_data(image[:8, 4:12], origin=(0, 4))
+    assert node._tile_positions == [(4, 0), (8, 0), (4, 4), (8, 4)]
+    assert node.adopted_children[0] is previous[(4, 0)]
+    assert node.adopted_children[2] is previous[(4, 4)]
+    assert len(uploads) == 2
+    assert [
+        tuple(ch.transform.translate[:2]) for ch in node.adopted_children
+    ] == [(0, 0), (4, 0), (0, 4), (4, 4)]
+
+    # tiles whose content changed are uploaded again
+    uploads.clear()
+    changed = image.copy()
+    changed[0, 4] = 2
+    node.set_data(changed[:8, 4:12], origin=(0, 4))
+    assert uploads == [previous[(4, 0)]]
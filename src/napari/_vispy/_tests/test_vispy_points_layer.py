@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
@@ -154,3 +156,102 @@ def test_highlight_with_out_of_slice_display():
 
     # Previously, raised ValueError: could not broadcast input array from shape (5,) into shape (1,)
     vispy_layer._on_highlight_change()
+
+
+def test_change_face_color_uploads_changed_range():
+    layer = Points(np.random.rand(100, 2) * 100)
+    vispy_layer = VispyPointsLayer(layer)
+    markers = vispy_layer.node.points_markers
+    layer.selected_data = {10, 12, 20}
+
+    with (
+        patch.object(
+            markers._vbo, 'set_data', wraps=markers._vbo.set_data
+        ) as set_data,
+        patch.object(
+            markers._vbo, 'set_subdata', wraps=markers._vbo.set_subdata
+        ) as set_subdata,
+    ):
+        layer.current_face_color = 'red'
+
+    set_data.assert_not_called()
+    set_subdata.assert_called_once()
+    assert set_subdata.call_args.kwargs['offset'] == 10
+    assert len(set_subdata.call_args.args[0]) == 11
+    np.testing.assert_array_equal(
+        markers._data['a_bg_color'], layer._view_face_color
+    )
+
+
+def test_lod_draws_fewer_points(monkeypatch):
+    monkeypatch.setattr('napari.layers.points.points._MIN_LOD_POINTS', 0)
+    layer = Points(np.random.rand(1000, 2) * 1000, lod=True)
+    vispy_layer = VispyPointsLayer(layer)
+    markers = vispy_layer.node.points_markers
+
+    layer._update_draw(8, np.array([[0, 0], [100, 100]]), (512, 512))
+    positions, _ = layer._view_lod
+    assert len(markers._data) == len(positions) < 1000
+    np.testing.assert_array_equal(
+        markers._data['a_bg_color'], layer._view_face_color[positions]
+    )
+
+    layer._update_draw(0.01, np.array([[0, 0], [100, 100]]), (512, 512))
+    assert len(markers._data) == 1000
+
+
+def test_density_drawn_instead_of_markers():
+    layer = Points(np.random.rand(1000, 2) * 1000)
+    vispy_layer = VispyPointsLayer(layer)
+    node = vispy_layer.node
+    assert not node.density.visible
+
+    layer._update_draw(4, np.array([[0, 0], [1000, 1000]]), (512, 512))
+    layer.density = True
+    density = layer._view_density
+    assert node.density.visible
+    assert not node.points_markers.visible
+    np.testing.assert_array_equal(node.density._data, density.image)
+    np.testing.assert_array_equal(
+        node.density.transform.scale[:2], density.bin_size[::-1]
+    )
+    np.testing.assert_array_equal(
+        node.density.transform.translate[:2], density.origin[::-1]
+    )
+    assert node.density.clim == (0, density.image.max())
+
+    layer.density_contrast_limits = (0, 5)
+    assert node.density.clim == (0, 5)
+
+    layer.visible = False
+    assert not node.density.visible
+
+    layer.visible = True
+    layer.density = False
+    assert not node.density.visible
+    assert node.points_markers.visible
+
+
+def test_lod_keeps_opacity_of_translucent_points(monkeypatch):
+    monkeypatch.setattr('napari.layers.points.points._MIN_LOD_POINTS', 0)
+    layer = Points(
+        np.random.rand(1000, 2) * 1000, lod=True, face_color=[1, 0, 0, 0.2]
+    )
+    vispy_layer = VispyPointsLayer(layer)
+    markers = vispy_layer.node.points_markers
+
+    layer._update_draw(8, np.array([[0, 0], [100, 100]]), (512, 512))
+    positions, counts = layer._view_lod
+    assert counts.max() > 1
+    np.testing.assert_allclose(
+        markers._data['a_bg_color'][:, 3], 1 - 0.8**counts, rtol=1e-6
+    )
+    np.testing.assert_array_equal(
+        markers._data['a_bg_color'][:, :3],
+        layer._view_face_color[positions, :3],
+    )
+
+    layer.face_color = [0, 0, 1, 0.5]
+    np.testing.assert_allclose(
+        markers._data['a_bg_color'][:, 3], 1 - 0.5**counts, rtol=1e-6
+    )
@@ -1,4 +1,7 @@
+import numpy as np
+
 from napari._vispy.layers.tracks import VispyTracksLayer
+from napari.components.dims import Dims
 from napari.layers import Tracks
 
 
@@ -25,3 +28,34 @@ def test_tracks_graph_cleanup():
 
     assert visual.node._subvisuals[2]._pos is None
     assert visual.node._subvisuals[2]._connect is None
+
+
+def _segments(line):
+    """Vertex index pairs of the segments drawn by a line, sorted."""
+    return sorted(np.asarray(line.connect).tolist())
+
+
+def test_tracks_draw_segments_in_time_window():
+    """Test that only the segments around the current time are drawn, and
+    that changing the time does not set the vertices again."""
+    tracks_data = [[0, t, t, 0] for t in range(10)] + [
+        [1, t, t, 10] for t in range(5, 10)
+    ]
+    layer = Tracks(tracks_data, graph={1: [0]}, tail_length=2)
+    visual = VispyTracksLayer(layer)
+    tracks_line, graph_line = visual.node._subvisuals[::2]
+    pos = tracks_line._pos
+
+    layer._slice_dims(Dims(ndim=3, point=(6, 0, 0), range=((0, 10, 1),) * 3))
+    assert _segments(tracks_line) == (
+        [[4, 5], [5, 6], [6, 7], [10, 11], [11, 12]]
+    )
+    assert _segments(graph_line) == [[0, 1]]
+
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0), range=((0, 10, 1),) * 3))
+    assert _segments(tracks_line) == [[0, 1], [1, 2], [2, 3]]
+    assert len(graph_line.connect) == 0
+    assert tracks_line._pos is pos
+
+    layer.tail_length = 1
+    assert _segments(tracks_line) == [[1, 2], [2, 3]]
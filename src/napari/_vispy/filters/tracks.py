@@ -16,6 +16,10 @@ class TracksFilter(Filter):
     is scaled according to the tail and head length. Points ahead of the current time
     are rendered with alpha set to zero.
 
+    Only the fading is done here: the segments outside of the time window
+    around the current_time are not drawn at all, see
+    ``Tracks._view_track_segments``.
+
     Parameters
     ----------
     current_time : int, float
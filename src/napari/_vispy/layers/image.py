@@ -70,11 +70,13 @@ class ImageLayerNode(ScalarFieldLayerNode):
         ndisplay: int,
         dtype: np.dtype | None = None,
         shape: tuple | None = None,
+        tile_shape: tuple[int, int] | None = None,
     ) -> Node:
         """Return the relevant Vispy VisualNode for current visualization.
 
         - For small 2D images, this is an Image node.
-        - For large 2D images, this is our custom TiledImage node.
+        - For large 2D images, and 2D images loaded in tiles, this is our
+          custom TiledImage node.
         - For 3D images, this is a Volume node.
 
         Parameters
@@ -85,6 +87,9 @@ class ImageLayerNode(ScalarFieldLayerNode):
             The dtype of the current data.
         shape : tuple[int, ...]
             The shape of the current data slice.
+        tile_shape : tuple[int, int], optional
+            The shape of the tiles in which the current 2D data slice was
+            loaded, if any.
 
         Returns:
         node : vispy.scene.Node
@@ -97,9 +102,17 @@ class ImageLayerNode(ScalarFieldLayerNode):
         # Return Image or Volume node based on 2D or 3D.
         M2D = self.MAX_TEXTURE_SIZE_2D
         match ndisplay, shape:
+            # 2D loaded in tiles: display the same tiles
+            case 2, _ if tile_shape is not None:
+                res = self._tiledimage_node
+                res.tile_size = (
+                    min(tile_shape[0], M2D),
+                    min(tile_shape[1], M2D),
+                )
             # 2D grayscale or RGB w/ any dimension exceeding max texture size
             case 2, (s0, s1, *_) if s0 > M2D or s1 > M2D:
                 res = self._tiledimage_node
+                res.tile_size = M2D
             # any other 2D
             case 2, _:
                 res = self._image_node
@@ -350,7 +350,9 @@ class LabelLayerNode(ScalarFieldLayerNode):
             interpolation='nearest',
         )
 
-    def get_node(self, ndisplay: int, dtype=None, shape=None) -> Node:
+    def get_node(
+        self, ndisplay: int, dtype=None, shape=None, tile_shape=None
+    ) -> Node:
         res = self._image_node if ndisplay == 2 else self._volume_node
 
         if (
@@ -1,10 +1,15 @@
 import numpy as np
+from vispy.visuals.transforms import STTransform
 
 from napari._vispy.layers.base import VispyBaseLayer
 from napari._vispy.utils.gl import BLENDING_MODES
 from napari._vispy.utils.text import update_text
 from napari._vispy.visuals.points import PointsVisual
 from napari.settings import get_settings
+from napari.utils.colormaps.colormap_utils import (
+    _coerce_contrast_limits,
+    _napari_cmap_to_vispy,
+)
 from napari.utils.colormaps.standardize_color import transform_color
 from napari.utils.events import disconnect_events
 
@@ -16,19 +21,22 @@ class VispyPointsLayer(VispyBaseLayer):
         node = PointsVisual()
         super().__init__(layer, node)
 
-        self.layer.events.symbol.connect(self._on_data_change)
-        self.layer.events.border_width.connect(self._on_data_change)
+        # changes of a single attribute only upload the changed values
+        self.layer.events.symbol.connect(self._on_symbol_change)
+        self.layer.events.border_width.connect(self._on_border_width_change)
         self.layer.events.border_width_is_relative.connect(
-            self._on_data_change
+            self._on_border_width_change
         )
-        self.layer.events.border_color.connect(self._on_data_change)
-        self.layer._border.events.colors.connect(self._on_data_change)
+        self.layer.events.border_color.connect(self._on_border_color_change)
+        self.layer._border.events.colors.connect(self._on_border_color_change)
         self.layer._border.events.color_properties.connect(
-            self._on_data_change
+            self._on_border_color_change
+        )
+        self.layer.events.face_color.connect(self._on_face_color_change)
+        self.layer._face.events.colors.connect(self._on_face_color_change)
+        self.layer._face.events.color_properties.connect(
+            self._on_face_color_change
         )
-        self.layer.events.face_color.connect(self._on_data_change)
-        self.layer._face.events.colors.connect(self._on_data_change)
-        self.layer._face.events.color_properties.connect(self._on_data_change)
         self.layer.events.highlight.connect(self._on_highlight_change)
         self.layer.text.events.connect(self._on_text_change)
         self.layer.events.shading.connect(self._on_shading_change)
@@ -37,6 +45,8 @@ class VispyPointsLayer(VispyBaseLayer):
             self._on_canvas_size_limits_change
         )
         self.layer.events.scale_factor.connect(self._update_text)
+        self.layer.events.lod.connect(self._on_data_change)
+        self.layer.events.density.connect(self._on_density_change)
 
         self._on_data_change()
 
@@ -53,12 +63,12 @@ class VispyPointsLayer(VispyBaseLayer):
             border_width = np.zeros(1)
             symbol = ['o']
         else:
-            data = self.layer._view_data
-            size = self.layer._view_size
-            border_color = self.layer._view_border_color
-            face_color = self.layer._view_face_color
-            border_width = self.layer._view_border_width
-            symbol = [str(x) for x in self.layer._view_symbol]
+            data = self._drawn(self.layer._view_data)
+            size = self._drawn(self.layer._view_size)
+            border_color = self._drawn_colors(self.layer._view_border_color)
+            face_color = self._drawn_colors(self.layer._view_face_color)
+            border_width = self._drawn(self.layer._view_border_width)
+            symbol = [str(x) for x in self._drawn(self.layer._view_symbol)]
 
         set_data = self.node.points_markers.set_data
 
@@ -90,6 +100,89 @@ class VispyPointsLayer(VispyBaseLayer):
         )
 
         self.reset()
+        self._on_density_change()
+
+    def _on_density_change(self):
+        """Draw the density of the points instead of the markers, if on."""
+        density = self.layer._view_density
+        node = self.node.density
+        self.node.points_markers.visible = density is None
+        node.visible = density is not None and self.layer.visible
+        if density is not None:
+            node.set_data(density.image)
+            # the bins of the density, in vispy's x / y ordering
+            node.transform = STTransform(
+                scale=density.bin_size[::-1], translate=density.origin[::-1]
+            )
+            node.cmap = _napari_cmap_to_vispy(self.layer.density_colormap)
+            contrast_limits = self.layer.density_contrast_limits
+            if contrast_limits is None:
+                low = min(float(density.image.min()), 0)
+                # an empty region is drawn with the lowest color
+                high = max(float(density.image.max()), low + 1)
+                contrast_limits = (low, high)
+            node.clim = _coerce_contrast_limits(
+                contrast_limits
+            ).contrast_limits
+        self.node.update()
+
+    def _drawn(self, values):
+        """Values of the points in view drawn at the level of detail."""
+        lod = self.layer._view_lod
+        return values if lod is None else values[lod[0]]
+
+    def _drawn_colors(self, colors):
+        """Colors of the points in view drawn at the level of detail.
+
+        The opacity of a point drawn for a cell is that of as many
+        overlapping markers as there are points in the cell, so that the
+        density of translucent points is kept when zoomed out.
+        """
+        lod = self.layer._view_lod
+        if lod is None:
+            return colors
+        positions, counts = lod
+        colors = np.array(colors[positions], dtype=np.float32)
+        colors[:, 3] = 1 - (1 - colors[:, 3]) ** counts
+        return colors
+
+    def _set_markers_attribute(self, name, values):
+        """Update one attribute of the drawn markers, or all of them if
+        needed.
+        """
+        if not self.node.points_markers.set_attribute_data(name, values):
+            self._on_data_change()
+
+    def _on_face_color_change(self):
+        self._set_markers_attribute(
+            'a_bg_color', self._drawn_colors(self.layer._view_face_color)
+        )
+
+    def _on_border_color_change(self):
+        self._set_markers_attribute(
+            'a_fg_color', self._drawn_colors(self.layer._view_border_color)
+        )
+
+    def _on_border_width_change(self):
+        scale = self.layer.scale[-1]
+        scaled_size = self.layer._view_size * scale
+        border_width = self.layer._view_border_width
+        if self.layer.border_width_is_relative:
+            edge_width = scaled_size * border_width
+        else:
+            edge_width = np.minimum(border_width * scale, scaled_size)
+        self._set_markers_attribute('a_edgewidth', self._drawn(edge_width))
+        self._on_highlight_change()
+
+    def _on_symbol_change(self):
+        symbol = [str(x) for x in self._drawn(self.layer._view_symbol)]
+        self._set_markers_attribute(
+            'a_symbol',
+            self.node.points_markers._prepare_symbol_values(
+                symbol, len(symbol)
+            ),
+        )
+        self._on_highlight_change()
 
     def _on_highlight_change(self):
         settings = get_settings()
@@ -197,8 +290,19 @@ class VispyPointsLayer(VispyBaseLayer):
         box_blending_kwargs = BLENDING_MODES['translucent_no_depth']
         self.node.highlight_lines.set_gl_state(**box_blending_kwargs)
 
+        # the density is not a subvisual, so does not share the gl state
+        self.node.density.set_gl_state(**BLENDING_MODES[self.layer.blending])
+
         self.node.update()
 
+    def _on_visible_change(self):
+        super()._on_visible_change()
+        self._on_density_change()
+
+    def _on_opacity_change(self):
+        super()._on_opacity_change()
+        self.node.density.opacity = self.layer.opacity
+
     def _on_antialiasing_change(self):
         self.node.antialias = self.layer.antialiasing
 
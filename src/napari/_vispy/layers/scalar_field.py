@@ -32,8 +32,13 @@ class ScalarFieldLayerNode(ABC):
         ndisplay: int,
         dtype: np.dtype | None = None,
         shape: tuple | None = None,
+        tile_shape: tuple[int, int] | None = None,
     ) -> Node:
-        """Return the appropriate node for the given ndisplay and dtype."""
+        """Return the appropriate node for the given ndisplay and dtype.
+
+        tile_shape is the shape of the tiles of 2D data loaded in tiles, if
+        any (see :attr:`_ScalarFieldSliceResponse.tile_shape`).
+        """
         raise NotImplementedError
 
 
@@ -87,6 +92,9 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             ndisplay,
             getattr(data, 'dtype', None),
             getattr(data, 'shape', None),
+            tile_shape=self._tile_shape(ndisplay)
+            if data is not None
+            else None,
         )
 
         if data is None:
@@ -98,7 +106,10 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
 
         self.node.visible = not self.layer._slice.empty and self.layer.visible
 
-        self.node.set_data(data)
+        if isinstance(self.node, TiledImageNode):
+            self.node.set_data(data, origin=self._tile_origin(data))
+        else:
+            self.node.set_data(data)
 
         self.node.parent = parent
         self.node.order = self.order
@@ -118,6 +129,7 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             ndisplay,
             getattr(data, 'dtype', None),
             getattr(data, 'shape', None),
+            tile_shape=self._tile_shape(ndisplay),
         )
         if ndisplay > self.layer.ndim:
             data = data.reshape(
@@ -142,6 +154,9 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             or node != self.node
         ):
             self._on_display_change(data)
+        elif isinstance(node, TiledImageNode):
+            node.set_data(data, origin=self._tile_origin(data))
+            node.visible = not self.layer._slice.empty and self.layer.visible
         else:
             node.set_data(data)
             node.visible = not self.layer._slice.empty and self.layer.visible
@@ -150,6 +165,20 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
         self._on_matrix_change()
         node.update()
 
+    def _tile_shape(self, ndisplay: int) -> tuple[int, int] | None:
+        """The shape of the tiles of the current 2D slice, if it is tiled."""
+        tile_shape = self.layer._slice.tile_shape
+        if ndisplay != 2 or tile_shape is None:
+            return None
+        return tile_shape[0], tile_shape[1]
+
+    def _tile_origin(self, data) -> tuple[int, int] | None:
+        """The position of the current tiled slice in its data level."""
+        tile_origin = self.layer._slice.tile_origin
+        if data is None or tile_origin is None:
+            return None
+        return tile_origin[0], tile_origin[1]
+
     def _on_custom_interpolation_kernel_2d_change(self) -> None:
         if self.layer._slice_input.ndisplay == 2:
             self.node.custom_kernel = self.layer.custom_interpolation_kernel_2d
@@ -31,14 +31,21 @@ class TiledImageNode(Compound):
     Attributes such as colormap and contrast limits are passed through to
     the child nodes using setattr.
 
+    When the data is a tile-aligned part of a larger image (e.g. the field
+    of view of a multiscale image), its ``origin`` in that image can be given
+    to :meth:`set_data`. Tiles are then identified by their position in the
+    larger image, and only the tiles whose content changed are uploaded, so
+    that panning does not upload the whole field of view again.
+
     Attributes
     ----------
     data : np.ndarray
         The data to be displayed.
     texture_format : str
         The texture format (uint8, uint16, float32).
-    tile_size : int
-        The maximum tile size, used to split the image.
+    tile_size : int or tuple[int, int]
+        The maximum tile size, used to split the image. A tuple gives the
+        size along each axis of the data (rows, columns).
     adopted_children : list[Image]
         The child Image nodes containing the component tiles of the image.
         Note: we use the term "adopted children" because "children" is a
@@ -50,7 +57,7 @@ class TiledImageNode(Compound):
     def __init__(
         self,
         data: np.ndarray,
-        tile_size: int,
+        tile_size: int | tuple[int, int],
         texture_format: str | None = None,
     ) -> None:
         self.unfreeze()
@@ -59,6 +66,12 @@ class TiledImageNode(Compound):
         self.offsets: list[tuple[int, int]] = []
         self.tile_size = tile_size
         self.data: npt.ArrayLike | None = None
+        # When the data has an origin, the x/y position of each tile in the
+        # larger image and the data last uploaded to it (in the same order as
+        # `adopted_children`). None otherwise.
+        self._tile_positions: list[tuple[int, int]] | None = None
+        self._tile_data: list[np.ndarray] = []
+        self._gl_state: tuple[tuple, dict] | None = None
         super().__init__([])
         self.set_data(data)
 
@@ -95,10 +108,28 @@ class TiledImageNode(Compound):
         ):
             ch.transform = STTransform(translate=offset + (0,))
 
-    def set_data(self, data: np.ndarray) -> None:
+    def set_data(
+        self, data: np.ndarray, origin: tuple[int, int] | None = None
+    ) -> None:
+        """Set the data to display.
+
+        Parameters
+        ----------
+        data : np.ndarray, shape (H, W[, 3])
+            The data to display.
+        origin : tuple[int, int], optional
+            The row/column position of the data in a larger image, which must
+            be a multiple of the tile size. If given, tiles whose position and
+            content did not change since the last call are not uploaded again.
+        """
         tiles = make_tiles(data, self.tile_size)
         self.offsets = [of for of, _ in tiles]
         self.data = data
+        if origin is not None:
+            self._set_tiles(tiles, origin)
+            return
+        self._tile_positions = None
+        self._tile_data = []
         # if the correct number of tiles already exist, just update their data
         # otherwise, delete all existing tiles and create new ones
         if len(self.adopted_children) == len(tiles):
@@ -108,21 +139,93 @@ class TiledImageNode(Compound):
             for child in self.adopted_children:
                 child.parent = None
             self._subvisuals: list[BaseVisual] = []
-            self.adopted_children = [
-                Image(
-                    data=dat,
-                    parent=self,
-                    texture_format=self.texture_format,
-                )
-                for _, dat in tiles
-            ]
+            self.adopted_children = [self._make_child(dat) for _, dat in tiles]
             for ch, offset in zip(
                 self.adopted_children, self.offsets, strict=True
             ):
                 ch.transform = STTransform(translate=offset + (0,))
                 self.add_subvisual(ch)
 
+    def _set_tiles(
+        self,
+        tiles: list[tuple[tuple[int, int], np.ndarray]],
+        origin: tuple[int, int],
+    ) -> None:
+        """Update the tiles of data positioned at origin in a larger image.
+
+        Children are reused (and their data not uploaded again) for tiles
+        that are at the same position in the larger image with the same
+        content. Other tiles are uploaded to the children that are no longer
+        needed, or to new children.
+        """
+        # vispy offsets are x/y, origin is row/column
+        x0, y0 = origin[1], origin[0]
+        reference = self.adopted_children[0] if self.adopted_children else None
+        previous = {}
+        if self._tile_positions is not None:
+            previous = {
+                pos: (ch, dat)
+                for pos, ch, dat in zip(
+                    self._tile_positions,
+                    self.adopted_children,
+                    self._tile_data,
+                    strict=True,
+                )
+            }
+        else:
+            # children with unknown content can only be recycled
+            for child in self.adopted_children:
+                child.parent = None
+            self._subvisuals = []
+            self.adopted_children = []
+
+        positions = [(x + x0, y + y0) for (x, y), _ in tiles]
+        unchanged = {
+            pos
+            for pos, (_, dat) in zip(positions, tiles, strict=True)
+            if pos in previous and _same_tile(previous[pos][1], dat)
+        }
+        spare = [
+            ch for pos, (ch, _) in previous.items() if pos not in unchanged
+        ]
+
+        children = []
+        for pos, ((x, y), dat) in zip(positions, tiles, strict=True):
+            if pos in unchanged:
+                child = previous[pos][0]
+            elif spare:
+                child = spare.pop()
+                child.set_data(dat)
+            else:
+                child = self._make_child(dat, reference)
+                self.add_subvisual(child)
+            child.transform = STTransform(translate=(x, y, 0))
+            children.append(child)
+        for child in spare:
+            child.parent = None
+            self._subvisuals.remove(child)
+
+        self.adopted_children = children
+        self._tile_positions = positions
+        self._tile_data = [dat for _, dat in tiles]
+
+    def _make_child(
+        self, data: np.ndarray, reference: Image | None = None
+    ) -> Image:
+        """Create a tile, with the same display attributes as reference."""
+        child = Image(
+            data=data, parent=self, texture_format=self.texture_format
+        )
+        if reference is not None:
+            for name in PASS_THROUGH_ATTRIBUTES:
+                setattr(child, name, getattr(reference, name))
+        if self._gl_state is not None:
+            args, kwargs = self._gl_state
+            child.set_gl_state(*args, **kwargs)
+        return child
+
     def set_gl_state(self, *args: Any, **kwargs: Any) -> None:
+        self._gl_state = (args, kwargs)
         for child in self.adopted_children:
             child.set_gl_state(*args, **kwargs)
 
@@ -141,8 +244,24 @@ class TiledImageNode(Compound):
             super().__setattr__(name, value)
 
 
+def _same_tile(old: np.ndarray, new: np.ndarray, rows: int = 64) -> bool:
+    """Return True if two tiles have the same shape and content.
+
+    The tiles are compared by blocks of rows, so that tiles that differ are
+    usually detected without comparing all their pixels.
+    """
+    if old is new:
+        return True
+    if old.shape != new.shape or old.dtype != new.dtype:
+        return False
+    return all(
+        np.array_equal(old[i : i + rows], new[i : i + rows])
+        for i in range(0, old.shape[0], rows)
+    )
+
+
 def make_tiles(
-    image: np.ndarray, tile_size: int
+    image: np.ndarray, tile_size: int | tuple[int, int]
 ) -> list[tuple[tuple[int, int], np.ndarray]]:
     """Split a large image into a list of tiles and offsets.
 
@@ -152,8 +271,9 @@ def make_tiles(
     ----------
     image : np.ndarray, shape (H, W[, 3])
         The input image.
-    tile_size : int
-        The maximum size of any tile along any axis.
+    tile_size : int or tuple[int, int]
+        The maximum size of any tile along any axis, or along the rows and
+        the columns of the image.
 
     Returns
     -------
@@ -161,14 +281,16 @@ def make_tiles(
         List of x, y offsets and corresponding array tiles.
     """
     h, w, *_ = image.shape
+    if isinstance(tile_size, int):
+        tile_h = tile_w = tile_size
+    else:
+        tile_h, tile_w = tile_size
 
     tile_list = [
         # note: vispy space is transposed (y, x -> x, y) compared to NumPy
         # indexing space; we want the vispy offsets so we swap them here.
-        ((x, y), image[y : y + tile_size, x : x + tile_size])
-        for y, x in itertools.product(
-            range(0, h, tile_size), range(0, w, tile_size)
-        )
+        ((x, y), image[y : y + tile_h, x : x + tile_w])
+        for y, x in itertools.product(range(0, h, tile_h), range(0, w, tile_w))
     ]
 
     return tile_list
@@ -19,7 +19,9 @@ class VispyTracksLayer(VispyBaseLayer):
         self.layer.events.display_id.connect(self._on_appearance_change)
         self.layer.events.display_tail.connect(self._on_appearance_change)
         self.layer.events.display_graph.connect(self._on_appearance_change)
-        self.layer.events.hide_completed_tracks.connect(self._on_tracks_change)
+        self.layer.events.hide_completed_tracks.connect(
+            self._on_time_window_change
+        )
 
         self.layer.events.color_by.connect(self._on_appearance_change)
         self.layer.events.colormap.connect(self._on_appearance_change)
@@ -46,10 +48,9 @@ class VispyTracksLayer(VispyBaseLayer):
             self.node._subvisuals[1].text = labels_text
             self.node._subvisuals[1].pos = labels_pos
 
-        # If hide_completed_tracks is enabled, update track connections
-        # when the current time changes
-        if self.layer.hide_completed_tracks:
-            self._on_tracks_change()
+        # only the segments in the time window around the current time are
+        # drawn
+        self._on_time_window_change()
 
         self.node.update()
         # Call to update order of translation values with new dims:
@@ -86,6 +87,22 @@ class VispyTracksLayer(VispyBaseLayer):
             width=self.layer.tail_width,
         )
 
+        # the tail and head lengths change the time window
+        self._on_time_window_change()
+
+    def _on_time_window_change(self):
+        """Draw only the segments in the time window around the current time.
+
+        The vertices are uploaded when the tracks or the graph change, only
+        the indices of the segments to draw are uploaded here.
+        """
+        self.node._subvisuals[0].set_data(
+            connect=self.layer._view_track_segments
+        )
+        graph_segments = self.layer._view_graph_segments
+        if graph_segments is not None:
+            self.node._subvisuals[2].set_data(connect=graph_segments)
+
     def _on_tracks_change(self):
         """Update the shader when the track data changes."""
 
@@ -99,7 +116,7 @@ class VispyTracksLayer(VispyBaseLayer):
         # change the data to the vispy line visual
         self.node._subvisuals[0].set_data(
             pos=self.layer._view_data,
-            connect=self.layer.track_connex,
+            connect=self.layer._view_track_segments,
             width=self.layer.tail_width,
             color=self.layer.track_colors,
         )
@@ -126,7 +143,7 @@ class VispyTracksLayer(VispyBaseLayer):
 
         self.node._subvisuals[2].set_data(
             pos=self.layer._view_graph,
-            connect=self.layer.graph_connex,
+            connect=self.layer._view_graph_segments,
             width=self.layer.tail_width,
             color='white',
         )
@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 from vispy import use
 from vispy.scene.visuals import Markers as BaseMarkers
 
@@ -33,3 +34,38 @@ class Markers(BaseMarkers):
             return (pos[:, axis].min(), pos[:, axis].max())
 
         return (0, 0)
+
+    def set_attribute_data(self, name: str, values: np.ndarray) -> bool:
+        """Update one attribute of the markers in place.
+
+        The attributes of all the markers are packed in one vertex buffer.
+        Only the markers from the first to the last one whose value changed
+        are uploaded again, instead of the whole buffer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute in the vertex buffer, e.g. 'a_bg_color'.
+        values : np.ndarray
+            Values of the attribute for all the markers.
+
+        Returns
+        -------
+        bool
+            False if the markers need to be set with set_data instead,
+            because their number changed.
+        """
+        if self._data is None or len(values) != len(self._data):
+            return False
+        current = self._data[name]
+        values = np.asarray(values, dtype=current.dtype).reshape(current.shape)
+        changed = np.flatnonzero(
+            (current != values).reshape(len(current), -1).any(axis=1)
+        )
+        if len(changed) == 0:
+            return True
+        start, stop = changed[0], changed[-1] + 1
+        current[start:stop] = values[start:stop]
+        self._vbo.set_subdata(self._data[start:stop], offset=start)
+        self.update()
+        return True
@@ -3,6 +3,7 @@ from __future__ import annotations
 from vispy.scene.visuals import Compound, Line
 
 from napari._vispy.visuals.clipping_planes_mixin import ClippingPlanesMixin
+from napari._vispy.visuals.image import Image
 from napari._vispy.visuals.markers import Markers
 from napari._vispy.visuals.text import Text
 
@@ -17,6 +18,9 @@ class PointsVisual(ClippingPlanesMixin, Compound):
         - Markers for selection highlights (vispy.MarkersVisual)
         - Lines for highlights (vispy.LineVisual)
         - Text labels (vispy.TextVisual)
+
+    The density of the points is drawn by a child image node, which is
+    positioned with its own transform in the bins of the density.
     """
 
     def __init__(self) -> None:
@@ -29,6 +33,12 @@ class PointsVisual(ClippingPlanesMixin, Compound):
             ]
         )
         self.scaling = True
+        self.unfreeze()
+        self._density = Image(
+            None, method='auto', texture_format=None, parent=self
+        )
+        self._density.visible = False
+        self.freeze()
 
     @property
     def points_markers(self) -> Markers:
@@ -50,6 +60,11 @@ class PointsVisual(ClippingPlanesMixin, Compound):
         """Text labels visual"""
         return self._subvisuals[3]
 
+    @property
+    def density(self) -> Image:
+        """Density image visual"""
+        return self._density
+
     @property
     def scaling(self) -> bool:
         """
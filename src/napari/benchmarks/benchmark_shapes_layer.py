@@ -699,6 +699,51 @@ class MeshTriangulationSuite(_BackendSelection):
             )
 
 
+class ShapesAddPolygonsSuite:
+    """Benchmarks for adding many polygons to a Shapes layer at once."""
+
+    param_names = ['n_shapes']
+    params = [1_000, 10_000, 100_000]
+
+    skip_params = Skip(if_in_pr=lambda n_shapes: n_shapes > 10_000)
+
+    timeout = 600
+
+    def setup(self, n_shapes):
+        self.data = _star_polygons(n_shapes)
+        # compile the triangulation functions outside of the timings
+        Shapes(self.data[:10], shape_type='polygon')
+
+    def time_create_layer(self, n_shapes):
+        """Time to create a layer with polygons."""
+        Shapes(self.data, shape_type='polygon')
+
+    def time_add_polygons(self, n_shapes):
+        """Time to add polygons to an existing layer."""
+        layer = Shapes(self.data[:10], shape_type='polygon')
+        layer.add_polygons(self.data)
+
+
+class ShapesToLabelsSuite:
+    """Benchmarks for rasterising many polygons to a labels image."""
+
+    param_names = ['n_shapes']
+    params = [1_000, 10_000]
+
+    timeout = 600
+
+    def setup(self, n_shapes):
+        self.layer = Shapes(_star_polygons(n_shapes), shape_type='polygon')
+
+    def time_to_labels(self, n_shapes):
+        """Time to rasterise the polygons to labels."""
+        self.layer.to_labels(labels_shape=(1000, 1000))
+
+    def peakmem_to_labels(self, n_shapes):
+        """Peak memory to rasterise the polygons to labels."""
+        self.layer.to_labels(labels_shape=(1000, 1000))
+
+
 def _load_data_from_file_or_generate(
     function: Callable, n_shapes: int, n_points: int
 ) -> list[np.ndarray]:
@@ -940,6 +985,17 @@ def polygons_with_holes(n_shapes=5_000, n_points=32) -> list[np.ndarray]:
     )
 
 
+def _star_polygons(n_shapes, n_vertices=6, seed=0) -> list[np.ndarray]:
+    """Random small star-shaped, mostly non-convex, polygons."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 1000, (n_shapes, 1, 2))
+    angles = np.sort(rng.uniform(0, 2 * np.pi, (n_shapes, n_vertices)), 1)
+    radii = rng.uniform(2, 10, (n_shapes, n_vertices, 1))
+    return list(
+        centers + radii * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    )
+
+
 if __name__ == '__main__':
     from utils import run_benchmark
 
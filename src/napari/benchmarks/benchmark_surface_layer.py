@@ -4,6 +4,7 @@
 # https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
 import numpy as np
 
+from napari.components.dims import Dims
 from napari.layers import Surface
 
 
@@ -67,6 +68,10 @@ class Surface3DSuite:
             np.random.random(n),
         )
         self.layer = Surface(self.data)
+        # the triangles are indexed on the first query along a ray
+        self.layer_3d = Surface(self.data)
+        self.layer_3d._slice_dims(Dims(ndim=3, ndisplay=3))
+        self.time_get_value_3d(n)
 
     def time_create_layer(self, n):
         """Time to create a layer."""
@@ -92,6 +97,15 @@ class Surface3DSuite:
         """Time to get current value."""
         self.layer.get_value((0,) * 3)
 
+    def time_get_value_3d(self, n):
+        """Time to get the value along a ray in 3D."""
+        self.layer_3d.get_value(
+            (0.5, 0.5, -1),
+            view_direction=(0, 0, 1),
+            dims_displayed=[0, 1, 2],
+            world=False,
+        )
+
     def mem_layer(self, n):
         """Memory used by layer."""
         return self.layer
@@ -39,6 +39,16 @@ class TracksSuite:
 
         self.data = data
 
+        # detections of all the tracks in the next frame
+        self.frame = np.concatenate(
+            (
+                np.arange(n_tracks)[:, None],
+                np.full((n_tracks, 1), size),
+                rng.uniform(size=(n_tracks, 3)),
+            ),
+            axis=1,
+        )
+
         # create layer for the update benchmark
         self.layer = Tracks(self.data)
 
@@ -48,6 +58,46 @@ class TracksSuite:
     def time_update_layer(self, *_) -> None:
         self.layer.data = self.data
 
+    def time_append_frame(self, *_) -> None:
+        self.layer.append(self.frame)
+
+    def time_segments_in_time_window(self, size, n_tracks) -> None:
+        time = size // n_tracks // 2
+        self.layer._manager.track_segments(time - 30, time)
+
+
+class TracksGraphSuite:
+    """Benchmarks for building the graph of a binary lineage tree."""
+
+    param_names = ['n_tracks']
+    params = [1_000, 100_000, 1_000_000]
+
+    skip_params = Skip(if_in_pr=lambda n_tracks: n_tracks > 1_000)
+
+    def setup(self, n_tracks):
+        rng = np.random.default_rng(0)
+        track_ids = np.repeat(np.arange(n_tracks), 3)
+        # each track starts after its parent, track (i - 1) // 2
+        time = np.tile(np.arange(3), n_tracks) + np.repeat(
+            np.floor(np.log2(np.arange(n_tracks) + 1)) * 3, 3
+        )
+        coordinates = rng.uniform(size=(len(track_ids), 2))
+        self.data = np.column_stack((track_ids, time, coordinates))
+        children = np.arange(1, n_tracks)
+        self.edges = np.stack([children, (children - 1) // 2], axis=1)
+        self.graph = {
+            int(child): [int(parent)] for child, parent in self.edges
+        }
+        self.layer = Tracks(self.data)
+
+    def time_set_graph_dict(self, n_tracks):
+        """Time to set the graph from a dictionary."""
+        self.layer.graph = self.graph
+
+    def time_set_graph_edges(self, n_tracks):
+        """Time to set the graph from an array of edges."""
+        self.layer.graph = self.edges
+
 
 if __name__ == '__main__':
     from utils import run_benchmark
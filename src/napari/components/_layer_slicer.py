@@ -5,11 +5,23 @@ See the NAP for more details: https://napari.org/dev/naps/4-async-slicing.html
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import math
+import time
 import weakref
-from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from concurrent.futures import (
+    Executor,
+    Future,
+    InvalidStateError,
+    ThreadPoolExecutor,
+    wait,
+)
 from contextlib import contextmanager
-from threading import RLock
+from dataclasses import dataclass, field
+from functools import partial
+from threading import Lock, RLock
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,12 +29,14 @@ from typing import (
     runtime_checkable,
 )
 
+import numpy as np
+
 from napari.layers import Layer
 from napari.settings import get_settings
 from napari.utils.events.event import EmitterGroup, Event
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Collection, Hashable, Iterable
 
     from napari.components import Dims
 
@@ -77,49 +91,199 @@ class _AsyncSliceable(Protocol):
         """
 
 
+# Lower values are sliced first. Hidden layers are never sliced asynchronously
+# (see ``_LayerSlicer.submit``), so only selected and visible layers need a
+# priority. Prefetching is speculative, so it only runs when nothing else
+# is waiting.
+_SELECTED_PRIORITY = 0
+_VISIBLE_PRIORITY = 1
+_PREFETCH_PRIORITY = 2
+
+# How far ahead in time to prefetch planes while stepping through an axis.
+_PREFETCH_HORIZON_SECS = 0.5
+
+
+@dataclass(order=True)
+class _LayerSliceTask:
+    """A single layer slice request waiting for, or running on, a worker.
+
+    Tasks are ordered by ``(priority, order)`` so that they can be stored in
+    a heap, where ``order`` breaks ties in submission order.
+
+    Prefetch tasks only fill the cache of their request: their responses
+    are not emitted, and they neither replace nor wait for the other tasks
+    of their layer.
+
+    The previews of a task are emitted under its ``emit_lock``, and only
+    while its own response has not been emitted, as marked by ``emitted``.
+    """
+
+    priority: int
+    order: int
+    weak_layer: weakref.ReferenceType[Layer] = field(compare=False)
+    request: _SliceRequest = field(compare=False)
+    future: Future[dict] = field(compare=False, default_factory=Future)
+    prefetch: bool = field(compare=False, default=False)
+    emit_lock: Lock = field(compare=False, default_factory=Lock)
+    emitted: bool = field(compare=False, default=False)
+
+    @property
+    def key(self) -> Hashable:
+        """Identifies the tasks that must not run at the same time."""
+        if self.prefetch:
+            return self.weak_layer, self.order
+        return self.weak_layer
+
+
+class _SlicePrefetcher:
+    """Predicts the next dims points while stepping through an axis.
+
+    A step is a change of the dims point along exactly one of the not
+    displayed axes. The next points are extrapolated from the last step,
+    and how many are predicted depends on how frequently steps happen,
+    such that the predictions cover ``_PREFETCH_HORIZON_SECS``.
+    """
+
+    def __init__(self) -> None:
+        self._last_point: np.ndarray | None = None
+        self._last_time = 0.0
+        self._steps_per_sec = 0.0
+
+    def predict(self, dims: Dims, max_points: int) -> list[Dims]:
+        """Records the current dims and returns up to ``max_points`` next dims."""
+        now = time.perf_counter()
+        point = np.asarray(dims.point, dtype=float)
+        last_point, last_time = self._last_point, self._last_time
+        self._last_point, self._last_time = point, now
+        if (
+            max_points == 0
+            or last_point is None
+            or last_point.shape != point.shape
+        ):
+            return []
+
+        moved = np.flatnonzero(point != last_point)
+        if len(moved) != 1 or moved[0] not in dims.not_displayed:
+            self._steps_per_sec = 0.0
+            return []
+
+        axis = int(moved[0])
+        rate = 1 / max(now - last_time, 1e-3)
+        # Smooth the rate because the interval between steps is noisy.
+        self._steps_per_sec = (
+            rate
+            if self._steps_per_sec == 0
+            else (self._steps_per_sec + rate) / 2
+        )
+        n_points = min(
+            max_points,
+            max(1, math.ceil(self._steps_per_sec * _PREFETCH_HORIZON_SECS)),
+        )
+
+        step = point[axis] - last_point[axis]
+        axis_range = dims.range[axis]
+        predicted = []
+        for i in range(1, n_points + 1):
+            value = point[axis] + i * step
+            if not axis_range.start <= value <= axis_range.stop:
+                break
+            next_point = list(dims.point)
+            next_point[axis] = value
+            # This shallow copy shares the events of dims, so it must only
+            # be read.
+            predicted.append(
+                dims.model_copy(update={'point': tuple(next_point)})
+            )
+        return predicted
+
+
 class _LayerSlicer:
     """
     High level class to control the creation of a slice (via a slice request),
     submit it (synchronously or asynchronously) to a thread pool, and emit the
     results when complete.
 
+    Each layer is sliced in its own task, so that a slow layer does not block
+    slicing of the others. At most one task per layer runs at any time and at
+    most one more waits behind it: a newer request for a layer cancels that
+    layer's waiting task. Waiting tasks are started in priority order, with
+    selected layers before other visible layers.
+
+    When a slice cache is enabled, stepping through an axis (e.g. during
+    playback) also prefetches the next planes along that axis into the cache,
+    using at most half of the workers. This happens for both sync and async
+    slicing, so that sync slicing can also read prefetched planes from the cache.
+
+    On the async path, requests that define previews (e.g. coarser levels of
+    a multiscale image) have them sliced alongside, on separate workers. Each
+    preview is emitted as soon as it is done, until the response of its
+    request is emitted, after which the remaining previews are dropped.
+
     Events
     ------
     ready
-        emitted after slicing is done with a dict value that maps from layer
-        to slice response. Note that this may be emitted on the main or
-        a non-main thread. If usage of this event relies on something happening
-        on the main thread, actions should be taken to ensure that the callback
-        is also executed on the main thread (e.g. by decorating the callback
-        with `@ensure_main_thread`).
+        emitted after slicing of a layer is done with a dict value that maps
+        from layer to slice response. It is also emitted for each preview
+        response, whose request ID differs from the one of the task. Note that this may be emitted on the
+        main or a non-main thread. If usage of this event relies on something
+        happening on the main thread, actions should be taken to ensure that
+        the callback is also executed on the main thread (e.g. by decorating
+        the callback with `@ensure_main_thread`).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int | None = None) -> None:
         """
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of layers that can be sliced concurrently.
+            If None, uses the ``experimental.async_slicing_workers`` setting.
+
         Attributes
         ----------
         _executor : concurrent.futures.ThreadPoolExecutor
             manager for the slicing threading
+        _preview_executor : concurrent.futures.ThreadPoolExecutor
+            manager for the threads slicing the previews of running tasks
+        _max_workers : int
+            maximum number of tasks that are run at the same time
         _force_sync: bool
             if true, forces slicing to execute synchronously
         _layers_to_task : dict of tuples of layer weakrefs to futures
-            task storage for cancellation logic
-        _task_to_requests : dict of futures to slice requests
-            maps completed tasks back to their layer and slice requests,
+            the futures returned by ``submit`` that are not done yet
+        _pending_tasks : dict of layer weakrefs to tasks
+            the task of each layer that is waiting for a worker
+        _running_tasks : dict of layer weakrefs to tasks
+            the task of each layer that is currently running
+        _queue : list of tasks
+            heap of pending tasks, which may contain cancelled tasks
         _lock_futures_dicts : threading.RLock
-            lock to guard against concurrent changes to `_layers_to_task`
-            and `_task_to_requests` when finding, adding, or removing tasks
+            lock to guard against concurrent changes to the task collections
+            above when finding, adding, or removing tasks
         """
         self.events = EmitterGroup(source=self, ready=Event)
-        self._executor: Executor = ThreadPoolExecutor(max_workers=1)
+        if max_workers is None:
+            max_workers = get_settings().experimental.async_slicing_workers
+        self._max_workers = max_workers
+        self._executor: Executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._preview_executor: Executor = ThreadPoolExecutor(
+            max_workers=max_workers
+        )
         self._force_sync = not get_settings().experimental.async_
         self._layers_to_task: dict[
             tuple[weakref.ReferenceType[Layer], ...], Future
         ] = {}
-        self._task_to_requests: dict[
-            Future, dict[weakref.ReferenceType[Layer], _SliceRequest]
+        self._pending_tasks: dict[
+            weakref.ReferenceType[Layer], _LayerSliceTask
+        ] = {}
+        self._running_tasks: dict[
+            weakref.ReferenceType[Layer], _LayerSliceTask
         ] = {}
+        self._queue: list[_LayerSliceTask] = []
+        self._task_order = itertools.count()
         self._lock_futures_dicts = RLock()
+        self._is_shutdown = False
+        self._prefetcher = _SlicePrefetcher()
 
     @contextmanager
     def force_sync(self):
@@ -153,7 +317,16 @@ class _LayerSlicer:
         TimeoutError: when the timeout limit has been exceeded and the task is
             not yet complete
         """
-        futures = self._layers_to_task.values()
+        with self._lock_futures_dicts:
+            futures = [
+                task.future
+                for task in (
+                    *self._running_tasks.values(),
+                    *self._pending_tasks.values(),
+                )
+                if not task.prefetch
+            ]
+            futures.extend(self._layers_to_task.values())
         _, not_done_futures = wait(futures, timeout=timeout)
 
         if len(not_done_futures) > 0:
@@ -167,17 +340,17 @@ class _LayerSlicer:
         layers: Iterable[Layer],
         dims: Dims,
         force: bool = False,
+        selected: Collection[Layer] = (),
     ) -> Future[dict] | None:
         """Slices the given layers with the given dims.
 
-        Submitting multiple layers at one generates multiple requests, but only ONE task.
+        Submitting multiple layers at once generates one task per layer, but
+        only ONE future that is done when all of those tasks are done.
 
-        This will attempt to cancel all pending slicing tasks that can be entirely
-        replaced the new ones. If multiple layers are sliced, any task that contains
-        only one of those layers can safely be cancelled. If a single layer is sliced,
-        it will wait for any existing tasks that include that layer AND another layer,
-        In other words, it will only cancel if the new task will replace the
-        slices of all the layers in the pending task.
+        Any pending slicing task of one of the given layers is cancelled,
+        because it is replaced by the new one. A task that is already running
+        cannot be interrupted, so its response is still emitted, and the new
+        task of that layer starts once it is done.
 
         This should only be called from the main thread.
 
@@ -190,6 +363,9 @@ class _LayerSlicer:
         force : bool
             True if slicing should be forced to occur, even when some cache thinks
             it already has a valid slice ready. False otherwise.
+        selected : collection of layers
+            The layers that are currently selected, which are sliced before
+            the other layers.
 
         Returns
         -------
@@ -203,15 +379,14 @@ class _LayerSlicer:
             dims,
             force,
         )
-        if existing_task := self._find_existing_task(layers):
-            logger.debug('Cancelling task %s', id(existing_task))
-            existing_task.cancel()
+        if self._is_shutdown:
+            raise RuntimeError('cannot submit slicing tasks after shutdown')
 
         # Not all layer types will initially be asynchronously sliceable.
         # The following logic gives us a way to handle those in the short
         # term as we develop, and also in the long term if there are cases
         # when we want to perform sync slicing anyway.
-        requests: dict[weakref.ref, _SliceRequest] = {}
+        tasks: list[_LayerSliceTask] = []
         sync_layers = []
         for layer in layers:
             # Slicing of non-visible layers is handled differently by sync
@@ -228,24 +403,49 @@ class _LayerSlicer:
             ):
                 logger.debug('Making async slice request for %s', layer)
                 request = layer._slicing_state._make_slice_request(dims)
-                weak_layer = weakref.ref(layer)
-                requests[weak_layer] = request
                 layer._slicing_state._set_unloaded_slice_id(request.id)
+                priority = (
+                    _SELECTED_PRIORITY
+                    if layer in selected
+                    else _VISIBLE_PRIORITY
+                )
+                tasks.append(
+                    _LayerSliceTask(
+                        priority=priority,
+                        order=next(self._task_order),
+                        weak_layer=weakref.ref(layer),
+                        request=request,
+                    )
+                )
             else:
                 logger.debug('Sync slicing for %s', layer)
                 sync_layers.append(layer)
 
-        # First maybe submit an async slicing task to start it ASAP.
+        # First maybe submit the async slicing tasks to start them ASAP.
         task = None
-        if len(requests) > 0:
+        if len(tasks) > 0:
+            for layer_task in tasks:
+                layer_task.future.add_done_callback(
+                    partial(self._on_slice_done, layer_task)
+                )
+            task = (
+                tasks[0].future
+                if len(tasks) == 1
+                else _gather_responses([t.future for t in tasks])
+            )
             logger.debug('Submitting task %s', id(task))
-            task = self._executor.submit(self._slice_layers, requests)
             # Store task before adding done callback to ensure there is always
             # a task to remove in the done callback.
             with self._lock_futures_dicts:
-                self._layers_to_task[tuple(requests)] = task
-                self._task_to_requests[task] = requests
-            task.add_done_callback(self._on_slice_done)
+                self._layers_to_task[tuple(t.weak_layer for t in tasks)] = task
+                for layer_task in tasks:
+                    self._enqueue(layer_task)
+            task.add_done_callback(self._try_to_remove_task)
+            self._start_pending_tasks()
+
+        # Then prefetch the planes that are likely to be sliced next, so that
+        # they can be read from the cache when needed.
+        self._submit_prefetch(layers, dims)
 
         # Then execute sync slicing tasks to run concurrent with async ones.
         for layer in sync_layers:
@@ -264,11 +464,173 @@ class _LayerSlicer:
         This should only be called from the main thread.
         """
         logger.debug('_LayerSlicer.shutdown')
+        with self._lock_futures_dicts:
+            self._is_shutdown = True
+            pending = list(self._pending_tasks.values())
+            self._pending_tasks.clear()
+            self._queue.clear()
+        for task in pending:
+            task.future.cancel()
         self._executor.shutdown(wait=True, cancel_futures=True)
+        self._preview_executor.shutdown(wait=True, cancel_futures=True)
         self.events.disconnect()
         self.events.ready.disconnect()
 
-    def _slice_layers(self, requests: dict) -> dict:
+    def _submit_prefetch(self, layers: Iterable[Layer], dims: Dims) -> None:
+        """Replaces the pending prefetch tasks by ones for the next dims.
+
+        Only layers whose slice requests store their responses in an enabled
+        cache are prefetched, and planes that are already cached are skipped.
+        """
+        max_points = get_settings().experimental.slice_prefetch_planes
+        predicted = self._prefetcher.predict(dims, max_points)
+        with self._lock_futures_dicts:
+            stale = [t for t in self._pending_tasks.values() if t.prefetch]
+            for task in stale:
+                del self._pending_tasks[task.key]
+        for task in stale:
+            task.future.cancel()
+        if not predicted:
+            return
+
+        tasks = []
+        for layer in layers:
+            if not (
+                isinstance(layer._slicing_state, _AsyncSliceable)
+                and layer.visible
+            ):
+                continue
+            for next_dims in predicted:
+                request = layer._slicing_state._make_slice_request(next_dims)
+                cache = getattr(request, 'cache', None)
+                if cache is None or not cache.enabled:
+                    break
+                if request._is_cached():
+                    continue
+                tasks.append(
+                    _LayerSliceTask(
+                        priority=_PREFETCH_PRIORITY,
+                        order=next(self._task_order),
+                        weak_layer=weakref.ref(layer),
+                        request=request,
+                        prefetch=True,
+                    )
+                )
+        if tasks:
+            logger.debug('Prefetching %d slices', len(tasks))
+            with self._lock_futures_dicts:
+                for task in tasks:
+                    self._enqueue(task)
+            self._start_pending_tasks()
+
+    def _enqueue(self, task: _LayerSliceTask) -> None:
+        """Adds a task to the queue, cancelling the pending task it replaces."""
+        with self._lock_futures_dicts:
+            if replaced := self._pending_tasks.pop(task.key, None):
+                logger.debug('Cancelling task %s', id(replaced.future))
+                replaced.future.cancel()
+            self._pending_tasks[task.key] = task
+            heapq.heappush(self._queue, task)
+
+    def _start_pending_tasks(self) -> None:
+        """Starts the highest priority pending tasks while workers are free.
+
+        A task is only started if no other task of the same layer is running,
+        so that the responses of a layer are always emitted in order.
+        Prefetch tasks only use up to half of the workers, so that they
+        cannot delay slicing of what is displayed for long.
+        Can be called from the main or slicing thread.
+        """
+        with self._lock_futures_dicts:
+            blocked = []
+            max_prefetch = max(1, self._max_workers // 2)
+            n_prefetch = sum(t.prefetch for t in self._running_tasks.values())
+            while (
+                self._queue
+                and not self._is_shutdown
+                and len(self._running_tasks) < self._max_workers
+            ):
+                task = heapq.heappop(self._queue)
+                if self._pending_tasks.get(task.key) is not task:
+                    # Replaced by a newer task.
+                    continue
+                if task.key in self._running_tasks or (
+                    task.prefetch and n_prefetch >= max_prefetch
+                ):
+                    blocked.append(task)
+                    continue
+                del self._pending_tasks[task.key]
+                if task.weak_layer() is None:
+                    task.future.cancel()
+                    continue
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                n_prefetch += task.prefetch
+                self._running_tasks[task.key] = task
+                self._executor.submit(self._slice_layer, task)
+            for task in blocked:
+                heapq.heappush(self._queue, task)
+
+    def _slice_layer(self, task: _LayerSliceTask) -> None:
+        """Runs a slice task and sets the result of its future.
+
+        Called on a slicing thread.
+        """
+        try:
+            if task.prefetch:
+                # The request stores its response in its cache.
+                task.request()
+                result = {}
+            else:
+                if hasattr(task.request, '_previews'):
+                    self._preview_executor.submit(self._slice_previews, task)
+                result = self._slice_layers(
+                    {task.weak_layer: task.request}, task
+                )
+        except BaseException as exc:  # noqa: BLE001
+            with task.emit_lock:
+                task.emitted = True
+            self._finish_task(task)
+            task.future.set_exception(exc)
+        else:
+            self._finish_task(task)
+            task.future.set_result(result)
+
+    def _slice_previews(self, task: _LayerSliceTask) -> None:
+        """Slices and emits the previews of a running task's request.
+
+        Requests can define a ``_previews`` method that returns cheaper
+        requests (e.g. at coarser resolutions) whose responses are shown
+        while the task's request runs. Each preview is emitted once done.
+        Stops when the response of the task was emitted, or when the task
+        is superseded by a newer pending task for the same layer.
+
+        Called on a preview thread.
+        """
+        for preview in task.request._previews():
+            if self._preview_dropped(task):
+                return
+            response = preview()
+            with task.emit_lock:
+                if self._preview_dropped(task):
+                    return
+                self.events.ready(value={task.weak_layer: response})
+
+    def _preview_dropped(self, task: _LayerSliceTask) -> bool:
+        """Whether the previews of a task should no longer be emitted."""
+        if task.emitted:
+            return True
+        with self._lock_futures_dicts:
+            return task.key in self._pending_tasks
+
+    def _finish_task(self, task: _LayerSliceTask) -> None:
+        """Frees the worker of a task and starts the next pending tasks."""
+        with self._lock_futures_dicts:
+            if self._running_tasks.get(task.key) is task:
+                del self._running_tasks[task.key]
+        self._start_pending_tasks()
+
+    def _slice_layers(self, requests: dict, task: _LayerSliceTask) -> dict:
         """
         Iterates through a dictionary of request objects and call the slice
         on each individual layer. Can be called from the main or slicing thread.
@@ -277,6 +639,9 @@ class _LayerSlicer:
         ----------
         requests: dict[Layer, SliceRequest]
             Dictionary of request objects to be used for constructing the slice
+        task: _LayerSliceTask
+            The task of the requests, whose previews are no longer emitted
+            once the result is emitted.
 
         Returns
         -------
@@ -284,35 +649,31 @@ class _LayerSlicer:
         """
         logger.debug('_LayerSlicer._slice_layers: %s', requests)
         result = {layer: request() for layer, request in requests.items()}
-        self.events.ready(value=result)
+        with task.emit_lock:
+            task.emitted = True
+            self.events.ready(value=result)
         return result
 
-    def _on_slice_done(self, task: Future[dict]) -> None:
+    def _on_slice_done(
+        self, layer_task: _LayerSliceTask, task: Future[dict]
+    ) -> None:
         """
-        This is the "done_callback" which is added to each task.
+        This is the "done_callback" which is added to each layer task.
         Can be called from the main or slicing thread.
         """
         logger.debug('_LayerSlicer._on_slice_done: %s', id(task))
-        with self._lock_futures_dicts:
-            requests = self._task_to_requests.pop(task, None)
-
-        if not self._try_to_remove_task(task):
-            logger.debug('Task not found: %s', id(task))
-
         if task.cancelled():
             logger.debug('Cancelled task: %s', id(task))
             return
 
         if exception := task.exception():
             logger.debug('Task failed: %s', id(task))
-            if requests:
-                for weak_layer, request in requests.items():
-                    if layer := weak_layer():
-                        # Mark the failed request as complete so layers don't
-                        # remain forever "loading" after an exception.
-                        layer._slicing_state._update_loaded_slice_id(
-                            request.id
-                        )
+            if layer := layer_task.weak_layer():
+                # Mark the failed request as complete so layers don't
+                # remain forever "loading" after an exception.
+                layer._slicing_state._update_loaded_slice_id(
+                    layer_task.request.id
+                )
 
             from napari.utils.notifications import notification_manager
 
@@ -333,23 +694,49 @@ class _LayerSlicer:
                 if v_task == task:
                     del self._layers_to_task[k_layers]
                     return True
+        logger.debug('Task not found: %s', id(task))
         return False
 
-    def _find_existing_task(
-        self, layers: Iterable[Layer]
-    ) -> Future[dict] | None:
-        """Find the task associated with a list of layers. Returns the first
-        task found for which the layers of the task are a subset of the input
-        layers.
 
-        This function provides a lock to ensure that the layers_to_task dict
-        is unmodified during this process.
-        """
-        with self._lock_futures_dicts:
-            layer_set = set(layers)
-            for weak_task_layers, task in self._layers_to_task.items():
-                task_layers = {w() for w in weak_task_layers} - {None}
-                if task_layers.issubset(layer_set):
-                    logger.debug('Found existing task for %s', task_layers)
-                    return task
-        return None
+def _gather_responses(futures: list[Future[dict]]) -> Future[dict]:
+    """Combines the futures of several layer tasks into one future.
+
+    The result of the returned future merges the results of all the layer
+    tasks that were not cancelled. It is cancelled if all the layer tasks are
+    cancelled, and it fails with the first exception raised by a layer task.
+    Cancelling the returned future cancels the layer tasks that did not start.
+    """
+    combined: Future[dict] = Future()
+    lock = RLock()
+    remaining = len(futures)
+
+    def _on_layer_done(_: Future[dict]) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining > 0 or combined.done():
+                return
+        done = [f for f in futures if not f.cancelled()]
+        try:
+            if not done:
+                combined.cancel()
+            elif exceptions := [f.exception() for f in done if f.exception()]:
+                combined.set_exception(exceptions[0])
+            else:
+                result: dict = {}
+                for f in done:
+                    result.update(f.result())
+                combined.set_result(result)
+        except InvalidStateError:
+            # The combined future was cancelled concurrently.
+            pass
+
+    def _on_combined_done(_: Future[dict]) -> None:
+        if combined.cancelled():
+            for f in futures:
+                f.cancel()
+
+    combined.add_done_callback(_on_combined_done)
+    for f in futures:
+        f.add_done_callback(_on_layer_done)
+    return combined
@@ -9,12 +9,15 @@ import pytest
 
 from napari._tests.utils import DEFAULT_TIMEOUT_SECS, LockableData
 from napari.components import Dims
-from napari.components._layer_slicer import _LayerSlicer
+from napari.components._layer_slicer import _LayerSlicer, _SlicePrefetcher
 from napari.layers import Image, Labels, Points
+from napari.settings import get_settings
+from napari.utils._slice_cache import _SLICE_CACHE
 from napari.utils.notifications import notification_manager
 
 if TYPE_CHECKING:
     import weakref
+    from collections.abc import Callable
 
 # The following fakes are used to control execution of slicing across
 # multiple threads, while also allowing us to mimic real classes
@@ -249,6 +252,237 @@ def test_submit_task_to_layers_lock(layer_slicer):
     assert task not in layer_slicer._layers_to_task
 
 
+def test_submit_blocked_layer_does_not_block_other_layers(layer_slicer):
+    """ensure that a slow layer does not delay slicing of other layers"""
+    dims = Dims()
+    slow_layer = FakeAsyncLayer()
+    fast_layer = FakeAsyncLayer()
+
+    with slow_layer.lock:
+        blocked = layer_slicer.submit(
+            layers=[slow_layer, fast_layer], dims=dims
+        )
+        fast = layer_slicer.submit(layers=[fast_layer], dims=dims)
+        assert _wait_for_response(fast)[fast_layer].id == 2
+        assert not blocked.done()
+
+    result = _wait_for_response(blocked)
+    assert result[slow_layer].id == 1
+    assert result[fast_layer].id == 1
+
+
+def test_submit_same_layer_runs_one_task_at_a_time(layer_slicer):
+    dims = Dims()
+    layer = FakeAsyncLayer()
+
+    with layer.lock:
+        running = layer_slicer.submit(layers=[layer], dims=dims)
+        _wait_until_running(running)
+        pending = layer_slicer.submit(layers=[layer], dims=dims)
+        assert not pending.running()
+        assert not running.done()
+
+    assert _wait_for_response(running)[layer].id == 1
+    assert _wait_for_response(pending)[layer].id == 2
+
+
+def test_submit_selected_layers_first():
+    layer_slicer = _LayerSlicer(max_workers=1)
+    layer_slicer._force_sync = False
+    dims = Dims()
+    blocking_layer = FakeAsyncLayer()
+    layer = FakeAsyncLayer()
+    selected_layer = FakeAsyncLayer()
+    order = []
+    layer_slicer.events.ready.connect(
+        lambda e: order.extend(ref() for ref in e.value)
+    )
+
+    with blocking_layer.lock:
+        blocked = layer_slicer.submit(layers=[blocking_layer], dims=dims)
+        _wait_until_running(blocked)
+        future = layer_slicer.submit(
+            layers=[layer, selected_layer],
+            dims=dims,
+            selected=[selected_layer],
+        )
+
+    _wait_for_result(future)
+    assert order == [blocking_layer, selected_layer, layer]
+    layer_slicer.shutdown()
+
+
+def test_cancel_combined_future_cancels_pending_layers():
+    layer_slicer = _LayerSlicer(max_workers=1)
+    layer_slicer._force_sync = False
+    dims = Dims()
+    blocking_layer = FakeAsyncLayer()
+    layer1 = FakeAsyncLayer()
+    layer2 = FakeAsyncLayer()
+    sliced = []
+    layer_slicer.events.ready.connect(
+        lambda e: sliced.extend(ref() for ref in e.value)
+    )
+
+    with blocking_layer.lock:
+        blocked = layer_slicer.submit(layers=[blocking_layer], dims=dims)
+        _wait_until_running(blocked)
+        pending = layer_slicer.submit(layers=[layer1, layer2], dims=dims)
+        assert pending.cancel()
+
+    layer_slicer.wait_until_idle(timeout=DEFAULT_TIMEOUT_SECS)
+    assert sliced == [blocking_layer]
+    layer_slicer.shutdown()
+
+
+def test_prefetcher_predicts_along_stepped_axis():
+    prefetcher = _SlicePrefetcher()
+    dims = Dims(ndim=3, range=((0, 5, 1), (0, 9, 1), (0, 9, 1)))
+    assert prefetcher.predict(dims, max_points=2) == []
+
+    dims.point = (1, 0, 0)
+    predicted = prefetcher.predict(dims, max_points=2)
+    assert [d.point for d in predicted] == [(2, 0, 0), (3, 0, 0)]
+
+    dims.point = (3, 0, 0)
+    predicted = prefetcher.predict(dims, max_points=2)
+    assert [d.point for d in predicted] == [(5, 0, 0)]
+
+    dims.point = (4, 0, 0)
+    predicted = prefetcher.predict(dims, max_points=3)
+    assert [d.point for d in predicted] == [(5, 0, 0)]
+
+
+def test_prefetcher_ignores_displayed_and_multi_axis_changes():
+    prefetcher = _SlicePrefetcher()
+    dims = Dims(ndim=3, range=((0, 5, 1), (0, 9, 1), (0, 9, 1)))
+    prefetcher.predict(dims, max_points=2)
+
+    dims.point = (0, 1, 0)
+    assert prefetcher.predict(dims, max_points=2) == []
+
+    dims.point = (1, 2, 0)
+    assert prefetcher.predict(dims, max_points=2) == []
+
+
+def test_submit_prefetches_next_planes_into_cache(layer_slicer):
+    settings = get_settings()
+    settings.experimental.slice_cache_size = 0.1
+    settings.experimental.slice_prefetch_planes = 2
+    _SLICE_CACHE.clear()
+    data = np.random.random((6, 8, 8))
+    layer = Image(data)
+    dims = Dims(ndim=3, range=tuple((0, s - 1, 1) for s in data.shape))
+    try:
+        layer_slicer.submit(layers=[layer], dims=dims)
+        dims.point = (1, 0, 0)
+        layer_slicer.submit(layers=[layer], dims=dims)
+        _wait_until_prefetched(layer_slicer)
+
+        hits = _SLICE_CACHE.hits
+        for point in (2, 3):
+            dims.point = (point, 0, 0)
+            response = layer._slicing_state._make_slice_request(dims)()
+            np.testing.assert_array_equal(response.image.raw, data[point])
+        assert _SLICE_CACHE.hits == hits + 2
+    finally:
+        settings.experimental.slice_cache_size = 0
+
+
+def test_submit_does_not_prefetch_cached_tiles(layer_slicer, monkeypatch):
+    settings = get_settings()
+    settings.experimental.slice_cache_size = 0.1
+    settings.experimental.tiled_multiscale = True
+    _SLICE_CACHE.clear()
+    data = [np.random.random((4, 64, 64)), np.random.random((4, 32, 32))]
+    layer = Image(data, multiscale=True)
+    layer._data_level = 0
+    layer.corner_pixels = np.array([[0, 0, 0], [3, 63, 63]])
+    dims = Dims(ndim=3, range=((0, 3, 1), (0, 63, 1), (0, 63, 1)))
+    next_dims = Dims(ndim=3, range=dims.range, point=(1, 0, 0))
+    monkeypatch.setattr(
+        layer_slicer._prefetcher, 'predict', lambda *args: [next_dims]
+    )
+    try:
+        layer_slicer._submit_prefetch([layer], dims)
+        _wait_until_prefetched(layer_slicer)
+        assert layer._slicing_state._make_slice_request(next_dims)._is_cached()
+
+        layer_slicer._submit_prefetch([layer], dims)
+        assert not layer_slicer._pending_tasks
+        assert not layer_slicer._running_tasks
+    finally:
+        settings.experimental.slice_cache_size = 0
+        settings.experimental.tiled_multiscale = False
+
+
+def test_submit_does_not_prefetch_without_cache(layer_slicer):
+    layer = Image(np.random.random((6, 8, 8)))
+    dims = Dims(ndim=3, range=((0, 5, 1), (0, 7, 1), (0, 7, 1)))
+    layer_slicer.submit(layers=[layer], dims=dims)
+    dims.point = (1, 0, 0)
+    layer_slicer.submit(layers=[layer], dims=dims)
+    assert not any(t.prefetch for t in layer_slicer._pending_tasks.values())
+    assert not any(t.prefetch for t in layer_slicer._running_tasks.values())
+
+
+def test_submit_emits_coarser_levels_while_level_loads(layer_slicer):
+    data = [np.random.random((s, s)) for s in (256, 128, 64)]
+    lockable_data = LockableData(data[0])
+    layer = Image([lockable_data, *data[1:]], multiscale=True)
+    layer._data_level = 0
+    layer.corner_pixels = np.array([[0, 0], [255, 255]])
+    dims = Dims(ndim=2, range=((0, 255, 1), (0, 255, 1)))
+    responses = []
+    layer_slicer.events.ready.connect(
+        lambda event: responses.extend(event.value.values())
+    )
+
+    with lockable_data.lock:
+        future = layer_slicer.submit(layers=[layer], dims=dims)
+        _wait_until(lambda: len(responses) == 2)
+    final = _wait_for_response(future)[layer]
+
+    assert [r.image.raw.shape for r in responses] == [
+        (64, 64),
+        (128, 128),
+        (256, 256),
+    ]
+    assert responses[-1] is final
+    assert len({r.request_id for r in responses}) == 3
+    np.testing.assert_array_equal(responses[0].image.raw, data[2])
+
+
+@dataclass(frozen=True)
+class FakePreviewedSliceRequest(FakeSliceRequest):
+    previews: tuple[FakeSliceRequest, ...] = ()
+
+    def _previews(self):
+        yield from self.previews
+
+
+def test_submit_drops_previews_done_after_response(layer_slicer, monkeypatch):
+    layer = FakeAsyncLayer()
+    preview_lock = RLock()
+    request = FakePreviewedSliceRequest(
+        id=1,
+        lock=layer.lock,
+        previews=(FakeSliceRequest(id=-1, lock=preview_lock),),
+    )
+    monkeypatch.setattr(layer, '_make_slice_request', lambda dims: request)
+    responses = []
+    layer_slicer.events.ready.connect(
+        lambda event: responses.extend(event.value.values())
+    )
+
+    with preview_lock:
+        future = layer_slicer.submit(layers=[layer], dims=Dims())
+        assert _wait_for_response(future)[layer].id == 1
+    layer_slicer._preview_executor.shutdown(wait=True)
+
+    assert [r.id for r in responses] == [1]
+
+
 def test_submit_exception_main_thread(layer_slicer):
     """Exception is raised on the main thread from an error on the main
     thread immediately when the task is created."""
@@ -415,6 +649,38 @@ def test_submit_after_shutdown_raises():
         layer_slicer.submit(layers=[FakeAsyncLayer()], dims=Dims())
 
 
+def _wait_until_prefetched(layer_slicer: _LayerSlicer):
+    """Waits until the given slicer has no prefetch task left."""
+    sleep_secs = 0.01
+    total_sleep_secs = 0
+    while any(
+        t.prefetch
+        for t in (
+            *layer_slicer._pending_tasks.values(),
+            *layer_slicer._running_tasks.values(),
+        )
+    ):
+        time.sleep(sleep_secs)
+        total_sleep_secs += sleep_secs
+        if total_sleep_secs > DEFAULT_TIMEOUT_SECS:
+            raise TimeoutError(
+                f'Prefetching did not complete after a timeout of {DEFAULT_TIMEOUT_SECS} seconds.'
+            )
+
+
+def _wait_until(condition: 'Callable[[], bool]'):
+    """Waits until the given condition is true using a default finite timeout."""
+    sleep_secs = 0.01
+    total_sleep_secs = 0
+    while not condition():
+        time.sleep(sleep_secs)
+        total_sleep_secs += sleep_secs
+        if total_sleep_secs > DEFAULT_TIMEOUT_SECS:
+            raise TimeoutError(
+                f'Condition was not met after a timeout of {DEFAULT_TIMEOUT_SECS} seconds.'
+            )
+
+
 def _wait_until_running(future: Future):
     """Waits until the given future is running using a default finite timeout."""
     sleep_secs = 0.01
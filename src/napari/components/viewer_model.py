@@ -690,7 +690,10 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
     def _on_layer_reload(self, event: Event) -> None:
         self.dims.units = self.layers.extent.units
         self._layer_slicer.submit(
-            layers=[event.layer], dims=self.dims, force=True
+            layers=[event.layer],
+            dims=self.dims,
+            force=True,
+            selected=self.layers.selection,
         )
 
     def _update_layers(self, *, layers=None):
@@ -703,7 +706,9 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         """
         layers = layers or self.layers
         self.dims.units = self.layers.extent.units
-        self._layer_slicer.submit(layers=layers, dims=self.dims)
+        self._layer_slicer.submit(
+            layers=layers, dims=self.dims, selected=self.layers.selection
+        )
         # If the currently selected layer is sliced asynchronously, then the value
         # shown with this position may be incorrect. See the discussion for more details:
         # https://github.com/napari/napari/pull/5377#discussion_r1036280855
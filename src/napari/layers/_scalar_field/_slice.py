@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import itertools
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -15,10 +16,12 @@ from napari.utils.misc import reorder_after_dim_reduction
 from napari.utils.transforms import Affine
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from numpy.typing import DTypeLike
 
+    from napari.utils._slice_cache import _SliceCache
+
 
 @dataclass(frozen=True)
 class _ScalarFieldView:
@@ -61,6 +64,140 @@ class _ScalarFieldView:
         return cls(raw=raw, view=view)
 
 
+#: Approximate size, in pixels along each axis, of the tiles in which 2D
+#: multiscale images are loaded when tiled loading is enabled.
+_TILE_SIZE = 512
+
+
+def _chunk_aligned_tile_shape(
+    data: ArrayLike, tile_size: int = _TILE_SIZE
+) -> tuple[int, ...]:
+    """Return the shape of the tiles in which to load one level of *data*.
+
+    Along each axis, the tile size is the multiple of the chunk size of the
+    data that is closest to (and not larger than) ``tile_size``, or the chunk
+    size itself if it is larger, so that each tile reads whole chunks.
+    Unchunked data (e.g. numpy arrays) is tiled with ``tile_size``.
+    """
+    chunks = getattr(data, 'chunks', None)
+    tile_shape = []
+    for axis in range(len(data.shape)):
+        chunk = chunks[axis] if chunks is not None else None
+        if isinstance(chunk, tuple):
+            # dask and xarray give all the chunk sizes along an axis
+            chunk = chunk[0] if chunk else None
+        if not chunk:
+            tile_shape.append(tile_size)
+        else:
+            tile_shape.append(int(chunk) * max(1, tile_size // int(chunk)))
+    return tuple(tile_shape)
+
+
+#: Maximum number of bins of the histograms of slices of data that is not
+#: 8-bit (which has one bin per value).
+_HISTOGRAM_BINS = 1024
+
+
+@dataclass(frozen=True)
+class _SliceHistogram:
+    """Histogram of the finite values of an image slice.
+
+    8-bit data has one bin per possible value. Other data has at most
+    ``_HISTOGRAM_BINS`` bins between the minimum and maximum values of the
+    slice, whose width is a whole number for integer data.
+
+    Attributes
+    ----------
+    counts : np.ndarray
+        The number of values in each bin.
+    bin_edges : np.ndarray
+        The ``len(counts) + 1`` edges of the bins.
+    min : float
+        The minimum finite value.
+    max : float
+        The maximum finite value.
+    """
+
+    counts: np.ndarray = field(repr=False)
+    bin_edges: np.ndarray = field(repr=False)
+    min: float
+    max: float
+
+    @classmethod
+    def from_data(cls, data: np.ndarray) -> _SliceHistogram | None:
+        """Returns the histogram of data, or None if it has no finite values."""
+        data = np.asarray(data)
+        if data.dtype == bool:
+            data = data.view(np.uint8)
+        if data.size == 0 or data.dtype.kind not in 'uif':
+            return None
+        values = data.ravel()
+        if data.dtype.itemsize == 1 and data.dtype.kind in 'ui':
+            start = int(np.iinfo(data.dtype).min)
+            # shift int8 values to [0, 255] without changing their order
+            counts = np.bincount(
+                values.view(np.uint8) ^ np.uint8(-start), minlength=256
+            )
+            bin_edges = np.arange(start, start + 257)
+            nonzero = np.flatnonzero(counts)
+            return cls(
+                counts,
+                bin_edges,
+                float(bin_edges[nonzero[0]]),
+                float(bin_edges[nonzero[-1]]),
+            )
+        if data.dtype.kind in 'ui':
+            low, high = int(values.min()), int(values.max())
+            width = max(1, -(-(high - low + 1) // _HISTOGRAM_BINS))
+            nbins = -(-(high - low + 1) // width)
+            # offsets from low computed modulo 2**64, which is exact as the
+            # range of 64-bit values fits in 64 unsigned bits
+            offsets = values.astype(np.uint64) - np.uint64(low % 2**64)
+            counts = np.bincount(
+                (offsets // np.uint64(width)).astype(np.intp), minlength=nbins
+            )
+            bin_edges = low + width * np.arange(nbins + 1, dtype=np.float64)
+            return cls(counts, bin_edges, float(low), float(high))
+        low, high = np.min(values), np.max(values)
+        if not (np.isfinite(low) and np.isfinite(high)):
+            values = values[np.isfinite(values)]
+            if values.size == 0:
+                return None
+            low, high = np.min(values), np.max(values)
+        counts, bin_edges = np.histogram(
+            values, bins=_HISTOGRAM_BINS, range=(low, high)
+        )
+        return cls(counts, bin_edges, float(low), float(high))
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0 to 100) of the values.
+
+        Values are assumed to be uniformly distributed within each bin.
+        """
+        cumulative = np.cumsum(self.counts)
+        target = q / 100 * cumulative[-1]
+        i = min(
+            int(np.searchsorted(cumulative, target, side='left')),
+            len(self.counts) - 1,
+        )
+        before = cumulative[i - 1] if i > 0 else 0
+        fraction = (target - before) / self.counts[i] if self.counts[i] else 0
+        value = self.bin_edges[i] + fraction * (
+            self.bin_edges[i + 1] - self.bin_edges[i]
+        )
+        return float(np.clip(value, self.min, self.max))
+
+    def data_range(self) -> tuple[float, float]:
+        """Returns the range of the values, or [0, 1] if they are all equal.
+
+        This is the same range as the one returned by ``calc_data_range``
+        for the data of the slice.
+        """
+        if self.min == self.max:
+            return min(self.min, 0), max(self.max, 1)
+        return self.min, self.max
+
+
 @dataclass(frozen=True)
 class _ScalarFieldSliceResponse:
     """Contains all the output data of slicing an image layer.
@@ -79,6 +216,19 @@ class _ScalarFieldSliceResponse:
         Describes the slicing plane or bounding box in the layer's dimensions.
     request_id : int
         The identifier of the request from which this was generated.
+    tile_shape : tuple of int or None
+        For tiled multiscale slices, the shape of the tiles of the image,
+        in the order of the image axes. None otherwise.
+    tile_origin : tuple of int or None
+        For tiled multiscale slices, the position of the image in the pixels
+        of the data level, in the order of the image axes. It is a multiple
+        of ``tile_shape``. None otherwise.
+    histogram : _SliceHistogram or None
+        The histogram of the raw sliced image, if it was requested and the
+        image has finite values. None otherwise.
+    data_level : int or None
+        For multiscale slices, the level of the data the image was sliced
+        from. None otherwise.
     """
 
     image: _ScalarFieldView = field(repr=False)
@@ -87,6 +237,10 @@ class _ScalarFieldSliceResponse:
     slice_input: _SliceInput
     request_id: int
     empty: bool = False
+    tile_shape: tuple[int, ...] | None = None
+    tile_origin: tuple[int, ...] | None = None
+    histogram: _SliceHistogram | None = field(default=None, repr=False)
+    data_level: int | None = None
 
     @classmethod
     def make_empty(
@@ -172,8 +326,20 @@ class _ScalarFieldSliceResponse:
             slice_input=self.slice_input,
             request_id=self.request_id,
             empty=self.empty,
+            tile_shape=self.tile_shape,
+            tile_origin=self.tile_origin,
+            histogram=self.histogram,
+            data_level=self.data_level,
         )
 
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the raw sliced image and thumbnail."""
+        nbytes = self.image.raw.nbytes
+        if self.thumbnail.raw is not self.image.raw:
+            nbytes += self.thumbnail.raw.nbytes
+        return nbytes
+
 
 @dataclass(frozen=True)
 class _ScalarFieldSliceRequest:
@@ -202,6 +368,20 @@ class _ScalarFieldSliceRequest:
         See the corresponding attributes in `Layer` and `Image`.
     id : int
         The identifier of this slice request.
+    cache : _SliceCache or None
+        The cache in which responses are looked up and stored, if any.
+    cache_owner : int
+        Identifies the current data of the layer in the cache keys.
+    tile_shape : tuple of int or None
+        If not None, 2D multiscale slices are loaded in tiles of this shape
+        (per layer dimension), which are looked up and stored individually
+        in the cache.
+    coarser_levels : tuple of array-like
+        The data of the levels coarser than ``data_level`` that can be shown
+        while this slice loads, from finest to coarsest (the last one being
+        ``data_at_thumbnail_level``). Empty if no previews should be shown.
+    histogram : bool
+        If True, the histogram of the sliced image is also computed.
     """
 
     slice_input: _SliceInput
@@ -219,6 +399,11 @@ class _ScalarFieldSliceRequest:
     level_shapes: np.ndarray = field(repr=False)
     downsample_factors: np.ndarray = field(repr=False)
     id: int = field(default_factory=_next_request_id)
+    cache: _SliceCache | None = field(default=None, repr=False)
+    cache_owner: int = field(default=-1, repr=False)
+    tile_shape: tuple[int, ...] | None = field(default=None, repr=False)
+    coarser_levels: tuple[Any, ...] = field(default=(), repr=False)
+    histogram: bool = field(default=False, repr=False)
 
     def __call__(self) -> _ScalarFieldSliceResponse:
         if self._slice_out_of_bounds():
@@ -228,12 +413,157 @@ class _ScalarFieldSliceRequest:
                 request_id=self.id,
                 dtype=self.dtype,
             )
+        cache = self.cache
+        if cache is not None and (not cache.enabled or self._tiled):
+            # Tiled slices are cached tile by tile instead.
+            cache = None
+        if cache is not None:
+            key = self._cache_key()
+            if (cached := cache.get(key)) is not None:
+                # nearby points share cache entries, so the slice input of
+                # the cached response may be that of another request
+                return self._with_histogram(
+                    replace(
+                        cached,
+                        request_id=self.id,
+                        slice_input=self.slice_input,
+                    )
+                )
         with self.dask_indexer():
-            return (
+            response = (
                 self._call_multi_scale()
                 if self.multiscale
                 else self._call_single_scale()
             )
+        response = self._with_histogram(response)
+        if cache is not None:
+            cache.put(key, response, response.nbytes)
+        return response
+
+    def _with_histogram(
+        self, response: _ScalarFieldSliceResponse
+    ) -> _ScalarFieldSliceResponse:
+        """Adds the histogram of the image to response, if requested."""
+        if not self.histogram or response.histogram is not None:
+            return response
+        return replace(
+            response,
+            histogram=_SliceHistogram.from_data(response.image.raw),
+        )
+
+    def _previews(self) -> Iterator[_ScalarFieldSliceRequest]:
+        """Requests of coarser levels to show while this slice loads.
+
+        The first request is for the finest coarser level that is in the
+        cache, or for the thumbnail level, which is the smallest. The
+        following ones refine through the levels in between, down to
+        (excluding) the level of this request. They are meant to be sliced
+        alongside this request, so that they do not delay it. Nothing is
+        yielded if this slice is cached itself.
+        """
+        if not self.coarser_levels or self._is_cached():
+            return
+        previews = []
+        for offset, data in enumerate(self.coarser_levels, start=1):
+            preview = self._at_level(self.data_level + offset, data)
+            previews.append(preview)
+            if preview._is_cached():
+                break
+        yield from reversed(previews)
+
+    def _at_level(self, level: int, data: Any) -> _ScalarFieldSliceRequest:
+        """A request for the same field of view at another level."""
+        factor = (
+            self.downsample_factors[self.data_level]
+            / self.downsample_factors[level]
+        )
+        max_pixels = np.asarray(self.level_shapes[level]) - 1
+        corner_pixels = np.stack(
+            [
+                np.clip(
+                    np.floor(self.corner_pixels[0] * factor), 0, max_pixels
+                ),
+                np.clip(
+                    np.ceil((self.corner_pixels[1] + 1) * factor) - 1,
+                    0,
+                    max_pixels,
+                ),
+            ]
+        ).astype(self.corner_pixels.dtype)
+        return replace(
+            self,
+            data_at_data_level=data,
+            data_level=level,
+            corner_pixels=corner_pixels,
+            tile_shape=(
+                _chunk_aligned_tile_shape(data)
+                if self.tile_shape is not None
+                else None
+            ),
+            coarser_levels=(),
+            id=_next_request_id(),
+        )
+
+    def _is_cached(self) -> bool:
+        """True if the response of this request is in its cache."""
+        if self.cache is None or not self.cache.enabled:
+            return False
+        if not self._tiled:
+            return self._cache_key() in self.cache
+        start, stop = self._tile_aligned_bounds(
+            self.corner_pixels[0], self.corner_pixels[1] + 1
+        )
+        key_prefix = self._tile_key_prefix(
+            self._thick_slice_at_level(self.data_level)
+        )
+        return all(
+            (*key_prefix, tile_start) in self.cache
+            for tile_start, _ in self._tiles(start, stop)
+        )
+
+    @property
+    def _tiled(self) -> bool:
+        """True if this request loads a multiscale slice in tiles."""
+        return (
+            self.multiscale
+            and self.tile_shape is not None
+            and self.slice_input.ndisplay == 2
+        )
+
+    def _cache_key(self) -> tuple:
+        """Key identifying the response of this request in a slice cache.
+
+        The not displayed dimensions are identified by the data indices they
+        resolve to, so that nearby dims points that fetch the same plane
+        share an entry.
+        """
+        corner_pixels = (
+            self.corner_pixels.tobytes()
+            if self.multiscale and self.slice_input.ndisplay == 2
+            else None
+        )
+        return (
+            self.cache_owner,
+            self.slice_input.order,
+            self.slice_input.ndisplay,
+            self._indices_key(self.data_slice),
+            self.data_level,
+            self.thumbnail_level,
+            corner_pixels,
+            str(self.projection_mode),
+        )
+
+    def _indices_key(self, data_slice: _ThickNDSlice) -> tuple:
+        """The data indices of the not displayed dimensions of a slice."""
+        if self.projection_mode == 'none':
+            slices = self._point_to_slices(data_slice.point)
+        else:
+            slices = self._data_slice_to_slices(
+                data_slice, self.slice_input.displayed
+            )
+        return tuple(
+            (s.start, s.stop) if isinstance(s, slice) else s for s in slices
+        )
 
     def _call_single_scale(self) -> _ScalarFieldSliceResponse:
         order = self._get_order()
@@ -266,14 +596,15 @@ class _ScalarFieldSliceRequest:
 
         translate = np.zeros(self.slice_input.ndim)
         disp_slice = [slice(None) for _ in data.shape]
+        start = self.corner_pixels[0]
+        stop = self.corner_pixels[1] + 1
+        if self._tiled:
+            # expand the field of view to whole tiles
+            start, stop = self._tile_aligned_bounds(start, stop)
         if self.slice_input.ndisplay == 2:
             for d in self.slice_input.displayed:
-                disp_slice[d] = slice(
-                    self.corner_pixels[0, d],
-                    self.corner_pixels[1, d] + 1,
-                    1,
-                )
-            translate = self.corner_pixels[0] * scale
+                disp_slice[d] = slice(start[d], stop[d], 1)
+            translate = start * scale
 
         # This only needs to be a ScaleTranslate but different types
         # of transforms in a chain don't play nicely together right now.
@@ -284,12 +615,14 @@ class _ScalarFieldSliceRequest:
             ndim=self.slice_input.ndim,
         )
 
-        # slice displayed dimensions to get the right tile data
-        data = data[tuple(disp_slice)]
-
-        # project the thick slice
         data_slice = self._thick_slice_at_level(self.data_level)
-        data = self._project_thick_slice(data, data_slice)
+        if self._tiled:
+            data = self._load_tiles(data, data_slice, start, stop)
+        else:
+            # slice displayed dimensions to get the right tile data
+            data = data[tuple(disp_slice)]
+            # project the thick slice
+            data = self._project_thick_slice(data, data_slice)
 
         order = self._get_order()
         data = np.transpose(data, order)
@@ -302,12 +635,115 @@ class _ScalarFieldSliceRequest:
         thumbnail_data = np.transpose(thumbnail_data, order)
         thumbnail = _ScalarFieldView.from_view(thumbnail_data)
 
+        tile_shape = tile_origin = None
+        if self._tiled:
+            assert self.tile_shape is not None
+            displayed = self.slice_input.displayed
+            tile_shape = tuple(int(self.tile_shape[d]) for d in displayed)
+            tile_origin = tuple(int(start[d]) for d in displayed)
+
         return _ScalarFieldSliceResponse(
             image=image,
             thumbnail=thumbnail,
             tile_to_data=tile_to_data,
             slice_input=self.slice_input,
             request_id=self.id,
+            tile_shape=tile_shape,
+            tile_origin=tile_origin,
+            data_level=self.data_level,
+        )
+
+    def _tile_aligned_bounds(
+        self, start: np.ndarray, stop: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Expand the given pixel bounds of the data level to whole tiles."""
+        assert self.tile_shape is not None
+        start = start.copy()
+        stop = stop.copy()
+        level_shape = self.level_shapes[self.data_level]
+        for d in self.slice_input.displayed:
+            size = self.tile_shape[d]
+            start[d] = start[d] // size * size
+            stop[d] = min(-(-stop[d] // size) * size, level_shape[d])
+        return start, stop
+
+    def _load_tiles(
+        self,
+        data: ArrayLike,
+        data_slice: _ThickNDSlice,
+        start: np.ndarray,
+        stop: np.ndarray,
+    ) -> np.ndarray:
+        """Load the projected data between start and stop tile by tile.
+
+        Each tile is looked up in the cache first, so that panning or
+        zooming back only loads the tiles that were not seen recently.
+        """
+        cache = self.cache
+        if cache is not None and not cache.enabled:
+            cache = None
+        # Projection removes the not displayed dimensions, so the displayed
+        # ones remain in increasing order.
+        displayed = sorted(self.slice_input.displayed)
+        key_prefix = self._tile_key_prefix(data_slice)
+        out = None
+        for tile_start, tile_stop in self._tiles(start, stop):
+            key = (*key_prefix, tile_start)
+            tile = cache.get(key) if cache is not None else None
+            if tile is None:
+                tile_slice = [slice(None)] * len(start)
+                for d, s, e in zip(
+                    displayed, tile_start, tile_stop, strict=True
+                ):
+                    tile_slice[d] = slice(s, e)
+                tile = self._project_thick_slice(
+                    data[tuple(tile_slice)], data_slice
+                )
+                if cache is not None:
+                    cache.put(key, tile, tile.nbytes)
+            if out is None:
+                shape = tuple(stop[d] - start[d] for d in displayed)
+                out = np.empty(
+                    shape + tile.shape[len(displayed) :], tile.dtype
+                )
+            out[
+                tuple(
+                    slice(s - start[d], e - start[d])
+                    for s, e, d in zip(
+                        tile_start, tile_stop, displayed, strict=True
+                    )
+                )
+            ] = tile
+        assert out is not None
+        return out
+
+    def _tiles(
+        self, start: np.ndarray, stop: np.ndarray
+    ) -> Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """The start and stop of the tiles between tile-aligned bounds.
+
+        Both are given along the displayed dimensions, in increasing order.
+        """
+        assert self.tile_shape is not None
+        displayed = sorted(self.slice_input.displayed)
+        for tile_start in itertools.product(
+            *(range(start[d], stop[d], self.tile_shape[d]) for d in displayed)
+        ):
+            tile_stop = tuple(
+                min(s + self.tile_shape[d], stop[d])
+                for s, d in zip(tile_start, displayed, strict=True)
+            )
+            yield tile_start, tile_stop
+
+    def _tile_key_prefix(self, data_slice: _ThickNDSlice) -> tuple:
+        """The start of the cache keys of the tiles of a slice."""
+        return (
+            self.cache_owner,
+            'tile',
+            self.data_level,
+            tuple(sorted(self.slice_input.displayed)),
+            self._indices_key(data_slice),
+            str(self.projection_mode),
         )
 
     def _thick_slice_at_level(self, level: int) -> _ThickNDSlice:
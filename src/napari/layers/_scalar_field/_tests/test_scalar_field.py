@@ -1,8 +1,15 @@
 import numpy as np
+import pytest
 
 from napari.components import Dims
 from napari.layers import Image
+from napari.layers._scalar_field._slice import (
+    _chunk_aligned_tile_shape,
+    _SliceHistogram,
+)
 from napari.layers._scalar_field.scalar_field import ScalarFieldBase
+from napari.settings import get_settings
+from napari.utils._slice_cache import _SLICE_CACHE
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_docstring_parent_class_consistency,
@@ -142,3 +149,222 @@ def test_rgb_2d_multiscale_prematerialized():
     assert isinstance(tld, np.ndarray)
     assert tld.shape == (64, 64, 3)
     np.testing.assert_array_equal(tld, data[1])
+
+
+@pytest.fixture
+def slice_cache():
+    settings = get_settings()
+    settings.experimental.slice_cache_size = 0.1
+    _SLICE_CACHE.clear()
+    yield _SLICE_CACHE
+    settings.experimental.slice_cache_size = 0
+
+
+def test_slice_cache_reuses_revisited_planes(slice_cache):
+    data = np.random.random((4, 16, 16))
+    layer = Image(data)
+    slice_cache.clear()
+    dims = Dims(ndim=3, range=tuple((0, s - 1, 1) for s in data.shape))
+    responses = []
+    for point in (0, 1, 0, 0.2):
+        dims.point = (point, 0, 0)
+        request = layer._slicing_state._make_slice_request(dims)
+        responses.append(request())
+        assert responses[-1].request_id == request.id
+
+    assert slice_cache.hits == 2
+    assert slice_cache.misses == 2
+    assert responses[2].image.raw is responses[0].image.raw
+    np.testing.assert_array_equal(responses[3].image.raw, data[0])
+
+
+def test_slice_cache_hit_keeps_slice_input(slice_cache):
+    data = np.random.random((4, 16, 16))
+    layer = Image(data)
+    dims = Dims(ndim=3, range=tuple((0, s - 1, 1) for s in data.shape))
+    for point in (1, 1.2):
+        dims.point = (point, 0, 0)
+        layer._slice_dims(dims)
+    assert slice_cache.hits == 1
+    assert layer._slice_input.world_slice.point == (1.2, 0, 0)
+    assert layer._slice.slice_input.world_slice.point == (1.2, 0, 0)
+
+
+def test_slice_cache_invalidated_on_refresh(slice_cache):
+    data = np.random.random((4, 16, 16))
+    layer = Image(data)
+    dims = Dims(ndim=3, range=tuple((0, s - 1, 1) for s in data.shape))
+    dims.point = (1, 0, 0)
+    layer._slicing_state._make_slice_request(dims)()
+    owner = layer._slicing_state._cache_owner
+    assert any(key[0] == owner for key in slice_cache._entries)
+
+    layer.refresh()
+    assert not any(key[0] == owner for key in slice_cache._entries)
+    slice_cache.clear()
+    layer._slicing_state._make_slice_request(dims)()
+    assert slice_cache.hits == 0
+
+
+def test_slice_cache_kept_on_partial_refresh(slice_cache):
+    data = np.random.random((4, 16, 16))
+    layer = Image(data)
+    owner = layer._slicing_state._cache_owner
+    assert any(key[0] == owner for key in slice_cache._entries)
+
+    # partial refreshes (e.g. after a camera change) do not touch the data
+    layer.refresh(extent=False)
+    assert layer._slicing_state._cache_owner == owner
+
+    # in-place edits must be followed by a full refresh, even a blocked one
+    data[0] = 0
+    with layer._block_refresh():
+        layer.refresh()
+    assert layer._slicing_state._cache_owner != owner
+    layer.refresh()
+    np.testing.assert_array_equal(layer._slice.image.raw, 0)
+
+
+@pytest.fixture
+def tiled_multiscale(slice_cache):
+    settings = get_settings()
+    settings.experimental.tiled_multiscale = True
+    yield slice_cache
+    settings.experimental.tiled_multiscale = False
+
+
+def test_tiled_multiscale_reuses_cached_tiles(tiled_multiscale):
+    data = [np.random.random((2000, 1500)), np.random.random((1000, 750))]
+    layer = Image(data, multiscale=True)
+    layer._data_level = 0
+    layer.corner_pixels = np.array([[100, 600], [700, 1300]])
+    layer.refresh(extent=False)
+    sl = layer._slice
+    assert sl.tile_shape == (512, 512)
+    assert sl.tile_origin == (0, 512)
+    np.testing.assert_array_equal(sl.image.raw, data[0][:1024, 512:1500])
+    np.testing.assert_array_equal(layer._transforms[0].translate, (0, 512))
+
+    # panning within the same tiles does not load anything
+    hits, misses = tiled_multiscale.hits, tiled_multiscale.misses
+    layer.corner_pixels = np.array([[150, 650], [750, 1350]])
+    layer.refresh(extent=False)
+    assert tiled_multiscale.misses == misses
+    assert tiled_multiscale.hits == hits + 4
+
+    # panning to new tiles only loads those
+    layer.corner_pixels = np.array([[600, 650], [1100, 1350]])
+    layer.refresh(extent=False)
+    assert tiled_multiscale.misses == misses + 2
+    np.testing.assert_array_equal(
+        layer._slice.image.raw, data[0][512:1536, 512:1500]
+    )
+
+
+def test_tile_shape_aligned_to_chunks():
+    da = pytest.importorskip('dask.array')
+    data = da.zeros((4, 1000, 3000), chunks=(1, 200, 1024))
+    assert _chunk_aligned_tile_shape(data) == (512, 400, 1024)
+    assert _chunk_aligned_tile_shape(np.zeros((10, 10))) == (512, 512)
+
+
+def test_previews_start_from_cached_level(slice_cache):
+    data = [np.random.random((s, s)) for s in (256, 128, 64, 32)]
+    layer = Image(data, multiscale=True)
+    assert layer._thumbnail_level == 3
+    dims = Dims(ndim=2, range=((0, 255, 1), (0, 255, 1)))
+    layer.corner_pixels = np.array([[0, 0], [255, 255]])
+
+    layer._data_level = 0
+    request = layer._slicing_state._make_slice_request(dims)
+    assert [p.data_level for p in request._previews()] == [3, 2, 1]
+
+    layer._data_level = 2
+    layer.corner_pixels = np.array([[0, 0], [63, 63]])
+    layer._slicing_state._make_slice_request(dims)()
+    layer._data_level = 0
+    layer.corner_pixels = np.array([[0, 0], [255, 255]])
+    request = layer._slicing_state._make_slice_request(dims)
+    previews = list(request._previews())
+    assert [p.data_level for p in previews] == [2, 1]
+    assert previews[0]._is_cached()
+    np.testing.assert_array_equal(previews[1]().image.raw, data[1])
+
+    # nothing to preview once the level itself is cached
+    request()
+    request = layer._slicing_state._make_slice_request(dims)
+    assert list(request._previews()) == []
+
+
+def test_no_preview_at_loaded_level():
+    data = [np.random.random((s, s)) for s in (256, 128, 64)]
+    layer = Image(data, multiscale=True)
+    dims = Dims(ndim=2, range=((0, 255, 1), (0, 255, 1)))
+    layer._data_level = 0
+    layer.corner_pixels = np.array([[0, 0], [127, 127]])
+    layer.refresh(extent=False)
+    assert layer._slice.data_level == 0
+
+    # panning at the level of the current slice
+    layer.corner_pixels = np.array([[100, 100], [227, 227]])
+    request = layer._slicing_state._make_slice_request(dims)
+    assert request.coarser_levels == ()
+
+    # zooming to another level
+    layer._data_level = 1
+    request = layer._slicing_state._make_slice_request(dims)
+    assert len(request.coarser_levels) == 1
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int8, bool])
+def test_slice_histogram_8bit(dtype):
+    data = np.array([[0, 1], [1, 1]], dtype=dtype)
+    histogram = _SliceHistogram.from_data(data)
+    assert histogram.counts.size == 256
+    assert histogram.counts.sum() == 4
+    assert (histogram.min, histogram.max) == (0, 1)
+    assert histogram.data_range() == (0, 1)
+
+
+def test_slice_histogram_wide_integers():
+    data = np.arange(-1000, 5000, 3, dtype=np.int32)
+    histogram = _SliceHistogram.from_data(data)
+    assert histogram.counts.size <= 1024
+    assert histogram.counts.sum() == data.size
+    np.testing.assert_array_equal(np.diff(histogram.bin_edges), 6)
+    assert (histogram.min, histogram.max) == (-1000, 4997)
+    assert histogram.percentile(25) == pytest.approx(
+        np.percentile(data, 25), abs=6
+    )
+
+
+@pytest.mark.parametrize(
+    ('data', 'counts'),
+    [
+        (
+            np.array([[1, 2**63 + 5], [3, 2**64 - 1]], dtype=np.uint64),
+            [2, 1, 1],
+        ),
+        (np.array([-(2**63), 0, 2**63 - 1], dtype=np.int64), [1, 1, 1]),
+    ],
+)
+def test_slice_histogram_full_64bit_range(data, counts):
+    histogram = _SliceHistogram.from_data(data)
+    assert histogram.counts.size == 1024
+    nonzero = np.flatnonzero(histogram.counts)
+    np.testing.assert_array_equal(nonzero, [0, 512, 1023])
+    np.testing.assert_array_equal(histogram.counts[nonzero], counts)
+    assert (histogram.min, histogram.max) == (data.min(), data.max())
+
+
+def test_slice_histogram_floats():
+    data = np.random.default_rng(0).normal(size=(64, 64))
+    data[0, 0] = np.nan
+    histogram = _SliceHistogram.from_data(data)
+    assert histogram.counts.sum() == data.size - 1
+    assert histogram.min == np.nanmin(data)
+    assert histogram.max == np.nanmax(data)
+    assert histogram.percentile(90) == pytest.approx(
+        np.nanpercentile(data, 90), abs=0.01
+    )
+    assert _SliceHistogram.from_data(np.full((2, 2), np.nan)) is None
@@ -12,6 +12,7 @@ from numpy import typing as npt
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
 from napari.layers._scalar_field._slice import (
+    _chunk_aligned_tile_shape,
     _ScalarFieldSliceRequest,
     _ScalarFieldSliceResponse,
 )
@@ -27,9 +28,11 @@ from napari.layers.utils._slice_input import (
     _ThickNDSlice,
 )
 from napari.layers.utils.plane import SlicingPlane
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dask_utils import DaskIndexer
 from napari.utils._dtype import normalize_dtype
+from napari.utils._slice_cache import _SLICE_CACHE, _next_owner_id
 from napari.utils.colormaps import AVAILABLE_COLORMAPS
 from napari.utils.events import Event
 from napari.utils.events.event import WarningEmitter
@@ -326,6 +329,9 @@ class ScalarFieldBase(Layer, ABC):
         # Trigger generation of view slice and thumbnail
         self.refresh()
 
+    def _on_data_refresh(self) -> None:
+        self._slicing_state._invalidate_slice_cache()
+
     def _slice_dtype(self):
         """Return the dtype of the slice view.
 
@@ -724,6 +730,18 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             rgb=len(self.layer.data.shape) != self.ndim,
             dtype=self.layer._slice_dtype(),
         )
+        self._cache_owner = _next_owner_id()
+
+    @property
+    def _compute_histogram(self) -> bool:
+        """Whether slice requests also compute the histogram of the slice."""
+        return False
+
+    def _invalidate_slice_cache(self) -> None:
+        """Drop the cached slices of the current data."""
+        if _SLICE_CACHE.enabled:
+            _SLICE_CACHE.discard_owner(self._cache_owner)
+        self._cache_owner = _next_owner_id()
 
     def _set_view_slice(self):
         request = self._make_slice_request_internal(
@@ -790,6 +808,24 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         else:
             data_at_data_level = data[data_level]
 
+        # previews are only shown when zooming to another level, not when
+        # panning or moving sliders at the level of the current slice
+        coarser_levels: tuple = ()
+        if (
+            self.layer.multiscale
+            and slice_input.ndisplay == 2
+            and data_level < thumbnail_level
+            and data_level != self._slice.data_level
+            and get_settings().experimental.progressive_multiscale
+        ):
+            coarser_levels = (
+                *(
+                    data[level]
+                    for level in range(data_level + 1, thumbnail_level)
+                ),
+                data_at_thumbnail_level,
+            )
+
         return self._slice_request_class(
             slice_input=slice_input,
             data_at_data_level=data_at_data_level,
@@ -805,6 +841,17 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             thumbnail_level=thumbnail_level,
             level_shapes=self.layer.level_shapes,
             downsample_factors=self.layer.downsample_factors,
+            cache=_SLICE_CACHE,
+            cache_owner=self._cache_owner,
+            tile_shape=(
+                _chunk_aligned_tile_shape(data_at_data_level)
+                if self.layer.multiscale
+                and slice_input.ndisplay == 2
+                and get_settings().experimental.tiled_multiscale
+                else None
+            ),
+            coarser_levels=coarser_levels,
+            histogram=self._compute_histogram,
         )
 
     def _update_slice_response(
@@ -1664,6 +1664,18 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         finally:
             self._refresh_blocked = previous
 
+    def _on_data_refresh(self) -> None:
+        """Drop state derived from the layer data before a full refresh.
+
+        Called by ``refresh`` whenever ``data_displayed`` and ``extent`` are
+        both set, even while refreshes are blocked. Code modifying the data
+        in place must follow up with such a full refresh (the default
+        arguments), which is the only notification layers get of the change.
+        Partial refreshes (``extent=False``, e.g. after a change of the
+        displayed style or of the camera) keep the derived state. Layers
+        caching slices, spatial indices or similar override this method.
+        """
+
     def refresh(
         self,
         event: Event | None = None,
@@ -1675,6 +1687,8 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         force: bool = False,
     ) -> None:
         """Refresh all layer data based on current view slice."""
+        if data_displayed and extent:
+            self._on_data_refresh()
         if self._refresh_blocked:
             logger.debug('Layer.refresh blocked: %s', self)
             return
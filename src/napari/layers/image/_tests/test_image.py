@@ -999,6 +999,35 @@ def test_adjust_contrast_limits_range_set_data():
     )
 
 
+def test_keep_auto_contrast_uses_slice_histogram():
+    data = np.arange(3 * 4 * 4, dtype=np.float32).reshape((3, 4, 4))
+    layer = Image(data)
+    layer._keep_auto_contrast = True
+    request = layer._slicing_state._make_slice_request(
+        Dims(ndim=3, range=((0, 2, 1), (0, 3, 1), (0, 3, 1)), point=(2, 0, 0))
+    )
+    response = request()
+    assert response.histogram is not None
+    assert response.histogram.counts.sum() == 16
+    layer._slicing_state._update_slice_response(response)
+    assert layer.contrast_limits == [32, 47]
+
+
+def test_slice_histogram():
+    data = np.zeros((2, 8, 8), dtype=np.uint16)
+    data[1] = np.arange(64).reshape((8, 8)) * 100
+    layer = Image(data)
+    assert layer._slice.histogram is None
+    histogram = layer.slice_histogram
+    assert (histogram.min, histogram.max) == (0, 0)
+    assert layer._slicing_state._slice.histogram is histogram
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    histogram = layer.slice_histogram
+    assert (histogram.min, histogram.max) == (0, 6300)
+    assert histogram.percentile(50) == pytest.approx(3150, abs=100)
+
+
 def test_thick_slice_multiscale():
     data = np.ones((5, 5, 5)) * np.arange(5).reshape(-1, 1, 1)
     data_zoom = data.repeat(2, 0).repeat(2, 1).repeat(2, 2)
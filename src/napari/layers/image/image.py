@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import typing
 import warnings
+from dataclasses import replace
 from typing import Any, Literal, cast
 
 import numpy as np
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
-from napari.layers._scalar_field._slice import _ScalarFieldSliceResponse
+from napari.layers._scalar_field._slice import (
+    _ScalarFieldSliceResponse,
+    _SliceHistogram,
+)
 from napari.layers._scalar_field.scalar_field import (
     ScalarFieldBase,
     ScalarFieldSlicingState,
@@ -25,7 +29,9 @@ from napari.layers.image._image_utils import guess_rgb
 from napari.layers.image._slice import _ImageSliceRequest
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
 from napari.layers.utils.layer_utils import calc_data_range
+from napari.settings import get_settings
 from napari.types import LayerDataType
+from napari.utils._data_range import DataRangeMode
 from napari.utils._dtype import get_dtype_limits, normalize_dtype
 from napari.utils.colormaps import ensure_colormap
 from napari.utils.colormaps.colormap_utils import _coerce_contrast_limits
@@ -568,7 +574,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         if mode == 'data':
             input_data = self.data[-1] if self.multiscale else self.data  # type: ignore[assignment]
         elif mode == 'slice':
-            input_data = self._slice.image.raw  # ugh
+            return self._slice_data_range(self._slice)
         else:
             raise ValueError(
                 trans._(
@@ -578,9 +584,45 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
                 )
             )
         return calc_data_range(
-            cast(LayerDataProtocol, input_data), rgb=self.rgb, dtype=self.dtype
+            cast(LayerDataProtocol, input_data),
+            rgb=self.rgb,
+            dtype=self.dtype,
+            mode=(
+                get_settings().experimental.data_range_mode
+                if mode == 'data'
+                else DataRangeMode.heuristic
+            ),
+        )
+
+    def _slice_data_range(
+        self, response: _ScalarFieldSliceResponse
+    ) -> tuple[float, float]:
+        """Range of the values of a slice, from its histogram if it has one."""
+        if response.histogram is not None and self.dtype != np.uint8:
+            return response.histogram.data_range()
+        data = response.image.raw
+        return calc_data_range(
+            typing.cast(LayerDataProtocol, data),
+            rgb=self.rgb,
+            dtype=self.dtype,
         )
 
+    @property
+    def slice_histogram(self) -> _SliceHistogram | None:
+        """Histogram of the values of the current slice.
+
+        It is computed while slicing if the ``experimental.slice_histogram``
+        setting is on, and on first access otherwise. None if the slice has
+        no finite values.
+        """
+        state = self._slicing_state
+        if state._slice.histogram is None and not state._slice.empty:
+            state._slice = replace(
+                state._slice,
+                histogram=_SliceHistogram.from_data(state._slice.image.raw),
+            )
+        return state._slice.histogram
+
     def _raw_to_displayed(self, raw: np.ndarray) -> np.ndarray:
         """Determine displayed image from raw image.
 
@@ -681,6 +723,14 @@ class _ImageSlicingState(ScalarFieldSlicingState):
     layer: Image
     _slice_request_class = _ImageSliceRequest
 
+    @property
+    def _compute_histogram(self) -> bool:
+        # The histogram gives the range of the slice for auto-contrast.
+        return (
+            get_settings().experimental.slice_histogram
+            or self.layer._keep_auto_contrast
+        )
+
     def _update_slice_response(
         self, response: _ScalarFieldSliceResponse
     ) -> None:
@@ -690,13 +740,7 @@ class _ImageSlicingState(ScalarFieldSlicingState):
         Will be removed as we want to go into multi canvas mode.
         """
         if self.layer._keep_auto_contrast:
-            data = response.image.raw
-            input_data = data[-1] if self.layer.multiscale else data
-            self.layer.contrast_limits = calc_data_range(
-                typing.cast(LayerDataProtocol, input_data),
-                rgb=self.layer.rgb,
-                dtype=self.layer.dtype,
-            )
+            self.layer.contrast_limits = self.layer._slice_data_range(response)
         super()._update_slice_response(response)
         if self.layer._should_calc_clims:
             self.layer.reset_contrast_limits_range()
@@ -0,0 +1,177 @@
+"""Flood fill of chunked labels data that does not fit in memory.
+
+:meth:`napari.layers.Labels.fill` labels the connected components of the
+whole region being edited, which requires loading it entirely. For chunked
+data (e.g. zarr or dask arrays) :func:`_chunked_fill` grows the filled
+component from the seed one chunk at a time instead, passing the elements
+filled on the faces of a chunk to its neighbours as new seeds, so that only
+one chunk is loaded at a time.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.utils._indexing import chunk_bounds
+from napari.utils.progress import progress
+from napari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    import numpy.typing as npt
+
+#: Minimum number of chunks for which a progress bar is shown.
+_PROGRESS_MIN_CHUNKS = 16
+
+
+def _is_chunked(data: Any) -> bool:
+    """Whether data is a lazy array with chunks, e.g. a zarr or dask array."""
+    return (
+        not isinstance(data, np.ndarray)
+        and getattr(data, 'chunks', None) is not None
+    )
+
+
+def _chunked_fill(
+    data: Any,
+    seed: Sequence[int],
+    old_label: int,
+    dims: Sequence[int],
+    contiguous: bool = True,
+) -> Generator[tuple[npt.NDArray[np.intp], ...], None, None]:
+    """Yield the indices of the elements to fill, one chunk at a time.
+
+    The caller must write the new label at the yielded indices before
+    resuming the generator: chunks are read again when the filled component
+    comes back to them, and the elements already filled must not match
+    ``old_label`` anymore.
+
+    Parameters
+    ----------
+    data : array
+        Chunked labels data.
+    seed : sequence of int
+        Index of the element where the fill starts.
+    old_label : int
+        Label of the elements to fill.
+    dims : sequence of int
+        Sorted axes along which to fill. The other axes are fixed at the
+        seed.
+    contiguous : bool
+        If True, only fill the component of ``old_label`` elements connected
+        to the seed, otherwise fill all the ``old_label`` elements.
+
+    Yields
+    ------
+    indices : tuple of arrays of int
+        Indices into data of the elements of a chunk to fill.
+    """
+    bounds = [chunk_bounds(data)[d] for d in dims]
+    grid = tuple(len(b) - 1 for b in bounds)
+
+    def _read(chunk: tuple[int, ...]) -> np.ndarray:
+        index: list[int | slice] = list(seed)
+        for d, b, i in zip(dims, bounds, chunk, strict=True):
+            index[d] = slice(int(b[i]), int(b[i + 1]))
+        return np.asarray(data[tuple(index)])
+
+    def _data_indices(
+        chunk: tuple[int, ...], local: tuple[np.ndarray, ...]
+    ) -> tuple[npt.NDArray[np.intp], ...]:
+        size = local[0].size
+        indices = [np.full(size, s, dtype=np.intp) for s in seed]
+        for j, d in enumerate(dims):
+            indices[d] = local[j].astype(np.intp) + int(bounds[j][chunk[j]])
+        return tuple(indices)
+
+    pbar = (
+        progress(desc=trans._('Filling labels'))
+        if np.prod(grid) >= _PROGRESS_MIN_CHUNKS
+        else None
+    )
+    try:
+        if contiguous:
+            chunks = _grow_component(_read, seed, dims, bounds, old_label)
+        else:
+            chunks = (
+                (chunk, np.nonzero(_read(chunk) == old_label))
+                for chunk in itertools.product(*(range(n) for n in grid))
+            )
+        for chunk, local in chunks:
+            if pbar is not None:
+                pbar.update(1)
+            if local[0].size:
+                yield _data_indices(chunk, local)
+    finally:
+        if pbar is not None:
+            pbar.close()
+
+
+def _grow_component(
+    read: Any,
+    seed: Sequence[int],
+    dims: Sequence[int],
+    bounds: Sequence[np.ndarray],
+    old_label: int,
+) -> Generator[tuple[tuple[int, ...], tuple[np.ndarray, ...]], None, None]:
+    """Yield the chunks reached by the component of the seed, with the
+    local indices of its elements in each of them.
+
+    A chunk is visited again when the component enters it through another
+    face, in which case only the elements that are not filled yet are
+    yielded.
+    """
+    from scipy import ndimage as ndi
+
+    ndim = len(dims)
+    local_seed = [seed[d] for d in dims]
+    start = tuple(
+        int(np.searchsorted(b, s, side='right')) - 1
+        for b, s in zip(bounds, local_seed, strict=True)
+    )
+    # seeds of each chunk to visit, as arrays of local indices of shape
+    # (ndim, n)
+    pending: dict[tuple[int, ...], list[np.ndarray]] = {
+        start: [
+            np.subtract(
+                local_seed,
+                [b[i] for b, i in zip(bounds, start, strict=True)],
+            ).astype(np.intp)[:, np.newaxis]
+        ]
+    }
+    queue = deque([start])
+    while queue:
+        chunk = queue.popleft()
+        seeds = np.concatenate(pending.pop(chunk), axis=1)
+        matches = read(chunk) == old_label
+        seeds = seeds[:, matches[tuple(seeds)]]
+        if seeds.shape[1] == 0:
+            continue
+        labeled, _ = ndi.label(matches)
+        component = np.isin(labeled, np.unique(labeled[tuple(seeds)]))
+        yield chunk, np.nonzero(component)
+
+        for axis in range(ndim):
+            for step in (-1, 1):
+                neighbor = list(chunk)
+                neighbor[axis] += step
+                if not 0 <= neighbor[axis] < len(bounds[axis]) - 1:
+                    continue
+                face: list[slice] = [slice(None)] * ndim
+                face[axis] = slice(0, 1) if step < 0 else slice(-1, None)
+                entering = np.array(np.nonzero(component[tuple(face)]))
+                if entering.shape[1] == 0:
+                    continue
+                b = bounds[axis]
+                n = neighbor[axis]
+                entering[axis] = int(b[n + 1] - b[n]) - 1 if step < 0 else 0
+                key = tuple(neighbor)
+                if key not in pending:
+                    pending[key] = []
+                    queue.append(key)
+                pending[key].append(entering)
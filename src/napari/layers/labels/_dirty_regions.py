@@ -0,0 +1,90 @@
+"""Tracking of the regions of labels data changed between refreshes.
+
+When painting, :meth:`napari.layers.Labels.data_setitem` is called for each
+brush stamp, and the changed elements are only colored and uploaded to the
+GPU on the next partial refresh. Uploading the bounding box of all the
+changes since the last refresh can be much more than what was painted, e.g.
+for a fast diagonal stroke on a large image, so :class:`_DirtyRegions` keeps
+a few boxes instead, merging boxes only when that does not add much.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+#: Number of elements that merging two boxes may add for free, accounting
+#: for the overhead of coloring and uploading each box separately.
+_MERGE_SLACK = 64 * 64
+#: Maximum number of boxes kept, above which the closest boxes are merged.
+_MAX_REGIONS = 16
+
+
+def _volume(box: np.ndarray) -> int:
+    return int(np.prod(box[1] - box[0]))
+
+
+def _union(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.stack([np.minimum(a[0], b[0]), np.maximum(a[1], b[1])])
+
+
+def _merge_cost(a: np.ndarray, b: np.ndarray) -> int:
+    """Number of elements added by replacing boxes a and b by their union."""
+    return _volume(_union(a, b)) - _volume(a) - _volume(b)
+
+
+class _DirtyRegions:
+    """Bounding boxes of the changed regions of labels data.
+
+    Boxes are tuples of slices with a start and a stop in data coordinates.
+
+    Parameters
+    ----------
+    max_regions : int
+        Maximum number of boxes kept.
+    """
+
+    def __init__(self, max_regions: int = _MAX_REGIONS) -> None:
+        self.max_regions = max_regions
+        # each box is an array of shape (2, ndim) with its start and stop
+        self._boxes: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def add(self, box: tuple[slice, ...]) -> None:
+        """Add a changed box, merging it with the boxes close to it."""
+        new = np.array([[s.start for s in box], [s.stop for s in box]])
+        merged = True
+        while merged:
+            merged = False
+            for i, other in enumerate(self._boxes):
+                if _merge_cost(new, other) <= _MERGE_SLACK:
+                    new = _union(new, self._boxes.pop(i))
+                    merged = True
+                    break
+        self._boxes.append(new)
+        while len(self._boxes) > self.max_regions:
+            self._merge_closest()
+
+    def pop_all(self) -> list[tuple[slice, ...]]:
+        """Remove and return all the boxes."""
+        boxes = [
+            tuple(
+                slice(int(start), int(stop))
+                for start, stop in zip(*box, strict=True)
+            )
+            for box in self._boxes
+        ]
+        self._boxes = []
+        return boxes
+
+    def _merge_closest(self) -> None:
+        """Merge the two boxes whose union adds the fewest elements."""
+        n = len(self._boxes)
+        _, i, j = min(
+            (_merge_cost(self._boxes[i], self._boxes[j]), i, j)
+            for i in range(n)
+            for j in range(i + 1, n)
+        )
+        other = self._boxes.pop(j)
+        self._boxes[i] = _union(self._boxes[i], other)
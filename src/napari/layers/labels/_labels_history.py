@@ -0,0 +1,202 @@
+"""Memory-bounded undo/redo history of labels edits.
+
+A history *item* is a list of *atoms* ``(indices, before, after)`` that
+were applied together (see :meth:`napari.layers.Labels._save_history`).
+Raw atoms of a long painting session on a large volume can use a lot of
+memory, so :class:`_LabelsHistory` stores items compressed, merges the
+atoms of each item into one, and spills the oldest items to a temporary
+file when the compressed items exceed a memory budget.
+"""
+
+from __future__ import annotations
+
+import io
+import tempfile
+import zlib
+from collections import deque
+from typing import IO, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    HistoryAtom = tuple[
+        tuple[npt.NDArray, ...], npt.NDArray, npt.NDArray | np.generic
+    ]
+
+
+def _coalesce(atoms: list[HistoryAtom]) -> list[HistoryAtom]:
+    """Merge consecutive atoms into a single equivalent atom.
+
+    Elements changed by several atoms (e.g. by overlapping brush strokes)
+    appear once, with their value before the first atom and after the
+    last one. Atoms with negative indices are returned unchanged.
+    """
+    ndim = len(atoms[0][0])
+    coords = np.concatenate(
+        [
+            np.stack(np.broadcast_arrays(*indices)).reshape(ndim, -1)
+            for indices, _, _ in atoms
+        ],
+        axis=1,
+    )
+    if coords.size == 0 or coords.min() < 0:
+        return atoms
+    sizes = [np.broadcast(*indices).size for indices, _, _ in atoms]
+    before = np.concatenate(
+        [
+            np.broadcast_to(b, (n,))
+            for (_, b, _), n in zip(atoms, sizes, strict=True)
+        ]
+    )
+    after = np.concatenate(
+        [
+            np.broadcast_to(a, (n,))
+            for (_, _, a), n in zip(atoms, sizes, strict=True)
+        ]
+    )
+    flat = np.ravel_multi_index(tuple(coords), tuple(coords.max(axis=1) + 1))
+    # np.unique returns the index of the first occurrence of each element;
+    # its last occurrence is its first one in the reversed array.
+    _, first = np.unique(flat, return_index=True)
+    _, last_reversed = np.unique(flat[::-1], return_index=True)
+    last = flat.size - 1 - last_reversed
+    return [(tuple(coords[:, first]), before[first], after[last])]
+
+
+def _flat(values: npt.ArrayLike) -> np.ndarray:
+    """Values as a 1D array, or a 0D array for a single broadcast value."""
+    values = np.asarray(values)
+    return values.reshape(-1) if values.ndim > 0 else values
+
+
+def _encode(item: list[HistoryAtom]) -> bytes:
+    """Serialize and compress a history item.
+
+    Indices are delta-encoded, as consecutive changed elements are usually
+    close to each other, which makes them compress well.
+    """
+    atoms = _coalesce(item) if len(item) > 1 else item
+    buffer = io.BytesIO()
+    np.save(buffer, np.array([len(atoms), len(atoms[0][0])]))
+    for indices, before, after in atoms:
+        for index in np.broadcast_arrays(*indices):
+            np.save(buffer, np.diff(_flat(index), prepend=0))
+        np.save(buffer, _flat(before), allow_pickle=False)
+        np.save(buffer, _flat(after), allow_pickle=False)
+    return zlib.compress(buffer.getvalue(), level=1)
+
+
+def _decode(blob: bytes) -> list[HistoryAtom]:
+    buffer = io.BytesIO(zlib.decompress(blob))
+    n_atoms, ndim = np.load(buffer)
+    atoms = []
+    for _ in range(n_atoms):
+        indices = tuple(np.cumsum(np.load(buffer)) for _ in range(ndim))
+        before = np.load(buffer)
+        after = np.load(buffer)
+        atoms.append((indices, before, after))
+    return atoms
+
+
+class _LabelsHistory:
+    """Stack of labels history items with bounded length and memory.
+
+    Items are stored compressed. When the compressed items use more than
+    ``max_bytes``, the oldest ones are moved to a temporary file, from which
+    they are read back when they are popped. When more than ``maxlen`` items
+    are appended, the oldest ones are dropped, like in a bounded deque.
+
+    Parameters
+    ----------
+    maxlen : int
+        Maximum number of items.
+    max_bytes : int
+        Maximum total size in bytes of the compressed items kept in memory.
+    """
+
+    def __init__(self, maxlen: int, max_bytes: int) -> None:
+        self.maxlen = maxlen
+        self.max_bytes = max_bytes
+        # each item is either its compressed bytes, or the (offset, size)
+        # of its compressed bytes in the spill file
+        self._items: deque[bytes | tuple[int, int]] = deque()
+        self._n_spilled = 0
+        self._spill_file: IO[bytes] | None = None
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> list[HistoryAtom]:
+        return _decode(self._load(self._items[index]))
+
+    def append(self, item: list[HistoryAtom]) -> None:
+        """Add a history item on top of the stack."""
+        blob = _encode(item)
+        self._items.append(blob)
+        self.nbytes += len(blob)
+        while len(self._items) > self.maxlen:
+            self._drop_oldest()
+        while self.nbytes > self.max_bytes and self._n_spilled < len(
+            self._items
+        ):
+            self._spill_oldest()
+
+    def pop(self) -> list[HistoryAtom]:
+        """Remove and return the item on top of the stack."""
+        stored = self._items.pop()
+        if isinstance(stored, bytes):
+            self.nbytes -= len(stored)
+        else:
+            self._n_spilled -= 1
+        blob = self._load(stored)
+        if self._n_spilled == 0:
+            self._reset_spill_file()
+        return _decode(blob)
+
+    def clear(self) -> None:
+        """Remove all the items."""
+        self._items.clear()
+        self.nbytes = 0
+        self._n_spilled = 0
+        self._reset_spill_file()
+
+    def _drop_oldest(self) -> None:
+        stored = self._items.popleft()
+        if isinstance(stored, bytes):
+            self.nbytes -= len(stored)
+        else:
+            self._n_spilled -= 1
+            if self._n_spilled == 0:
+                self._reset_spill_file()
+
+    def _spill_oldest(self) -> None:
+        """Move the oldest item kept in memory to the spill file."""
+        blob = self._items[self._n_spilled]
+        assert isinstance(blob, bytes)
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(  # noqa: SIM115
+                prefix='napari-labels-'
+            )
+        offset = self._spill_file.seek(0, io.SEEK_END)
+        self._spill_file.write(blob)
+        self._items[self._n_spilled] = (offset, len(blob))
+        self._n_spilled += 1
+        self.nbytes -= len(blob)
+
+    def _load(self, stored: bytes | tuple[int, int]) -> bytes:
+        if isinstance(stored, bytes):
+            return stored
+        assert self._spill_file is not None
+        offset, size = stored
+        self._spill_file.seek(offset)
+        return self._spill_file.read(size)
+
+    def _reset_spill_file(self) -> None:
+        # Spilled items are a prefix of the stack, so the file is only
+        # emptied when none are left.
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
@@ -0,0 +1,48 @@
+import numpy as np
+
+from napari.layers import Labels
+from napari.layers.labels._dirty_regions import _DirtyRegions
+
+
+def test_dirty_regions_merge_close_boxes():
+    regions = _DirtyRegions()
+    regions.add((slice(0, 10), slice(0, 10)))
+    regions.add((slice(5, 15), slice(5, 15)))
+    assert regions.pop_all() == [(slice(0, 15), slice(0, 15))]
+    assert len(regions) == 0
+
+
+def test_dirty_regions_keep_distant_boxes():
+    regions = _DirtyRegions()
+    regions.add((slice(0, 10), slice(0, 10)))
+    regions.add((slice(1000, 1010), slice(1000, 1010)))
+    assert len(regions) == 2
+
+
+def test_dirty_regions_max_regions():
+    regions = _DirtyRegions(max_regions=2)
+    regions.add((slice(0, 10), slice(0, 10)))
+    regions.add((slice(0, 10), slice(1000, 1010)))
+    regions.add((slice(1000, 1010), slice(0, 10)))
+    boxes = regions.pop_all()
+    assert len(boxes) == 2
+    assert (slice(0, 10), slice(0, 1010)) in boxes
+
+
+def test_partial_refresh_updates_painted_regions_only():
+    layer = Labels(np.zeros((2000, 2000), dtype=np.uint8))
+    layer.brush_size = 5
+    updates = []
+    layer.events.labels_update.connect(
+        lambda e: updates.append((e.offset, e.data.shape))
+    )
+    layer.paint((10, 10), 1, refresh=False)
+    layer.paint((1900, 1900), 1, refresh=False)
+    layer._partial_labels_refresh()
+
+    assert len(updates) == 2
+    assert all(shape[0] * shape[1] <= 10 * 10 for _, shape in updates)
+    np.testing.assert_array_equal(
+        layer._slice.image.view[8:13, 8:13] != 0,
+        layer.data[8:13, 8:13] != 0,
+    )
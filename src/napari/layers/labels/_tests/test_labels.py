@@ -1936,3 +1936,36 @@ def test_view_dtype(visible, dtype):
 def test_view_dtype_int16(visible, dtype):
     layer = Labels(np.arange(25, dtype=dtype).reshape(5, 5), visible=visible)
     assert layer._slice.image.view.dtype == np.uint16
+
+
+@pytest.mark.parametrize('contiguous', [True, False])
+@pytest.mark.parametrize('n_edit_dimensions', [2, 3])
+@pytest.mark.parametrize('chunks', [(2, 3, 4), (5, 7, 7), (6, 20, 20)])
+def test_fill_chunked(contiguous, n_edit_dimensions, chunks):
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 2, size=(6, 20, 20)).astype(np.uint32)
+    labels[:, 10, :] = 0
+    expected_layer = Labels(labels.copy())
+    layer = Labels(zarr.array(labels, chunks=chunks))
+    for lyr in (expected_layer, layer):
+        lyr.contiguous = contiguous
+        lyr.n_edit_dimensions = n_edit_dimensions
+        lyr.fill((3, 10, 5), 7)
+    np.testing.assert_array_equal(layer.data[:], expected_layer.data)
+    assert len(layer._undo_history) == 1
+
+    layer.undo()
+    np.testing.assert_array_equal(layer.data[:], labels)
+
+
+def test_fill_chunked_joins_history_block():
+    labels = np.zeros((10, 10), dtype=np.uint32)
+    layer = Labels(zarr.array(labels, chunks=(4, 4)))
+    with layer.block_history():
+        layer.paint((1, 1), 3)
+        layer.fill((8, 8), 5)
+        layer.paint((8, 8), 3)
+    assert len(layer._undo_history) == 1
+
+    layer.undo()
+    np.testing.assert_array_equal(layer.data[:], labels)
@@ -0,0 +1,136 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from napari.layers import Labels
+from napari.layers.labels._labels_history import (
+    _coalesce,
+    _decode,
+    _encode,
+    _LabelsHistory,
+)
+
+
+def _apply(data, item, undoing):
+    for indices, before, after in reversed(item) if undoing else item:
+        data[indices] = before if undoing else after
+
+
+def _random_item(rng, data, n_atoms=5):
+    """Paint random overlapping blocks of data, returning the history item."""
+    item = []
+    for _ in range(n_atoms):
+        start = rng.integers(0, 10, size=2)
+        indices = tuple(
+            np.broadcast_arrays(*np.ix_(*(np.arange(s, s + 8) for s in start)))
+        )
+        indices = tuple(i.ravel() for i in indices)
+        before = data[indices].copy()
+        after = rng.integers(1, 5, dtype=data.dtype)
+        data[indices] = after
+        item.append((indices, before, after))
+    return item
+
+
+def test_coalesce_overlapping_atoms():
+    rng = np.random.default_rng(0)
+    original = rng.integers(0, 3, size=(20, 20), dtype=np.uint8)
+    painted = original.copy()
+    item = _random_item(rng, painted)
+
+    (coalesced,) = _coalesce(item)
+    indices = np.stack(coalesced[0])
+    # every changed element appears once
+    assert np.unique(indices, axis=1).shape[1] == indices.shape[1]
+
+    data = painted.copy()
+    _apply(data, [coalesced], undoing=True)
+    npt.assert_array_equal(data, original)
+    _apply(data, [coalesced], undoing=False)
+    npt.assert_array_equal(data, painted)
+
+
+def test_coalesce_keeps_negative_indices():
+    item = [
+        ((np.array([-1]), np.array([0])), np.array([0]), 1),
+        ((np.array([0]), np.array([0])), np.array([0]), 2),
+    ]
+    assert _coalesce(item) is item
+
+
+def test_encode_round_trip():
+    item = [
+        (
+            (np.array([[1, 2], [3, 4]]), np.array([[0, 0], [1, 1]])),
+            np.array([[5, 6], [7, 8]], dtype=np.int32),
+            np.int32(3),
+        )
+    ]
+    ((indices, before, after),) = _decode(_encode(item))
+    npt.assert_array_equal(indices[0], [1, 2, 3, 4])
+    npt.assert_array_equal(indices[1], [0, 0, 1, 1])
+    npt.assert_array_equal(before, [5, 6, 7, 8])
+    assert before.dtype == np.int32
+    assert after == 3
+
+
+def test_history_maxlen():
+    history = _LabelsHistory(maxlen=2, max_bytes=2**30)
+    for value in range(3):
+        history.append([((np.array([value]),), np.array([0]), value)])
+    assert len(history) == 2
+    assert history[0][0][2] == 1
+    assert history.pop()[0][2] == 2
+    assert history.pop()[0][2] == 1
+    assert len(history) == 0
+
+
+@pytest.mark.parametrize('max_bytes', [0, 2**30])
+def test_history_spill(max_bytes):
+    rng = np.random.default_rng(0)
+    history = _LabelsHistory(maxlen=10, max_bytes=max_bytes)
+    items = [
+        [((rng.integers(0, 100, 50),), rng.integers(0, 5, 50), i)]
+        for i in range(5)
+    ]
+    for item in items:
+        history.append(item)
+    assert len(history) == 5
+    if max_bytes == 0:
+        assert history.nbytes == 0
+        assert history._n_spilled == 5
+    else:
+        assert history._n_spilled == 0
+
+    for item in reversed(items):
+        ((indices, before, after),) = history.pop()
+        npt.assert_array_equal(indices[0], item[0][0][0])
+        npt.assert_array_equal(before, item[0][1])
+        assert after == item[0][2]
+    assert history._spill_file is None
+    assert history.nbytes == 0
+
+
+def test_labels_undo_redo_with_spilled_history(monkeypatch):
+    from napari.settings import get_settings
+
+    monkeypatch.setattr(
+        get_settings().experimental, 'labels_history_memory', 0
+    )
+    rng = np.random.default_rng(0)
+    layer = Labels(rng.integers(0, 3, size=(20, 20), dtype=np.uint8))
+    states = [layer.data.copy()]
+    for _ in range(3):
+        with layer.block_history():
+            for _ in range(4):
+                start = rng.integers(0, 16, size=2)
+                layer.paint(start, rng.integers(1, 5), refresh=False)
+        states.append(layer.data.copy())
+    assert layer._undo_history._n_spilled == 3
+
+    for state in reversed(states[:-1]):
+        layer.undo()
+        npt.assert_array_equal(layer.data, state)
+    for state in states[1:]:
+        layer.redo()
+        npt.assert_array_equal(layer.data, state)
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import typing
 import warnings
-from collections import deque
 from collections.abc import Callable, Generator, Sequence
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,12 +27,15 @@ from napari.layers.base._base_mouse_bindings import (
     transform_with_box,
 )
 from napari.layers.image._image_utils import guess_multiscale
+from napari.layers.labels._chunked_fill import _chunked_fill, _is_chunked
+from napari.layers.labels._dirty_regions import _DirtyRegions
 from napari.layers.labels._labels_constants import (
     IsoCategoricalGradientMode,
     LabelColorMode,
     LabelsRendering,
     Mode,
 )
+from napari.layers.labels._labels_history import _LabelsHistory
 from napari.layers.labels._labels_mouse_bindings import (
     BrushSizeOnMouseMove,
     draw,
@@ -49,6 +51,7 @@ from napari.layers.labels._labels_utils import (
 )
 from napari.layers.labels._slice import _LabelsSliceRequest
 from napari.layers.utils.layer_utils import _FeatureTable
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dtype import (
     get_dtype_limits,
@@ -421,15 +424,15 @@ class Labels(ScalarFieldBase):
         self.colormap.use_selection = self._show_selected_label
         self._prev_selected_label = None
         self._selected_color = self.get_color(self._selected_label)
-        self._updated_slice: tuple[slice, ...] | None = None
+        self._dirty_regions = _DirtyRegions()
         if colormap is not None:
             self._set_colormap(colormap)
 
         self._status = self.mode
         self._preserve_labels = False
 
-        self._undo_history: deque[HistoryItem]
-        self._redo_history: deque[HistoryItem]
+        self._undo_history: _LabelsHistory
+        self._redo_history: _LabelsHistory
         self._staged_history: list[HistoryItem]
         self._block_history: bool
 
@@ -863,37 +866,41 @@ class Labels(ScalarFieldBase):
         return vispy_texture_dtype(data)
 
     def _partial_labels_refresh(self) -> None:
-        """Prepares and displays only an updated part of the labels."""
+        """Prepares and displays only the updated parts of the labels.
 
-        if self._updated_slice is None or not self._slicing_state.loaded:
+        A ``labels_update`` event is emitted for each of the regions changed
+        since the last refresh, rather than for their bounding box.
+        """
+
+        if not self._dirty_regions or not self._slicing_state.loaded:
             return
 
         dims_displayed = self._slice_input.displayed
         raw_displayed = self._slice.image.raw
 
-        # Keep only the dimensions that correspond to the current view
-        updated_slice = tuple(
-            self._updated_slice[index] for index in dims_displayed
-        )
+        for dirty_slice in self._dirty_regions.pop_all():
+            # Keep only the dimensions that correspond to the current view
+            updated_slice = tuple(
+                dirty_slice[index] for index in dims_displayed
+            )
 
-        offset = [axis_slice.start for axis_slice in updated_slice]
+            offset = [axis_slice.start for axis_slice in updated_slice]
 
-        if self.contour > 0:
-            colors_sliced = self._raw_to_displayed(
-                raw_displayed, data_slice=updated_slice
-            )
-        else:
-            colors_sliced = self._slice.image.view[updated_slice]
-        # The next line is needed to make the following tests pass in
-        # napari/_vispy/_tests/:
-        # - test_vispy_labels_layer.py::test_labels_painting
-        # - test_vispy_labels_layer.py::test_labels_fill_slice
-        # See https://github.com/napari/napari/pull/6112/files#r1291613760
-        # and https://github.com/napari/napari/issues/6185
-        self._slice.image.view[updated_slice] = colors_sliced
-
-        self.events.labels_update(data=colors_sliced, offset=offset)
-        self._updated_slice = None
+            if self.contour > 0:
+                colors_sliced = self._raw_to_displayed(
+                    raw_displayed, data_slice=updated_slice
+                )
+            else:
+                colors_sliced = self._slice.image.view[updated_slice]
+            # The next line is needed to make the following tests pass in
+            # napari/_vispy/_tests/:
+            # - test_vispy_labels_layer.py::test_labels_painting
+            # - test_vispy_labels_layer.py::test_labels_fill_slice
+            # See https://github.com/napari/napari/pull/6112/files#r1291613760
+            # and https://github.com/napari/napari/issues/6185
+            self._slice.image.view[updated_slice] = colors_sliced
+
+            self.events.labels_update(data=colors_sliced, offset=offset)
 
     def _calculate_contour(
         self, labels: np.ndarray, data_slice: tuple[slice, ...]
@@ -1026,8 +1033,11 @@ class Labels(ScalarFieldBase):
         return col
 
     def _reset_history(self, event: Event | None = None) -> None:
-        self._undo_history = deque(maxlen=self._history_limit)
-        self._redo_history = deque(maxlen=self._history_limit)
+        max_bytes = int(
+            get_settings().experimental.labels_history_memory * 1e9
+        )
+        self._undo_history = _LabelsHistory(self._history_limit, max_bytes)
+        self._redo_history = _LabelsHistory(self._history_limit, max_bytes)
         self._staged_history = []
         self._block_history = False
 
@@ -1139,6 +1149,9 @@ class Labels(ScalarFieldBase):
         if it is `False`, working in the number of dimensions specified by
         the `n_edit_dimensions` flag.
 
+        Chunked data (e.g. zarr or dask arrays) is filled one chunk at a time,
+        so that the region being edited does not need to fit in memory.
+
         Parameters
         ----------
         coord : sequence of float
@@ -1177,6 +1190,28 @@ class Labels(ScalarFieldBase):
         dims_to_fill = sorted(
             self._slice_input.order[-self.n_edit_dimensions :]
         )
+        if _is_chunked(self.data):
+            # join the history block of the caller (e.g. a drag), if any
+            history_block = (
+                nullcontext() if self._block_history else self.block_history()
+            )
+            with history_block:
+                for indices in _chunked_fill(
+                    self.data,
+                    int_coord,
+                    old_label,
+                    dims_to_fill,
+                    contiguous=self.contiguous,
+                ):
+                    self.data_setitem(
+                        _coerce_indices_for_vectorization(self.data, indices),
+                        new_label,
+                        refresh=False,
+                    )
+            if refresh:
+                self._partial_labels_refresh()
+            return
+
         data_slice_list = list(int_coord)
         for dim in dims_to_fill:
             data_slice_list[dim] = slice(None)
@@ -1473,6 +1508,7 @@ class Labels(ScalarFieldBase):
 
         # update the labels image
         self.data[indices] = value  # type: ignore[index]
+        self._slicing_state._invalidate_slice_cache()
 
         pt_not_disp = self._get_pt_not_disp()
         displayed_indices = index_in_slice(
@@ -1515,17 +1551,7 @@ class Labels(ScalarFieldBase):
                 self.colormap._data_to_texture(visible_values)
             )
 
-        if self._updated_slice is None:
-            self._updated_slice = updated_slice
-        else:
-            self._updated_slice = tuple(
-                [
-                    slice(min(s1.start, s2.start), max(s1.stop, s2.stop))
-                    for s1, s2 in zip(
-                        updated_slice, self._updated_slice, strict=False
-                    )
-                ]
-            )
+        self._dirty_regions.add(updated_slice)
 
         if refresh is True:
             self._partial_labels_refresh()
@@ -0,0 +1,134 @@
+"""Density of the points in view, drawn as an image.
+
+When millions of points are in view, the markers hide each other and the
+density of the points is lost. :class:`_PointsDensity` is instead the
+histogram of the displayed coordinates of the points, or of the sum of a
+weight of the points, in bins about as large as canvas pixels, which is
+drawn like an image with a colormap and contrast limits.
+
+The histogram covers the view padded on each side, with bins whose sizes
+are powers of two, so that it is only computed again when panning out of
+the padded region or when the zoom changes by a factor of two.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+#: Fraction of the size of the view binned on each side of the view.
+_DENSITY_PADDING = 0.25
+
+
+def density_bin_size(pixel_size: npt.ArrayLike) -> np.ndarray:
+    """Power of two nearest to the size of a canvas pixel along each axis."""
+    pixel_size = np.asarray(pixel_size, dtype=float)
+    return 2.0 ** np.round(np.log2(pixel_size))
+
+
+class _PointsDensity(NamedTuple):
+    """Histogram of 2D coordinates over a rectangular region.
+
+    Attributes
+    ----------
+    image : (H, W) array of float32
+        Number of points, or sum of their weights, in each bin.
+    origin : (2,) array
+        Coordinates of the low corner of the first bin.
+    bin_size : (2,) array
+        Size of the bins along each axis.
+    """
+
+    image: np.ndarray
+    origin: np.ndarray
+    bin_size: np.ndarray
+
+    @property
+    def end(self) -> np.ndarray:
+        """Coordinates of the high corner of the last bin."""
+        return self.origin + self.bin_size * self.image.shape
+
+    def covers(
+        self,
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+        bin_size: npt.ArrayLike,
+    ) -> bool:
+        """Whether the histogram covers a view with bins of a given size."""
+        return bool(
+            np.array_equal(self.bin_size, bin_size)
+            and np.all(np.asarray(low) >= self.origin)
+            and np.all(np.asarray(high) <= self.end)
+        )
+
+    @classmethod
+    def from_points(
+        cls,
+        coords: npt.ArrayLike,
+        origin: npt.ArrayLike,
+        shape: tuple[int, int],
+        bin_size: npt.ArrayLike,
+        weights: npt.ArrayLike | None = None,
+    ) -> _PointsDensity:
+        """Bin points over a region.
+
+        Parameters
+        ----------
+        coords : (M, 2) array
+            Displayed coordinates of the points. Points outside of the
+            region are ignored.
+        origin : (2,) array
+            Coordinates of the low corner of the region.
+        shape : 2-tuple of int
+            Number of bins along each axis.
+        bin_size : (2,) array
+            Size of the bins along each axis.
+        weights : (M,) array, optional
+            Weight of each point. By default, the points are counted.
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        origin = np.asarray(origin, dtype=float)
+        bin_size = np.asarray(bin_size, dtype=float)
+        # reductions along the columns are much faster than along axis 0
+        inside = np.ones(len(coords), dtype=bool)
+        bins = []
+        for axis in range(2):
+            axis_bins = np.floor(
+                (coords[:, axis] - origin[axis]) / bin_size[axis]
+            )
+            inside &= (axis_bins >= 0) & (axis_bins < shape[axis])
+            bins.append(axis_bins)
+        flat = (bins[0][inside] * shape[1] + bins[1][inside]).astype(np.intp)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)[inside]
+        image = np.bincount(
+            flat, weights=weights, minlength=shape[0] * shape[1]
+        )
+        return cls(image.reshape(shape).astype(np.float32), origin, bin_size)
+
+
+def density_region(
+    low: npt.ArrayLike, high: npt.ArrayLike, bin_size: npt.ArrayLike
+) -> tuple[np.ndarray, tuple[int, int]]:
+    """Region binned around a view.
+
+    The view is padded on each side and aligned to the bins.
+
+    Returns
+    -------
+    origin : (2,) array
+        Coordinates of the low corner of the region.
+    shape : 2-tuple of int
+        Number of bins along each axis.
+    """
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    bin_size = np.asarray(bin_size, dtype=float)
+    padding = (high - low) * _DENSITY_PADDING
+    origin = np.floor((low - padding) / bin_size) * bin_size
+    shape = np.maximum(np.ceil((high + padding - origin) / bin_size), 1)
+    return origin, (int(shape[0]), int(shape[1]))
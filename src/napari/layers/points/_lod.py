@@ -0,0 +1,119 @@
+"""Levels of detail of the points in view.
+
+When zoomed out on millions of points, most markers are smaller than a
+canvas pixel and hide each other, yet all of them are drawn.
+:class:`_PointsLOD` aggregates the displayed coordinates of the points in
+view in a hierarchy of square grids, each cell of a level being split in
+four cells in the next one. A level keeps one point per non-empty cell,
+drawn in place of the others, and the number of points in the cell.
+
+The points are sorted once along a Z-order curve through the cells of the
+finest level, in which the points of every cell of every level are
+contiguous, so that each level is then found with a single pass.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+#: Number of levels below the level with a single cell.
+_MAX_LOD_LEVEL = 16
+
+#: Minimum number of points in view for levels of detail to be drawn.
+_MIN_LOD_POINTS = 100_000
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert a zero bit before each of the 16 lowest bits of values."""
+    values = values & np.uint32(0xFFFF)
+    for shift, mask in (
+        (8, 0x00FF00FF),
+        (4, 0x0F0F0F0F),
+        (2, 0x33333333),
+        (1, 0x55555555),
+    ):
+        values |= values << np.uint32(shift)
+        values &= np.uint32(mask)
+    return values
+
+
+class _PointsLOD:
+    """Hierarchical grid aggregation of 2D coordinates.
+
+    Parameters
+    ----------
+    coords : (M, 2) array
+        Displayed coordinates of the points in view.
+    """
+
+    def __init__(self, coords: npt.ArrayLike) -> None:
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        self.n_points = len(coords)
+        # reductions along the columns are much faster than along axis 0
+        columns = (coords[:, 0], coords[:, 1])
+        low = [c.min() if self.n_points else 0.0 for c in columns]
+        high = [c.max() if self.n_points else 0.0 for c in columns]
+        #: Width of the single cell of level 0, in data coordinates.
+        self.side = float(max(high[0] - low[0], high[1] - low[1]))
+        n_cells = 2**_MAX_LOD_LEVEL
+        cells = []
+        for column, column_low in zip(columns, low, strict=True):
+            if self.side > 0:
+                cell = (column - column_low) * (n_cells / self.side)
+                np.clip(cell, 0, n_cells - 1, out=cell)
+            else:
+                cell = np.zeros(self.n_points)
+            cells.append(_spread_bits(cell.astype(np.uint32)))
+        codes = (cells[0] << np.uint32(1)) | cells[1]
+        # positions in view of the points along the curve
+        self._order = np.argsort(codes)
+        self._codes = codes[self._order]
+        self._levels: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def level_for_cell_size(self, cell_size: float) -> int | None:
+        """Coarsest level whose cells are at most cell_size wide.
+
+        Returns None if the cells of all the levels are wider, in which case
+        all the points should be drawn.
+        """
+        if self.side == 0:
+            return 0
+        if not cell_size > 0:
+            return None
+        level = max(math.ceil(math.log2(self.side / cell_size)), 0)
+        return level if level <= _MAX_LOD_LEVEL else None
+
+    def level(self, level: int) -> tuple[np.ndarray, np.ndarray]:
+        """Points of a level of detail.
+
+        Parameters
+        ----------
+        level : int
+            Level, from 0 for a single cell to the finest level.
+
+        Returns
+        -------
+        positions : (K,) array of int
+            Sorted positions in view of the points drawn for the K non-empty
+            cells of the level, which are the last points of the cells.
+        counts : (K,) array of int
+            Number of points in the cell of each drawn point.
+        """
+        if self.n_points == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        if level not in self._levels:
+            shift = np.uint32(2 * (_MAX_LOD_LEVEL - level))
+            cells = self._codes >> shift
+            first = np.flatnonzero(np.append(True, cells[1:] != cells[:-1]))
+            counts = np.diff(first, append=len(cells))
+            # the last point of a cell is drawn on top of the others
+            positions = np.maximum.reduceat(self._order, first)
+            order = np.argsort(positions)
+            self._levels[level] = positions[order], counts[order]
+        return self._levels[level]
@@ -240,9 +240,16 @@ def _select_points_from_drag(
     assert layer._drag_box is not None
     # if there is data in view, find the points in the drag box
     if n_display == 2:
-        selection = points_in_box(
-            layer._drag_box, layer._view_data, layer._view_size
+        # points whose squares may intersect the box
+        margin = layer._spatial_index.max_size / 2
+        positions = layer._view_positions_in_box(
+            np.min(layer._drag_box, axis=0) - margin,
+            np.max(layer._drag_box, axis=0) + margin,
         )
+        view_data, view_size = layer._view_data_and_size(positions)
+        selection = points_in_box(layer._drag_box, view_data, view_size)
+        if positions is not None:
+            selection = positions[selection]
     else:
         assert layer._drag_normal is not None
         assert layer._drag_up is not None
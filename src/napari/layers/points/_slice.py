@@ -6,6 +6,7 @@ import numpy.typing as npt
 
 from napari.layers.base._slice import _next_request_id
 from napari.layers.points._points_constants import PointsProjectionMode
+from napari.layers.points._spatial_index import _PointsIndex
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 
 
@@ -53,6 +54,9 @@ class _PointSliceRequest:
         The slicing coordinates and margins in data space.
     size : array like
         Size of each point. This is used in calculating visibility.
+    spatial_index : _PointsIndex or None
+        Index of the data, used to find the points near the slice without
+        checking all of them.
     others
         See the corresponding attributes in `Layer` and `Points`.
     """
@@ -63,6 +67,7 @@ class _PointSliceRequest:
     projection_mode: PointsProjectionMode
     size: Any = field(repr=False)
     out_of_slice_display: bool = field(repr=False)
+    spatial_index: _PointsIndex | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _PointSliceResponse:
@@ -96,7 +101,6 @@ class _PointSliceRequest:
         )
 
     def _get_slice_data(self, not_disp: list[int]) -> tuple[npt.NDArray, int]:
-        data = self.data[:, not_disp]
         scale = 1
 
         point, m_left, m_right = self.data_slice[not_disp].as_array()
@@ -114,11 +118,25 @@ class _PointSliceRequest:
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
 
+        out_of_slice = self.out_of_slice_display and self.slice_input.ndim > 2
+        candidates = None
+        if self.spatial_index is not None:
+            margin = self.spatial_index.max_size / 2 if out_of_slice else 0
+            candidates = self.spatial_index.in_box(
+                not_disp, low - margin, high + margin
+            )
+        if candidates is None:
+            data = self.data[:, not_disp]
+            size = self.size
+        else:
+            data = self.data[np.ix_(candidates, not_disp)]
+            size = self.size[candidates]
+
         inside_slice = np.all((data >= low) & (data <= high), axis=1)
         slice_indices = np.where(inside_slice)[0].astype(int)
 
-        if self.out_of_slice_display and self.slice_input.ndim > 2:
-            sizes = self.size[:, np.newaxis] / 2
+        if out_of_slice:
+            sizes = size[:, np.newaxis] / 2
 
             # add out of slice points with progressively lower sizes
             dist_from_low = np.abs(data - low)
@@ -137,4 +155,6 @@ class _PointSliceRequest:
             scale = np.prod(scale_per_dim, axis=1)
             slice_indices = np.where(matches)[0].astype(int)
 
+        if candidates is not None:
+            slice_indices = candidates[slice_indices].astype(int)
         return slice_indices, scale
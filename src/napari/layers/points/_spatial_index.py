@@ -0,0 +1,115 @@
+"""Spatial index of the coordinates of a Points layer.
+
+Slicing, hover and drag-box selection of points check the coordinates of
+every point, which is slow with millions of points. :class:`_PointsIndex`
+answers box queries along any subset of the axes: along a single axis
+(e.g. when slicing along time or z) with the points sorted along that axis,
+and along several axes with k-d trees. Both are built lazily, the first
+time the same axes are queried twice. Data edited between every query (e.g.
+while points are dragged) is thus not indexed for nothing.
+
+The index does not track changes to the data: the layer replaces it by a
+new one when its data changes.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from napari.layers.utils._axis_index import _IndexUsePolicy, _SortedAxesIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+    from scipy.spatial import cKDTree
+
+
+class _PointsIndex:
+    """Lazily built indices of points coordinates along subsets of axes.
+
+    Parameters
+    ----------
+    data : (N, D) array
+        Coordinates of the points.
+    size : (N,) array
+        Size of the points.
+    """
+
+    def __init__(self, data: np.ndarray, size: np.ndarray) -> None:
+        self._data = data
+        self._size = size
+        self._max_size: float | None = None
+        self._policy = _IndexUsePolicy(len(data))
+        self._sorted_axes = _SortedAxesIndex(data)
+        self._trees: dict[tuple[int, ...], cKDTree] = {}
+        # Queries may come from the slicing threads and the main thread.
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> float:
+        """Size of the largest point, or 0 if there are no points."""
+        if self._max_size is None:
+            self._max_size = (
+                float(np.max(self._size)) if self._size.size else 0.0
+            )
+        return self._max_size
+
+    def _tree(self, axes: tuple[int, ...]) -> cKDTree:
+        from scipy.spatial import cKDTree
+
+        with self._lock:
+            if axes not in self._trees:
+                self._trees[axes] = cKDTree(self._data[:, list(axes)])
+            return self._trees[axes]
+
+    def in_box(
+        self,
+        axes: Sequence[int],
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+    ) -> npt.NDArray[np.intp] | None:
+        """Indices of the points whose coordinates along axes are in a box.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            Axes of the coordinates of the points compared to the box.
+        low, high : array
+            Lower and upper corners of the box (included), along axes.
+
+        Returns
+        -------
+        indices : array of int or None
+            Sorted indices of the points in the box, or None if the index
+            should not be used (e.g. for few points), in which case all the
+            points must be checked.
+        """
+        axes = tuple(axes)
+        if not self._policy.use_index(axes):
+            return None
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+        if len(axes) == 1:
+            return self._sorted_axes.in_interval(
+                axes[0], float(low[0]), float(high[0])
+            )
+        tree = self._tree(axes)
+        center = (low + high) / 2
+        # Chebyshev ball containing the box, with a tolerance for rounding
+        radius = float(np.max(high - low)) / 2
+        radius += 1e-9 * (radius + float(np.max(np.abs(center))))
+        candidates = np.asarray(
+            tree.query_ball_point(
+                center, radius, p=np.inf, return_sorted=True
+            ),
+            dtype=np.intp,
+        )
+        if candidates.size == 0:
+            return candidates
+        coords = self._data[np.ix_(candidates, list(axes))]
+        inside = np.all((coords >= low) & (coords <= high), axis=1)
+        return candidates[inside]
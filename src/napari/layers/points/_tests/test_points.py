@@ -482,6 +482,55 @@ def test_removing_selected_points():
     assert len(layer.data) == shape[0] - 3
 
 
+def test_selected_mask_follows_selection():
+    """Test the mask of selected points is kept in sync with the selection."""
+    data = np.stack([np.arange(10), np.zeros(10)], axis=1)
+    layer = Points(data)
+    layer.selected_data = {1, 3, 8}
+    np.testing.assert_array_equal(layer._selected_indices, [1, 3, 8])
+
+    layer.selected_data.add(5)
+    layer.selected_data.discard(1)
+    np.testing.assert_array_equal(layer._selected_indices, [3, 5, 8])
+
+    layer.remove([0, 4])
+    assert layer.selected_data == {2, 3, 6}
+    np.testing.assert_array_equal(layer._selected_indices, [2, 3, 6])
+    np.testing.assert_array_equal(layer._selected_view, [2, 3, 6])
+
+    layer.add([[20, 0]])
+    layer.selected_data = {1, 8}
+    np.testing.assert_array_equal(layer._selected_indices, [1, 8])
+    np.testing.assert_array_equal(layer._selected_view, [1, 8])
+
+    layer.selected_data = set()
+    assert len(layer._selected_indices) == 0
+    assert len(layer._selected_view) == 0
+
+
+def test_highlight_selected_and_hovered_points():
+    """Test the highlighted points are the selected and hovered points."""
+    data = np.stack([np.arange(10) % 2, np.arange(10), np.zeros(10)], axis=1)
+    layer = Points(data)
+    layer._slice_dims(Dims(ndim=3, range=((0, 10, 1),) * 3, point=(1, 0, 0)))
+    np.testing.assert_array_equal(layer._indices_view, [1, 3, 5, 7, 9])
+
+    layer.mode = 'select'
+    layer.selected_data = {0, 3, 9}
+    np.testing.assert_array_equal(layer._selected_view, [1, 4])
+    np.testing.assert_array_equal(layer._highlight_index, [1, 4])
+
+    # hovered point in view
+    layer._value = 5
+    layer._set_highlight()
+    np.testing.assert_array_equal(layer._highlight_index, [1, 2, 4])
+
+    # hovered point not in view
+    layer._value = 4
+    layer._set_highlight()
+    np.testing.assert_array_equal(layer._highlight_index, [1, 4])
+
+
 def test_popping_points():
     """Test popping points."""
     shape = (10, 2)
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from napari.components.dims import Dims
+from napari.layers import Points
+from napari.layers.points._density import (
+    _PointsDensity,
+    density_bin_size,
+    density_region,
+)
+
+
+def _random_points(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0, 1000, size=(n, 2))
+
+
+def _histogram(coords, density, weights=None):
+    edges = [
+        density.origin[axis]
+        + density.bin_size[axis] * np.arange(density.image.shape[axis] + 1)
+        for axis in range(2)
+    ]
+    histogram, _, _ = np.histogram2d(
+        coords[:, 0], coords[:, 1], bins=edges, weights=weights
+    )
+    return histogram
+
+
+def test_bin_size_is_power_of_two():
+    np.testing.assert_array_equal(
+        density_bin_size([0.3, 1, 1.3, 5]), [0.25, 1, 1, 4]
+    )
+
+
+def test_region_pads_and_aligns_view():
+    origin, shape = density_region([10, 20], [50, 100], [4, 8])
+    np.testing.assert_array_equal(origin, [0, 0])
+    assert shape == (15, 15)
+    density = _PointsDensity(
+        np.zeros(shape, np.float32), origin, np.array([4, 8])
+    )
+    assert density.covers([10, 20], [50, 100], [4, 8])
+    assert not density.covers([10, 20], [70, 130], [4, 8])
+    assert not density.covers([10, 20], [50, 100], [2, 8])
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_density_matches_histogram(weighted):
+    data = _random_points()
+    weights = np.random.default_rng(1).uniform(size=len(data))
+    origin, shape = density_region([100, 200], [600, 500], [8, 4])
+    density = _PointsDensity.from_points(
+        data, origin, shape, [8, 4], weights=weights if weighted else None
+    )
+    np.testing.assert_allclose(
+        density.image,
+        _histogram(data, density, weights if weighted else None),
+        rtol=1e-6,
+    )
+
+
+def test_density_follows_pan_and_zoom():
+    data = _random_points()
+    layer = Points(data, density=True)
+    events = []
+    layer.events.density.connect(events.append)
+
+    # about 2 data units per canvas pixel
+    layer._update_draw(2, np.array([[0, 0], [400, 400]]), (512, 512))
+    density = layer._view_density
+    np.testing.assert_array_equal(density.bin_size, [2, 2])
+    np.testing.assert_allclose(density.image, _histogram(data, density))
+    assert len(events) == 1
+
+    # panning inside the binned region does not bin the points again
+    layer._update_draw(2, np.array([[50, 50], [450, 450]]), (512, 512))
+    assert layer._view_density is density
+    assert len(events) == 1
+
+    # panning out of it does
+    layer._update_draw(2, np.array([[500, 500], [900, 900]]), (512, 512))
+    assert layer._view_density is not density
+    assert len(events) == 2
+
+    # as does zooming in
+    layer._update_draw(1, np.array([[500, 500], [700, 700]]), (512, 512))
+    np.testing.assert_array_equal(layer._view_density.bin_size, [1, 1])
+    assert len(events) == 3
+
+
+def test_density_weights_and_slicing():
+    data = np.array([[0, 5, 5], [0, 6, 6], [1, 5, 5]])
+    layer = Points(data, features={'w': [1.0, 2.0, 4.0]}, density=True)
+    layer._update_draw(1, np.array([[0, 0], [10, 10]]), (512, 512))
+    assert layer._view_density.image.sum() == 2
+
+    layer.density_weights = 'w'
+    assert layer._view_density.image.sum() == 3
+
+    # slicing bins the points of the new slice
+    layer._slice_dims(Dims(ndim=3, range=((0, 10, 1),) * 3, point=(1, 0, 0)))
+    assert layer._view_density.image.sum() == 4
+
+    # no density is drawn in 3D, where the markers are drawn
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    assert layer._view_density is None
+
+    with pytest.raises(ValueError, match='density_weights'):
+        layer.density_weights = 'missing'
+
+
+def test_density_follows_features():
+    data = np.array([[5, 5], [6, 6]])
+    layer = Points(
+        data, features={'w': [1.0, 1.0]}, density=True, density_weights='w'
+    )
+    layer._update_draw(1, np.array([[0, 0], [10, 10]]), (512, 512))
+    assert layer._view_density.image.sum() == 2
+    events = []
+    layer.events.density.connect(events.append)
+
+    layer.features = {'w': [5.0, 5.0]}
+    assert events
+    assert layer._view_density.image.sum() == 10
+
+    with pytest.warns(RuntimeWarning, match='density_weights'):
+        layer.features = {'other': [3.0, 3.0]}
+    assert layer.density_weights is None
+    assert layer._view_density.image.sum() == 2
+
+
+def test_density_disabled():
+    layer = Points(_random_points())
+    layer._update_draw(2, np.array([[0, 0], [400, 400]]), (512, 512))
+    assert layer._view_density is None
+
+    layer.density = True
+    assert layer._view_density is not None
+    state = layer._get_state()
+    assert state['density']
+    assert state['density_weights'] is None
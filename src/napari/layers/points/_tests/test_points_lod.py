@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from napari.layers import Points
+from napari.layers.points import points as points_module
+from napari.layers.points._lod import _MAX_LOD_LEVEL, _PointsLOD
+
+
+@pytest.fixture
+def always_lod(monkeypatch):
+    monkeypatch.setattr(points_module, '_MIN_LOD_POINTS', 0)
+
+
+def _random_points(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0, 1000, size=(n, 2))
+
+
+@pytest.mark.parametrize('level', [0, 1, 4, 7])
+def test_level_keeps_last_point_of_each_cell(level):
+    data = _random_points()
+    lod = _PointsLOD(data)
+    positions, counts = lod.level(level)
+
+    n_cells = 2**level
+    cells = np.floor((data - data.min(axis=0)) / lod.side * n_cells)
+    cells = np.clip(cells, 0, n_cells - 1)
+    keys = cells[:, 0] * n_cells + cells[:, 1]
+    _, first_in_reversed, expected_counts = np.unique(
+        keys[::-1], return_index=True, return_counts=True
+    )
+    expected = len(keys) - 1 - first_in_reversed
+    order = np.argsort(expected)
+
+    np.testing.assert_array_equal(positions, expected[order])
+    np.testing.assert_array_equal(counts, expected_counts[order])
+
+
+def test_level_for_cell_size():
+    lod = _PointsLOD([[0, 0], [100, 50]])
+    assert lod.level_for_cell_size(1000) == 0
+    assert lod.level_for_cell_size(100) == 0
+    assert lod.level_for_cell_size(30) == 2
+    assert lod.level_for_cell_size(100 / 2**_MAX_LOD_LEVEL) == _MAX_LOD_LEVEL
+    assert lod.level_for_cell_size(1e-6) is None
+
+
+def test_empty_and_coincident_points():
+    positions, counts = _PointsLOD(np.empty((0, 2))).level(3)
+    assert len(positions) == len(counts) == 0
+    lod = _PointsLOD(np.ones((5, 2)))
+    assert lod.level_for_cell_size(1) == 0
+    np.testing.assert_array_equal(lod.level(0)[0], [4])
+
+
+def test_lod_follows_zoom(always_lod):
+    layer = Points(_random_points(), lod=True)
+    corners = np.array([[0, 0], [100, 100]])
+    events = []
+    layer.events.lod.connect(events.append)
+
+    # zoomed out, about 8 data units per canvas pixel
+    layer._update_draw(8, corners, (512, 512))
+    positions, counts = layer._view_lod
+    assert 0 < len(positions) < len(layer.data)
+    assert counts.sum() == len(layer.data)
+    assert len(events) == 1
+
+    # zooming in shows all the points
+    layer._update_draw(0.01, corners, (512, 512))
+    assert layer._view_lod is None
+    assert len(events) == 2
+
+
+def test_lod_disabled(always_lod):
+    layer = Points(_random_points())
+    layer._update_draw(8, np.array([[0, 0], [100, 100]]), (512, 512))
+    assert layer._view_lod is None
+
+    layer.lod = True
+    assert layer._view_lod is not None
+    assert layer._get_state()['lod']
+
+
+def test_lod_not_used_for_few_points():
+    layer = Points(_random_points(n=10), lod=True)
+    layer._update_draw(8, np.array([[0, 0], [100, 100]]), (512, 512))
+    assert layer._view_lod is None
+
+
+def test_lod_built_when_drawn(always_lod):
+    layer = Points(_random_points(), lod=True)
+    layer.refresh()
+    assert layer._slicing_state._points_lod is None
+
+    layer._update_draw(8, np.array([[0, 0], [100, 100]]), (512, 512))
+    assert layer._slicing_state._points_lod is not None
@@ -0,0 +1,164 @@
+import numpy as np
+import pytest
+
+from napari.components.dims import Dims
+from napari.layers import Points
+from napari.layers.points._points_mouse_bindings import (
+    _select_points_from_drag,
+)
+from napari.layers.points._spatial_index import _PointsIndex
+from napari.layers.utils import _axis_index
+
+
+@pytest.fixture
+def always_indexed(monkeypatch):
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+
+
+def _random_points(n=2000, ndim=3, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.round(rng.uniform(0, 50, size=(n, ndim)), 1)
+
+
+def test_index_is_built_on_second_query(always_indexed):
+    data = _random_points()
+    index = _PointsIndex(data, np.ones(len(data)))
+    assert index.in_box([0], [10], [12]) is None
+    assert index.in_box([1, 2], [0, 0], [1, 1]) is None
+    assert index.in_box([0], [10], [12]) is not None
+
+
+def test_index_not_used_for_few_points():
+    data = _random_points(n=10)
+    index = _PointsIndex(data, np.ones(len(data)))
+    for _ in range(2):
+        assert index.in_box([0], [10], [12]) is None
+
+
+def test_in_box(always_indexed):
+    data = _random_points()
+    index = _PointsIndex(data, np.ones(len(data)))
+    low, high = np.array([10.0, 20.0]), np.array([10.5, 35.0])
+    index.in_box([0, 2], low, high)
+    found = index.in_box([0, 2], low, high)
+    coords = data[:, [0, 2]]
+    expected = np.flatnonzero(np.all((coords >= low) & (coords <= high), 1))
+    np.testing.assert_array_equal(found, expected)
+    assert (0, 2) in index._trees
+
+    index.in_box([1], [10.0], [10.5])
+    found = index.in_box([1], [10.0], [10.5])
+    coords = data[:, 1]
+    expected = np.flatnonzero((coords >= 10) & (coords <= 10.5))
+    np.testing.assert_array_equal(found, expected)
+    assert (1,) not in index._trees
+
+
+def _dims(point=(0, 0, 0), ndisplay=2):
+    return Dims(
+        ndim=3, ndisplay=ndisplay, range=((0, 100, 0.1),) * 3, point=point
+    )
+
+
+def _indexed_and_brute_force_layers(**kwargs):
+    data = _random_points()
+    size = np.random.default_rng(1).uniform(0.5, 3, len(data))
+    return Points(data, size=size, **kwargs), Points(data, size=size, **kwargs)
+
+
+@pytest.mark.parametrize('out_of_slice_display', [True, False])
+@pytest.mark.parametrize('point', [0, 10, 24.7, 49])
+def test_slicing_with_index(monkeypatch, out_of_slice_display, point):
+    indexed, brute_force = _indexed_and_brute_force_layers(
+        out_of_slice_display=out_of_slice_display
+    )
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+    dims = _dims((point, 0, 0))
+    # the tree is built the second time the layer is sliced
+    indexed._slice_dims(_dims((point + 1, 0, 0)))
+    indexed._slice_dims(dims)
+    assert 0 in indexed._spatial_index._sorted_axes._sorted
+
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 10**9)
+    brute_force._slice_dims(dims)
+    np.testing.assert_array_equal(
+        indexed._indices_view, brute_force._indices_view
+    )
+    np.testing.assert_allclose(
+        indexed._view_size_scale, brute_force._view_size_scale
+    )
+
+
+def test_get_value_with_index(monkeypatch):
+    indexed, brute_force = _indexed_and_brute_force_layers()
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+    dims = _dims((25, 0, 0))
+    indexed._slice_dims(dims)
+    brute_force._slice_dims(dims)
+    positions = np.random.default_rng(2).uniform(0, 50, size=(50, 3))
+    positions[:, 0] = 25
+    indexed_values = [indexed._get_value(p) for p in positions]
+    assert indexed._spatial_index._trees[(1, 2)] is not None
+
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 10**9)
+    assert indexed_values == [brute_force._get_value(p) for p in positions]
+    assert any(v is not None for v in indexed_values)
+
+
+def test_get_value_3d_with_index(monkeypatch):
+    indexed, brute_force = _indexed_and_brute_force_layers()
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+    dims = _dims(ndisplay=3)
+    indexed._slice_dims(dims)
+    brute_force._slice_dims(dims)
+    rng = np.random.default_rng(3)
+    rays = []
+    for point in indexed.data[rng.choice(len(indexed.data), 20)]:
+        start, end = point.copy(), point.copy()
+        start[0], end[0] = -5, 55
+        rays.append((start, end))
+    indexed_values = [
+        indexed._get_value_3d(start, end, [0, 1, 2]) for start, end in rays
+    ]
+
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 10**9)
+    expected = [
+        brute_force._get_value_3d(start, end, [0, 1, 2]) for start, end in rays
+    ]
+    assert indexed_values == expected
+    assert None not in indexed_values
+
+
+def test_drag_box_selection_with_index(monkeypatch):
+    indexed, brute_force = _indexed_and_brute_force_layers()
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+    dims = _dims((25, 0, 0))
+    for layer in (indexed, brute_force):
+        layer._slice_dims(dims)
+        layer._drag_box = np.array([[10, 5], [20, 40]])
+    for _ in range(2):
+        _select_points_from_drag(indexed, modify_selection=False, n_display=2)
+
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 10**9)
+    _select_points_from_drag(brute_force, modify_selection=False, n_display=2)
+    assert indexed.selected_data == brute_force.selected_data
+    assert len(indexed.selected_data) > 0
+
+
+def test_index_invalidated_on_data_change(always_indexed):
+    layer = Points(_random_points())
+    dims = _dims((60, 0, 0))
+    layer._slice_dims(_dims((61, 0, 0)))
+    layer._slice_dims(dims)
+    assert len(layer._indices_view) == 0
+
+    layer.data[:10, 0] = 60
+    layer.refresh()
+    layer._slice_dims(dims)
+    np.testing.assert_array_equal(layer._indices_view, np.arange(10))
+
+    layer.add([60, 1, 1])
+    layer._slice_dims(dims)
+    np.testing.assert_array_equal(
+        layer._indices_view, [*range(10), len(layer.data) - 1]
+    )
@@ -22,6 +22,12 @@ from napari.layers.base._base_mouse_bindings import (
     highlight_box_handles,
     transform_with_box,
 )
+from napari.layers.points._density import (
+    _PointsDensity,
+    density_bin_size,
+    density_region,
+)
+from napari.layers.points._lod import _MIN_LOD_POINTS, _PointsLOD
 from napari.layers.points._points_constants import (
     Mode,
     PointsProjectionMode,
@@ -36,6 +42,7 @@ from napari.layers.points._points_utils import (
     points_to_squares,
 )
 from napari.layers.points._slice import _PointSliceRequest, _PointSliceResponse
+from napari.layers.points._spatial_index import _PointsIndex
 from napari.layers.utils._color_manager_constants import ColorMode
 from napari.layers.utils._slice_input import (
     _SliceInput,
@@ -53,7 +60,7 @@ from napari.layers.utils.layer_utils import (
 )
 from napari.layers.utils.text_manager import TextManager
 from napari.types import LayerDataType
-from napari.utils.colormaps import Colormap, ValidColormapArg
+from napari.utils.colormaps import Colormap, ValidColormapArg, ensure_colormap
 from napari.utils.colormaps.standardize_color import hex_to_name, rgb_to_hex
 from napari.utils.events import Event
 from napari.utils.events.custom_types import Array
@@ -123,6 +130,17 @@ class Points(Layer):
         Currently, this only applies to dask arrays.
     canvas_size_limits : tuple of float
         Lower and upper limits for the size of points in canvas pixels.
+    density : bool
+        If True, in 2D the points are drawn as an image of their density,
+        binned at about the resolution of the canvas, instead of as markers.
+    density_colormap : str, napari.utils.Colormap
+        Colormap of the image of the density of the points.
+    density_contrast_limits : None, (float, float)
+        Contrast limits of the image of the density of the points. If None,
+        the limits are from 0 to the maximum density in the binned region.
+    density_weights : str, optional
+        Name of the feature summed in each bin of the image of the density
+        of the points. If None, the points are counted.
     experimental_clipping_planes : list of dicts, list of ClippingPlane, or ClippingPlaneList
         Each dict defines a clipping plane in 3D in data coordinates.
         Valid dictionary keys are {'position', 'normal', and 'enabled'}.
@@ -144,6 +162,11 @@ class Points(Layer):
     features : dict[str, array-like] or DataFrame
         Features table where each row corresponds to a point and each column
         is a feature.
+    lod : bool
+        If True, when zoomed out in 2D on many points, only one point is
+        drawn per canvas pixel, from a hierarchy of grids aggregating the
+        points in view, like the lower resolutions of multiscale images.
+        Full detail returns when zooming in.
     metadata : dict
         Layer metadata.
     n_dimensional : bool
@@ -308,6 +331,19 @@ class Points(Layer):
         Amount of antialiasing in canvas pixels.
     canvas_size_limits : tuple of float
         Lower and upper limits for the size of points in canvas pixels.
+    density : bool
+        Whether the points are drawn as an image of their density in 2D.
+    density_colormap : napari.utils.Colormap
+        Colormap of the image of the density of the points.
+    density_contrast_limits : None, (float, float)
+        Contrast limits of the image of the density of the points, or None
+        for limits from 0 to the maximum density in the binned region.
+    density_weights : str or None
+        Name of the feature summed in each bin of the image of the density
+        of the points, or None to count the points.
+    lod : bool
+        Whether only one point is drawn per canvas pixel when zoomed out in
+        2D on many points.
     shown : 1-D array of bool
         Whether each point is shown.
     units: tuple of pint.Unit
@@ -325,7 +361,7 @@ class Points(Layer):
         Border width of the point markers in the currently viewed slice.
     _indices_view : array (M, )
         Integer indices of the points in the currently viewed slice and are shown.
-    _selected_view :
+    _selected_view : array (K, )
         Integer indices of selected points in the currently viewed slice within
         the `_view_data` array.
     _selected_box : array (4, 2) or None
@@ -385,6 +421,10 @@ class Points(Layer):
         border_width_is_relative=True,
         cache=True,
         canvas_size_limits=(2, 10000),
+        density=False,
+        density_colormap='viridis',
+        density_contrast_limits=None,
+        density_weights=None,
         experimental_clipping_planes=None,
         face_color='white',
         face_color_cycle=None,
@@ -392,6 +432,7 @@ class Points(Layer):
         face_contrast_limits=None,
         feature_defaults=None,
         features=None,
+        lod=False,
         metadata=None,
         n_dimensional=None,
         name=None,
@@ -425,9 +466,18 @@ class Points(Layer):
         data, ndim = fix_data_points(data, ndim)
 
         # Indices of selected points
-        self._selected_data_stored = set()
         self._selected_data_history = set()
         self._selected_data: Selection[int] = Selection()
+        # Boolean mask of the selected points, aligned with the data and
+        # updated with the changes of the selection, or None if not built
+        self._selected_mask_cache: np.ndarray | None = None
+        # Counter of the changes of the selection, to check whether the
+        # highlight must be updated without comparing selections
+        self._selection_version = 0
+        self._selection_version_stored: int | None = None
+        self._selected_data.events.items_changed.connect(
+            self._on_selection_changed
+        )
         # Index of hovered point
         self._value = None
         self._value_stored = None
@@ -488,12 +538,24 @@ class Points(Layer):
             shading=Event,
             antialiasing=Event,
             canvas_size_limits=Event,
+            lod=Event,
+            density=Event,
             features=Event,
             feature_defaults=Event,
         )
 
         # Save the point coordinates
         self._data = np.asarray(data)
+        self._points_index: _PointsIndex | None = None
+        self._lod = bool(lod)
+        self._density = bool(density)
+        self._density_colormap = ensure_colormap(density_colormap)
+        self._density_contrast_limits = (
+            None
+            if density_contrast_limits is None
+            else tuple(density_contrast_limits)
+        )
+        self._density_weights: str | None = None
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
@@ -560,6 +622,7 @@ class Points(Layer):
         self.canvas_size_limits = canvas_size_limits
         self.shading = shading
         self.antialiasing = antialiasing
+        self.density_weights = density_weights
 
         # Trigger generation of view slice and thumbnail
         self.refresh(extent=False)
@@ -624,6 +687,7 @@ class Points(Layer):
         data, _ = fix_data_points(data, self.ndim)
         cur_npoints = len(self._data)
         self._data = data
+        self._points_index = None
 
         # Add/remove property and style values based on the number of new points.
         with (
@@ -720,9 +784,24 @@ class Points(Layer):
         self._update_color_manager(
             self._border, self._feature_table, 'border_color'
         )
+        if (
+            self._density_weights is not None
+            and self._density_weights not in self.features
+        ):
+            self._density_weights = None
+            warnings.warn(
+                trans._(
+                    'property used for {name} dropped',
+                    deferred=True,
+                    name='density_weights',
+                ),
+                RuntimeWarning,
+            )
+        self._slicing_state._points_density = None
         self.text.refresh(self.features)
         self.events.properties()
         self.events.features()
+        self.events.density()
 
     @property
     def feature_defaults(self) -> pd.DataFrame:
@@ -824,6 +903,54 @@ class Points(Layer):
             features=self.features,
         )
 
+    def _on_data_refresh(self) -> None:
+        self._points_index = None
+
+    @property
+    def _spatial_index(self) -> _PointsIndex:
+        """Index of the coordinates of the points, built lazily."""
+        if self._points_index is None:
+            self._points_index = _PointsIndex(self._data, self._size)
+        return self._points_index
+
+    def _view_positions_in_box(
+        self, low: npt.ArrayLike, high: npt.ArrayLike
+    ) -> npt.NDArray[np.intp] | None:
+        """Positions in view of the points whose displayed coordinates are in
+        a box, using the spatial index.
+
+        Returns None if the spatial index is not used, in which case all the
+        points in view must be checked.
+        """
+        candidates = self._spatial_index.in_box(
+            self._slice_input.displayed, low, high
+        )
+        if candidates is None:
+            return None
+        # The indices of the points in view are sorted.
+        view = self._indices_view
+        positions = np.searchsorted(view, candidates)
+        valid = positions < len(view)
+        valid[valid] = view[positions[valid]] == candidates[valid]
+        return positions[valid]
+
+    def _view_data_and_size(
+        self, positions: npt.NDArray[np.intp] | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Coordinates and sizes of the points at the given positions in
+        view, or of all the points in view if positions is None.
+        """
+        if positions is None:
+            return self._view_data, self._view_size
+        indices = self._indices_view[positions]
+        scale = self._view_size_scale
+        if isinstance(scale, np.ndarray):
+            scale = scale[positions]
+        return (
+            self.data[np.ix_(indices, self._slice_input.displayed)],
+            self.size[indices] * scale,
+        )
+
     def refresh_text(self) -> None:
         """Refresh the text values.
 
@@ -922,7 +1049,7 @@ class Points(Layer):
         symbol = coerce_symbols(np.array([symbol]))[0]
         self._current_symbol = symbol
         if self._update_properties and len(self.selected_data) > 0:
-            self.symbol[list(self.selected_data)] = symbol
+            self.symbol[self._selected_indices] = symbol
             self.events.symbol()
         self.events.current_symbol()
 
@@ -971,7 +1098,7 @@ class Points(Layer):
 
         self._current_size = size
         if self._update_properties and len(self.selected_data) > 0:
-            idx = np.fromiter(self.selected_data, dtype=int)
+            idx = self._selected_indices
             self.size[idx] = size
             # TODO: also here technically no need to clear base extent
             self.refresh(highlight=False)
@@ -1010,6 +1137,104 @@ class Points(Layer):
         self._shading = Shading(value)
         self.events.shading()
 
+    @property
+    def lod(self) -> bool:
+        """bool: draw one point per canvas pixel when zoomed out in 2D.
+
+        When there are many points in view, the points drawn are those of
+        the coarsest level of detail whose cells are smaller than a canvas
+        pixel. Hit-testing and selection still use all the points.
+        """
+        return self._lod
+
+    @lod.setter
+    def lod(self, lod: bool) -> None:
+        self._lod = bool(lod)
+        self._slicing_state._drawn_lod_level = None
+        self.events.lod()
+
+    @property
+    def density(self) -> bool:
+        """bool: draw the density of the points in 2D instead of markers.
+
+        The density is the number of points, or the sum of the
+        ``density_weights`` feature, in bins about as large as canvas
+        pixels, drawn with ``density_colormap``. Hit-testing and selection
+        still use the points.
+        """
+        return self._density
+
+    @density.setter
+    def density(self, density: bool) -> None:
+        self._density = bool(density)
+        self._slicing_state._points_density = None
+        self.events.density()
+
+    @property
+    def density_colormap(self) -> Colormap:
+        """napari.utils.Colormap: colormap of the density of the points."""
+        return self._density_colormap
+
+    @density_colormap.setter
+    def density_colormap(self, colormap: ValidColormapArg) -> None:
+        self._density_colormap = ensure_colormap(colormap)
+        self.events.density()
+
+    @property
+    def density_contrast_limits(self) -> tuple[float, float] | None:
+        """None, (float, float): contrast limits of the density of the
+        points, or None for limits from 0 to the maximum density in the
+        binned region.
+        """
+        return self._density_contrast_limits
+
+    @density_contrast_limits.setter
+    def density_contrast_limits(
+        self, contrast_limits: tuple[float, float] | None
+    ) -> None:
+        self._density_contrast_limits = (
+            None if contrast_limits is None else tuple(contrast_limits)
+        )
+        self.events.density()
+
+    @property
+    def density_weights(self) -> str | None:
+        """str or None: name of the feature summed in each bin of the
+        density of the points, or None to count the points.
+        """
+        return self._density_weights
+
+    @density_weights.setter
+    def density_weights(self, name: str | None) -> None:
+        if name is not None and name not in self.features:
+            raise ValueError(
+                trans._(
+                    'density_weights must be the name of a feature, got {name}',
+                    deferred=True,
+                    name=name,
+                )
+            )
+        self._density_weights = name
+        self._slicing_state._points_density = None
+        self.events.density()
+
+    @property
+    def _view_density(self) -> _PointsDensity | None:
+        """Density of the points in view around the current view, or None
+        if the points are drawn as markers.
+        """
+        return self._slicing_state.density()
+
+    @property
+    def _view_lod(
+        self,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]] | None:
+        """Positions in view of the points drawn at the current level of
+        detail and the number of points each of them stands for, or None if
+        all the points in view are drawn.
+        """
+        return self._slicing_state.lod()
+
     @property
     def canvas_size_limits(self) -> tuple[float, float]:
         """Limit the canvas size of points"""
@@ -1091,7 +1316,7 @@ class Points(Layer):
     def current_border_width(self, border_width: None | float) -> None:
         self._current_border_width = border_width
         if self._update_properties and len(self.selected_data) > 0:
-            idx = np.fromiter(self.selected_data, dtype=int)
+            idx = self._selected_indices
             self.border_width[idx] = border_width
             self.refresh(highlight=False)
             self.events.border_width()
@@ -1401,6 +1626,11 @@ class Points(Layer):
                 'shading': self.shading,
                 'antialiasing': self.antialiasing,
                 'canvas_size_limits': self.canvas_size_limits,
+                'lod': self.lod,
+                'density': self.density,
+                'density_colormap': self.density_colormap.model_dump(),
+                'density_contrast_limits': self.density_contrast_limits,
+                'density_weights': self.density_weights,
                 'shown': self.shown,
             }
         )
@@ -1420,7 +1650,7 @@ class Points(Layer):
         if not len(self._selected_data):
             self._set_highlight()
             return
-        index = list(self._selected_data)
+        index = self._selected_indices
         with self.block_update_properties():
             if (
                 unique_border_color := _unique_element(
@@ -1502,7 +1732,7 @@ class Points(Layer):
             self.selected_data = set()
             self.mouse_pan = True
         elif mode != Mode.SELECT or self._mode != Mode.SELECT:
-            self._selected_data_stored = set()
+            self._selection_version_stored = None
 
         self._set_highlight()
         return mode
@@ -1513,10 +1743,58 @@ class Points(Layer):
         return self._slicing_state._indices_view
 
     @property
-    def _selected_view(self) -> list[int]:
+    def _selected_view(self) -> npt.NDArray[np.intp]:
         """Indices of selected points within the currently viewed slice"""
         return self._slicing_state._selected_view
 
+    @property
+    def _selected_mask(self) -> npt.NDArray[np.bool_]:
+        """(N,) array: True for the selected points."""
+        mask = self._selected_mask_cache
+        if mask is None or len(mask) != len(self.data):
+            mask = np.zeros(len(self.data), dtype=bool)
+            mask[self._valid_indices(self._selected_data)] = True
+            self._selected_mask_cache = mask
+        return mask
+
+    @property
+    def _selected_indices(self) -> npt.NDArray[np.intp]:
+        """Sorted indices of the selected points."""
+        return np.flatnonzero(self._selected_mask)
+
+    def _valid_indices(self, indices: Iterable[int]) -> npt.NDArray[np.intp]:
+        """Indices of points in indices, without those out of the data."""
+        array = np.fromiter(indices, dtype=np.intp)
+        return array[(array >= 0) & (array < len(self.data))]
+
+    def _on_selection_changed(
+        self, added: tuple[int, ...], removed: tuple[int, ...]
+    ) -> None:
+        """Update the mask of the selected points with the changes."""
+        self._selection_version += 1
+        mask = self._selected_mask_cache
+        if mask is None:
+            return
+        if len(mask) != len(self.data):
+            self._selected_mask_cache = None
+            return
+        mask[self._valid_indices(removed)] = False
+        mask[self._valid_indices(added)] = True
+
+    def _view_position(self, index: int | None) -> int | None:
+        """Position of the point at index within the currently viewed slice.
+
+        Returns None if the point is not in view.
+        """
+        indices_view = self._indices_view
+        if index is None or len(indices_view) == 0:
+            return None
+        # indices of the points in view are sorted
+        position = int(np.searchsorted(indices_view, index))
+        if position < len(indices_view) and indices_view[position] == index:
+            return position
+        return None
+
     @property
     def _view_size_scale(
         self,
@@ -1669,6 +1947,15 @@ class Points(Layer):
         )
         # update highlight only if scale has changed, otherwise causes a cycle
         self._set_highlight(force=(prev_scale != self.scale_factor))
+        # draw another level of detail if the zoom changed enough
+        level = self._slicing_state.lod_level()
+        if level != self._slicing_state._drawn_lod_level:
+            self._slicing_state._drawn_lod_level = level
+            self.events.lod()
+        # bin the points again if the view left the binned region
+        density = self._slicing_state._points_density
+        if self.density and self._slicing_state.density() is not density:
+            self.events.density()
 
     def _get_value_(
         self,
@@ -1703,29 +1990,35 @@ class Points(Layer):
             Index of point that is at the current coordinate if any.
         """
         # Display points if there are any in this slice
-        view_data = self._view_data
         selection = None
-        if len(view_data) > 0:
-            displayed_position = [
-                position[i] for i in self._slice_input.displayed
-            ]
+        if len(self._indices_view) > 0:
+            displayed_position = np.array(
+                [position[i] for i in self._slice_input.displayed]
+            )
             # positions are scaled anisotropically by scale, but sizes are not,
             # so we need to calculate the ratio to correctly map to screen coordinates
             scale_ratio = (
                 self.scale[self._slice_input.displayed] / self.scale[-1]
             )
+            radius = self._spatial_index.max_size / scale_ratio / 2
+            positions = self._view_positions_in_box(
+                displayed_position - radius, displayed_position + radius
+            )
+            view_data, view_size = self._view_data_and_size(positions)
             # Get the point sizes
             # TODO: calculate distance in canvas space to account for canvas_size_limits.
             # Without this implementation, point hover and selection (and anything depending
             # on self.get_value()) won't be aware of the real extent of points, causing
             # unexpected behaviour. See #3734 for details.
-            sizes = np.expand_dims(self._view_size, axis=1) / scale_ratio / 2
+            sizes = np.expand_dims(view_size, axis=1) / scale_ratio / 2
             distances = abs(view_data - displayed_position)
             in_slice_matches = np.all(
                 distances <= sizes,
                 axis=1,
             )
             indices = np.where(in_slice_matches)[0]
+            if positions is not None:
+                indices = positions[indices]
             if len(indices) > 0:
                 selection = self._indices_view[indices[-1]]
 
@@ -1760,9 +2053,20 @@ class Points(Layer):
             start_point, end_point, dims_displayed
         )
 
+        # positions are scaled anisotropically by scale, but sizes are not,
+        # so we need to calculate the ratio to correctly map to screen coordinates
+        scale_ratio = self.scale[self._slice_input.displayed] / self.scale[-1]
+        # only the points near the ray segment can be intersected
+        segment = np.array([start_point, end_point])[:, dims_displayed]
+        radius = self._spatial_index.max_size / np.min(scale_ratio)
+        positions = self._view_positions_in_box(
+            segment.min(axis=0) - radius, segment.max(axis=0) + radius
+        )
+        view_data, view_size = self._view_data_and_size(positions)
+
         # project the in view points onto the plane
         projected_points, projection_distances = project_points_onto_plane(
-            points=self._view_data,
+            points=view_data,
             plane_point=plane_point,
             plane_normal=plane_normal,
         )
@@ -1775,11 +2079,8 @@ class Points(Layer):
         )
         rotated_click_point = np.dot(rotation_matrix, plane_point)
 
-        # positions are scaled anisotropically by scale, but sizes are not,
-        # so we need to calculate the ratio to correctly map to screen coordinates
-        scale_ratio = self.scale[self._slice_input.displayed] / self.scale[-1]
         # find the points the click intersects
-        sizes = np.expand_dims(self._view_size, axis=1) / scale_ratio / 2
+        sizes = np.expand_dims(view_size, axis=1) / scale_ratio / 2
         distances = abs(rotated_points - rotated_click_point)
         in_slice_matches = np.all(
             distances <= sizes,
@@ -1791,6 +2092,8 @@ class Points(Layer):
             # find the point that is most in the foreground
             candidate_point_distances = projection_distances[indices]
             closest_index = indices[np.argmin(candidate_point_distances)]
+            if positions is not None:
+                closest_index = positions[closest_index]
             selection = self._indices_view[closest_index]
         else:
             selection = None
@@ -1869,42 +2172,27 @@ class Points(Layer):
         """
         # Check if any point ids have changed since last call
         if (
-            self.selected_data == self._selected_data_stored
+            self._selection_version == self._selection_version_stored
             and self._value == self._value_stored
             and np.array_equal(self._drag_box, self._drag_box_stored)
         ) and not force:
             return
-        self._selected_data_stored = Selection(self.selected_data)
+        self._selection_version_stored = self._selection_version
         self._value_stored = copy(self._value)
         self._drag_box_stored = copy(self._drag_box)
 
         if self._highlight_visible and (
             self._value is not None or len(self._selected_view) > 0
         ):
-            if len(self._selected_view) > 0:
-                index = copy(self._selected_view)
-                # highlight the hovered point if not in adding mode
-                if (
-                    self._value in self._indices_view
-                    and self._mode == Mode.SELECT
-                    and not self._is_selecting
-                ):
-                    hover_point = list(self._indices_view).index(self._value)
-                    if hover_point not in index:
-                        index.append(hover_point)
-                index.sort()
-            else:
-                # only highlight hovered points in select mode
-                if (
-                    self._value in self._indices_view
-                    and self._mode == Mode.SELECT
-                    and not self._is_selecting
-                ):
-                    hover_point = list(self._indices_view).index(self._value)
-                    index = [hover_point]
-                else:
-                    index = []
-
+            index = np.asarray(self._selected_view, dtype=np.intp)
+            # only highlight the hovered point in select mode
+            hover_point = self._view_position(self._value)
+            if (
+                hover_point is not None
+                and self._mode == Mode.SELECT
+                and not self._is_selecting
+            ):
+                index = np.union1d(index, [hover_point]).astype(np.intp)
             self._highlight_index = index
         else:
             self._highlight_index = []
@@ -2005,6 +2293,7 @@ class Points(Layer):
         """
         indices = sorted(indices)
         if len(indices):
+            selected_mask = np.delete(self._selected_mask, indices)
             self.events.data(
                 value=self.data,
                 action=ActionType.REMOVING,
@@ -2036,20 +2325,12 @@ class Points(Layer):
 
             self._set_data(np.delete(self.data, indices, axis=0))
 
-            if len(self.data) == 0 and self.selected_data:
-                self.selected_data.clear()
-            elif self.selected_data:
-                selected_not_removed = self.selected_data - set(indices)
-                if selected_not_removed:
-                    indices_array = np.array(indices)
-                    remaining_selected = np.fromiter(
-                        selected_not_removed,
-                        dtype=np.intp,
-                        count=len(selected_not_removed),
-                    )
-                    shifts = np.searchsorted(indices_array, remaining_selected)
-                    new_selected_indices = remaining_selected - shifts
-                    self.selected_data = set(new_selected_indices)
+            if self.selected_data:
+                # the mask is already up to date with the new selection
+                self._selected_mask_cache = selected_mask
+                remaining_selected = np.flatnonzero(selected_mask)
+                if len(remaining_selected):
+                    self.selected_data = remaining_selected.tolist()
                 else:
                     self.selected_data.clear()
 
@@ -2120,7 +2401,7 @@ class Points(Layer):
 
     def remove_selected(self) -> None:
         """Remove all selected points."""
-        self.remove(list(self.selected_data))
+        self.remove(self._selected_indices.tolist())
 
     def _move(
         self,
@@ -2230,18 +2511,18 @@ class Points(Layer):
                 ),
             )
 
-            self._slicing_state._selected_view = list(
-                range(npoints, npoints + len(self._clipboard['data']))
+            self._slicing_state._selected_view = np.arange(
+                npoints, npoints + len(self._clipboard['data'])
             )
             self._selected_data.update(
-                set(range(totpoints, totpoints + len(self._clipboard['data'])))
+                range(totpoints, totpoints + len(self._clipboard['data']))
             )
             self.refresh()
 
     def _copy_data(self) -> None:
         """Copy selected points to clipboard."""
         if len(self.selected_data) > 0:
-            index = list(self.selected_data)
+            index = self._selected_indices
             self._clipboard = {
                 'data': deepcopy(self.data[index]),
                 'border_color': deepcopy(self.border_color[index]),
@@ -2480,11 +2761,16 @@ class _PointsSlicingState(_LayerSlicingState):
         super().__init__(layer, data, cache)
         self.__indices_view = np.empty(0, int)
         # Indices of selected points within the currently viewed slice
-        self._selected_view = []
+        self._selected_view: npt.NDArray[np.intp] = np.empty(0, np.intp)
         # initialize view data
         self._view_size_scale: (
             float | np.ndarray[tuple[int], np.dtype[np.float64]]
         ) = 1.0
+        # levels of detail of the points in view, built when first drawn
+        self._points_lod: _PointsLOD | None = None
+        self._drawn_lod_level: int | None = None
+        # density of the points around the view, binned when first drawn
+        self._points_density: _PointsDensity | None = None
 
     def _set_view_slice(self) -> None:
         """Sets the view given the indices to slice with."""
@@ -2516,6 +2802,7 @@ class _PointsSlicingState(_LayerSlicingState):
             projection_mode=self.layer.projection_mode,
             out_of_slice_display=self.layer.out_of_slice_display,
             size=self.layer.size,
+            spatial_index=self.layer._spatial_index,
         )
 
     def _update_slice_response(self, response: _PointSliceResponse) -> None:
@@ -2536,6 +2823,9 @@ class _PointsSlicingState(_LayerSlicingState):
             self._view_size_scale = scale[self.layer.shown[indices]]
 
         self._indices_view = np.array(indices, dtype=int)
+        self._points_lod = None
+        self._drawn_lod_level = None
+        self._points_density = None
         # get the selected points that are in view
 
         # WARNING This `with` will be removed in future
@@ -2543,16 +2833,87 @@ class _PointsSlicingState(_LayerSlicingState):
             self.update_selected_view()
 
     def update_selected_view(self):
-        self._selected_view = list(
-            np.intersect1d(
-                np.array(list(self.layer._selected_data)),
-                self._indices_view,
-                return_indices=True,
-            )[2]
-        )
+        mask = self.layer._selected_mask
+        indices_view = self._indices_view
+        # the view may still refer to points removed since it was sliced
+        in_data = indices_view < len(mask)
+        selected = np.zeros(len(indices_view), dtype=bool)
+        selected[in_data] = mask[indices_view[in_data]]
+        self._selected_view = np.flatnonzero(selected)
         # WARNING This will be removed in future
         self.layer._set_highlight(force=True)
 
+    def lod_level(self) -> int | None:
+        """Level of detail of the points in view to draw at the current
+        zoom, or None if all the points should be drawn.
+        """
+        layer = self.layer
+        if (
+            not layer.lod
+            or self._slice_input.ndisplay != 2
+            or len(self._indices_view) < _MIN_LOD_POINTS
+        ):
+            return None
+        if self._points_lod is None:
+            self._points_lod = _PointsLOD(layer._view_data)
+        # cells must be smaller than a canvas pixel along both axes
+        displayed_scale = np.abs(layer.scale[self._slice_input.displayed])
+        pixel_size = layer.scale_factor / float(np.max(displayed_scale))
+        return self._points_lod.level_for_cell_size(pixel_size)
+
+    def lod(
+        self,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]] | None:
+        """Positions in view of the points to draw at the current level of
+        detail and the number of points in their cells, or None if all the
+        points should be drawn.
+        """
+        level = self.lod_level()
+        # the levels are only built when drawn, which records the level
+        self._drawn_lod_level = level
+        if level is None:
+            return None
+        assert self._points_lod is not None
+        positions, counts = self._points_lod.level(level)
+        if len(positions) == len(self._indices_view):
+            return None
+        return positions, counts
+
+    def density(self) -> _PointsDensity | None:
+        """Density of the points in view around the current view, binned
+        again if the view left the binned region or the zoom changed, or
+        None if the points are drawn as markers.
+        """
+        layer = self.layer
+        if not layer.density or self._slice_input.ndisplay != 2:
+            return None
+        displayed = self._slice_input.displayed
+        # bins about as large as a canvas pixel
+        bin_size = density_bin_size(
+            layer.scale_factor / np.abs(layer.scale[displayed])
+        )
+        low, high = layer.corner_pixels[:, displayed]
+        density = self._points_density
+        if density is not None and density.covers(low, high, bin_size):
+            return density
+        origin, shape = density_region(low, high, bin_size)
+        positions = layer._view_positions_in_box(
+            origin, origin + bin_size * shape
+        )
+        if positions is None:
+            coords = layer._view_data
+            indices = self._indices_view
+        else:
+            indices = self._indices_view[positions]
+            coords = layer.data[np.ix_(indices, displayed)]
+        weights = None
+        if layer.density_weights in layer.features:
+            weights = layer.features[layer.density_weights].to_numpy()[indices]
+        self._points_density = _PointsDensity.from_points(
+            coords, origin, shape, bin_size, weights=weights
+        )
+        return self._points_density
+
     @property
     def _indices_view(self):
         """Indices of the points in the currently viewed slice."""
@@ -16,6 +16,7 @@ import numpy as np
 from napari.layers.shapes import _accelerated_triangulate_python
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from types import ModuleType
 
 _accelerated_triangulate_numba: ModuleType | None
@@ -46,6 +47,9 @@ SWAPPABLE_NUMBA = (
     'reconstruct_polygons_from_edges',
 )
 
+closed_edge_mesh_sizes: Callable[..., np.ndarray] | None
+triangulate_closed_polygons: Callable[..., np.ndarray] | None
+
 if _accelerated_triangulate_numba is not None:
     remove_path_duplicates = (
         _accelerated_triangulate_numba.remove_path_duplicates
@@ -63,6 +67,14 @@ if _accelerated_triangulate_numba is not None:
     reconstruct_polygons_from_edges = (
         _accelerated_triangulate_numba.reconstruct_polygons_from_edges
     )
+    # There is no NumPy-only alternative: without numba, polygons are
+    # triangulated one by one.
+    closed_edge_mesh_sizes = (
+        _accelerated_triangulate_numba.closed_edge_mesh_sizes
+    )
+    triangulate_closed_polygons = (
+        _accelerated_triangulate_numba.triangulate_closed_polygons
+    )
 
 else:
     remove_path_duplicates = (
@@ -78,6 +90,8 @@ else:
     reconstruct_polygons_from_edges = (
         _accelerated_triangulate_python.reconstruct_polygons_from_edges_py
     )
+    closed_edge_mesh_sizes = None
+    triangulate_closed_polygons = None
 
 
 def _set_numba(value: bool) -> None:
@@ -159,3 +173,19 @@ def warmup_numba_cache() -> None:
             _accelerated_triangulate_numba.reconstruct_polygons_from_edges(
                 v, e
             )
+
+    square = np.array([[0, 0], [0, 1], [1, 1], [1, 0]], dtype=np.float32)
+    offsets = np.array([0, 4], dtype=np.int64)
+    n_edge = _accelerated_triangulate_numba.closed_edge_mesh_sizes(
+        square, offsets
+    )[0]
+    _accelerated_triangulate_numba.triangulate_closed_polygons(
+        square,
+        offsets,
+        np.ones(1, dtype=np.float32),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        *(np.empty((4 + n_edge, 2), dtype=np.float32) for _ in range(3)),
+        # two face triangles and two edge triangles less than edge vertices
+        np.empty((n_edge, 3), dtype=np.int32),
+    )
@@ -7,7 +7,7 @@ from math import atan2, pi
 from typing import Literal, overload
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from numba.core import types
 from numba.typed import List
 
@@ -971,3 +971,252 @@ def normalize_vertices_and_edges(
         new_vertices_array[i] = vertex
     edges_array = np.array(list(edges), dtype=np.int64)
     return new_vertices_array, edges_array  # type: ignore[return-value]
+
+
+@njit(cache=True, inline='always')
+def _cross_at(poly: np.ndarray, i: int, j: int, k: int) -> float:
+    """Cross product of the vectors from vertex i to vertices j and k."""
+    return (poly[j, 0] - poly[i, 0]) * (poly[k, 1] - poly[i, 1]) - (
+        poly[j, 1] - poly[i, 1]
+    ) * (poly[k, 0] - poly[i, 0])
+
+
+@njit(cache=True, inline='always')
+def _on_segment(poly: np.ndarray, i: int, j: int, k: int) -> bool:
+    """Whether vertex k, collinear with i and j, is on the segment ij."""
+    return min(poly[i, 0], poly[j, 0]) <= poly[k, 0] <= max(
+        poly[i, 0], poly[j, 0]
+    ) and min(poly[i, 1], poly[j, 1]) <= poly[k, 1] <= max(
+        poly[i, 1], poly[j, 1]
+    )
+
+
+@njit(cache=True, inline='always')
+def _segments_touch(poly: np.ndarray, a: int, b: int, c: int, d: int) -> bool:
+    """Whether the segments ab and cd intersect or touch."""
+    d1 = _cross_at(poly, c, d, a)
+    d2 = _cross_at(poly, c, d, b)
+    d3 = _cross_at(poly, a, b, c)
+    d4 = _cross_at(poly, a, b, d)
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        return True
+    return (
+        (d1 == 0 and _on_segment(poly, c, d, a))
+        or (d2 == 0 and _on_segment(poly, c, d, b))
+        or (d3 == 0 and _on_segment(poly, a, b, c))
+        or (d4 == 0 and _on_segment(poly, a, b, d))
+    )
+
+
+@njit(cache=True)
+def _is_simple_polygon(poly: np.ndarray) -> bool:
+    """Whether a closed polygon has no touching or crossing edges."""
+    n = poly.shape[0]
+    for i in range(n):
+        i1 = (i + 1) % n
+        i2 = (i + 2) % n
+        # adjacent edges must not fold back onto each other
+        if _cross_at(poly, i1, i, i2) == 0 and (
+            (poly[i, 0] - poly[i1, 0]) * (poly[i2, 0] - poly[i1, 0])
+            + (poly[i, 1] - poly[i1, 1]) * (poly[i2, 1] - poly[i1, 1])
+            > 0
+        ):
+            return False
+        for j in range(i + 2, n):
+            if i == 0 and j == n - 1:
+                continue
+            if _segments_touch(poly, i, i1, j, (j + 1) % n):
+                return False
+    return True
+
+
+@njit(cache=True)
+def _ear_clip(poly: np.ndarray, triangles: np.ndarray) -> bool:
+    """Triangulate a simple polygon by ear clipping.
+
+    Ears are searched from vertex 1 onwards, so convex polygons get the
+    same fan triangulation as ``_fan_triangulation``. Returns False,
+    leaving ``triangles`` partially filled, if the polygon is not simple.
+    """
+    n = poly.shape[0]
+    if n < 3 or not _is_simple_polygon(poly):
+        return False
+    area = 0.0
+    for i in range(n):
+        j = (i + 1) % n
+        area += poly[i, 0] * poly[j, 1] - poly[j, 0] * poly[i, 1]
+    if area == 0:
+        return False
+    orientation = 1.0 if area > 0 else -1.0
+    prev = np.empty(n, dtype=np.int64)
+    next_ = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        prev[i] = (i - 1) % n
+        next_[i] = (i + 1) % n
+    remaining = n
+    count = 0
+    current = 1
+    attempts = 0
+    while remaining > 3:
+        p = prev[current]
+        q = next_[current]
+        is_ear = _cross_at(poly, p, current, q) * orientation > 0
+        # no other vertex may be inside or on the candidate ear
+        k = next_[q]
+        while is_ear and k != p:
+            if (
+                _cross_at(poly, p, current, k) * orientation >= 0
+                and _cross_at(poly, current, q, k) * orientation >= 0
+                and _cross_at(poly, q, p, k) * orientation >= 0
+            ):
+                is_ear = False
+            k = next_[k]
+        if is_ear:
+            triangles[count, 0] = p
+            triangles[count, 1] = current
+            triangles[count, 2] = q
+            count += 1
+            next_[p] = q
+            prev[q] = p
+            remaining -= 1
+            attempts = 0
+        else:
+            attempts += 1
+            if attempts > remaining:
+                return False
+        current = q
+    triangles[count, 0] = prev[current]
+    triangles[count, 1] = current
+    triangles[count, 2] = next_[current]
+    return True
+
+
+@njit(cache=True, inline='always')
+def _closed_edge_path(path: np.ndarray) -> np.ndarray:
+    """The path of the edge of a polygon, as in ``generate_2D_edge_meshes``."""
+    if path.shape[0] > 2 and np.all(path[-1] == path[-2]):
+        return path[:-1]
+    return path
+
+
+@njit(cache=True, parallel=True)
+def closed_edge_mesh_sizes(
+    paths: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """Number of edge mesh vertices of many polygons.
+
+    Parameters
+    ----------
+    paths : np.ndarray
+        (V, 2) array of the vertices of all the polygons, one after the
+        other, without repeated vertices.
+    offsets : np.ndarray
+        (P + 1,) array of the offsets of the polygons in ``paths``.
+
+    Returns
+    -------
+    np.ndarray
+        (P,) array of the number of vertices of the edge mesh of each
+        polygon, as generated by ``generate_2D_edge_meshes`` for a closed
+        path. The meshes have two triangles less than vertices.
+    """
+    cos_limit = 1 / (2 * (3.0 / 2) ** 2) - 1.0
+    n_polygons = offsets.shape[0] - 1
+    sizes = np.empty(n_polygons, dtype=np.int64)
+    for i in prange(n_polygons):
+        path = _closed_edge_path(paths[offsets[i] : offsets[i + 1]])
+        direction_vectors, _ = _direction_vec_and_half_length(path, True)
+        sizes[i] = _calc_output_size(direction_vectors, True, cos_limit, False)
+    return sizes
+
+
+@njit(cache=True, parallel=True)
+def triangulate_closed_polygons(
+    paths: np.ndarray,
+    offsets: np.ndarray,
+    edge_widths: np.ndarray,
+    vertex_starts: np.ndarray,
+    triangle_starts: np.ndarray,
+    vertices: np.ndarray,
+    centers: np.ndarray,
+    vertex_offsets: np.ndarray,
+    triangles: np.ndarray,
+) -> np.ndarray:
+    """Triangulate the faces and edges of many polygons in parallel.
+
+    The meshes are written to the given mesh arrays, the face of each
+    polygon followed by its edge, with triangles indexing the vertices of
+    their own face or edge. Faces are triangulated by ear clipping, which is
+    only correct for simple polygons, and edges as by
+    ``generate_2D_edge_meshes`` for closed paths.
+
+    Parameters
+    ----------
+    paths : np.ndarray
+        (V, 2) array of the vertices of all the polygons, one after the
+        other, without repeated vertices.
+    offsets : np.ndarray
+        (P + 1,) array of the offsets of the polygons in ``paths``.
+    edge_widths : np.ndarray
+        (P,) array of the edge width of each polygon.
+    vertex_starts : np.ndarray
+        (P,) array of the index of the first mesh vertex of each polygon.
+        A polygon of N vertices has N face vertices followed by the number
+        of edge vertices given by ``closed_edge_mesh_sizes``.
+    triangle_starts : np.ndarray
+        (P,) array of the index of the first mesh triangle of each polygon,
+        which has two face triangles less than face vertices followed by two
+        edge triangles less than edge vertices.
+    vertices, centers, vertex_offsets : np.ndarray
+        (M, 2) arrays filled with the vertices of the meshes, their centers
+        and offsets, as in ``ShapeList``.
+    triangles : np.ndarray
+        (T, 3) array filled with the triangles of the meshes.
+
+    Returns
+    -------
+    np.ndarray
+        (P,) boolean array, False for the polygons that are not simple,
+        whose face triangles are left unset.
+    """
+    cos_limit = 1 / (2 * (3.0 / 2) ** 2) - 1.0
+    n_polygons = offsets.shape[0] - 1
+    triangulated = np.zeros(n_polygons, dtype=np.bool_)
+    for i in prange(n_polygons):
+        path = paths[offsets[i] : offsets[i + 1]]
+        n_face = path.shape[0]
+        v = vertex_starts[i]
+        t = triangle_starts[i]
+        vertices[v : v + n_face] = path
+        centers[v : v + n_face] = path
+        vertex_offsets[v : v + n_face] = 0
+        triangulated[i] = _ear_clip(
+            path.astype(np.float64), triangles[t : t + n_face - 2]
+        )
+
+        edge_path = _closed_edge_path(path)
+        direction_vectors, bevel_limit_array = _direction_vec_and_half_length(
+            edge_path, True
+        )
+        n_edge = _calc_output_size(direction_vectors, True, cos_limit, False)
+        edge_centers = centers[v + n_face : v + n_face + n_edge]
+        edge_offsets = vertex_offsets[v + n_face : v + n_face + n_edge]
+        edge_triangles = triangles[t + n_face - 2 : t + n_face + n_edge - 4]
+        _generate_2D_edge_meshes_loop(
+            edge_path,
+            True,
+            cos_limit,
+            False,
+            direction_vectors,
+            bevel_limit_array,
+            edge_centers,
+            edge_offsets,
+            edge_triangles,
+        )
+        _normalize_triangle_orientation(
+            edge_triangles, edge_centers, edge_offsets
+        )
+        vertices[v + n_face : v + n_face + n_edge] = (
+            edge_centers + edge_widths[i] * edge_offsets
+        )
+    return triangulated
@@ -0,0 +1,202 @@
+"""Scanline rasterisation of many shapes into one image.
+
+Converting shapes to masks or labels one shape at a time allocates a full
+size mask for each shape. :class:`_ShapesRasterizer` instead computes the
+rows and columns of the pixels of all the shapes in a region of the image
+(e.g. a tile of a large output) at once, from a table of the edges of the
+shapes, so that memory only grows with the size of the region and of the
+shapes in it.
+
+The pixels are the same as those of ``Shape.to_mask``: a pixel is inside a
+filled shape if it is inside the polygon or on its boundary (see
+``skimage.draw.polygon``), and the pixels of paths are those of the lines
+between their rounded vertices.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from napari.layers.shapes._shapes_utils import path_to_pixels
+from napari.utils._indexing import concatenated_ranges
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+#: Tolerance for vertices to be on a pixel, as in skimage.draw.polygon.
+_VERTEX_TOLERANCE = 1e-12
+
+
+class _ShapesRasterizer:
+    """Pixels of the displayed 2D outlines of shapes.
+
+    Parameters
+    ----------
+    outlines : sequence of (N, 2) np.ndarray
+        Displayed vertices of the outline of each shape to rasterise, e.g.
+        the data of a polygon or the face vertices of an ellipse. The owner
+        index of a shape is its position.
+    filled : sequence of bool
+        Whether each shape is filled, or else drawn as a path.
+    plane_shape : 2-tuple of int
+        Shape of the image the shapes are drawn in, along the displayed
+        dimensions.
+    zoom_factor : float
+        Premultiplier applied to coordinates before rasterising.
+    offset : 2-tuple
+        Offset subtracted from coordinates before multiplying by the
+        zoom_factor.
+    """
+
+    def __init__(
+        self,
+        outlines: Sequence[np.ndarray],
+        filled: Sequence[bool],
+        plane_shape: npt.ArrayLike,
+        zoom_factor: float = 1,
+        offset: npt.ArrayLike = (0, 0),
+    ) -> None:
+        self.plane_shape = tuple(int(s) for s in np.asarray(plane_shape))
+        edges = []
+        edge_owners = []
+        pixels = []
+        pixel_owners = []
+        for i, (data, is_filled) in enumerate(
+            zip(outlines, filled, strict=True)
+        ):
+            vertices = np.asarray(
+                (data[:, -2:] - offset) * zoom_factor, dtype=np.float64
+            )
+            if is_filled:
+                edges.append(
+                    np.concatenate(
+                        [
+                            vertices,
+                            np.concatenate([vertices[1:], vertices[:1]]),
+                        ],
+                        axis=1,
+                    )
+                )
+                edge_owners.append(np.full(len(vertices), i))
+                # vertices on pixels are drawn, even when the polygon is
+                # degenerate (e.g. a line)
+                rounded = np.round(vertices)
+                on_pixel = np.all(
+                    np.abs(vertices - rounded) < _VERTEX_TOLERANCE, axis=1
+                )
+                found = rounded[on_pixel].astype(np.intp)
+            else:
+                found = np.stack(path_to_pixels(self.plane_shape, vertices), 1)
+            pixels.append(found.reshape(-1, 2))
+            pixel_owners.append(np.full(len(found), i))
+        # (E, 4) array of the (y0, x0, y1, x1) ends of the edges of the
+        # filled shapes, and (P, 2) array of single pixels
+        self._edges = np.concatenate(edges) if edges else np.empty((0, 4))
+        self._edge_owners = _concatenate_int(edge_owners)
+        self._pixels = (
+            np.concatenate(pixels) if pixels else np.empty((0, 2), np.intp)
+        )
+        self._pixel_owners = _concatenate_int(pixel_owners)
+
+    def pixels(
+        self,
+        rows: tuple[int, int],
+        cols: tuple[int, int],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pixels of the shapes in a rectangular region of the image.
+
+        Parameters
+        ----------
+        rows, cols : 2-tuple of int
+            Start (included) and stop (excluded) of the rows and columns of
+            the region.
+
+        Returns
+        -------
+        owners, rows, cols : arrays of int
+            Owner, row and column of each pixel. A pixel may be repeated.
+        """
+        r0, r1 = max(rows[0], 0), min(rows[1], self.plane_shape[0])
+        c0, c1 = max(cols[0], 0), min(cols[1], self.plane_shape[1])
+        span_owners, span_rows, starts, stops = self._spans(r0, r1)
+        starts = np.clip(starts, c0, c1)
+        stops = np.clip(stops, c0, c1)
+        counts = stops - starts
+        span_cols = concatenated_ranges(starts, stops)
+        pixel_owners = np.repeat(span_owners, counts)
+        pixel_rows = np.repeat(span_rows, counts)
+
+        pixels, owned = self._pixels, self._pixel_owners
+        keep = (
+            (pixels[:, 0] >= r0)
+            & (pixels[:, 0] < r1)
+            & (pixels[:, 1] >= c0)
+            & (pixels[:, 1] < c1)
+        )
+        return (
+            np.concatenate([pixel_owners, owned[keep]]),
+            np.concatenate([pixel_rows, pixels[keep, 0]]),
+            np.concatenate([span_cols, pixels[keep, 1]]),
+        )
+
+    def _spans(
+        self, r0: int, r1: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Runs of pixels inside the filled shapes in rows r0 to r1.
+
+        Like skimage.draw.polygon, a pixel is drawn if an odd number of
+        edges crosses its row on its right, counting edges from their lower
+        end, or on its left, counting edges from their upper end.
+        """
+        edges, edge_owners = self._edges, self._edge_owners
+        y_low = np.minimum(edges[:, 0], edges[:, 2])
+        y_high = np.maximum(edges[:, 0], edges[:, 2])
+        spans = []
+        for rows_start, rows_stop, ceil in (
+            # rows with y_low <= row < y_high, crossings right of the pixel
+            (np.ceil(y_low), np.ceil(y_high), True),
+            # rows with y_low < row <= y_high, crossings left of the pixel
+            (np.floor(y_low) + 1, np.floor(y_high) + 1, False),
+        ):
+            rows_start = np.clip(rows_start, r0, r1).astype(np.intp)
+            rows_stop = np.clip(rows_stop, r0, r1).astype(np.intp)
+            counts = np.maximum(rows_stop - rows_start, 0)
+            crossing_rows = concatenated_ranges(
+                rows_start, rows_start + counts
+            )
+            edge = np.repeat(np.arange(len(edges)), counts)
+            y0, x0, y1, x1 = edges[edge].T
+            crossing_x = x0 + (crossing_rows - y0) * (x1 - x0) / (y1 - y0)
+            crossing_owners = edge_owners[edge]
+            # consecutive crossings of a shape in a row bound a run of pixels
+            order = np.lexsort((crossing_x, crossing_rows, crossing_owners))
+            crossing_x = crossing_x[order]
+            rounded = np.ceil(crossing_x) if ceil else np.floor(crossing_x) + 1
+            spans.append(
+                np.stack(
+                    [
+                        crossing_owners[order][::2],
+                        crossing_rows[order][::2],
+                        rounded[::2],
+                        rounded[1::2],
+                    ],
+                    axis=1,
+                )
+            )
+        # both rules mostly give the same runs, which are only drawn once
+        all_spans = np.concatenate(spans).astype(np.intp)
+        all_spans = all_spans[np.lexsort(all_spans.T[::-1])]
+        first = np.ones(len(all_spans), dtype=bool)
+        first[1:] = np.any(all_spans[1:] != all_spans[:-1], axis=1)
+        all_spans = all_spans[first]
+        return tuple(all_spans.T)  # type: ignore[return-value]
+
+
+def _concatenate_int(arrays: list[np.ndarray]) -> npt.NDArray[np.intp]:
+    if not arrays:
+        return np.empty(0, dtype=np.intp)
+    return np.concatenate(arrays).astype(np.intp)
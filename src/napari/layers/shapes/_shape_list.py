@@ -1,16 +1,27 @@
+import itertools
 import typing
 from collections.abc import Generator, Iterable, Sequence
 from contextlib import contextmanager
-from functools import cached_property, wraps
-from itertools import repeat
+from functools import wraps
 from typing import Literal, TypedDict
 
 import numpy as np
 import numpy.typing as npt
 
 from napari.layers.shapes._mesh import Mesh
+from napari.layers.shapes._rasterize import _ShapesRasterizer
 from napari.layers.shapes._shapes_constants import ShapeType, shape_classes
-from napari.layers.shapes._shapes_models import Line, Path, Shape
+from napari.layers.shapes._shapes_index import _ShapesIndex
+from napari.layers.shapes._shapes_models import Polygon, Shape
+from napari.layers.shapes._shapes_models._polygon_base import (
+    batched_mesh_sizes,
+    batched_path,
+    batched_triangulation,
+    batched_triangulation_available,
+    set_batched_meshes,
+    take_deferred_meshes,
+    triangulated_polygon,
+)
 from napari.layers.shapes._shapes_utils import triangles_intersect_box
 from napari.layers.shapes.shape_types import (
     CoordinateArray,
@@ -25,6 +36,8 @@ from napari.layers.shapes.shape_types import (
     ZOrderArray,
     ZOrderDtype,
 )
+from napari.layers.utils._box_tree import _BoxTree
+from napari.utils._indexing import concatenated_ranges
 from napari.utils.geometry import (
     inside_triangles,
     intersect_line_with_triangles,
@@ -54,7 +67,11 @@ class MeshArrayDict(TypedDict):
         array of face triangulation vertices offsets.
         It is required for update of edges triangulation.
     mesh_triangles : TriangleArray
-        array of triangles in mesh.
+        array of triangles in mesh, indexing the vertices of the face or
+        edge of their shape.
+    mesh_triangles_base : IndexArray
+        index in the mesh of the first vertex of the face or edge of each
+        triangle, to be added to its indices.
     mesh_triangles_colors : ShapeColorArray
         colors of triangles in mesh.
     vertices_index : IndexArray
@@ -73,6 +90,7 @@ class MeshArrayDict(TypedDict):
     mesh_vertices_offsets: CoordinateArray
 
     mesh_triangles: TriangleArray
+    mesh_triangles_base: IndexArray
     mesh_triangles_colors: ShapeColorArray
 
     vertices_index: IndexArray  # offset of vertices for each shape
@@ -82,7 +100,28 @@ class MeshArrayDict(TypedDict):
     mesh_vertices_index: IndexArray  # offset of mesh vertices for each shape
 
 
-_SizeInformation = tuple[int, int, int, int, int]
+#: Number of pixels of the tiles shapes are rasterised in by default.
+_RASTER_TILE_SIZE = 2**22
+
+#: Names of the types of the shapes of ShapeLists, by their code in the
+#: 'kind' column.
+_KIND_NAMES: list[str] = [str(shape_type) for shape_type in ShapeType]
+
+
+def _kind(name: str) -> int:
+    """Code of the type of shape of the given name in the 'kind' column."""
+    if name not in _KIND_NAMES:
+        _KIND_NAMES.append(name)
+    return _KIND_NAMES.index(name)
+
+
+_POLYGON_KIND = _kind(str(ShapeType.POLYGON))
+_LINE_KINDS = [_kind(str(ShapeType.PATH)), _kind(str(ShapeType.LINE))]
+
+
+def _tile_shape(key: tuple[int | slice, ...]) -> tuple[int, ...]:
+    """Shape of the tile of an array indexed by key."""
+    return tuple(k.stop - k.start for k in key if isinstance(k, slice))
 
 
 def _ensure_color_arrays(shapes, face_colors=None, edge_colors=None):
@@ -131,235 +170,203 @@ def _ensure_color_arrays(shapes, face_colors=None, edge_colors=None):
     return face_colors, edge_colors
 
 
-def _calculate_array_sizes(shapes: Iterable[Shape]) -> _SizeInformation:
-    """Calculate sizes needed for array preallocation.
+class _ShapeColumns(TypedDict):
+    """Per-shape columns of a ShapeList, one element per shape.
 
-    Parameters
-    ----------
-    shapes : iterable of Shape
-        Each Shape must be a subclass of Shape
-
-    Returns
-    -------
-    n_vertices : int
-        Total number of vertices
-    n_indices : int
-        Total number of indices
-    n_mesh_vertices : int
-        Total number of mesh vertices
-    n_face_tri : int
-        Total number of face triangles
-    n_edge_tri : int
-        Total number of edge triangles
+    Fields
+    ------
+    vertices_count : IndexArray
+        number of displayed vertices of each shape.
+    face_vertices_count : IndexArray
+        number of face mesh vertices of each shape.
+    edge_vertices_count : IndexArray
+        number of edge mesh vertices of each shape.
+    face_triangles_count : IndexArray
+        number of face triangles of each shape.
+    edge_triangles_count : IndexArray
+        number of edge triangles of each shape.
+    kind : np.ndarray
+        code of the type of each shape, see ``_kind``.
+    edge_width : np.ndarray
+        edge width of each shape.
+    slice_keys : np.ndarray
+        (N, 2, P) slice key of each shape.
     """
-    n_vertices = 0
-    n_indices = 0
-    n_mesh_vertices = 0
-    n_face_tri = 0
-    n_edge_tri = 0
 
-    for shape in shapes:
-        n_vertices += len(shape.data_displayed)
-        n_indices += len(shape.data)
-        n_mesh_vertices += len(shape._face_vertices) + len(
-            shape._edge_vertices
-        )
-        n_face_tri += len(shape._face_triangles)
-        n_edge_tri += len(shape._edge_triangles)
+    vertices_count: IndexArray
+    face_vertices_count: IndexArray
+    edge_vertices_count: IndexArray
+    face_triangles_count: IndexArray
+    edge_triangles_count: IndexArray
+    kind: npt.NDArray[np.uint8]
+    edge_width: npt.NDArray[np.float64]
+    slice_keys: np.ndarray
+
 
-    return n_vertices, n_indices, n_mesh_vertices, n_face_tri, n_edge_tri
+def _shape_columns(shapes: Sequence[Shape]) -> _ShapeColumns:
+    """Gather the per-shape columns of shapes."""
+    n = len(shapes)
+    return {
+        'vertices_count': np.fromiter(
+            (len(s.data_displayed) for s in shapes), dtype=IndexDtype, count=n
+        ),
+        'face_vertices_count': np.fromiter(
+            (s.face_vertices_count for s in shapes), dtype=IndexDtype, count=n
+        ),
+        'edge_vertices_count': np.fromiter(
+            (s.edge_vertices_count for s in shapes), dtype=IndexDtype, count=n
+        ),
+        'face_triangles_count': np.fromiter(
+            (s.face_triangles_count for s in shapes), dtype=IndexDtype, count=n
+        ),
+        'edge_triangles_count': np.fromiter(
+            (s.edge_triangles_count for s in shapes), dtype=IndexDtype, count=n
+        ),
+        'kind': np.fromiter(
+            (_kind(s.name) for s in shapes), dtype=np.uint8, count=n
+        ),
+        'edge_width': np.fromiter(
+            (s.edge_width for s in shapes), dtype=np.float64, count=n
+        ),
+        'slice_keys': np.array([s.slice_key for s in shapes]),
+    }
 
 
 def _preallocate_arrays(
-    shapes: Sequence[Shape], sizes: _SizeInformation
+    n_shapes: int,
+    n_vertices: int,
+    n_mesh_vertices: int,
+    n_triangles: int,
+    dim: Literal[2, 3],
 ) -> MeshArrayDict:
     """Preallocate arrays for storing shape data.
 
     Parameters
     ----------
-    shapes : Sequence of Shape
-        Each Shape must be a subclass of Shape
-    sizes : tuple
-        Tuple containing sizes for preallocation:
-        (n_vertices, n_indices, n_mesh_vertices,
-        n_face_tri, n_edge_tri)
+    n_shapes : int
+        Number of shapes.
+    n_vertices : int
+        Total number of displayed vertices.
+    n_mesh_vertices : int
+        Total number of mesh vertices.
+    n_triangles : int
+        Total number of face and edge triangles.
+    dim : int
+        Number of displayed dimensions.
 
     Returns
     -------
     arrays : dict
         Dictionary containing preallocated arrays
     """
-    n_shapes = len(shapes)
-    n_vertices, _n_indices, n_mesh_vertices, n_face_tri, n_edge_tri = sizes
-
-    # Determine the displayed dimensionality from the first shape
-    # All shapes in a batch will have the same dimensionality
-    dim: Literal[2, 3] = shapes[0]._face_vertices.shape[1]
-
-    z_index = np.empty(n_shapes, dtype=np.int32)
-
-    vertices_index = np.empty(n_shapes, dtype=IndexDtype)
-    mesh_triangles_index = np.empty(n_shapes, dtype=IndexDtype)
-    mesh_vertices_index = np.empty(n_shapes, dtype=IndexDtype)
-
-    vertices = np.empty((n_vertices, dim), dtype=CoordinateDtype)
+    return {
+        'z_index': np.empty(n_shapes, dtype=np.int32),
+        'vertices': np.empty((n_vertices, dim), dtype=CoordinateDtype),  # type: ignore[typeddict-item]
+        'mesh_vertices': np.empty(
+            (n_mesh_vertices, dim), dtype=CoordinateDtype
+        ),  # type: ignore[typeddict-item]
+        'mesh_vertices_centers': np.empty(  # type: ignore[typeddict-item]
+            (n_mesh_vertices, dim), dtype=CoordinateDtype
+        ),
+        'mesh_vertices_offsets': np.empty(  # type: ignore[typeddict-item]
+            (n_mesh_vertices, dim), dtype=CoordinateDtype
+        ),
+        'mesh_triangles': np.empty((n_triangles, 3), dtype=TriangleDtype),  # type: ignore[typeddict-item]
+        'mesh_triangles_base': np.empty(n_triangles, dtype=IndexDtype),
+        'mesh_triangles_colors': np.empty(  # type: ignore[typeddict-item]
+            (n_triangles, 4), dtype=ShapeColorDtype
+        ),
+        'vertices_index': np.empty(n_shapes, dtype=IndexDtype),
+        'mesh_triangles_index': np.empty(n_shapes, dtype=IndexDtype),
+        'mesh_vertices_index': np.empty(n_shapes, dtype=IndexDtype),
+    }
 
-    mesh_vertices = np.empty((n_mesh_vertices, dim), dtype=CoordinateDtype)
-    mesh_vertices_centers = np.empty(
-        (n_mesh_vertices, dim), dtype=CoordinateDtype
-    )
-    mesh_vertices_offsets = np.empty(
-        (n_mesh_vertices, dim), dtype=CoordinateDtype
-    )
 
-    total_triangles = n_face_tri + n_edge_tri
-    mesh_triangles = np.empty((total_triangles, 3), dtype=TriangleDtype)
-    mesh_triangles_colors = np.empty(
-        (total_triangles, 4), dtype=ShapeColorDtype
+def _ranges_extent(
+    values: np.ndarray, starts: np.ndarray, counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Minimum and maximum of the non empty ranges of rows of values."""
+    if len(starts) == 0:
+        empty = np.empty((0, values.shape[1]), dtype=values.dtype)
+        return empty, empty
+    rows = values[concatenated_ranges(starts, starts + counts)]
+    offsets = np.cumsum(counts) - counts
+    return (
+        np.minimum.reduceat(rows, offsets),
+        np.maximum.reduceat(rows, offsets),
     )
 
-    return {
-        'z_index': z_index,
-        'vertices': vertices,  # type: ignore[typeddict-item]
-        'mesh_vertices': mesh_vertices,  # type: ignore[typeddict-item]
-        'mesh_vertices_centers': mesh_vertices_centers,  # type: ignore[typeddict-item]
-        'mesh_vertices_offsets': mesh_vertices_offsets,  # type: ignore[typeddict-item]
-        'mesh_triangles': mesh_triangles,  # type: ignore[typeddict-item]
-        'mesh_triangles_colors': mesh_triangles_colors,  # type: ignore[typeddict-item]
-        'vertices_index': vertices_index,
-        'mesh_triangles_index': mesh_triangles_index,
-        'mesh_vertices_index': mesh_vertices_index,
-    }
-
 
-def _fill_arrays(
-    start_mesh_index: int,
-    start_triangle_index: int,
-    start_vertices_index: int,
-    shapes: Iterable[Shape],
-    face_colors: np.ndarray,
-    edge_colors: np.ndarray,
+def _fill_shape_meshes(
+    shape: Shape,
+    mesh_vertices_offset: int,
+    triangles_offset: int,
     arrays: MeshArrayDict,
 ) -> None:
-    """Fill pre-allocated arrays with shape data.
+    """Copy the face and edge meshes of a shape to pre-allocated arrays.
 
     Parameters
     ----------
-    start_mesh_index : int
-        The number of mesh vertices in the shape list before adding these
-        shapes.
-    start_triangle_index : int
-        The number of mesh triangles in the shape list before adding these
-    shapes : iterable of Shape
-        Each Shape must be a subclass of Shape
-    face_colors : np.ndarray
-        Array of face colors
-    edge_colors : np.ndarray
-        Array of edge colors
+    shape : Shape
+        The shape whose meshes are copied.
+    mesh_vertices_offset : int
+        Index in the arrays of the first mesh vertex of the shape.
+    triangles_offset : int
+        Index in the arrays of the first mesh triangle of the shape.
     arrays : dict
         Dictionary containing preallocated arrays
     """
-    z_index = arrays['z_index']
-    vertices = arrays['vertices']
-    # index = arrays['index']
     mesh_vertices = arrays['mesh_vertices']
     mesh_vertices_centers = arrays['mesh_vertices_centers']
     mesh_vertices_offsets = arrays['mesh_vertices_offsets']
-
     mesh_triangles = arrays['mesh_triangles']
-    mesh_triangles_colors = arrays['mesh_triangles_colors']
 
-    vertices_index = arrays['vertices_index']
-    mesh_triangles_index = arrays['mesh_triangles_index']
-    mesh_vertices_index = arrays['mesh_vertices_index']
+    # Add faces to mesh
+    face_vertices = shape._face_vertices
+    n_face_vertices = len(face_vertices)
 
-    vertices_offset = 0
-    mesh_vertices_offset = 0
-    triangles_offset = 0
-
-    for i, (shape, face_color, edge_color) in enumerate(
-        zip(shapes, face_colors, edge_colors, strict=True)
-    ):
-        # Store z_index ("number of shapes" space)
-        z_index[i] = shape.z_index
-        vertices_ = shape.data_displayed
-        n_vertices = len(vertices_)
-
-        vertices_index[i] = start_vertices_index + vertices_offset + n_vertices
-        mesh_triangles_index[i] = (
-            start_triangle_index + triangles_offset + shape.triangles_count
-        )
-        mesh_vertices_index[i] = (
-            start_mesh_index + mesh_vertices_offset + shape.vertices_count
-        )
-
-        # Store vertices data and update vertices offset
-        vertices[vertices_offset : vertices_offset + n_vertices] = vertices_
-        vertices_offset += n_vertices
-
-        # Add faces to mesh
-        face_vertices = shape._face_vertices
-        n_face_vertices = len(face_vertices)
-
-        face_vertices_slice = slice(
-            mesh_vertices_offset, mesh_vertices_offset + n_face_vertices
-        )
-
-        mesh_vertices[face_vertices_slice] = face_vertices
-        mesh_vertices_centers[face_vertices_slice] = face_vertices
-        mesh_vertices_offsets[face_vertices_slice] = (
-            0  # no shift for face vertices
-        )
-
-        # Store face triangles
-        face_triangles = (
-            shape._face_triangles + start_mesh_index + mesh_vertices_offset
-        )
-        n_face_triangles = len(face_triangles)
-        face_triangles_slice = slice(
-            triangles_offset, triangles_offset + n_face_triangles
-        )
-        mesh_triangles[face_triangles_slice] = face_triangles
+    face_vertices_slice = slice(
+        mesh_vertices_offset, mesh_vertices_offset + n_face_vertices
+    )
 
-        # Create and store face triangles colors
-        mesh_triangles_colors[face_triangles_slice] = face_color
+    mesh_vertices[face_vertices_slice] = face_vertices
+    mesh_vertices_centers[face_vertices_slice] = face_vertices
+    mesh_vertices_offsets[face_vertices_slice] = (
+        0  # no shift for face vertices
+    )
 
-        # Update offsets
-        mesh_vertices_offset += n_face_vertices
-        triangles_offset += n_face_triangles
+    # Store face triangles
+    face_triangles = shape._face_triangles
+    n_face_triangles = len(face_triangles)
+    mesh_triangles[triangles_offset : triangles_offset + n_face_triangles] = (
+        face_triangles
+    )
 
-        # Add edges to mesh
+    # Update offsets
+    mesh_vertices_offset += n_face_vertices
+    triangles_offset += n_face_triangles
 
-        # Calculate edge vertices
-        edge_vertices = shape._edge_vertices
-        edge_offsets = shape._edge_offsets
-        n_edge_vertices = len(edge_vertices)
+    # Add edges to mesh
 
-        # Store edge vertices
-        curr_vertices = edge_vertices + shape.edge_width * edge_offsets
-        edge_vertices_slice = slice(
-            mesh_vertices_offset, mesh_vertices_offset + n_edge_vertices
-        )
-        mesh_vertices[edge_vertices_slice] = curr_vertices
-        mesh_vertices_centers[edge_vertices_slice] = edge_vertices
-        mesh_vertices_offsets[edge_vertices_slice] = edge_offsets
+    # Calculate edge vertices
+    edge_vertices = shape._edge_vertices
+    edge_offsets = shape._edge_offsets
+    n_edge_vertices = len(edge_vertices)
 
-        # Store edge triangles
-        edge_triangles = (
-            shape._edge_triangles + start_mesh_index + mesh_vertices_offset
-        )
-        n_edge_triangles = len(edge_triangles)
-        edge_triangles_slice = slice(
-            triangles_offset, triangles_offset + n_edge_triangles
-        )
-        mesh_triangles[edge_triangles_slice] = edge_triangles
-
-        # Create and store edge triangles colors
-        mesh_triangles_colors[edge_triangles_slice] = edge_color
+    # Store edge vertices
+    curr_vertices = edge_vertices + shape.edge_width * edge_offsets
+    edge_vertices_slice = slice(
+        mesh_vertices_offset, mesh_vertices_offset + n_edge_vertices
+    )
+    mesh_vertices[edge_vertices_slice] = curr_vertices
+    mesh_vertices_centers[edge_vertices_slice] = edge_vertices
+    mesh_vertices_offsets[edge_vertices_slice] = edge_offsets
 
-        # Update offsets
-        mesh_vertices_offset += n_edge_vertices
-        triangles_offset += n_edge_triangles
+    # Store edge triangles
+    edge_triangles = shape._edge_triangles
+    mesh_triangles[
+        triangles_offset : triangles_offset + len(edge_triangles)
+    ] = edge_triangles
 
 
 def _batch_dec(meth):
@@ -375,6 +382,34 @@ def _batch_dec(meth):
     return _wrapped
 
 
+class _ShapesView(Sequence[Shape]):
+    """Read-only sequence of the shapes of a ShapeList.
+
+    The Shape of a polygon stored in the columns of the list only is built
+    the first time it is accessed.
+    """
+
+    def __init__(self, shape_list: 'ShapeList') -> None:
+        self._shape_list = shape_list
+
+    def __len__(self) -> int:
+        return len(self._shape_list._shapes)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Shape: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[Shape]: ...
+
+    def __getitem__(self, index: int | slice) -> Shape | list[Shape]:
+        if isinstance(index, slice):
+            return [
+                self._shape_list._shape(i)
+                for i in range(*index.indices(len(self)))
+            ]
+        return self._shape_list._shape(index)
+
+
 class ShapeList:
     """List of shapes class.
 
@@ -387,8 +422,9 @@ class ShapeList:
 
     Attributes
     ----------
-    shapes : (N, ) list
-        Shape objects.
+    shapes : (N, ) sequence
+        Shape objects, built on access for the polygons added with
+        ``add_data`` that are only stored in the columns of the list.
     data : (N, ) list of (M, D) array
         Data arrays for each shape.
     ndisplay : int
@@ -425,13 +461,39 @@ class ShapeList:
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    _columns : dict of np.ndarray
+        Length N arrays with the number of vertices and triangles, the type,
+        the edge width and the slice key of each shape, for operations on
+        many shapes at once. The hit-testing index reads the slice keys from
+        here.
+    _shapes : list
+        Length N list of the Shape objects, None for the polygons stored in
+        the columns only, whose meshes are only in ``_mesh``.
+    _data : np.ndarray
+        MxD array of the data of the polygons stored in the columns only.
+        The rows of the polygons whose Shape was built since are unused.
+    _data_index : np.ndarray
+        Length N+1 array with the start of the rows of each shape in
+        ``_data``, where the ranges of the other shapes are empty.
+    _data_views : dict
+        Views of ``_data`` returned for the rows of the polygons stored in
+        the columns only, so that ``data`` keeps returning the same arrays
+        until ``_data`` changes.
+    _dims_order : list
+        Order of the dimensions of the polygons stored in the columns only.
     """
 
     def __init__(
         self, data: typing.Iterable[Shape] = (), ndisplay: int = 2
     ) -> None:
         self._ndisplay = ndisplay
-        self.shapes: list[Shape] = []
+        self._shapes: list[Shape | None] = []
+        self._shapes_view = _ShapesView(self)
+        self._data = np.empty((0, 0), dtype=CoordinateDtype)
+        self._data_index: IndexArray = np.zeros(1, dtype=IndexDtype)
+        self._data_views: dict[int, npt.NDArray] = {}
+        self._dims_order: Sequence[int] = []
+        self._n_lazy = 0
         self._displayed = np.array([])
         self._slice_key = np.array([])
         self.displayed_vertices = np.array([], dtype=CoordinateDtype)
@@ -441,8 +503,13 @@ class ShapeList:
         self._vertices_index: IndexArray = np.zeros(1, dtype=IndexDtype)
         self._z_index: IndexArray = np.empty(0, dtype=IndexDtype)
         self._z_order: IndexArray = np.empty(0, dtype=IndexDtype)
+        self._columns: _ShapeColumns = _shape_columns([])
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
+        # bounding boxes of the shapes for hit-testing
+        self._index = _ShapesIndex(
+            self._shape_bounding_boxes, self._shape_mesh_boxes
+        )
 
         self._edge_color: ShapeColorArray = np.empty((0, 4))  # type: ignore[assignment]
         self._face_color: ShapeColorArray = np.empty((0, 4))  # type: ignore[assignment]
@@ -457,11 +524,66 @@ class ShapeList:
             data = list(data)
         self.add(data)
 
+    @property
+    def shapes(self) -> Sequence[Shape]:
+        """(N, ) sequence: Shape objects, built on access if needed."""
+        return self._shapes_view
+
+    def _shape(self, index: int | np.integer) -> Shape:
+        """Return the Shape at index, building it if needed."""
+        index = range(len(self._shapes))[index]
+        shape = self._shapes[index]
+        if shape is None:
+            shape = self._shapes[index] = self._build_shape(index)
+            self._data_views.pop(index, None)
+            self._n_lazy -= 1
+        return shape
+
+    def _build_shape(self, index: int) -> Shape:
+        """Build the Shape of a polygon stored in the columns only."""
+        face_vertices = self._mesh_vertices_face_slice(index)
+        edge_vertices = self._mesh_vertices_edge_slice(index)
+        face_triangles = self._mesh.triangles[
+            self._mesh_triangles_face_slice(index)
+        ]
+        edge_triangles = self._mesh.triangles[
+            self._mesh_triangles_edge_slice(index)
+        ]
+        return triangulated_polygon(
+            Polygon,
+            self._row_data(index),
+            (
+                self._mesh.vertices_centers[face_vertices].copy(),
+                face_triangles - face_vertices.start,
+            ),
+            (
+                self._mesh.vertices_centers[edge_vertices].copy(),
+                self._mesh.vertices_offsets[edge_vertices].copy(),
+                edge_triangles - edge_vertices.start,
+            ),
+            edge_width=float(self._columns['edge_width'][index]),
+            z_index=int(self._z_index[index]),
+            dims_order=self._dims_order,
+            ndisplay=self.ndisplay,
+        )
+
+    def _row_data(self, index: int) -> npt.NDArray:
+        """Return the data of the shape at index, without building it."""
+        shape = self._shapes[index]
+        if shape is not None:
+            return shape.data
+        if index not in self._data_views:
+            self._data_views[index] = self._data[
+                self._data_index[index] : self._data_index[index + 1]
+            ]
+        return self._data_views[index]
+
     def _vertices_slice(self, shape_index: int | np.integer) -> slice:
         """Return the slice of vertices for a given shape index."""
         start = self._vertices_index[shape_index]
-        shape = self.shapes[shape_index]
-        return slice(start, start + shape.data_displayed.shape[0])
+        return slice(
+            start, start + self._columns['vertices_count'][shape_index]
+        )
 
     def _vertices_slice_available(self, shape_index: int) -> slice:
         """Return the available slice of vertices for a given shape index."""
@@ -472,8 +594,12 @@ class ShapeList:
     def _mesh_vertices_slice(self, shape_index: int) -> slice:
         """Return the slice of mesh vertices for a given shape index."""
         start = self._mesh.vertices_index[shape_index]
-        shape = self.shapes[shape_index]
-        return slice(start, start + shape.vertices_count)
+        return slice(
+            start,
+            start
+            + self._columns['face_vertices_count'][shape_index]
+            + self._columns['edge_vertices_count'][shape_index],
+        )
 
     def _mesh_vertices_slice_available(self, shape_index: int) -> slice:
         """Return the available slice of mesh vertices for a given shape index."""
@@ -484,19 +610,7 @@ class ShapeList:
     def _mesh_triangles_slice(self, shape_index: int | np.integer) -> slice:
         """Return the slice of mesh triangles for a given shape index."""
         start = self._mesh.triangles_index[shape_index]
-        shape = self.shapes[shape_index]
-        return slice(start, start + shape.triangles_count)
-
-    @staticmethod
-    def _slicess_to_array(slices: Sequence[slice]) -> np.ndarray:
-        count = sum(r.stop - r.start for r in slices)
-        res = np.empty(count, dtype=np.int64)
-        begin = 0
-        for r in slices:
-            end = begin + (r.stop - r.start)
-            res[begin:end] = np.arange(r.start, r.stop)
-            begin = end
-        return res
+        return slice(start, start + self._triangles_count[shape_index])
 
     def _mesh_triangles_range_seq(
         self, shape_indexes: IndexArray
@@ -507,11 +621,12 @@ class ShapeList:
         ):  # If the sequence is continuous, return a range
             start = self._mesh.triangles_index[shape_indexes[0]]
             end = self._mesh.triangles_index[shape_indexes[-1]]
-            end_shape = self.shapes[shape_indexes[-1]]
-            return slice(start, end + end_shape.triangles_count)
+            return slice(start, end + self._triangles_count[shape_indexes[-1]])
         # If the sequence is not continuous, return a numpy array
-        ranges = [self._mesh_triangles_slice(i) for i in shape_indexes]
-        return self._slicess_to_array(ranges)
+        starts = self._mesh.triangles_index[shape_indexes]
+        return concatenated_ranges(
+            starts, starts + self._triangles_count[shape_indexes]
+        )
 
     def _vertices_range_seq(
         self, shape_indexes: IndexArray
@@ -522,11 +637,37 @@ class ShapeList:
         ):  # If the sequence is continuous, return a range
             start = self._vertices_index[shape_indexes[0]]
             end = self._vertices_index[shape_indexes[-1]]
-            end_shape = self.shapes[shape_indexes[-1]]
-            return slice(start, end + end_shape.data_displayed.shape[0])
+            vertices_count = self._columns['vertices_count']
+            return slice(start, end + vertices_count[shape_indexes[-1]])
         # If the sequence is not continuous, return a numpy array
-        slicess = [self._vertices_slice(i) for i in shape_indexes]
-        return self._slicess_to_array(slicess)
+        starts = self._vertices_index[shape_indexes]
+        return concatenated_ranges(
+            starts, starts + self._columns['vertices_count'][shape_indexes]
+        )
+
+    @property
+    def _triangles_count(self) -> IndexArray:
+        """Length N array with the number of triangles of each shape."""
+        return (
+            self._columns['face_triangles_count']
+            + self._columns['edge_triangles_count']
+        )
+
+    def _append_columns(self, columns: _ShapeColumns) -> None:
+        """Append the per-shape columns of new shapes."""
+        if len(self._columns['vertices_count']) == 0:
+            self._columns = columns
+            return
+        for name, column in columns.items():
+            self._columns[name] = np.concatenate(  # type: ignore[literal-required]
+                [self._columns[name], column]  # type: ignore[literal-required]
+            )
+
+    def _update_columns(self, index: int) -> None:
+        """Update the per-shape columns of the shape at index."""
+        columns = _shape_columns([self._shape(index)])
+        for name, column in self._columns.items():
+            column[index] = columns[name][0]  # type: ignore[literal-required]
 
     def _mesh_triangles_slice_available(self, shape_index: int) -> slice:
         """Return the available slice of mesh triangles for a given shape index."""
@@ -536,32 +677,37 @@ class ShapeList:
 
     def _mesh_vertices_face_slice(self, shape_index: int) -> slice:
         """Return the slice of mesh vertices of face triangles for a given shape index."""
-        shape = self.shapes[shape_index]
         start = self._mesh.vertices_index[shape_index]
-        return slice(start, start + shape.face_vertices_count)
+        return slice(
+            start, start + self._columns['face_vertices_count'][shape_index]
+        )
 
     def _mesh_triangles_face_slice(self, shape_index: int) -> slice:
         """Return the slice of mesh triangles of face triangles for a given shape index."""
-        shape = self.shapes[shape_index]
         start = self._mesh.triangles_index[shape_index]
-        return slice(start, start + shape.face_triangles_count)
+        return slice(
+            start, start + self._columns['face_triangles_count'][shape_index]
+        )
 
     def _mesh_vertices_edge_slice(self, shape_index: int) -> slice:
         """Return the slice of mesh vertices of edge triangles for a given shape index."""
-        shape = self.shapes[shape_index]
         start = (
-            self._mesh.vertices_index[shape_index] + shape.face_vertices_count
+            self._mesh.vertices_index[shape_index]
+            + self._columns['face_vertices_count'][shape_index]
+        )
+        return slice(
+            start, start + self._columns['edge_vertices_count'][shape_index]
         )
-        return slice(start, start + shape.edge_vertices_count)
 
     def _mesh_triangles_edge_slice(self, shape_index: int) -> slice:
         """Return the slice of mesh triangles of edge triangles for a given shape index."""
-        shape = self.shapes[shape_index]
         start = (
             self._mesh.triangles_index[shape_index]
-            + shape.face_triangles_count
+            + self._columns['face_triangles_count'][shape_index]
+        )
+        return slice(
+            start, start + self._columns['edge_triangles_count'][shape_index]
         )
-        return slice(start, start + shape.edge_triangles_count)
 
     @contextmanager
     def batched_updates(self) -> Generator[None, None, None]:
@@ -602,7 +748,7 @@ class ShapeList:
     @property
     def data(self) -> list[npt.NDArray]:
         """list of (M, D) array: data arrays for each shape."""
-        return [s.data for s in self.shapes]
+        return [self._row_data(i) for i in range(len(self._shapes))]
 
     @property
     def ndisplay(self) -> int:
@@ -616,29 +762,19 @@ class ShapeList:
 
         self._ndisplay = ndisplay
         self._mesh.ndisplay = self.ndisplay
-        shapes = self.shapes
-        face_color = self._face_color
-        edge_color = self._edge_color
-
-        with self.batched_updates():
-            for shape in shapes:
-                shape.ndisplay = self.ndisplay
-            self.remove_all()
-            self._add_multiple_shapes(
-                shapes, face_colors=face_color, edge_colors=edge_color
-            )
+        self._add_again()
 
     @property
     def slice_keys(
         self,
     ) -> np.ndarray[tuple[int, Literal[2], int], np.dtype[np.int64]]:
         """(N, 2, P) array: slice key for each shape."""
-        return np.array([s.slice_key for s in self.shapes])
+        return self._columns['slice_keys']
 
     @property
     def shape_types(self) -> list[str]:
         """list of str: shape types for each shape."""
-        return [s.name for s in self.shapes]
+        return [_KIND_NAMES[kind] for kind in self._columns['kind']]
 
     @property
     def edge_color(self) -> ShapeColorArray:
@@ -673,7 +809,7 @@ class ShapeList:
             The name of the attribute to set the color of.
             Should be 'edge' for edge_color or 'face' for face_color.
         """
-        n_shapes = len(self.data)
+        n_shapes = len(self._shapes)
         if not np.array_equal(colors.shape, (n_shapes, 4)):
             raise ValueError(
                 trans._(
@@ -692,12 +828,12 @@ class ShapeList:
     @property
     def edge_widths(self) -> list[float]:
         """list of float: edge width for each shape."""
-        return [s.edge_width for s in self.shapes]
+        return self._columns['edge_width'].tolist()
 
     @property
     def z_indices(self) -> list[int]:
         """list of int: z-index for each shape."""
-        return [s.z_index for s in self.shapes]
+        return self._z_index.tolist()
 
     @property
     def slice_key(self):
@@ -710,7 +846,6 @@ class ShapeList:
         slice_key = list(slice_key)
         if not np.array_equal(self._slice_key, slice_key):
             self._slice_key = slice_key
-            self._clear_cache()
             self._update_displayed()
 
     def _update_displayed_triangles_to_shape_index(
@@ -724,15 +859,11 @@ class ShapeList:
             self._mesh.displayed_triangles_to_shape_index = np.full(
                 self._mesh.displayed_triangles.shape[0], -1, dtype=IndexDtype
             )
-        shift_idx = 0
-        for i in displayed_indices:
-            begin = self._mesh.triangles_index[i]
-            end = self._mesh.triangles_index[i + 1]
-            elem_num = end - begin
-            self._mesh.displayed_triangles_to_shape_index[
-                shift_idx : shift_idx + elem_num
-            ] = i
-            shift_idx += elem_num
+        # displayed_triangles only hold the used triangles of each shape
+        counts = self._triangles_count[displayed_indices]
+        self._mesh.displayed_triangles_to_shape_index[: counts.sum()] = (
+            np.repeat(displayed_indices, counts)
+        )
 
     def _update_displayed_vertices_to_shape_num(
         self, displayed_indices: IndexArray
@@ -745,15 +876,11 @@ class ShapeList:
             self.displayed_vertices_to_shape_num = np.full(
                 self.displayed_vertices.shape[0], -1, dtype=IndexDtype
             )
-        shift_idx = 0
-        for i in displayed_indices:
-            begin = self._vertices_index[i]
-            end = self._vertices_index[i + 1]
-            elem_num = end - begin
-            self.displayed_vertices_to_shape_num[
-                shift_idx : shift_idx + elem_num
-            ] = i
-            shift_idx += elem_num
+        # displayed_vertices only hold the used vertices of each shape
+        counts = self._columns['vertices_count'][displayed_indices]
+        self.displayed_vertices_to_shape_num[: counts.sum()] = np.repeat(
+            displayed_indices, counts
+        )
 
     def _update_displayed(self) -> None:
         """Update the displayed data based on the slice key.
@@ -774,7 +901,7 @@ class ShapeList:
 
         # Slice key must exactly match mins and maxs of shape as then the
         # shape is entirely contained within the current slice.
-        if len(self.shapes) > 0:
+        if len(self._shapes) > 0:
             self._displayed = np.all(
                 np.abs(self.slice_keys - slice_key) < 0.5, axis=(1, 2)
             )
@@ -904,9 +1031,16 @@ class ShapeList:
                     deferred=True,
                 )
             )
+        # nothing to triangulate together with a single polygon
+        for path in take_deferred_meshes([shape]).values():
+            shape._set_meshes(path, face=True, closed=True)
 
         if shape_index is None:
-            self.shapes.append(shape)
+            self._shapes.append(shape)
+            self._data_index = np.append(
+                self._data_index, self._data_index[-1]
+            )
+            self._append_columns(_shape_columns([shape]))
             self._z_index = np.append(self._z_index, shape.z_index)
 
             if face_color is None:
@@ -917,7 +1051,11 @@ class ShapeList:
             self._edge_color = np.vstack([self._edge_color, edge_color])
         else:
             z_refresh = False
-            self.shapes[shape_index] = shape
+            if self._shapes[shape_index] is None:
+                self._data_views.pop(shape_index, None)
+                self._n_lazy -= 1
+            self._shapes[shape_index] = shape
+            self._update_columns(shape_index)
             self._z_index[shape_index] = shape.z_index
 
             if face_color is None:
@@ -997,7 +1135,10 @@ class ShapeList:
         if z_refresh:
             # Set z_order
             self._update_z_order()
-        self._clear_cache()
+        if shape_index is None:
+            self._index.append(self.slice_keys)
+        else:
+            self._index.update(shape_index, self.slice_keys)
 
     def _extend_meshes(self, face_colors, edge_colors, arrays: MeshArrayDict):
         """Assemble mesh properties from filled arrays.
@@ -1019,6 +1160,7 @@ class ShapeList:
         mesh_vertices_offsets = arrays['mesh_vertices_offsets']
 
         mesh_triangles = arrays['mesh_triangles']
+        mesh_triangles_base = arrays['mesh_triangles_base']
         mesh_triangles_colors = arrays['mesh_triangles_colors']
 
         vertices_index = arrays['vertices_index']
@@ -1045,9 +1187,18 @@ class ShapeList:
             self._mesh.vertices_index, mesh_vertices_index, axis=0
         )
 
-        self._mesh.triangles = np.vstack(
-            (self._mesh.triangles, mesh_triangles)
+        n_triangles = len(self._mesh.triangles)
+        triangles = np.empty(
+            (n_triangles + len(mesh_triangles), 3), dtype=TriangleDtype
+        )
+        triangles[:n_triangles] = self._mesh.triangles
+        # offset the triangles of each face and edge to index the mesh
+        np.add(
+            mesh_triangles,
+            mesh_triangles_base[:, np.newaxis],
+            out=triangles[n_triangles:],
         )
+        self._mesh.triangles = triangles
         self._mesh.triangles_index = np.append(
             self._mesh.triangles_index, mesh_triangles_index, axis=0
         )
@@ -1055,6 +1206,461 @@ class ShapeList:
             (self._mesh.triangles_colors, mesh_triangles_colors)
         )
 
+    def add_data(
+        self,
+        data: Sequence[npt.ArrayLike],
+        shape_types: Sequence[str],
+        edge_widths: Sequence[float],
+        z_indices: Sequence[int],
+        face_colors=None,
+        edge_colors=None,
+        dims_order: Sequence[int] | None = None,
+        ndisplay: int = 2,
+        z_refresh: bool = True,
+    ) -> None:
+        """Add multiple shapes from their data, building them only if needed.
+
+        The polygons whose meshes can be triangulated together (see
+        ``batched_triangulation``) are only stored in the columns of the
+        list, and their Shape is built the first time it is accessed through
+        ``shapes``. The other shapes are built right away.
+
+        Parameters
+        ----------
+        data : sequence of (M, D) array
+            Vertices of each shape.
+        shape_types : sequence of str
+            Type of each shape, one of "{'line', 'rectangle', 'ellipse',
+            'path', 'polygon'}".
+        edge_widths : sequence of float
+            Thickness of the lines and edges of each shape.
+        z_indices : sequence of int
+            z-index of each shape.
+        face_colors : iterable of face_color
+        edge_colors : iterable of edge_color
+        dims_order : (D,) list
+            Order that the dimensions are to be rendered in.
+        ndisplay : int
+            Number of displayed dimensions.
+        z_refresh : bool
+            If set to true, the mesh elements are reindexed with the new z order.
+        """
+        if len(data) == 0:
+            return
+        face_colors, edge_colors = _ensure_color_arrays(
+            data, face_colors, edge_colors
+        )
+        edge_widths_ = np.asarray(edge_widths, dtype=np.float64)
+        z_indices_ = np.asarray(z_indices, dtype=np.int32)
+        with batched_triangulation():
+            shapes, rows_data, paths = self._build_rows(
+                data,
+                [shape_classes[shape_type] for shape_type in shape_types],
+                edge_widths_,
+                z_indices_,
+                dims_order,
+                ndisplay,
+            )
+            self._add_rows(
+                shapes,
+                rows_data,
+                paths,
+                edge_widths_,
+                z_indices_,
+                face_colors,
+                edge_colors,
+                z_refresh,
+            )
+
+    def _build_rows(
+        self,
+        data: Sequence[npt.ArrayLike],
+        classes: Sequence[type[Shape]],
+        edge_widths: np.ndarray,
+        z_indices: np.ndarray,
+        dims_order: Sequence[int] | None,
+        ndisplay: int,
+    ) -> tuple[
+        list[Shape | None], list[np.ndarray | None], list[np.ndarray | None]
+    ]:
+        """Build the shapes of rows, but for polygons stored in the columns.
+
+        A polygon is only stored in the columns if its meshes can be
+        triangulated together with others, and if its dimensions are in the
+        same order as those of the polygons already stored so.
+
+        Returns
+        -------
+        shapes : list of Shape or None
+            Shape of each row, None for the polygons stored in the columns.
+        rows_data : list of np.ndarray or None
+            Data of the polygons stored in the columns.
+        paths : list of np.ndarray or None
+            Displayed vertices of the polygons stored in the columns,
+            without duplicates.
+        """
+        columns_dims = self._dims_order if self._n_lazy else None
+        in_columns = (
+            ndisplay == self.ndisplay == 2
+            and batched_triangulation_available()
+        )
+        shapes: list[Shape | None] = []
+        rows_data: list[np.ndarray | None] = []
+        paths: list[np.ndarray | None] = []
+        for d, shape_cls, edge_width, z_index in zip(
+            data, classes, edge_widths, z_indices, strict=True
+        ):
+            path = None
+            if in_columns and shape_cls is Polygon:
+                d = np.asarray(d, dtype=CoordinateDtype)
+                # like the dimensions of Shape.data
+                row_dims = (
+                    dims_order
+                    if dims_order and len(dims_order) == d.shape[-1]
+                    else list(range(d.shape[-1]))
+                )
+                if (
+                    d.ndim == 2
+                    and len(d) >= 2
+                    and len(row_dims) >= 2
+                    and columns_dims in (None, row_dims)
+                ):
+                    path = batched_path(d[:, list(row_dims[-2:])])
+            if path is None:
+                shapes.append(
+                    shape_cls(
+                        d,
+                        edge_width=edge_width,
+                        z_index=z_index,
+                        dims_order=dims_order,
+                        ndisplay=ndisplay,
+                    )
+                )
+                rows_data.append(None)
+            else:
+                columns_dims = row_dims
+                shapes.append(None)
+                rows_data.append(d)
+            paths.append(path)
+        if columns_dims is not None:
+            self._dims_order = columns_dims
+        return shapes, rows_data, paths
+
+    def _add_rows(
+        self,
+        shapes: list[Shape | None],
+        data: list[np.ndarray | None],
+        paths: list[np.ndarray | None],
+        edge_widths: np.ndarray,
+        z_indices: np.ndarray,
+        face_colors: np.ndarray,
+        edge_colors: np.ndarray,
+        z_refresh: bool = True,
+    ) -> None:
+        """Append rows of shapes, some stored in the columns only.
+
+        The meshes of the polygons stored in the columns only, and of the
+        polygons whose triangulation is deferred (see
+        ``batched_triangulation``), are triangulated together straight into
+        the mesh arrays. The arrays of the other shapes are copied.
+
+        Parameters
+        ----------
+        shapes : list of Shape or None
+            Shape of each row, None for the polygons stored in the columns
+            only.
+        data : list of np.ndarray or None
+            (M, D) data of the polygons stored in the columns only.
+        paths : list of np.ndarray or None
+            Displayed vertices of the polygons stored in the columns only,
+            without duplicates (see ``batched_path``).
+        edge_widths : np.ndarray
+            Edge width of each row.
+        z_indices : np.ndarray
+            z-index of each row.
+        face_colors : np.ndarray
+            Array of face colors
+        edge_colors : np.ndarray
+            Array of edge colors
+        z_refresh : bool
+            If set to true, the mesh elements are reindexed with the new z order.
+        """
+        n = len(shapes)
+        in_columns = np.flatnonzero([s is None for s in shapes])
+        deferred = take_deferred_meshes(shapes)
+        batched = np.flatnonzero(
+            [s is None or i in deferred for i, s in enumerate(shapes)]
+        )
+        batched_paths = [
+            deferred[i] if shapes[i] is not None else paths[i] for i in batched
+        ]
+        face_sizes, edge_sizes = batched_mesh_sizes(batched_paths)
+
+        columns: _ShapeColumns = {
+            'vertices_count': np.zeros(n, dtype=IndexDtype),
+            'face_vertices_count': np.zeros(n, dtype=IndexDtype),
+            'edge_vertices_count': np.zeros(n, dtype=IndexDtype),
+            'face_triangles_count': np.zeros(n, dtype=IndexDtype),
+            'edge_triangles_count': np.zeros(n, dtype=IndexDtype),
+            'kind': np.full(n, _POLYGON_KIND, dtype=np.uint8),
+            'edge_width': np.asarray(edge_widths, dtype=np.float64),
+            'slice_keys': np.empty(0),
+        }
+        built = np.setdiff1d(np.arange(n), in_columns)
+        built_columns = _shape_columns([shapes[i] for i in built])
+        for name in (
+            'vertices_count',
+            'face_vertices_count',
+            'edge_vertices_count',
+            'face_triangles_count',
+            'edge_triangles_count',
+            'kind',
+        ):
+            columns[name][built] = built_columns[name]  # type: ignore[literal-required]
+        columns['face_vertices_count'][batched] = face_sizes
+        columns['edge_vertices_count'][batched] = edge_sizes
+        columns['face_triangles_count'][batched] = face_sizes - 2
+        columns['edge_triangles_count'][batched] = edge_sizes - 2
+
+        if len(in_columns):
+            columns_data = np.concatenate([data[i] for i in in_columns])
+            data_counts = np.fromiter(
+                (len(data[i]) for i in in_columns),  # type: ignore[arg-type]
+                dtype=IndexDtype,
+                count=len(in_columns),
+            )
+            columns['vertices_count'][in_columns] = data_counts
+            # like the slice keys of Polygon
+            data_starts = np.cumsum(data_counts) - data_counts
+            bounding_boxes = np.stack(
+                [
+                    np.minimum.reduceat(columns_data, data_starts),
+                    np.maximum.reduceat(columns_data, data_starts),
+                ],
+                axis=1,
+            )
+            not_displayed = list(self._dims_order[:-2])
+            slice_keys = np.rint(bounding_boxes[:, :, not_displayed]).astype(
+                int
+            )
+        else:
+            columns_data = np.empty((0, 0), dtype=CoordinateDtype)
+            slice_keys = np.empty(
+                (0, *built_columns['slice_keys'].shape[1:]), dtype=int
+            )
+        columns['slice_keys'] = np.empty(
+            (n, *slice_keys.shape[1:]), dtype=slice_keys.dtype
+        )
+        columns['slice_keys'][in_columns] = slice_keys
+        if len(built):
+            columns['slice_keys'][built] = built_columns['slice_keys']
+
+        vertices_count = columns['vertices_count']
+        face_vertices_count = columns['face_vertices_count']
+        mesh_vertices_count = (
+            face_vertices_count + columns['edge_vertices_count']
+        )
+        # the triangles of the face and of the edge of each shape in turn
+        triangles_count = np.stack(
+            [
+                columns['face_triangles_count'],
+                columns['edge_triangles_count'],
+            ],
+            axis=1,
+        ).ravel()
+        vertices_stops = np.cumsum(vertices_count)
+        vertices_starts = vertices_stops - vertices_count
+        mesh_vertices_stops = np.cumsum(mesh_vertices_count)
+        mesh_vertices_starts = mesh_vertices_stops - mesh_vertices_count
+        triangles_stops = np.cumsum(triangles_count)[1::2]
+        triangles_starts = triangles_stops - (
+            triangles_count[::2] + triangles_count[1::2]
+        )
+
+        arrays = _preallocate_arrays(
+            n,
+            int(vertices_stops[-1]),
+            int(mesh_vertices_stops[-1]),
+            int(triangles_stops[-1]),
+            self.ndisplay,  # type: ignore[arg-type]
+        )
+        arrays['z_index'][:] = z_indices
+        arrays['vertices_index'][:] = len(self._vertices) + vertices_stops
+        arrays['mesh_vertices_index'][:] = (
+            len(self._mesh.vertices) + mesh_vertices_stops
+        )
+        arrays['mesh_triangles_index'][:] = (
+            len(self._mesh.triangles) + triangles_stops
+        )
+        arrays['mesh_triangles_colors'][:] = np.repeat(
+            np.stack([face_colors, edge_colors], axis=1).reshape(-1, 4),
+            triangles_count,
+            axis=0,
+        )
+        # triangles index the vertices of their face or edge, which follows
+        arrays['mesh_triangles_base'][:] = np.repeat(
+            len(self._mesh.vertices)
+            + np.stack(
+                [
+                    mesh_vertices_starts,
+                    mesh_vertices_starts + face_vertices_count,
+                ],
+                axis=1,
+            ).ravel(),
+            triangles_count,
+        )
+
+        vertices = arrays['vertices']
+        for i in built:
+            shape = shapes[i]
+            assert shape is not None
+            vertices[vertices_starts[i] : vertices_stops[i]] = (
+                shape.data_displayed
+            )
+        if len(in_columns):
+            vertices[
+                concatenated_ranges(
+                    vertices_starts[in_columns], vertices_stops[in_columns]
+                )
+            ] = columns_data[:, list(self._dims_order[-2:])]
+        for i in np.setdiff1d(built, batched):
+            _fill_shape_meshes(
+                shapes[i],  # type: ignore[arg-type]
+                mesh_vertices_starts[i],
+                triangles_starts[i],
+                arrays,
+            )
+
+        if len(batched):
+            triangulated = set_batched_meshes(
+                [shapes[i] for i in batched],
+                batched_paths,  # type: ignore[arg-type]
+                columns['edge_width'][batched],
+                edge_sizes,
+                mesh_vertices_starts[batched],
+                triangles_starts[batched],
+                arrays['mesh_vertices'],
+                arrays['mesh_vertices_centers'],
+                arrays['mesh_vertices_offsets'],
+                arrays['mesh_triangles'],
+            )
+            if not triangulated.all():
+                # the faces of some polygons are not simple, so their meshes
+                # are triangulated one by one to other sizes: build those
+                # stored in the columns and lay the arrays out again
+                for i in batched[~triangulated]:
+                    if shapes[i] is None:
+                        shapes[i] = self._triangulated_polygon(
+                            data[i],  # type: ignore[arg-type]
+                            columns['edge_width'][i],
+                            z_indices[i],
+                        )
+                        data[i] = paths[i] = None
+                self._add_rows(
+                    shapes,
+                    data,
+                    paths,
+                    edge_widths,
+                    z_indices,
+                    face_colors,
+                    edge_colors,
+                    z_refresh,
+                )
+                return
+
+        # Update local arrays appending mesh properties
+        self._extend_meshes(face_colors, edge_colors, arrays)
+
+        # Update list of shapes
+        self._shapes.extend(shapes)
+        self._n_lazy += len(in_columns)
+        self._append_columns(columns)
+        data_counts_ = np.zeros(n, dtype=IndexDtype)
+        data_counts_[in_columns] = vertices_count[in_columns]
+        self._data_index = np.append(
+            self._data_index, self._data_index[-1] + np.cumsum(data_counts_)
+        ).astype(IndexDtype)
+        if len(columns_data):
+            self._data = (
+                np.concatenate([self._data, columns_data])
+                if len(self._data)
+                else columns_data
+            )
+            self._data_views.clear()
+
+        if z_refresh:
+            # Set z_order
+            self._update_z_order()
+        self._index.append(self.slice_keys)
+
+    def _triangulated_polygon(
+        self, data: np.ndarray, edge_width: float, z_index: int
+    ) -> Shape:
+        """Build the Shape of a polygon of the columns, triangulating it."""
+        polygon = Polygon(
+            data,
+            edge_width=float(edge_width),
+            z_index=int(z_index),
+            dims_order=self._dims_order,
+            ndisplay=self.ndisplay,
+        )
+        # nothing to triangulate together with a single polygon
+        for path in take_deferred_meshes([polygon]).values():
+            polygon._set_meshes(path, face=True, closed=True)
+        return polygon
+
+    def _add_again(self, dims_order: Sequence[int] | None = None) -> None:
+        """Add all the shapes again, e.g. after ndisplay changed.
+
+        Parameters
+        ----------
+        dims_order : (D,) list, optional
+            New order of the dimensions of the shapes.
+        """
+        shapes = list(self._shapes)
+        data: list[np.ndarray | None] = [
+            None if shape is not None else self._row_data(i)
+            for i, shape in enumerate(shapes)
+        ]
+        edge_widths = self._columns['edge_width']
+        z_indices = self._z_index
+        face_colors = self._face_color
+        edge_colors = self._edge_color
+        columns_dims = self._dims_order if dims_order is None else dims_order
+
+        with self.batched_updates(), batched_triangulation():
+            for shape in shapes:
+                if shape is not None:
+                    shape.ndisplay = self.ndisplay
+                    if dims_order is not None:
+                        shape.dims_order = dims_order
+            self.remove_all()
+            # the polygons of the columns stay there if they still can
+            in_columns = [i for i, shape in enumerate(shapes) if shape is None]
+            rows = self._build_rows(
+                [data[i] for i in in_columns],  # type: ignore[misc]
+                [Polygon] * len(in_columns),
+                edge_widths[in_columns],
+                z_indices[in_columns],
+                columns_dims,
+                self.ndisplay,
+            )
+            paths: list[np.ndarray | None] = [None] * len(shapes)
+            for i, shape, row_data, path in zip(
+                in_columns, *rows, strict=True
+            ):
+                shapes[i], data[i], paths[i] = shape, row_data, path
+            if shapes:
+                self._add_rows(
+                    shapes,
+                    data,
+                    paths,
+                    edge_widths,
+                    z_indices,
+                    face_colors,
+                    edge_colors,
+                )
+
     def _add_multiple_shapes(
         self,
         shapes: Sequence[Shape],
@@ -1097,38 +1703,29 @@ class ShapeList:
             shapes, face_colors, edge_colors
         )
 
-        # Calculate sizes for preallocation
-        sizes = _calculate_array_sizes(shapes)
-
-        # Preallocate arrays
-        arrays = _preallocate_arrays(shapes, sizes)
-
-        # Fill pre-allocated arrays with mesh and index data
-        _fill_arrays(
-            len(self._mesh.vertices),
-            len(self._mesh.triangles),
-            len(self._vertices),
-            shapes,
+        n = len(shapes)
+        self._add_rows(
+            list(shapes),
+            [None] * n,
+            [None] * n,
+            np.fromiter(
+                (s.edge_width for s in shapes), dtype=np.float64, count=n
+            ),
+            np.fromiter((s.z_index for s in shapes), dtype=np.int32, count=n),
             face_colors,
             edge_colors,
-            arrays,
+            z_refresh,
         )
 
-        # Update local arrays appending mesh properties
-        self._extend_meshes(face_colors, edge_colors, arrays)
-
-        # Update list of shapes
-        self.shapes.extend(shapes)
-
-        if z_refresh:
-            # Set z_order
-            self._update_z_order()
-        self._clear_cache()
-
     @_batch_dec
     def remove_all(self):
         """Removes all shapes"""
-        self.shapes = []
+        self._shapes = []
+        self._n_lazy = 0
+        self._data = np.empty((0, 0), dtype=CoordinateDtype)
+        self._data_index = np.zeros(1, dtype=IndexDtype)
+        self._data_views.clear()
+        self._columns = _shape_columns([])
         self._vertices = np.empty((0, self.ndisplay))  # type: ignore[assignment]
         self._vertices_index = np.zeros(1, dtype=IndexDtype)
         self._z_index = np.empty(0, dtype=IndexDtype)
@@ -1136,18 +1733,20 @@ class ShapeList:
         self._edge_color = np.empty((0, 4), dtype=ShapeColorDtype)  # type: ignore[assignment]
         self._face_color = np.empty((0, 4), dtype=ShapeColorDtype)  # type: ignore[assignment]
         self._mesh.clear()
+        self._index.reset()
         self._update_displayed()
 
     @_batch_dec
     def update(self, index: int) -> None:
         """update shape at index `index`"""
+        self._update_columns(index)
         self._update_vertices(index)
         self._update_mesh_triangles(index)
         self._update_mesh_vertices(index, edge=True, face=True)
         self._update_displayed()
 
     def _update_vertices(self, index: int) -> None:
-        shape = self.shapes[index]
+        shape = self._shape(index)
         vertices_slice = self._vertices_slice_available(index)
         curr_vert_count = vertices_slice.stop - vertices_slice.start
         if shape.data_displayed.shape[0] == curr_vert_count:
@@ -1181,7 +1780,7 @@ class ShapeList:
         index : int
             Location in list of the shape to be changed.
         """
-        shape = self.shapes[index]
+        shape = self._shape(index)
         if index == 0:
             triangle_shift = 0
         else:
@@ -1288,10 +1887,12 @@ class ShapeList:
         if not indices:
             return
 
+        shape_indices = np.asarray(indices)
+
         # Remove indices
-        vert_slices = [self._vertices_slice_available(i) for i in indices]
-        vert_indices_to_del = np.concatenate(
-            [np.arange(s.start, s.stop) for s in vert_slices]
+        vert_indices_to_del = concatenated_ranges(
+            self._vertices_index[shape_indices],
+            self._vertices_index[shape_indices + 1],
         )
         self._vertices = np.delete(self._vertices, vert_indices_to_del, axis=0)
 
@@ -1301,12 +1902,23 @@ class ShapeList:
             ([0], np.cumsum(new_vert_counts))
         ).astype(IndexDtype)
 
+        self._data = np.delete(
+            self._data,
+            concatenated_ranges(
+                self._data_index[shape_indices],
+                self._data_index[shape_indices + 1],
+            ),
+            axis=0,
+        )
+        self._data_index = np.concatenate(
+            ([0], np.cumsum(np.delete(np.diff(self._data_index), indices)))
+        ).astype(IndexDtype)
+        self._data_views.clear()
+
         # Remove vertices
-        mesh_vert_slices = [
-            self._mesh_vertices_slice_available(i) for i in indices
-        ]
-        mesh_vert_indices_to_del = np.concatenate(
-            [np.arange(s.start, s.stop) for s in mesh_vert_slices]
+        mesh_vert_indices_to_del = concatenated_ranges(
+            self._mesh.vertices_index[shape_indices],
+            self._mesh.vertices_index[shape_indices + 1],
         )
         # Get the shift for triangles caused by the removal of mesh vertices
         deleted_vertex_shift = np.zeros(len(self._mesh.vertices), dtype=int)
@@ -1329,11 +1941,9 @@ class ShapeList:
         ).astype(IndexDtype)
 
         # Remove triangles
-        mesh_tri_slices = [
-            self._mesh_triangles_slice_available(i) for i in indices
-        ]
-        mesh_tri_indices_to_del = np.concatenate(
-            [np.arange(s.start, s.stop) for s in mesh_tri_slices]
+        mesh_tri_indices_to_del = concatenated_ranges(
+            self._mesh.triangles_index[shape_indices],
+            self._mesh.triangles_index[shape_indices + 1],
         )
         self._mesh.triangles -= deleted_vertex_shift[self._mesh.triangles]
         self._mesh.triangles = np.delete(
@@ -1350,12 +1960,20 @@ class ShapeList:
         ).astype(IndexDtype)
 
         if renumber:
-            for i in indices:
-                del self.shapes[i]
+            removed = set(indices)
+            self._n_lazy -= sum(self._shapes[i] is None for i in removed)
+            self._shapes = [
+                shape
+                for i, shape in enumerate(self._shapes)
+                if i not in removed
+            ]
+            for name, column in self._columns.items():
+                self._columns[name] = np.delete(  # type: ignore[literal-required]
+                    column, shape_indices, axis=0
+                )
             self._z_index = np.delete(self._z_index, indices)
             self._update_z_order()
-
-        self._clear_cache()
+            self._index.remove(indices)
 
     @_batch_dec
     def _update_mesh_vertices(self, index, edge=False, face=False):
@@ -1373,7 +1991,10 @@ class ShapeList:
             Bool to indicate whether to update mesh vertices corresponding to
             faces and to update the underlying shape vertices
         """
-        shape = self.shapes[index]
+        shape = self._shape(index)
+        if face:
+            self._update_columns(index)
+        self._index.update(index, self.slice_keys)
         if edge and face:
             shape_slice = self._mesh_vertices_slice_available(index)
             current_range = shape_slice.stop - shape_slice.start
@@ -1438,7 +2059,6 @@ class ShapeList:
             indices = self._vertices_slice(index)
             self._vertices[indices] = shape.data_displayed
             self._update_displayed()
-        self._clear_cache()
 
     @_batch_dec
     def _update_z_order(self):
@@ -1451,10 +2071,10 @@ class ShapeList:
             counts = np.empty(idx.shape, dtype=idx.dtype)
             counts[:-1] = idx[1:] - idx[:-1]
             counts[-1] = len(self._mesh.triangles) - idx[-1]
-            triangles_z_order = [
-                np.arange(idx[z], idx[z] + counts[z]) for z in self._z_order
-            ]
-            self._mesh.triangles_z_order = np.concatenate(triangles_z_order)
+            starts = idx[self._z_order]
+            self._mesh.triangles_z_order = concatenated_ranges(
+                starts, starts + counts[self._z_order]
+            )
         self._update_displayed()
 
     def edit(
@@ -1474,7 +2094,7 @@ class ShapeList:
             'path', 'polygon'}".
         """
         if new_type is not None:
-            cur_shape = self.shapes[index]
+            cur_shape = self._shape(index)
             if isinstance(new_type, str):
                 shape_type = ShapeType(new_type)
                 if shape_type in shape_classes:
@@ -1496,9 +2116,9 @@ class ShapeList:
                 z_index=cur_shape.z_index,
                 dims_order=cur_shape.dims_order,
             )
-            self.shapes[index] = shape
+            self._shapes[index] = shape
         else:
-            shape = self.shapes[index]
+            shape = self._shape(index)
             shape.data = data
 
         if face_color is not None:
@@ -1509,6 +2129,7 @@ class ShapeList:
         self.update(index)
         self._update_z_order()
 
+    @_batch_dec
     def update_edge_width(self, index, edge_width):
         """Updates the edge width of a single shape located at index.
 
@@ -1519,8 +2140,17 @@ class ShapeList:
         edge_width : float
             thickness of lines and edges.
         """
-        self.shapes[index].edge_width = edge_width
-        self._update_mesh_vertices(index, edge=True)
+        shape = self._shapes[index]
+        if shape is not None:
+            shape.edge_width = edge_width
+        self._columns['edge_width'][index] = edge_width
+        indices = self._mesh_vertices_edge_slice(index)
+        self._mesh.vertices[indices] = (
+            self._mesh.vertices_centers[indices]
+            + edge_width * self._mesh.vertices_offsets[indices]
+        )
+        self._index.update(index, self.slice_keys)
+        self._update_displayed()
 
     @_batch_dec
     def update_edge_color(
@@ -1552,18 +2182,37 @@ class ShapeList:
         update: bool = True,
     ) -> None:
         """same as update_edge_color() but for multiple indices/edgecolors at once"""
-        edge_colors_: Iterable[ShapeColor]
-        if edge_colors.ndim == 1:
-            edge_colors_ = repeat(typing.cast(ShapeColor, edge_colors))
-        elif edge_colors.ndim == 2 and edge_colors.shape[0] == 1:
-            edge_colors_ = repeat(typing.cast(ShapeColor, edge_colors[0]))
-        else:
-            edge_colors_ = edge_colors
-        for i, color in zip(indices, edge_colors_, strict=False):
-            self.update_edge_color(i, color, update=False)
+        indices_, edge_colors_ = self._broadcast_colors(indices, edge_colors)
+        self._edge_color[indices_] = edge_colors_
+        starts = (
+            self._mesh.triangles_index[indices_]
+            + self._columns['face_triangles_count'][indices_]
+        )
+        counts = self._columns['edge_triangles_count'][indices_]
+        self._mesh.triangles_colors[
+            concatenated_ranges(starts, starts + counts)
+        ] = np.repeat(self._edge_color[indices_], counts, axis=0)
         if update:
             self._update_displayed()
 
+    @staticmethod
+    def _broadcast_colors(
+        indices: Iterable[int], colors: ShapeColor | ShapeColorArray
+    ) -> tuple[IndexArray, np.ndarray]:
+        """Pair indices with one color each, repeating a single color."""
+        indices_ = np.fromiter(indices, dtype=IndexDtype)
+        if colors.ndim == 1:
+            colors_ = np.broadcast_to(colors, (len(indices_), len(colors)))
+        elif colors.ndim == 2 and colors.shape[0] == 1:
+            colors_ = np.broadcast_to(
+                colors[0], (len(indices_), colors.shape[1])
+            )
+        else:
+            # like zip, ignore the indices or colors in excess
+            n = min(len(indices_), len(colors))
+            indices_, colors_ = indices_[:n], colors[:n]
+        return indices_, colors_
+
     @_batch_dec
     def update_face_color(
         self, index: int, face_color: ShapeColor, update: bool = True
@@ -1594,16 +2243,13 @@ class ShapeList:
         update: bool = True,
     ) -> None:
         """same as update_face_color() but for multiple indices/facecolors at once"""
-        face_colors_: Iterable[ShapeColor]
-        if face_colors.ndim == 1:
-            face_colors_ = repeat(typing.cast(ShapeColor, face_colors))
-        elif face_colors.ndim == 2 and face_colors.shape[0] == 1:
-            face_colors_ = repeat(typing.cast(ShapeColor, face_colors[0]))
-        else:
-            face_colors_ = face_colors
-
-        for i, color in zip(indices, face_colors_, strict=False):
-            self.update_face_color(i, color, update=False)
+        indices_, face_colors_ = self._broadcast_colors(indices, face_colors)
+        self._face_color[indices_] = face_colors_
+        starts = self._mesh.triangles_index[indices_]
+        counts = self._columns['face_triangles_count'][indices_]
+        self._mesh.triangles_colors[
+            concatenated_ranges(starts, starts + counts)
+        ] = np.repeat(self._face_color[indices_], counts, axis=0)
         if update:
             self._update_displayed()
 
@@ -1615,11 +2261,19 @@ class ShapeList:
         dims_order : (D,) list
             Order that the dimensions are rendered in.
         """
-        for index in range(len(self.shapes)):
-            if self.shapes[index].dims_order != dims_order:
-                shape = self.shapes[index]
-                shape.dims_order = dims_order
-                self.update(index)
+        if self._n_lazy and dims_order != self._dims_order:
+            self._add_again(dims_order)
+            return
+        changed = [
+            index
+            for index, shape in enumerate(self._shapes)
+            if shape is not None and shape.dims_order != dims_order
+        ]
+        with batched_triangulation():
+            for index in changed:
+                self._shape(index).dims_order = dims_order
+        for index in changed:
+            self.update(index)
         self._update_z_order()
 
     def update_z_index(self, index, z_index):
@@ -1633,7 +2287,9 @@ class ShapeList:
             Specifier of z order priority. Shapes with higher z order are
             displayed ontop of others.
         """
-        self.shapes[index].z_index = z_index
+        shape = self._shapes[index]
+        if shape is not None:
+            shape.z_index = z_index
         self._z_index[index] = z_index
         self._update_z_order()
 
@@ -1647,7 +2303,7 @@ class ShapeList:
         shift : np.ndarray
             length 2 array specifying shift of shapes.
         """
-        self.shapes[index].shift(shift)
+        self._shape(index).shift(shift)
         self._update_mesh_vertices(index, edge=True, face=True)
 
     def scale(self, index, scale, center=None):
@@ -1662,7 +2318,7 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of scaling.
         """
-        self.shapes[index].scale(scale, center=center)
+        self._shape(index).scale(scale, center=center)
         self.update(index)
         self._update_z_order()
 
@@ -1678,7 +2334,7 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of rotation.
         """
-        self.shapes[index].rotate(angle, center=center)
+        self._shape(index).rotate(angle, center=center)
         self._update_mesh_vertices(index, edge=True, face=True)
 
     def flip(self, index, axis, center=None):
@@ -1694,7 +2350,7 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of flip axes.
         """
-        self.shapes[index].flip(axis, center=center)
+        self._shape(index).flip(axis, center=center)
         self._update_mesh_vertices(index, edge=True, face=True)
 
     def transform(self, index, transform):
@@ -1707,10 +2363,9 @@ class ShapeList:
         transform : np.ndarray
             2x2 array specifying linear transform.
         """
-        self.shapes[index].transform(transform)
+        self._shape(index).transform(transform)
         self.update(index)
         self._update_z_order()
-        self._clear_cache()
 
     def outline(
         self, indices: int | Sequence[int]
@@ -1732,21 +2387,12 @@ class ShapeList:
         triangles : np.ndarray
             Mx3 array of any indices of vertices for triangles of outline
         """
-        if isinstance(indices, Sequence) and len(indices) == 1:
-            indices = indices[0]
-        if not isinstance(indices, Sequence):
-            shape = self.shapes[indices]
-            return (
-                shape._edge_vertices,
-                shape._edge_offsets,
-                shape._edge_triangles,
-            )
         return self.outlines(indices)
 
     def outlines(
         self, indices: Sequence[int]
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Finds outlines of shapes listed in indices, using chunked processing.
+        """Finds outlines of shapes listed in indices, from the mesh arrays.
 
         Parameters
         ----------
@@ -1762,66 +2408,37 @@ class ShapeList:
         triangles : np.ndarray
             Mx3 array of any indices of vertices for triangles of outline
         """
-        # Based on benchmarking, a chunk_size of 500 provides a good balance
-        # of performance for a wide range of shape counts.
-        chunk_size = 500
-
-        if not indices:
-            return (
-                np.empty((0, self.ndisplay), dtype=CoordinateDtype),
-                np.empty((0, self.ndisplay), dtype=CoordinateDtype),
-                np.empty((0, 3), dtype=TriangleDtype),
-            )
-
-        centers_blocks = []
-        offsets_blocks = []
-        triangles_blocks = []
-        n_verts_cumsum = 0
-
-        for start in range(0, len(indices), chunk_size):
-            chunk_indices = indices[start : start + chunk_size]
-            chunk_shapes = [self.shapes[i] for i in chunk_indices]
-
-            chunk_centers = []
-            chunk_offsets = []
-            chunk_tris = []
-            n_verts_per_shape = []
-            n_tris_per_shape = []
-
-            for s in chunk_shapes:
-                verts = s._edge_vertices
-                chunk_centers.append(verts)
-                chunk_offsets.append(s._edge_offsets)
-                tris = s._edge_triangles
-                chunk_tris.append(tris)
-                n_verts_per_shape.append(verts.shape[0])
-                n_tris_per_shape.append(tris.shape[0])
-
-            centers = np.concatenate(chunk_centers)
-            offsets = np.concatenate(chunk_offsets)
-            triangles = np.concatenate(chunk_tris)
-
-            # Offset triangle indices within chunk and across blocks
-            if triangles.size > 0:
-                vert_offsets = np.zeros(
-                    len(n_verts_per_shape), dtype=triangles.dtype
-                )
-                if len(vert_offsets) > 1:
-                    np.cumsum(n_verts_per_shape[:-1], out=vert_offsets[1:])
-                tri_offsets = np.repeat(vert_offsets, n_tris_per_shape)
-                triangles = (
-                    triangles + tri_offsets[:, np.newaxis] + n_verts_cumsum
+        indices_ = np.asarray(indices, dtype=np.intp).reshape(-1)
+        vertices_counts = self._columns['edge_vertices_count'][indices_]
+        vertices_starts = (
+            self._mesh.vertices_index[indices_]
+            + self._columns['face_vertices_count'][indices_]
+        )
+        triangles_counts = self._columns['edge_triangles_count'][indices_]
+        triangles_starts = (
+            self._mesh.triangles_index[indices_]
+            + self._columns['face_triangles_count'][indices_]
+        )
+        vertices = concatenated_ranges(
+            vertices_starts, vertices_starts + vertices_counts
+        )
+        # the triangles index the outline vertices of their shape, which
+        # follow those of the previous shapes
+        shifts = (
+            vertices_starts - np.cumsum(vertices_counts) + vertices_counts
+        ).astype(TriangleDtype)
+        triangles = (
+            self._mesh.triangles[
+                concatenated_ranges(
+                    triangles_starts, triangles_starts + triangles_counts
                 )
-
-            centers_blocks.append(centers)
-            offsets_blocks.append(offsets)
-            triangles_blocks.append(triangles)
-            n_verts_cumsum += centers.shape[0]
-
+            ]
+            - np.repeat(shifts, triangles_counts)[:, np.newaxis]
+        )
         return (
-            np.concatenate(centers_blocks),
-            np.concatenate(offsets_blocks),
-            np.concatenate(triangles_blocks),
+            self._mesh.vertices_centers[vertices],
+            self._mesh.vertices_offsets[vertices],
+            triangles,
         )
 
     def shapes_in_box(
@@ -1842,33 +2459,20 @@ class ShapeList:
         shapes : list of ints
             List of shapes that are inside the box.
         """
-        shape_mins, shape_maxs = self._bounding_boxes
-        if shape_mins.shape[0] == 0:
+        if not self._shapes:
             return []
 
         selection_min = np.min(corners, axis=0)
         selection_max = np.max(corners, axis=0)
 
-        # If the box encompasses all shapes, just get them directly
-        layer_min = np.min(shape_mins, axis=0)
-        layer_max = np.max(shape_maxs, axis=0)
-        if np.all(selection_min <= layer_min) and np.all(
-            selection_max >= layer_max
-        ):
-            return self._visible_shapes_indices.tolist()
-
         # Get shapes with bounding boxes intersecting the selection box
-        intersects_mask = np.all(shape_maxs >= selection_min, axis=1) & np.all(
-            shape_mins <= selection_max, axis=1
+        intersecting_indices = self._visible_shapes_tree().intersecting(
+            selection_min, selection_max
         )
-
-        intersecting_indices = self._visible_shapes_indices[intersects_mask]
-
         if intersecting_indices.size == 0:
             return []
 
-        shape_mins = shape_mins[intersects_mask]
-        shape_maxs = shape_maxs[intersects_mask]
+        shape_mins, shape_maxs = self._index.boxes(intersecting_indices)
 
         shapes_full_in_mask = np.all(
             shape_maxs <= selection_max, axis=1
@@ -1888,37 +2492,92 @@ class ShapeList:
             ).any()
         ]
 
-    @cached_property
+    @property
     def _visible_shapes(self) -> list[tuple[int, Shape]]:
-        slice_key = self.slice_key
-        if len(slice_key):
-            return [
-                (i, s)
-                for i, s in enumerate(self.shapes)
-                if (
-                    np.all(s.slice_key[0] <= slice_key)
-                    and np.all(slice_key <= s.slice_key[1])
-                )
-            ]
-        return list(enumerate(self.shapes))
+        return [
+            (int(i), self._shape(i))
+            for i in self._index.visible(self.slice_keys, self.slice_key)
+        ]
 
-    @cached_property
+    @property
     def _bounding_boxes(
         self,
     ) -> tuple[
         np.ndarray[tuple[int, Literal[2, 3]]],
         np.ndarray[tuple[int, Literal[2, 3]]],
     ]:
-        data = np.array([s[1].bounding_box for s in self._visible_shapes])
-        if data.size == 0:
-            return np.empty((0, self.ndisplay)), np.empty((0, self.ndisplay))  # type: ignore[return-value]
-        return data[:, 0], data[:, 1]
+        return self._index.boxes(
+            self._index.visible(self.slice_keys, self.slice_key)
+        )
 
-    @cached_property
-    def _visible_shapes_indices(
-        self,
-    ) -> np.ndarray[tuple[int], np.dtype[IndexDtype]]:
-        return np.array([s[0] for s in self._visible_shapes])
+    def _shape_bounding_boxes(
+        self, indices: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.float64]:
+        """(K, 2, D) bounding boxes of the shapes at indices.
+
+        See Shape.bounding_box, which is used for the shapes that are built.
+        """
+        boxes = np.empty((len(indices), 2, self.ndisplay))
+        in_columns = np.array(
+            [self._shapes[i] is None for i in indices], dtype=bool
+        )
+        for j in np.flatnonzero(~in_columns):
+            boxes[j] = self._shapes[indices[j]].bounding_box  # type: ignore[union-attr]
+        ids = indices[in_columns]
+        mins, maxs = _ranges_extent(
+            self._vertices,
+            self._vertices_index[ids],
+            self._columns['vertices_count'][ids],
+        )
+        # We add +-0.5 to handle edge width
+        half_widths = 0.5 * self._columns['edge_width'][ids, np.newaxis]
+        boxes[in_columns, 0] = mins - half_widths
+        boxes[in_columns, 1] = maxs + half_widths
+        return boxes
+
+    def _shape_mesh_boxes(
+        self, indices: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.float64]:
+        """(K, 2, D) bounding boxes of the shapes at indices and their edges.
+
+        The bounding boxes only include half of the edge width around the
+        vertices, while the edge triangles go further at sharp corners.
+        """
+        boxes = self._shape_bounding_boxes(indices)
+        counts = self._columns['edge_vertices_count'][indices]
+        with_edge = counts > 0
+        starts = (
+            self._mesh.vertices_index[indices]
+            + self._columns['face_vertices_count'][indices]
+        )
+        mins, maxs = _ranges_extent(
+            self._mesh.vertices, starts[with_edge], counts[with_edge]
+        )
+        boxes[with_edge, 0] = np.minimum(boxes[with_edge, 0], mins)
+        boxes[with_edge, 1] = np.maximum(boxes[with_edge, 1], maxs)
+        return boxes
+
+    @property
+    def data_extent(self) -> np.ndarray:
+        """(2, D) array: minimum and maximum of the data of all the shapes."""
+        in_columns = np.array([s is None for s in self._shapes], dtype=bool)
+        boxes = [
+            shape._bounding_box for shape in self._shapes if shape is not None
+        ]
+        if in_columns.any():
+            data = self._data[
+                concatenated_ranges(
+                    self._data_index[:-1][in_columns],
+                    self._data_index[1:][in_columns],
+                )
+            ]
+            boxes.append(np.stack([data.min(axis=0), data.max(axis=0)]))
+        boxes_ = np.array(boxes)
+        return np.stack([boxes_[:, 0].min(axis=0), boxes_[:, 1].max(axis=0)])
+
+    def _visible_shapes_tree(self) -> _BoxTree:
+        """Tree of the bounding boxes of the shapes in the current slice."""
+        return self._index.tree(self.slice_keys, self.slice_key)
 
     def inside(self, coord):
         """Determines if any shape at given coord by looking inside triangle
@@ -1935,37 +2594,29 @@ class ShapeList:
             Index of shape if any that is at the coordinates. Returns `None`
             if no shape is found.
         """
-        if not self.shapes:
+        if not self._shapes:
             return None
-        bounding_boxes = self._bounding_boxes
-        in_bbox = np.all(
-            (bounding_boxes[0] <= coord) * (bounding_boxes[1] >= coord),
-            axis=1,
-        )
-        inside_indices = np.flatnonzero(in_bbox)
+        inside_indices = self._visible_shapes_tree().containing(coord)
         if inside_indices.size == 0:
             return None
-        try:
-            z_index = [
-                self._visible_shapes[i][1].z_index for i in inside_indices
-            ]
-            pos = np.argsort(z_index)
-            return self._visible_shapes[
-                next(
-                    inside_indices[p]
-                    for p in pos[::-1]
-                    if np.any(
-                        inside_triangles(
-                            self._visible_shapes[inside_indices[p]][
-                                1
-                            ]._all_triangles()
-                            - coord
-                        )
+        pos = np.argsort(self._z_index[inside_indices], kind='stable')
+        return next(
+            (
+                int(inside_indices[p])
+                for p in pos[::-1]
+                if np.any(
+                    inside_triangles(
+                        self._mesh.vertices[
+                            self._mesh.triangles[
+                                self._mesh_triangles_slice(inside_indices[p])
+                            ]
+                        ]
+                        - coord
                     )
                 )
-            ][0]
-        except StopIteration:
-            return None
+            ),
+            None,
+        )
 
     def _inside_3d(self, ray_position: np.ndarray, ray_direction: np.ndarray):
         """Determines if any shape is intersected by a ray by looking inside triangle
@@ -1990,15 +2641,29 @@ class ShapeList:
             The point where the ray intersects the mesh face. If there was
             no intersection, returns None.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        # only check the triangles of the displayed shapes whose bounding
+        # boxes are crossed by the ray
+        crossed_shapes = self._index.tree(
+            self.slice_keys, self.slice_key, mode='displayed'
+        ).along_line(ray_position, ray_direction)
+        candidates = np.flatnonzero(
+            np.isin(
+                self._mesh.displayed_triangles_to_shape_index, crossed_shapes
+            )
+        )
+        if candidates.size == 0:
+            return None, None
+        triangles = self._mesh.vertices[
+            self._mesh.displayed_triangles[candidates]
+        ]
         inside = line_in_triangles_3d(
             line_point=ray_position,
             line_direction=ray_direction,
             triangles=triangles,
         )
-        # intersected_shapes = self._mesh.displayed_triangles_index[inside, 0]
         if not np.any(inside):
             return None, None
+        inside = candidates[inside]
 
         intersection_points = self._triangle_intersection(
             triangle_indices=inside,
@@ -2049,6 +2714,140 @@ class ShapeList:
         )
         return intersection_points
 
+    def _raster_tiles(
+        self,
+        out_shape,
+        zoom_factor=1,
+        offset=(0, 0),
+        tile_shape=None,
+        indices=None,
+    ) -> Generator[tuple[tuple, np.ndarray, np.ndarray, np.ndarray]]:
+        """Pixels of shapes in the tiles of an output array.
+
+        If out_shape has the dimensionality of the shapes, each shape is
+        drawn in the planes of its slice along the not displayed dimensions,
+        otherwise out_shape must be 2D and all the shapes are drawn in it.
+
+        Parameters
+        ----------
+        out_shape : tuple of int
+            Shape of the output array.
+        zoom_factor : float
+            Premultiplier applied to coordinates before rasterising.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+        tile_shape : 2-tuple of int, optional
+            Shape of the tiles along the displayed dimensions. By default,
+            tiles are made of whole rows.
+        indices : array of int, optional
+            Indices of the shapes to draw, all of them by default.
+
+        Yields
+        ------
+        key : tuple of int and slice
+            Index of the tile in the output array.
+        owners : np.ndarray
+            Index of the shape of each pixel of the tile.
+        rows, cols : np.ndarray
+            Coordinates of the pixels in the tile, which is 2D.
+        """
+        out_shape = tuple(int(s) for s in out_shape)
+        indices = (
+            np.arange(len(self._shapes))
+            if indices is None
+            else np.asarray(indices, dtype=np.intp)
+        )
+        if len(indices) == 0:
+            return
+        if len(out_shape) == 2:
+            displayed = [0, 1]
+            planes = {(): list(indices)}
+        elif len(out_shape) == len(self._row_dims_order(indices[0])):
+            dims_order = self._row_dims_order(indices[0])
+            displayed = list(dims_order[-self.ndisplay :][-2:])
+            planes = {}
+            for ind in indices:
+                ranges = [
+                    range(max(low, 0), min(high + 1, out_shape[d]))
+                    for d, low, high in zip(
+                        self._row_dims_order(ind)[: -self.ndisplay],
+                        *self.slice_keys[ind],
+                        strict=False,
+                    )
+                ]
+                for plane in itertools.product(*ranges):
+                    planes.setdefault(plane, []).append(ind)
+        else:
+            raise ValueError(
+                trans._(
+                    'mask shape length must either be 2 or the same as the dimensionality of the shape, expected {expected} got {received}.',
+                    deferred=True,
+                    expected=len(self._row_dims_order(indices[0])),
+                    received=len(out_shape),
+                )
+            )
+        not_displayed = [
+            d for d in range(len(out_shape)) if d not in displayed
+        ]
+        plane_shape = (out_shape[displayed[0]], out_shape[displayed[1]])
+        # tiles are given and yielded in the order of the output axes, and
+        # rasterised in the order of the displayed dimensions
+        transposed = displayed[0] > displayed[1]
+        if tile_shape is None:
+            width = out_shape[max(displayed)]
+            tile_shape = (max(_RASTER_TILE_SIZE // max(width, 1), 1), width)
+        tile_shape = tuple(max(int(t), 1) for t in tile_shape)
+        if transposed:
+            tile_shape = tile_shape[::-1]
+
+        for plane, plane_indices in planes.items():
+            owners_of = np.array(plane_indices, dtype=np.intp)
+            outlines, filled = zip(
+                *(self._raster_outline(i) for i in owners_of), strict=True
+            )
+            rasterizer = _ShapesRasterizer(
+                outlines,
+                filled,
+                plane_shape,
+                zoom_factor=zoom_factor,
+                offset=offset,
+            )
+            key: list[int | slice] = [0] * len(out_shape)
+            for d, p in zip(not_displayed, plane, strict=True):
+                key[d] = p
+            for r0 in range(0, plane_shape[0], tile_shape[0]):
+                r1 = min(r0 + tile_shape[0], plane_shape[0])
+                for c0 in range(0, plane_shape[1], tile_shape[1]):
+                    c1 = min(c0 + tile_shape[1], plane_shape[1])
+                    owners, rows, cols = rasterizer.pixels((r0, r1), (c0, c1))
+                    if len(owners) == 0:
+                        continue
+                    key[displayed[0]] = slice(r0, r1)
+                    key[displayed[1]] = slice(c0, c1)
+                    rows, cols = rows - r0, cols - c0
+                    if transposed:
+                        rows, cols = cols, rows
+                    yield tuple(key), owners_of[owners], rows, cols
+
+    def _row_dims_order(self, index: int) -> list[int]:
+        """Order of the dimensions of the shape at index."""
+        shape = self._shapes[index]
+        return self._dims_order if shape is None else shape.dims_order
+
+    def _raster_outline(self, index: int) -> tuple[np.ndarray, bool]:
+        """Displayed outline of the shape at index and whether it is filled.
+
+        See _ShapesRasterizer, the polygons of the columns are filled and
+        outlined by their displayed vertices.
+        """
+        shape = self._shapes[index]
+        if shape is None:
+            return self._vertices[self._vertices_slice(index)], True
+        if shape._use_face_vertices:
+            return shape._face_vertices, shape._filled
+        return shape.data_displayed, shape._filled
+
     def to_masks(self, mask_shape=None, zoom_factor=1, offset=(0, 0)):
         """Returns N binary masks, one for each shape, embedded in an array of
         shape `mask_shape`.
@@ -2074,16 +2873,28 @@ class ShapeList:
         if mask_shape is None:
             mask_shape = self.displayed_vertices.max(axis=0).astype('int')
 
-        masks = np.array(
-            [
-                s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
-                for s in self.shapes
+        masks = np.zeros((len(self._shapes), *mask_shape), dtype=bool)
+        for key, owners, rows, cols in self._raster_tiles(
+            mask_shape, zoom_factor=zoom_factor, offset=offset
+        ):
+            # the rows and columns of the tile are along its sliced axes
+            tile_axes = iter((rows, cols))
+            index = [
+                next(tile_axes) + k.start if isinstance(k, slice) else k
+                for k in key
             ]
-        )
+            masks[(owners, *index)] = True
 
         return masks
 
-    def to_labels(self, labels_shape=None, zoom_factor=1, offset=(0, 0)):
+    def to_labels(
+        self,
+        labels_shape=None,
+        zoom_factor=1,
+        offset=(0, 0),
+        out=None,
+        tile_shape=None,
+    ):
         """Returns a integer labels image, where each shape is embedded in an
         array of shape labels_shape with the value of the index + 1
         corresponding to it, and 0 for background. For overlapping shapes
@@ -2093,13 +2904,22 @@ class ShapeList:
         ----------
         labels_shape : np.ndarray | tuple | None
             2-tuple defining shape of labels image to be generated. If non
-            specified, takes the max of all the vertices
+            specified, takes the shape of `out`, or else the max of all the
+            vertices
         zoom_factor : float
             Premultiplier applied to coordinates before generating mask. Used
             for generating as downsampled mask.
         offset : 2-tuple
             Offset subtracted from coordinates before multiplying by the
             zoom_factor. Used for putting negative coordinates into the mask.
+        out : array-like | None
+            Array of shape labels_shape to write the labels into, tile by
+            tile, e.g. a zarr array. Tiles without shapes are not written,
+            so it should be filled with zeros beforehand.
+        tile_shape : 2-tuple | None
+            Shape of the tiles along the displayed dimensions, e.g. the
+            chunks of `out`. If non specified, tiles of whole rows of about
+            4 million pixels are used.
 
         Returns
         -------
@@ -2108,17 +2928,32 @@ class ShapeList:
             integer up to N for points inside the corresponding shape.
         """
         if labels_shape is None:
-            labels_shape = self.displayed_vertices.max(axis=0).astype(int)
-
-        labels = np.zeros(labels_shape, dtype=int)
-
-        for ind in self._z_order[::-1]:
-            mask = self.shapes[ind].to_mask(
-                labels_shape, zoom_factor=zoom_factor, offset=offset
-            )
-            labels[mask] = ind + 1
+            if out is not None:
+                labels_shape = out.shape
+            else:
+                labels_shape = self.displayed_vertices.max(axis=0).astype(int)
+
+        if out is None:
+            out = np.zeros(labels_shape, dtype=int)
+
+        # pixels get the label of the first of their shapes in the z order
+        n_shapes = len(self._shapes)
+        priority = np.empty(n_shapes, dtype=np.intp)
+        priority[self._z_order] = np.arange(n_shapes, 0, -1)
+        labels_of_priority = np.zeros(n_shapes + 1, dtype=int)
+        labels_of_priority[priority] = np.arange(1, n_shapes + 1)
+
+        for key, owners, rows, cols in self._raster_tiles(
+            labels_shape,
+            zoom_factor=zoom_factor,
+            offset=offset,
+            tile_shape=tile_shape,
+        ):
+            tile = np.zeros(_tile_shape(key), dtype=np.intp)
+            np.maximum.at(tile, (rows, cols), priority[owners])
+            out[key] = labels_of_priority[tile]
 
-        return labels
+        return out
 
     def to_colors(
         self, colors_shape=None, zoom_factor=1, offset=(0, 0), max_shapes=None
@@ -2168,19 +3003,30 @@ class ShapeList:
         if max_shapes is not None and len(z_order_in_view) > max_shapes:
             z_order_in_view = z_order_in_view[-max_shapes:]
 
-        for ind in z_order_in_view:
-            mask = self.shapes[ind].to_mask(
-                colors_shape, zoom_factor=zoom_factor, offset=offset
-            )
-            if type(self.shapes[ind]) in [Path, Line]:
-                col = self._edge_color[ind]
-            else:
-                col = self._face_color[ind]
-            colors[mask, :] = col
+        # pixels get the color of the last of their shapes in the z order
+        priority = np.zeros(len(self._shapes), dtype=np.intp)
+        priority[z_order_in_view] = np.arange(1, len(z_order_in_view) + 1)
+        is_line = np.isin(self._columns['kind'][z_order_in_view], _LINE_KINDS)
+        colors_of_priority = np.concatenate(
+            [
+                np.zeros((1, 4)),
+                np.where(
+                    is_line[:, None],
+                    self._edge_color[z_order_in_view],
+                    self._face_color[z_order_in_view],
+                ),
+            ]
+        )
 
-        return colors
+        for key, owners, rows, cols in self._raster_tiles(
+            colors_shape,
+            zoom_factor=zoom_factor,
+            offset=offset,
+            indices=z_order_in_view,
+        ):
+            tile = np.zeros(_tile_shape(key), dtype=np.intp)
+            np.maximum.at(tile, (rows, cols), priority[owners])
+            drawn = tile > 0
+            colors[key][drawn] = colors_of_priority[tile[drawn]]
 
-    def _clear_cache(self):
-        self.__dict__.pop('_bounding_boxes', None)
-        self.__dict__.pop('_visible_shapes', None)
-        self.__dict__.pop('_visible_shapes_indices', None)
+        return colors
@@ -0,0 +1,189 @@
+"""Index of the bounding boxes of shapes for hit-testing.
+
+Finding the shapes under the cursor, in a selection box or crossed by a ray
+compares the bounding box of every shape of the slice to the query.
+:class:`_ShapesIndex` keeps the bounding boxes of all the shapes and a
+:class:`~napari.layers.utils._box_tree._BoxTree` of the shapes of each
+recently viewed slice, which are updated when shapes are added, removed or
+edited instead of being recomputed. The boxes and slice keys of the shapes are
+read from the columns of their ShapeList.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from napari.layers.utils._box_tree import _BoxTree
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import numpy.typing as npt
+
+#: Number of slices whose trees are kept.
+_MAX_CACHED_SLICES = 8
+
+
+class _ShapesIndex:
+    """Bounding boxes of shapes and trees of the boxes of slices.
+
+    The index is built from the shapes the first time it is queried, and
+    updated incrementally afterwards. The owner of the shapes notifies it of
+    every change, after updating the (N, 2, P) slice keys it passes along.
+
+    Parameters
+    ----------
+    bounding_boxes : callable
+        Function returning the (K, 2, D) bounding boxes of the shapes at an
+        array of K indices.
+    mesh_boxes : callable
+        Function returning the (K, 2, D) bounding boxes of the meshes of the
+        shapes at an array of K indices, which include their edge triangles.
+    """
+
+    def __init__(
+        self,
+        bounding_boxes: Callable[[npt.NDArray[np.intp]], np.ndarray],
+        mesh_boxes: Callable[[npt.NDArray[np.intp]], np.ndarray],
+    ) -> None:
+        self._bounding_boxes = bounding_boxes
+        self._shape_mesh_boxes = mesh_boxes
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all the shapes."""
+        # (N, 2, D) bounding boxes of the shapes, None if the index is not
+        # built
+        self._boxes: np.ndarray | None = None
+        # (N, 2, D) bounding boxes of the meshes of the shapes, built for the
+        # first query of the displayed shapes
+        self._mesh_boxes: np.ndarray | None = None
+        self._trees: dict[tuple, _BoxTree] = {}
+
+    def _build(self, n_shapes: int) -> None:
+        if self._boxes is None:
+            self._boxes = self._bounding_boxes(np.arange(n_shapes))
+
+    def _visible(
+        self,
+        slice_keys: np.ndarray,
+        slice_key: np.ndarray,
+        mode: Literal['within', 'displayed'],
+    ) -> npt.NDArray[np.bool_]:
+        """Whether each shape of slice_keys is in the slice of slice_key."""
+        if len(slice_key) == 0 or len(slice_keys) == 0:
+            return np.ones(len(slice_keys), dtype=bool)
+        if mode == 'within':
+            return np.all(
+                (slice_keys[:, 0] <= slice_key)
+                & (slice_key <= slice_keys[:, 1]),
+                axis=1,
+            )
+        # same test as ShapeList._update_displayed
+        return np.all(np.abs(slice_keys - slice_key) < 0.5, axis=(1, 2))
+
+    def boxes(self, indices: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Lower and upper corners of the bounding boxes of shapes."""
+        assert self._boxes is not None
+        boxes = self._boxes[indices]
+        return boxes[:, 0], boxes[:, 1]
+
+    def visible(
+        self, slice_keys: np.ndarray, slice_key: npt.ArrayLike
+    ) -> npt.NDArray[np.intp]:
+        """Sorted indices of the shapes whose extent contains the slice."""
+        self._build(len(slice_keys))
+        return np.flatnonzero(
+            self._visible(
+                slice_keys, np.asarray(slice_key, dtype=float), 'within'
+            )
+        )
+
+    def tree(
+        self,
+        slice_keys: np.ndarray,
+        slice_key: npt.ArrayLike,
+        mode: Literal['within', 'displayed'] = 'within',
+    ) -> _BoxTree:
+        """Tree of the bounding boxes of the shapes in a slice.
+
+        Parameters
+        ----------
+        slice_keys : (N, 2, P) array
+            Slice keys of all the shapes.
+        slice_key : array
+            Coordinates of the slice along the not displayed dimensions.
+        mode : {'within', 'displayed'}
+            Whether the shapes of the slice are those whose extent along the
+            not displayed dimensions contains the slice, with their bounding
+            boxes, or those that are entirely in the slice like the
+            displayed shapes, with the bounding boxes of their meshes.
+        """
+        self._build(len(slice_keys))
+        if mode == 'displayed' and self._mesh_boxes is None:
+            self._mesh_boxes = self._shape_mesh_boxes(
+                np.arange(len(slice_keys))
+            )
+        slice_key = np.asarray(slice_key, dtype=float)
+        key = (mode, *slice_key.tolist())
+        if key in self._trees:
+            # most recently used trees are last
+            self._trees[key] = self._trees.pop(key)
+            return self._trees[key]
+        ids = np.flatnonzero(self._visible(slice_keys, slice_key, mode))
+        boxes = self._tree_boxes(mode)[ids]
+        tree = _BoxTree(ids, boxes[:, 0], boxes[:, 1])
+        self._trees[key] = tree
+        if len(self._trees) > _MAX_CACHED_SLICES:
+            del self._trees[next(iter(self._trees))]
+        return tree
+
+    def _tree_boxes(self, mode: str) -> np.ndarray:
+        boxes = self._mesh_boxes if mode == 'displayed' else self._boxes
+        assert boxes is not None
+        return boxes
+
+    def _update_trees(self, ids: np.ndarray, slice_keys: np.ndarray) -> None:
+        """Update the trees with the boxes and slice keys of shapes."""
+        slice_keys = slice_keys[ids]
+        for (mode, *slice_key), tree in self._trees.items():
+            boxes = self._tree_boxes(mode)[ids]
+            visible = self._visible(slice_keys, np.array(slice_key), mode)
+            # shapes out of the slice are removed with empty boxes
+            mins = np.where(visible[:, None], boxes[:, 0], np.inf)
+            maxs = np.where(visible[:, None], boxes[:, 1], -np.inf)
+            tree.update(ids, mins, maxs)
+
+    def append(self, slice_keys: np.ndarray) -> None:
+        """Add the shapes after the existing ones, up to len(slice_keys)."""
+        if self._boxes is None or len(slice_keys) == len(self._boxes):
+            return
+        ids = np.arange(len(self._boxes), len(slice_keys))
+        self._boxes = np.concatenate([self._boxes, self._bounding_boxes(ids)])
+        if self._mesh_boxes is not None:
+            self._mesh_boxes = np.concatenate(
+                [self._mesh_boxes, self._shape_mesh_boxes(ids)]
+            )
+        self._update_trees(ids, slice_keys)
+
+    def update(self, index: int, slice_keys: np.ndarray) -> None:
+        """Update the shape at index, e.g. after it was edited."""
+        if self._boxes is None:
+            return
+        ids = np.array([index])
+        self._boxes[index] = self._bounding_boxes(ids)[0]
+        if self._mesh_boxes is not None:
+            self._mesh_boxes[index] = self._shape_mesh_boxes(ids)[0]
+        self._update_trees(ids, slice_keys)
+
+    def remove(self, indices: Sequence[int]) -> None:
+        """Remove the shapes at indices, renumbering the following ones."""
+        if self._boxes is None or len(indices) == 0:
+            return
+        self._boxes = np.delete(self._boxes, indices, axis=0)
+        if self._mesh_boxes is not None:
+            self._mesh_boxes = np.delete(self._mesh_boxes, indices, axis=0)
+        for tree in self._trees.values():
+            tree.remove(indices)
@@ -1,5 +1,10 @@
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 import numpy as np
 
+from napari.layers.shapes import _accelerated_triangulate_dispatch
 from napari.layers.shapes._accelerated_triangulate_dispatch import (
     create_box_from_bounding,
 )
@@ -7,8 +12,266 @@ from napari.layers.shapes._shapes_models.shape import (
     Shape,
     remove_path_duplicates,
 )
+from napari.layers.shapes._shapes_utils import _MAX_EAR_CLIPPING_VERTICES
 from napari.utils.translations import trans
 
+# Polygons whose meshes are deferred, by id, with their displayed data,
+# while polygons are triangulated together
+_deferred_meshes: ContextVar[
+    dict[int, tuple['PolygonBase', np.ndarray]] | None
+] = ContextVar('_deferred_meshes', default=None)
+
+
+@contextmanager
+def batched_triangulation() -> Iterator[None]:
+    """Triangulate the polygons created or edited together.
+
+    Within this context, the faces and edges of filled 2D polygons are not
+    triangulated one by one when their data is set. Those of the polygons
+    then added to a ShapeList within the context are triangulated together
+    straight into its mesh arrays (see ``take_deferred_meshes``), and those
+    of the other polygons together on exit.
+    """
+    if _deferred_meshes.get() is not None:
+        # already batching
+        yield
+        return
+    token = _deferred_meshes.set({})
+    try:
+        yield
+        deferred = _deferred_meshes.get()
+    finally:
+        _deferred_meshes.reset(token)
+    assert deferred is not None
+    polygons, paths = _batched_paths(deferred.values())
+    if not polygons:
+        return
+    face_sizes, edge_sizes = batched_mesh_sizes(paths)
+    vertex_sizes = face_sizes + edge_sizes
+    vertex_starts = np.cumsum(vertex_sizes) - vertex_sizes
+    triangle_starts = np.cumsum(vertex_sizes - 4) - (vertex_sizes - 4)
+    n_vertices = int(vertex_sizes.sum())
+    set_batched_meshes(
+        polygons,
+        paths,
+        np.array([p.edge_width for p in polygons], dtype=np.float32),
+        edge_sizes,
+        vertex_starts,
+        triangle_starts,
+        np.empty((n_vertices, 2), dtype=np.float32),
+        np.empty((n_vertices, 2), dtype=np.float32),
+        np.empty((n_vertices, 2), dtype=np.float32),
+        np.empty((n_vertices - 4 * len(paths), 3), dtype=np.int32),
+    )
+
+
+def batched_triangulation_available() -> bool:
+    """Whether the meshes of filled 2D polygons can be triangulated together.
+
+    They are with the pure Python triangulation backend, when numba is
+    installed.
+    """
+    set_meshes, _ = PolygonBase._triangulation_methods()
+    return (
+        _accelerated_triangulate_dispatch.USE_NUMBA_FOR_EDGE_TRIANGULATION
+        and set_meshes is Shape._set_meshes_py
+    )
+
+
+def batched_path(data: np.ndarray) -> np.ndarray | None:
+    """Path of a polygon of displayed data to triangulate with others.
+
+    None if the polygon is too large or too small to be triangulated by ear
+    clipping.
+    """
+    path = remove_path_duplicates(data, closed=True)
+    if 3 <= len(path) <= _MAX_EAR_CLIPPING_VERTICES:
+        return path
+    return None
+
+
+def _batched_paths(
+    deferred: Iterable[tuple['PolygonBase', np.ndarray]],
+) -> tuple[list['PolygonBase'], list[np.ndarray]]:
+    """Polygons whose meshes can be triangulated together, with their paths.
+
+    The other polygons are triangulated one by one right away.
+    """
+    polygons = []
+    paths = []
+    for polygon, data in deferred:
+        path = batched_path(data)
+        if path is not None:
+            polygons.append(polygon)
+            paths.append(path)
+        else:
+            polygon._set_meshes(data, face=True, closed=polygon._closed)
+    return polygons, paths
+
+
+def take_deferred_meshes(shapes: Sequence[Shape]) -> dict[int, np.ndarray]:
+    """Take the polygons among shapes whose meshes are deferred.
+
+    Parameters
+    ----------
+    shapes : sequence of Shape
+        Shapes being added together, e.g. to a ShapeList.
+
+    Returns
+    -------
+    dict of int to np.ndarray
+        Path of each polygon whose meshes the caller must now set with
+        ``set_batched_meshes``, by position in shapes. The meshes of the
+        other deferred polygons among shapes are set right away.
+    """
+    deferred = _deferred_meshes.get()
+    if not deferred:
+        return {}
+    positions = [i for i, shape in enumerate(shapes) if id(shape) in deferred]
+    polygons, paths = _batched_paths(
+        deferred.pop(id(shapes[i])) for i in positions
+    )
+    batched = {id(polygon) for polygon in polygons}
+    return dict(
+        zip(
+            (i for i in positions if id(shapes[i]) in batched),
+            paths,
+            strict=True,
+        )
+    )
+
+
+def _packed_paths(
+    paths: Sequence[np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vertices of paths one after the other, and the offset of each path."""
+    offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+    np.cumsum([len(path) for path in paths], out=offsets[1:])
+    return np.concatenate(paths).astype(np.float32, copy=False), offsets
+
+
+def batched_mesh_sizes(
+    paths: Sequence[np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Number of face and edge mesh vertices of polygons triangulated together.
+
+    The face and the edge of each polygon have two triangles less than
+    vertices.
+    """
+    if not paths:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    packed, offsets = _packed_paths(paths)
+    edge_sizes = _accelerated_triangulate_dispatch.closed_edge_mesh_sizes(
+        packed, offsets
+    )
+    return np.diff(offsets), edge_sizes
+
+
+def set_batched_meshes(
+    polygons: Sequence['PolygonBase | None'],
+    paths: Sequence[np.ndarray],
+    edge_widths: np.ndarray,
+    edge_sizes: np.ndarray,
+    vertex_starts: np.ndarray,
+    triangle_starts: np.ndarray,
+    vertices: np.ndarray,
+    centers: np.ndarray,
+    offsets: np.ndarray,
+    triangles: np.ndarray,
+) -> np.ndarray:
+    """Triangulate polygons together straight into mesh arrays.
+
+    The face of each polygon, followed by its edge, is written to the mesh
+    arrays from the given starts, with the sizes of ``batched_mesh_sizes``
+    (see ``triangulate_closed_polygons``). The meshes of each polygon are
+    then views of the arrays. A polygon may be None when the caller keeps
+    its meshes in the arrays only.
+
+    Returns
+    -------
+    np.ndarray
+        Whether the meshes of each polygon were written to the arrays. They
+        are not when its face is not simple, in which case the polygon is
+        triangulated one by one instead, so its meshes have other sizes than
+        the ones written to the arrays.
+    """
+    packed, path_offsets = _packed_paths(paths)
+    triangulated = (
+        _accelerated_triangulate_dispatch.triangulate_closed_polygons(
+            packed,
+            path_offsets,
+            np.asarray(edge_widths, dtype=np.float32),
+            vertex_starts,
+            triangle_starts,
+            vertices,
+            centers,
+            offsets,
+            triangles,
+        )
+    )
+    for polygon, path, n_edge, v, t, ok in zip(
+        polygons,
+        paths,
+        edge_sizes,
+        vertex_starts,
+        triangle_starts,
+        triangulated,
+        strict=True,
+    ):
+        if polygon is None:
+            continue
+        if not ok:
+            polygon._set_meshes(path, face=True, closed=polygon._closed)
+            continue
+        # the edge follows the face in the arrays
+        e = v + len(path)
+        polygon._face_vertices = centers[v:e]
+        polygon._face_triangles = triangles[t : t + len(path) - 2]
+        polygon._edge_vertices = centers[e : e + n_edge]
+        polygon._edge_offsets = offsets[e : e + n_edge]
+        polygon._edge_triangles = triangles[
+            t + len(path) - 2 : t + len(path) + n_edge - 4
+        ]
+    return triangulated
+
+
+def triangulated_polygon(
+    polygon_class: type['PolygonBase'],
+    data: np.ndarray,
+    face: tuple[np.ndarray, np.ndarray],
+    edge: tuple[np.ndarray, np.ndarray, np.ndarray],
+    **kwargs,
+) -> 'PolygonBase':
+    """Create a polygon whose meshes are already triangulated.
+
+    Parameters
+    ----------
+    polygon_class : type
+        Subclass of PolygonBase to create.
+    data : np.ndarray
+        NxD array of vertices of the polygon.
+    face : tuple of np.ndarray
+        Vertices and triangles of the face.
+    edge : tuple of np.ndarray
+        Centers, offsets and triangles of the edge.
+    **kwargs
+        Other arguments of polygon_class.
+    """
+    with batched_triangulation():
+        polygon = polygon_class(data, **kwargs)
+        # the polygon is not triangulated if its meshes were deferred
+        deferred = _deferred_meshes.get()
+        assert deferred is not None
+        deferred.pop(id(polygon), None)
+    polygon._face_vertices, polygon._face_triangles = face
+    (
+        polygon._edge_vertices,
+        polygon._edge_offsets,
+        polygon._edge_triangles,
+    ) = edge
+    return polygon
+
 
 class PolygonBase(Shape):
     """Class for a polygon or path.
@@ -127,8 +390,23 @@ class PolygonBase(Shape):
                 # get interpolated data (discard last element which is a copy)
                 data = np.stack(splev(u, tck), axis=1)[:-1].astype(np.float32)
 
-        # For path connect every all data
-        self._set_meshes(data, face=self._filled, closed=self._closed)
+        deferred = _deferred_meshes.get()
+        if (
+            deferred is not None
+            and self._filled
+            and self._closed
+            and data.shape[1] == 2
+            and batched_triangulation_available()
+        ):
+            # the meshes are triangulated with other polygons later
+            self._set_empty_face()
+            self._set_empty_edge()
+            deferred[id(self)] = (self, data)
+        else:
+            if deferred is not None:
+                deferred.pop(id(self), None)
+            # For path connect every all data
+            self._set_meshes(data, face=self._filled, closed=self._closed)
         bbox = self._bounding_box[:, self.dims_displayed]
         self._box = create_box_from_bounding(bbox)
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 import numpy.typing as npt
@@ -32,6 +32,9 @@ from napari.utils.misc import argsort
 from napari.utils.translations import trans
 from napari.utils.triangulation_backend import TriangulationBackend
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 try:
     import bermuda
 except ImportError:
@@ -161,6 +164,19 @@ class Shape(ABC):
         self._bounding_box = np.empty((0, self.ndisplay))
 
     def __new__(cls, *args, **kwargs):
+        set_meshes, triangulate_edge = cls._triangulation_methods()
+        cls._set_meshes = set_meshes
+        if triangulate_edge is not None:
+            cls._triangulate_edge = triangulate_edge
+        return super().__new__(cls)
+
+    @classmethod
+    def _triangulation_methods(cls) -> tuple[Callable, Callable | None]:
+        """Methods setting the meshes and the edges with the selected backend.
+
+        The method triangulating edges is None if the backend has no faster
+        one than the default.
+        """
         if (
             TRIANGULATION_BACKEND
             in {
@@ -169,9 +185,11 @@ class Shape(ABC):
             }
             and bermuda is not None
         ):
-            cls._set_meshes = cls._set_meshes_compiled_bermuda
-            cls._triangulate_edge = cls._triangulate_edge_bermuda
-        elif (
+            return (
+                cls._set_meshes_compiled_bermuda,
+                cls._triangulate_edge_bermuda,
+            )
+        if (
             TRIANGULATION_BACKEND
             in {
                 TriangulationBackend.partsegcore,
@@ -179,9 +197,11 @@ class Shape(ABC):
             }
             and partsegcore_triangulate is not None
         ):
-            cls._set_meshes = cls._set_meshes_compiled_partseg
-            cls._triangulate_edge = cls._triangulate_edge_partseg
-        elif (
+            return (
+                cls._set_meshes_compiled_partseg,
+                cls._triangulate_edge_partseg,
+            )
+        if (
             TRIANGULATION_BACKEND
             in {
                 TriangulationBackend.triangle,
@@ -189,10 +209,8 @@ class Shape(ABC):
             }
             and 'triangle' in sys.modules
         ):
-            cls._set_meshes = cls._set_meshes_triangle
-        else:
-            cls._set_meshes = cls._set_meshes_py
-        return super().__new__(cls)
+            return cls._set_meshes_triangle, None
+        return cls._set_meshes_py, None
 
     @property
     @abstractmethod
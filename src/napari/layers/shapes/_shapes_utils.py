@@ -28,6 +28,10 @@ from napari.utils.translations import trans
 if TYPE_CHECKING:
     import numpy.typing as npt
 
+#: Polygons with more vertices are not triangulated by ear clipping, whose
+#: cost grows quickly with the number of vertices.
+_MAX_EAR_CLIPPING_VERTICES = 256
+
 try:
     # see https://github.com/vispy/vispy/issues/1029
     from triangle import triangulate
@@ -1058,28 +1062,24 @@ def generate_tube_meshes(path, closed=False, tube_points=10):
     return centers, offsets, triangles
 
 
-def path_to_mask(
-    mask_shape: npt.NDArray, vertices: npt.NDArray
-) -> npt.NDArray[np.bool_]:
-    """Converts a path to a boolean mask with `True` for points lying along
-    each edge.
+def path_to_pixels(
+    mask_shape: npt.ArrayLike, vertices: npt.NDArray
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Rows and columns of the points lying along each edge of a path.
 
     Parameters
     ----------
     mask_shape : array (2,)
-        Shape of mask to be generated.
+        Shape of the mask the path is drawn in.
     vertices : array (N, 2)
         Vertices of the path.
 
     Returns
     -------
-    mask : np.ndarray
-        Boolean array with `True` for points along the path
-
+    rows, cols : np.ndarray
+        Indices of the points along the path, which may be repeated.
     """
     mask_shape = np.asarray(mask_shape, dtype=int)
-    mask = np.zeros(mask_shape, dtype=bool)
-
     vertices = np.round(np.clip(vertices, 0, mask_shape - 1)).astype(int)
 
     # remove identical, consecutive vertices
@@ -1093,7 +1093,31 @@ def path_to_mask(
         iis.extend(ii.tolist())
         jjs.extend(jj.tolist())
 
-    mask[iis, jjs] = 1
+    return np.array(iis, dtype=np.intp), np.array(jjs, dtype=np.intp)
+
+
+def path_to_mask(
+    mask_shape: npt.NDArray, vertices: npt.NDArray
+) -> npt.NDArray[np.bool_]:
+    """Converts a path to a boolean mask with `True` for points lying along
+    each edge.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of mask to be generated.
+    vertices : array (N, 2)
+        Vertices of the path.
+
+    Returns
+    -------
+    mask : np.ndarray
+        Boolean array with `True` for points along the path
+
+    """
+    mask_shape = np.asarray(mask_shape, dtype=int)
+    mask = np.zeros(mask_shape, dtype=bool)
+    mask[path_to_pixels(mask_shape, vertices)] = 1
 
     return mask
 
@@ -3,7 +3,14 @@ import numpy.testing as npt
 import pytest
 
 from napari.layers.shapes._shape_list import ShapeList
-from napari.layers.shapes._shapes_models import Path, Polygon, Rectangle
+from napari.layers.shapes._shapes_models import (
+    Ellipse,
+    Line,
+    Path,
+    Polygon,
+    Rectangle,
+)
+from napari.layers.shapes._shapes_utils import triangles_intersect_box
 
 
 @pytest.fixture
@@ -460,3 +467,158 @@ def test_proper_shape_position(
         sl._mesh.displayed_triangles,
         triangles_slice + slice_ * simple_rectangle.vertices_count,
     )
+
+
+def _square(z, y, x, size):
+    return Polygon(
+        np.array(
+            [
+                [z, y, x],
+                [z, y + size, x],
+                [z, y + size, x + size],
+                [z, y, x + size],
+            ]
+        )
+    )
+
+
+def _hit_shapes(shape_list, corners):
+    """Shapes in a box, checking all the visible shapes."""
+    return [
+        i
+        for i, shape in shape_list._visible_shapes
+        if triangles_intersect_box(shape._all_triangles(), corners).any()
+    ]
+
+
+def test_index_follows_shape_changes():
+    """Test hit-testing stays correct when shapes are added, edited and
+    removed after the index is built."""
+    rng = np.random.default_rng(0)
+    shape_list = ShapeList()
+    shape_list.slice_key = np.array([0])
+    shape_list.add(
+        [
+            _square(z, *rng.uniform(0, 90, 2), rng.uniform(1, 10))
+            for z in rng.integers(0, 2, 200)
+        ]
+    )
+    corners = np.array([[20, 20], [60, 60]])
+    assert shape_list.shapes_in_box(corners) == _hit_shapes(
+        shape_list, corners
+    )
+
+    shape_list.add(_square(0, 30, 30, 10))
+    shape_list.shift(3, np.array([100, 100]))
+    shape_list.edit(4, _square(1, 30, 30, 20).data)
+    shape_list.remove_multiple([10, 2])
+    assert len(shape_list.shapes) == 199
+    assert shape_list.shapes_in_box(corners) == _hit_shapes(
+        shape_list, corners
+    )
+    assert shape_list.inside((35, 35)) == 198
+
+    shape_list.slice_key = np.array([1])
+    assert shape_list.shapes_in_box(corners) == _hit_shapes(
+        shape_list, corners
+    )
+
+
+def test_columns_follow_shape_changes():
+    """Test the per-shape columns match the shapes after changes."""
+    rng = np.random.default_rng(1)
+    shape_list = ShapeList()
+    shape_list.add([_square(z, 10 * z, 0, 5) for z in range(5)])
+    shape_list.add(Path(rng.uniform(0, 50, (6, 3))))
+    shape_list.edit(1, rng.uniform(0, 50, (7, 3)), new_type=Polygon)
+    shape_list.remove_multiple([3, 0])
+
+    expected = ShapeList()
+    expected.add([shape_list.shapes[i] for i in range(4)])
+    for name, column in expected._columns.items():
+        npt.assert_array_equal(shape_list._columns[name], column)
+    npt.assert_array_equal(shape_list._columns['vertices_count'], [7, 4, 4, 6])
+
+
+def test_update_colors_of_several_shapes():
+    """Test bulk color updates match updating shapes one by one."""
+    bulk, one_by_one = ShapeList(), ShapeList()
+    for shape_list in (bulk, one_by_one):
+        shape_list.add([_square(0, 10 * i, 0, 5) for i in range(4)])
+        shape_list.add(Path(np.array([[0, 0, 0], [0, 5, 5], [0, 0, 9]])))
+    colors = np.random.default_rng(2).uniform(size=(3, 4))
+
+    bulk.update_face_colors([4, 0, 2], colors)
+    bulk.update_edge_colors([1, 3], colors[0])
+    for i, color in zip([4, 0, 2], colors, strict=True):
+        one_by_one.update_face_color(i, color)
+    for i in [1, 3]:
+        one_by_one.update_edge_color(i, colors[0])
+
+    npt.assert_array_equal(bulk._face_color, one_by_one._face_color)
+    npt.assert_array_equal(bulk._edge_color, one_by_one._edge_color)
+    npt.assert_array_equal(
+        bulk._mesh.triangles_colors, one_by_one._mesh.triangles_colors
+    )
+
+
+@pytest.mark.parametrize('tile_shape', [None, (7, 5)])
+@pytest.mark.parametrize(
+    ('zoom_factor', 'offset'), [(1, (0, 0)), (0.5, (-4, 2))]
+)
+def test_to_labels_matches_shape_masks(tile_shape, zoom_factor, offset):
+    """Test rasterised labels and masks match the masks of the shapes."""
+    shape_list = ShapeList()
+    shape_list.add(
+        [
+            Polygon(np.array([[2, 2], [20, 30], [2, 30], [20, 2]]), z_index=1),
+            Polygon(np.array([[10, 5], [35, 12], [25, 40], [18, 20]])),
+            Rectangle(np.array([[5, 10], [30, 25]]), z_index=2),
+            Ellipse(np.array([[15, 15], [38, 36]])),
+            Path(np.array([[0, 0], [39, 20], [10, 39]]), z_index=3),
+            Line(np.array([[39, 0], [0, 39]])),
+        ]
+    )
+    mask_shape = (40, 36)
+    expected_masks = np.array(
+        [
+            s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
+            for s in shape_list.shapes
+        ]
+    )
+    expected_labels = np.zeros(mask_shape, dtype=int)
+    for ind in shape_list._z_order[::-1]:
+        expected_labels[expected_masks[ind]] = ind + 1
+
+    masks = shape_list.to_masks(
+        mask_shape, zoom_factor=zoom_factor, offset=offset
+    )
+    out = np.zeros(mask_shape, dtype=np.uint8)
+    labels = shape_list.to_labels(
+        mask_shape,
+        zoom_factor=zoom_factor,
+        offset=offset,
+        out=out,
+        tile_shape=tile_shape,
+    )
+
+    npt.assert_array_equal(masks, expected_masks)
+    assert labels is out
+    npt.assert_array_equal(labels, expected_labels)
+
+
+def test_to_labels_embedded_in_planes(shape_li_3d):
+    """Test 3D shapes are drawn in the planes of their slice."""
+    labels_shape = (2, 32, 32)
+    expected_masks = np.array(
+        [s.to_mask(labels_shape) for s in shape_li_3d.shapes]
+    )
+    expected_labels = np.zeros(labels_shape, dtype=int)
+    for ind in shape_li_3d._z_order[::-1]:
+        expected_labels[expected_masks[ind]] = ind + 1
+
+    masks = shape_li_3d.to_masks(labels_shape)
+    labels = shape_li_3d.to_labels(labels_shape, tile_shape=(5, 5))
+
+    npt.assert_array_equal(masks, expected_masks)
+    npt.assert_array_equal(labels, expected_labels)
@@ -2509,6 +2509,22 @@ def test_to_labels_3D():
     assert np.array_equal(np.unique(labels), [0, 1, 2, 3])
 
 
+def test_to_labels_tiled_into_out():
+    """Test labels can be written tile by tile into an existing array"""
+    data = [
+        [[0, 100, 100], [0, 100, 200], [0, 200, 200], [0, 200, 100]],
+        [[1, 125, 125], [1, 125, 175], [1, 175, 175], [1, 175, 125]],
+        [[1, 150, 150], [1, 150, 250], [1, 250, 150]],
+    ]
+    layer = Shapes(data, shape_type=['rectangle', 'ellipse', 'polygon'])
+    out = np.zeros((3, 300, 300), dtype=np.uint16)
+    labels = layer.to_labels(out=out, tile_shape=(64, 100))
+    assert labels is out
+    np.testing.assert_array_equal(
+        out, layer.to_labels(labels_shape=(3, 300, 300))
+    )
+
+
 def test_add_single_shape_consistent_properties():
     """Test adding a single shape ensures correct number of added properties"""
     data = [
@@ -8,6 +8,17 @@ import pytest
 from napari.layers.shapes import (
     _accelerated_triangulate_python,
 )
+from napari.layers.shapes._shape_list import ShapeList
+from napari.layers.shapes._shapes_constants import shape_classes
+from napari.layers.shapes._shapes_models import Polygon, Rectangle
+from napari.layers.shapes._shapes_models._polygon_base import (
+    batched_triangulation,
+)
+from napari.layers.shapes._shapes_utils import _fan_triangulation
+from napari.utils.triangulation_backend import (
+    TriangulationBackend,
+    set_backend,
+)
 
 ac = pytest.importorskip('napari.layers.shapes._accelerated_triangulate_numba')
 
@@ -193,6 +204,325 @@ def test_reconstruct_polygon_edges():
     assert len(res[1]) == 4
 
 
+def _triangles_area(vertices, triangles):
+    """Area covered by triangles, which must not overlap."""
+    a, b, c = (vertices[triangles[:, i]] for i in range(3))
+    u, v = b - a, c - a
+    return np.sum(np.abs(u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0])) / 2
+
+
+def _polygon_area(polygon):
+    """Area of a simple polygon."""
+    x, y = polygon.T
+    return abs(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)) / 2
+
+
+def _triangulate_closed_polygons(polygons, edge_width=1):
+    paths = np.concatenate(polygons).astype(np.float32)
+    offsets = np.cumsum([0, *map(len, polygons)])
+    face_sizes = np.diff(offsets)
+    edge_sizes = ac.closed_edge_mesh_sizes(paths, offsets)
+    vertex_sizes = face_sizes + edge_sizes
+    vertex_starts = np.cumsum(vertex_sizes) - vertex_sizes
+    triangle_starts = vertex_starts - 4 * np.arange(len(polygons))
+    vertices, centers, vertex_offsets = (
+        np.empty((vertex_sizes.sum(), 2), np.float32) for _ in range(3)
+    )
+    triangles = np.empty((vertex_sizes.sum() - 4 * len(polygons), 3), np.int32)
+    triangulated = ac.triangulate_closed_polygons(
+        paths,
+        offsets,
+        np.full(len(polygons), edge_width, np.float32),
+        vertex_starts,
+        triangle_starts,
+        vertices,
+        centers,
+        vertex_offsets,
+        triangles,
+    )
+    meshes = [
+        (
+            (centers[v : v + n], triangles[t : t + n - 2]),
+            (
+                centers[v + n : v + n + e],
+                vertex_offsets[v + n : v + n + e],
+                triangles[t + n - 2 : t + n + e - 4],
+            ),
+        )
+        for n, e, v, t in zip(
+            face_sizes, edge_sizes, vertex_starts, triangle_starts, strict=True
+        )
+    ]
+    npt.assert_array_equal(vertices, centers + edge_width * vertex_offsets)
+    return triangulated, meshes
+
+
+@pytest.mark.usefixtures('_disable_jit')
+def test_triangulate_closed_polygons_convex(regular_polygon):
+    """Convex polygons get the same meshes as one by one."""
+    polygons = [
+        regular_polygon.astype(np.float32),
+        regular_polygon[::-1].astype(np.float32),
+    ]
+    triangulated, meshes = _triangulate_closed_polygons(polygons, edge_width=2)
+    assert triangulated.all()
+    _, fan = _fan_triangulation(regular_polygon)
+    for polygon, ((face_vertices, face_triangles), edge) in zip(
+        polygons, meshes, strict=True
+    ):
+        npt.assert_array_equal(face_vertices, polygon)
+        npt.assert_array_equal(face_triangles, fan)
+        for value, expected in zip(
+            edge, ac.generate_2D_edge_meshes(polygon, closed=True), strict=True
+        ):
+            npt.assert_array_equal(value, expected)
+
+
+@pytest.mark.usefixtures('_disable_jit')
+def test_triangulate_closed_polygons_non_convex(non_convex_poly):
+    triangulated, [((face_vertices, face_triangles), _)] = (
+        _triangulate_closed_polygons([non_convex_poly])
+    )
+    assert triangulated.all()
+    assert _triangles_area(face_vertices, face_triangles) == pytest.approx(
+        _polygon_area(non_convex_poly)
+    )
+
+
+@pytest.mark.usefixtures('_disable_jit')
+def test_triangulate_closed_polygons_not_simple(
+    self_intersecting_polygon, poly_hole, non_convex_poly
+):
+    triangulated, _ = _triangulate_closed_polygons(
+        [self_intersecting_polygon, poly_hole[:-1], non_convex_poly]
+    )
+    npt.assert_array_equal(triangulated, [False, False, True])
+
+
+def _assert_same_meshes(polygon, expected):
+    npt.assert_array_equal(polygon._edge_vertices, expected._edge_vertices)
+    npt.assert_array_equal(polygon._edge_offsets, expected._edge_offsets)
+    npt.assert_array_equal(polygon._edge_triangles, expected._edge_triangles)
+    assert _triangles_area(
+        polygon._face_vertices, polygon._face_triangles
+    ) == pytest.approx(
+        _triangles_area(expected._face_vertices, expected._face_triangles)
+    )
+
+
+def test_batched_triangulation(non_convex_poly, poly_hole):
+    """Batched meshes cover polygons like meshes triangulated one by one."""
+    polygons = [non_convex_poly, poly_hole, non_convex_poly * 2]
+    prev = set_backend(TriangulationBackend.numba)
+    try:
+        with batched_triangulation():
+            batched = [Polygon(polygon) for polygon in polygons]
+            # meshes are triangulated on exit
+            assert all(len(p._face_triangles) == 0 for p in batched)
+            assert all(len(p._edge_triangles) == 0 for p in batched)
+        one_by_one = [Polygon(polygon) for polygon in polygons]
+    finally:
+        set_backend(prev)
+    for polygon, expected in zip(batched, one_by_one, strict=True):
+        _assert_same_meshes(polygon, expected)
+    # the polygon with a hole is not simple and is triangulated alone
+    npt.assert_array_equal(
+        batched[1]._face_triangles, one_by_one[1]._face_triangles
+    )
+
+
+def test_batched_triangulation_into_shape_list(non_convex_poly, poly_hole):
+    """Polygons added to a ShapeList are triangulated into its meshes."""
+    polygons = [non_convex_poly, poly_hole, non_convex_poly * 2]
+    prev = set_backend(TriangulationBackend.numba)
+    try:
+        batched = ShapeList()
+        batched.add(Rectangle(np.array([[0, 0], [1, 1]])))
+        with batched_triangulation():
+            shapes = [Polygon(polygon) for polygon in polygons]
+            batched.add(shapes)
+            # meshes were triangulated when added, not on exit
+            assert all(len(p._edge_triangles) > 0 for p in shapes)
+        one_by_one = [Polygon(polygon) for polygon in polygons]
+    finally:
+        set_backend(prev)
+    for polygon, expected in zip(shapes, one_by_one, strict=True):
+        _assert_same_meshes(polygon, expected)
+    # the mesh of each shape holds its face then its edge, with triangles
+    # indexing its own vertices
+    for i, shape in enumerate(batched.shapes):
+        mesh_vertices = slice(*batched._mesh.vertices_index[i : i + 2])
+        mesh_triangles = slice(*batched._mesh.triangles_index[i : i + 2])
+        npt.assert_array_equal(
+            batched._mesh.vertices[mesh_vertices],
+            np.concatenate(
+                [
+                    shape._face_vertices,
+                    shape._edge_vertices
+                    + shape.edge_width * shape._edge_offsets,
+                ]
+            ),
+        )
+        npt.assert_array_equal(
+            batched._mesh.triangles[mesh_triangles] - mesh_vertices.start,
+            np.concatenate(
+                [
+                    shape._face_triangles,
+                    shape._edge_triangles + len(shape._face_vertices),
+                ]
+            ),
+        )
+
+
+def _shape_lists_from_data(polygons, dims_order=None):
+    """ShapeLists of the polygons and a rectangle, from data and shapes."""
+    rectangle = np.array([[0, 0], [0, 8], [5, 8], [5, 0]])
+    if dims_order is not None:
+        rectangle = np.pad(rectangle, ((0, 0), (1, 0)))
+    data = [*polygons, rectangle]
+    shape_types = ['polygon'] * len(polygons) + ['rectangle']
+    edge_widths = np.arange(1, len(data) + 1, dtype=float)
+    z_indices = np.arange(len(data))[::-1]
+    lazy = ShapeList()
+    lazy.add_data(
+        data, shape_types, edge_widths, z_indices, dims_order=dims_order
+    )
+    eager = ShapeList()
+    with batched_triangulation():
+        eager.add(
+            [
+                shape_classes[shape_type](
+                    d, edge_width=w, z_index=z, dims_order=dims_order
+                )
+                for d, shape_type, w, z in zip(
+                    data, shape_types, edge_widths, z_indices, strict=True
+                )
+            ]
+        )
+    return lazy, eager
+
+
+def _assert_same_shape_lists(shape_list, expected):
+    for name, column in expected._columns.items():
+        npt.assert_array_equal(shape_list._columns[name], column)
+    for name in ('vertices', 'vertices_index', 'triangles', 'triangles_index'):
+        npt.assert_array_equal(
+            getattr(shape_list._mesh, name), getattr(expected._mesh, name)
+        )
+    npt.assert_array_equal(shape_list._vertices, expected._vertices)
+    npt.assert_array_equal(shape_list._z_order, expected._z_order)
+    for data, expected_data in zip(
+        shape_list.data, expected.data, strict=True
+    ):
+        npt.assert_array_equal(data, expected_data)
+
+
+def test_shape_list_add_data_builds_polygons_on_access(
+    non_convex_poly, poly_hole
+):
+    """Polygons added as data are only stored in the ShapeList columns."""
+    polygons = [non_convex_poly, poly_hole, non_convex_poly * 2]
+    prev = set_backend(TriangulationBackend.numba)
+    try:
+        lazy, eager = _shape_lists_from_data(polygons)
+        # the polygon with a hole and the rectangle are built right away
+        assert [shape is None for shape in lazy._shapes] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert lazy._n_lazy == 2
+        assert lazy.shape_types == eager.shape_types
+        _assert_same_shape_lists(lazy, eager)
+        all_data = np.concatenate(eager.data)
+        npt.assert_array_equal(
+            lazy.data_extent, [all_data.min(axis=0), all_data.max(axis=0)]
+        )
+
+        outline = lazy.outline([3, 2, 0])
+        expected_outline = eager.outline([3, 2, 0])
+        for array, expected in zip(outline, expected_outline, strict=True):
+            npt.assert_array_equal(array, expected)
+        npt.assert_array_equal(
+            lazy.to_masks((60, 40)), eager.to_masks((60, 40))
+        )
+        npt.assert_array_equal(
+            lazy.to_labels((60, 40)), eager.to_labels((60, 40))
+        )
+        npt.assert_array_equal(
+            lazy._shape_mesh_boxes(np.arange(4)),
+            eager._shape_mesh_boxes(np.arange(4)),
+        )
+
+        polygon = lazy.shapes[2]
+        assert lazy._n_lazy == 1
+        assert lazy.shapes[2] is polygon
+        _assert_same_meshes(polygon, eager.shapes[2])
+        assert polygon.edge_width == 3
+        assert polygon.z_index == 1
+        _assert_same_shape_lists(lazy, eager)
+    finally:
+        set_backend(prev)
+
+
+def test_shape_list_add_data_edits(non_convex_poly, poly_hole):
+    """Polygons stored in the ShapeList columns follow edits."""
+    polygons = [non_convex_poly, poly_hole, non_convex_poly * 2]
+    prev = set_backend(TriangulationBackend.numba)
+    try:
+        lazy, eager = _shape_lists_from_data(polygons)
+        colors = np.random.default_rng(0).uniform(size=(2, 4))
+        for shape_list in (lazy, eager):
+            shape_list.update_edge_width(2, 0.5)
+            shape_list.update_face_colors([0, 2], colors)
+            shape_list.update_z_index(0, 5)
+            shape_list.remove_multiple([1])
+        assert lazy._n_lazy == 2
+        _assert_same_shape_lists(lazy, eager)
+        npt.assert_array_equal(lazy._face_color, eager._face_color)
+        npt.assert_array_equal(lazy.edge_widths, [1, 0.5, 4])
+        assert lazy.inside((10, 3)) == eager.inside((10, 3))
+        assert lazy.shapes_in_box(
+            np.array([[0, 0], [30, 30]])
+        ) == eager.shapes_in_box(np.array([[0, 0], [30, 30]]))
+
+        for shape_list in (lazy, eager):
+            shape_list.shift(1, np.array([1, 2]))
+        assert lazy._n_lazy == 1
+        _assert_same_shape_lists(lazy, eager)
+    finally:
+        set_backend(prev)
+
+
+def test_shape_list_add_data_dims_changes(non_convex_poly):
+    """Polygons stored in the ShapeList columns follow the displayed dims."""
+    polygons = [
+        np.pad(non_convex_poly, ((0, 0), (1, 0)), constant_values=z)
+        for z in range(3)
+    ]
+    prev = set_backend(TriangulationBackend.numba)
+    try:
+        lazy, eager = _shape_lists_from_data(polygons, dims_order=[0, 1, 2])
+        assert lazy._n_lazy == 3
+        _assert_same_shape_lists(lazy, eager)
+        npt.assert_array_equal(
+            lazy.slice_keys[:, :, 0], [[0, 0], [1, 1], [2, 2], [0, 0]]
+        )
+
+        for shape_list in (lazy, eager):
+            shape_list.update_dims_order([0, 2, 1])
+        assert lazy._n_lazy == 3
+        _assert_same_shape_lists(lazy, eager)
+
+        for shape_list in (lazy, eager):
+            shape_list.ndisplay = 3
+        assert lazy._n_lazy == 0
+        _assert_same_shape_lists(lazy, eager)
+    finally:
+        set_backend(prev)
+
+
 @pytest.fixture
 def country_wth_hole():
     return np.array(
@@ -878,12 +878,7 @@ class Shapes(Layer):
         if len(self.data) == 0:
             return np.full((2, self.ndim), np.nan)
 
-        bounding_boxes = np.array(
-            [d._bounding_box for d in self._data_view.shapes]
-        )
-        mins = np.min(bounding_boxes[:, 0, :], axis=0)
-        maxs = np.max(bounding_boxes[:, 1, :], axis=0)
-        return np.vstack([mins, maxs])
+        return self._data_view.data_extent
 
     @property
     def nshapes(self):
@@ -1302,12 +1297,9 @@ class Shapes(Layer):
                     self.current_edge_color = unique_edge_color
 
             unique_edge_width = _unique_element(
-                np.array(
-                    [
-                        self._data_view.shapes[i].edge_width
-                        for i in self.selected_data
-                    ]
-                )
+                self._data_view._columns['edge_width'][
+                    list(self.selected_data)
+                ]
             )
             if unique_edge_width is not None:
                 with self.block_update_properties():
@@ -2366,30 +2358,23 @@ class Shapes(Layer):
         """Build new shapes and add them to the _data_view"""
 
         shape_inputs = tuple(shape_inputs)
-
-        # build all shapes
-        sh_inp = tuple(
-            (
-                shape_classes[st](
-                    d,
-                    edge_width=ew,
-                    z_index=z,
-                    dims_order=self._slice_input.order,
-                    ndisplay=self._slice_input.ndisplay,
-                ),
-                ec,
-                fc,
-            )
-            for d, st, ew, ec, fc, z in shape_inputs
+        if not shape_inputs:
+            return
+        data, shape_types, edge_widths, edge_colors, face_colors, z_indices = (
+            zip(*shape_inputs, strict=True)
         )
 
-        shapes, edge_colors, face_colors = tuple(zip(*sh_inp, strict=False))
-
-        # Add all shapes at once (faster than adding them one by one)
-        data_view.add(
-            shape=shapes,
-            edge_color=edge_colors,
-            face_color=face_colors,
+        # add all shapes at once (faster than adding them one by one), the
+        # polygons are triangulated together and only built when accessed
+        data_view.add_data(
+            data,
+            shape_types,
+            edge_widths,
+            z_indices,
+            face_colors=face_colors,
+            edge_colors=edge_colors,
+            dims_order=self._slice_input.order,
+            ndisplay=self._slice_input.ndisplay,
             z_refresh=False,
         )
 
@@ -3296,31 +3281,45 @@ class Shapes(Layer):
 
         return masks
 
-    def to_labels(self, labels_shape=None):
+    def to_labels(self, labels_shape=None, out=None, tile_shape=None):
         """Return an integer labels image.
 
         Parameters
         ----------
         labels_shape : np.ndarray | tuple | None
             Tuple defining shape of labels image to be generated. If non
-            specified, takes the max of all the vertiecs
+            specified, takes the shape of `out`, or else the max of all the
+            vertiecs
+        out : array-like | None
+            Array to write the labels into, e.g. a zarr array, which is
+            written tile by tile. Tiles without shapes are not written, so
+            it should be filled with zeros beforehand.
+        tile_shape : tuple | None
+            Shape of the tiles along the displayed dimensions, e.g. the
+            chunks of `out`. If non specified, tiles of whole rows are used.
 
         Returns
         -------
         labels : np.ndarray
             Integer array where each value is either 0 for background or an
             integer up to N for points inside the shape at the index value - 1.
-            For overlapping shapes z-ordering will be respected.
+            For overlapping shapes z-ordering will be respected. This is
+            `out` if it is provided.
         """
         if labels_shape is None:
-            # See https://github.com/napari/napari/issues/2778
-            # Point coordinates land on pixel centers. We want to find the
-            # smallest shape that will hold the largest point in the data,
-            # using rounding.
-            labels_shape = np.round(self._extent_data[1]) + 1
+            if out is not None:
+                labels_shape = out.shape
+            else:
+                # See https://github.com/napari/napari/issues/2778
+                # Point coordinates land on pixel centers. We want to find
+                # the smallest shape that will hold the largest point in the
+                # data, using rounding.
+                labels_shape = np.round(self._extent_data[1]) + 1
 
         labels_shape = np.ceil(labels_shape).astype('int')
-        labels = self._data_view.to_labels(labels_shape=labels_shape)
+        labels = self._data_view.to_labels(
+            labels_shape=labels_shape, out=out, tile_shape=tile_shape
+        )
 
         return labels
 
@@ -13,6 +13,7 @@ from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
 )
+from napari.utils.geometry import find_nearest_triangle_intersection
 
 
 def test_random_surface():
@@ -436,6 +437,44 @@ def test_get_value_3d_nd(
     np.testing.assert_allclose(value, expected_value)
 
 
+def test_get_value_3d_matches_all_triangles():
+    """Test that picking with the tree of the triangles finds the same
+    triangle as testing all of them."""
+    rng = np.random.default_rng(0)
+    vertices = rng.uniform(0, 100, size=(600, 3))
+    faces = rng.integers(len(vertices), size=(200, 3))
+    # values over time, slicing along which keeps the triangles in view
+    values = rng.uniform(size=(2, len(vertices)))
+    layer = Surface((vertices, faces, values))
+    layer._slice_dims(Dims(ndim=4, ndisplay=3))
+
+    starts = np.column_stack(
+        [np.zeros(50), rng.uniform(0, 100, size=(50, 2)), np.zeros(50)]
+    )
+    starts[:, 3] = -10
+    directions = rng.normal(size=(50, 3)) + [0, 0, 5]
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    n_hits = 0
+    for start, direction in zip(starts, directions, strict=True):
+        end = start.copy()
+        end[1:] += 200 * direction
+        _, index = layer._get_value_3d(start, end, [1, 2, 3])
+        expected, _ = find_nearest_triangle_intersection(
+            start[1:], direction, vertices[faces]
+        )
+        assert index == expected
+        n_hits += index is not None
+    assert n_hits > 0
+
+    tree = layer._view_faces_tree
+    layer._slice_dims(Dims(ndim=4, ndisplay=3, point=(1, 0, 0, 0)))
+    assert layer._view_faces_tree is tree
+
+    # the vertices may have been changed in place
+    layer.refresh()
+    assert layer._view_faces_tree is not tree
+
+
 def test_surface_normals():
     """Ensure that normals can be set both with dict and SurfaceNormals.
 
@@ -12,6 +12,7 @@ from napari.layers.surface._surface_utils import (
 )
 from napari.layers.surface.normals import SurfaceNormals
 from napari.layers.surface.wireframe import SurfaceWireframe
+from napari.layers.utils._box_tree import _BoxTree
 from napari.layers.utils.interactivity_utils import (
     nd_line_segment_to_displayed_data_ray,
 )
@@ -351,6 +352,10 @@ class Surface(IntensityVisualizationMixin, Layer):
     def _view_faces(self) -> np.ndarray:
         return self._slicing_state._view_faces
 
+    @property
+    def _view_faces_tree(self) -> _BoxTree:
+        return self._slicing_state._view_faces_tree
+
     def _calc_data_range(self, mode='data'):
         return calc_data_range(self.vertex_values)
 
@@ -638,6 +643,9 @@ class Surface(IntensityVisualizationMixin, Layer):
         """Sets the view given the indices to slice with."""
         raise NotImplementedError
 
+    def _on_data_refresh(self) -> None:
+        self._slicing_state._faces_tree = None
+
     def _update_thumbnail(self) -> None:
         """Update thumbnail with current surface."""
 
@@ -693,18 +701,23 @@ class Surface(IntensityVisualizationMixin, Layer):
             dims_displayed=dims_displayed,
         )
 
-        # get the mesh triangles
-        mesh_triangles = self._data_view[self._view_faces]
+        # only the triangles whose bounding boxes are crossed by the ray can
+        # be intersected
+        candidates = self._view_faces_tree.along_line(
+            start_position, ray_direction
+        )
+        mesh_triangles = self._data_view[self._view_faces[candidates]]
 
         # get the triangles intersection
-        intersection_index, intersection = find_nearest_triangle_intersection(
+        candidate_index, intersection = find_nearest_triangle_intersection(
             ray_position=start_position,
             ray_direction=ray_direction,
             triangles=mesh_triangles,
         )
 
-        if intersection_index is None or intersection is None:
+        if candidate_index is None or intersection is None:
             return None, None
+        intersection_index = int(candidates[candidate_index])
 
         # add the full nD coords to intersection
         intersection_point = start_point.copy()
@@ -768,6 +781,39 @@ class _SurfaceSlicingState(_LayerSlicingState):
         self._view_faces = np.zeros((0, 3), dtype=int)
         self._view_vertex_values: list[Any] | np.ndarray = []
         self._view_vertex_colors: list[Any] | np.ndarray = []
+        # Tree of the bounding boxes of the triangles in view, and the arrays
+        # and displayed dimensions it was built from
+        self._faces_tree: _BoxTree | None = None
+        self._faces_tree_source: tuple = ()
+
+    @property
+    def _view_faces_tree(self) -> _BoxTree:
+        """Tree of the bounding boxes of the triangles in view.
+
+        The tree is built when first queried, and built again only when the
+        triangles in view change, not when slicing only changes the vertex
+        values.
+        """
+        source = (
+            self.layer.vertices,
+            self._view_faces,
+            tuple(self._slice_input.displayed),
+        )
+        old_source = self._faces_tree_source
+        if (
+            self._faces_tree is None
+            or source[0] is not old_source[0]
+            or source[1] is not old_source[1]
+            or source[2] != old_source[2]
+        ):
+            triangles = self._data_view[self._view_faces]
+            self._faces_tree = _BoxTree(
+                np.arange(len(triangles)),
+                triangles.min(axis=1),
+                triangles.max(axis=1),
+            )
+            self._faces_tree_source = source
+        return self._faces_tree
 
     def _slice_associated_data(
         self,
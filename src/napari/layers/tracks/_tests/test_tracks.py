@@ -1,10 +1,12 @@
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.sparse import csr_matrix
 
 from napari.components.dims import Dims
 from napari.layers import Tracks
-from napari.layers.tracks._track_utils import TrackManager
+from napari.layers.tracks import _track_utils as track_utils
+from napari.layers.tracks._track_utils import TrackManager, _TimeSortedSegments
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -147,6 +149,30 @@ def test_track_layer_graph():
     assert layer.graph == graph
 
 
+def test_track_layer_graph_from_edges():
+    """Test track layer graph set from edge arrays or a sparse matrix."""
+    data = np.zeros((90, 4))
+    data[:, 0] = np.repeat([0, 1, 2], 30)
+    data[:, 1] = np.arange(90)
+    data[:, 2] = np.arange(90) * 2
+    graph = {1: [0], 2: [0, 1]}
+    expected = Tracks(data, graph=graph)._manager.graph_vertices
+    np.testing.assert_array_equal(expected[:, 0], [30, 29, 60, 29, 60, 59])
+
+    edges = np.array([[1, 0], [2, 0], [2, 1]])
+    sparse_graph = csr_matrix(
+        (np.ones(len(edges)), (edges[:, 0], edges[:, 1])), shape=(3, 3)
+    )
+    for edge_graph in (edges, sparse_graph):
+        layer = Tracks(data, graph=edge_graph)
+        assert layer.graph == graph
+        np.testing.assert_array_equal(layer.graph_connex, [1, 0] * 3)
+        np.testing.assert_array_equal(layer._manager.graph_vertices, expected)
+
+    with pytest.raises(ValueError, match='node 2 not found'):
+        Tracks(data, graph=np.array([[1, 0], [2, 7]]))
+
+
 def test_track_layer_reset_data():
     """Test changing data once layer is instantiated."""
     data = np.zeros((100, 4))
@@ -161,6 +187,130 @@ def test_track_layer_reset_data():
     assert layer.graph == {}
 
 
+def _random_tracks(n_tracks=20, n_times=10, seed=0):
+    """Random tracks, with some detections missing, sorted by time."""
+    rng = np.random.default_rng(seed)
+    track_ids, times = np.meshgrid(np.arange(n_tracks), np.arange(n_times))
+    data = np.column_stack(
+        [
+            track_ids.ravel(),
+            times.ravel(),
+            rng.uniform(size=(track_ids.size, 2)),
+        ]
+    )
+    return data[rng.uniform(size=len(data)) < 0.8]
+
+
+def test_track_layer_append():
+    """Test appending vertices frame by frame as if the data were set."""
+    data = _random_tracks()
+    score = np.random.default_rng(1).uniform(size=len(data))
+    graph = {5: [1], 6: [1]}
+    expected = Tracks(data, features={'score': score}, graph=graph)
+
+    first = data[:, 1] < 5
+    layer = Tracks(data[first], features={'score': score[first]}, graph=graph)
+    rng = np.random.default_rng(2)
+    for time in range(5, 10):
+        frame = rng.permutation(np.flatnonzero(data[:, 1] == time))
+        layer.append(data[frame], features={'score': score[frame]})
+
+    np.testing.assert_array_equal(layer.data, expected.data)
+    pd.testing.assert_frame_equal(
+        layer.features, expected.features, check_dtype=False
+    )
+    np.testing.assert_array_equal(layer.track_connex, expected.track_connex)
+    np.testing.assert_array_equal(layer.track_colors, expected.track_colors)
+    np.testing.assert_array_equal(
+        layer._manager.graph_vertices, expected._manager.graph_vertices
+    )
+    manager = layer._manager
+    np.testing.assert_array_equal(
+        manager._points, manager.data[manager._ordered_points_idx, 1:]
+    )
+    np.testing.assert_array_equal(
+        manager._points[:, 0], expected._manager._points[:, 0]
+    )
+    np.testing.assert_array_equal(
+        manager.track_end_times, expected._manager.track_end_times
+    )
+    position = data[-1, 1:]
+    assert layer._get_value(position) == int(data[-1, 0])
+
+
+def test_track_layer_append_new_track_with_default_features():
+    """Test appending a new track without features."""
+    data = _random_tracks()
+    layer = Tracks(data, features={'score': np.ones(len(data))})
+    layer.append([[100, 3, 0.5, 0.5], [100, 4, 0.5, 0.6]])
+    assert len(layer.data) == len(data) + 2
+    np.testing.assert_array_equal(layer.features['track_id'][-2:], [100, 100])
+    np.testing.assert_array_equal(layer.features['score'][-2:], [1, 1])
+    assert layer.track_connex[-2]
+    assert not layer.track_connex[-1]
+
+    with pytest.raises(ValueError, match='should be 4-dimensional'):
+        layer.append(np.zeros((1, 5)))
+
+
+def _nearest_track(data, position):
+    """Brute force ID of the track nearest to a position at its time."""
+    at_time = data[data[:, 1] == position[0]]
+    distances = np.linalg.norm(at_time[:, 2:] - position[1:], axis=1)
+    return int(at_time[np.argmin(distances), 0])
+
+
+def test_get_value_is_exact():
+    """Test that the nearest track is found among many closer vertices at
+    other time points."""
+    rng = np.random.default_rng(0)
+    # many tracks standing still near the origin, and one far away
+    data = np.concatenate(
+        [
+            np.column_stack(
+                [
+                    np.repeat(np.arange(20), 10),
+                    np.tile(np.arange(10), 20),
+                    rng.uniform(0, 1, size=(200, 2)),
+                ]
+            ),
+            [[20, 3, 50, 50]],
+        ]
+    )
+    layer = Tracks(data)
+    assert layer._get_value([3, 40, 40]) == 20
+    assert layer._get_value([2, 40, 40]) == _nearest_track(data, [2, 40, 40])
+    assert layer._get_value([30, 0, 0]) is None
+
+    for position in rng.uniform(0, 1, size=(20, 3)) * [9, 1, 1]:
+        position[0] = np.round(position[0])
+        assert layer._get_value(position) == _nearest_track(data, position)
+
+
+def test_get_value_time_kdtrees_bounded_and_appended(monkeypatch):
+    """Test that the kd-trees of few time points are kept, and that those
+    of the time points with appended vertices are built again."""
+    monkeypatch.setattr(track_utils, '_MAX_TIME_KDTREES', 3)
+    data = _random_tracks()
+    layer = Tracks(data)
+    manager = layer._manager
+    for time in range(10):
+        layer._get_value([time, 0.5, 0.5])
+    assert list(manager._time_kdtrees) == [7, 8, 9]
+
+    layer._get_value([8, 0.5, 0.5])
+    assert list(manager._time_kdtrees) == [7, 9, 8]
+
+    new = [[100, 2, 0.5, 0.5], [100, 9, 0.3, 0.3]]
+    layer.append(new)
+    assert list(manager._time_kdtrees) == [7, 8]
+    assert layer._get_value([9, 0.3, 0.3]) == 100
+    all_data = np.concatenate([data, new])
+    for time in (2, 7, 8):
+        position = [time, 0.45, 0.55]
+        assert layer._get_value(position) == _nearest_track(all_data, position)
+
+
 def test_malformed_id():
     """Test for malformed track ID."""
     data = np.random.random((100, 4))
@@ -413,6 +563,73 @@ def test_hide_completed_tracks() -> None:
     np.testing.assert_array_equal(unmasked_connex, original_connex)
 
 
+def _segments_in_window(connex, times, low, high):
+    """Brute force vertex index pairs of the segments in a time window."""
+    starts = np.flatnonzero(connex)
+    first = np.minimum(times[starts], times[starts + 1])
+    last = np.maximum(times[starts], times[starts + 1])
+    starts = starts[(last > low) & (first <= high)]
+    return np.column_stack([starts, starts + 1])
+
+
+def _sorted_segments(segments):
+    return segments[np.argsort(segments[:, 0])]
+
+
+@pytest.mark.parametrize('hide_completed_tracks', [False, True])
+@pytest.mark.parametrize(('tail_length', 'head_length'), [(3, 0), (2, 4)])
+def test_view_segments_in_time_window(
+    hide_completed_tracks, tail_length, head_length
+):
+    """Test that only the segments around the current time are drawn."""
+    # detections are missing, so some segments span several time points
+    data = _random_tracks(n_times=20)
+    layer = Tracks(
+        data,
+        graph={5: [1], 6: [1], 7: [2]},
+        tail_length=tail_length,
+        head_length=head_length,
+        hide_completed_tracks=hide_completed_tracks,
+    )
+    # all the segments are drawn when the tails are not faded
+    np.testing.assert_array_equal(
+        _sorted_segments(layer._manager.track_segments()),
+        _segments_in_window(
+            layer._manager._track_connex, layer.track_times, -np.inf, np.inf
+        ),
+    )
+
+    for time in (0, 5, 12, 25):
+        layer._slice_dims(
+            Dims(ndim=3, point=(time, 0, 0), range=((0, 30, 1),) * 3)
+        )
+        low, high = time - tail_length, time + head_length
+        np.testing.assert_array_equal(
+            _sorted_segments(layer._view_track_segments),
+            _segments_in_window(
+                layer.track_connex, layer.track_times, low, high
+            ),
+        )
+        graph_connex = np.tile([True, False], 3)
+        np.testing.assert_array_equal(
+            _sorted_segments(layer._view_graph_segments),
+            _segments_in_window(graph_connex, layer.graph_times, low, high),
+        )
+
+
+def test_segments_in_window_with_long_segment():
+    """Test that one long segment leaves the scan of the others short."""
+    times = np.arange(1001, dtype=float)
+    times[-1] = 1e6
+    segments = _TimeSortedSegments(times, np.arange(1000), is_sorted=True)
+    assert len(segments._groups) == 2
+    for low, high in ((-np.inf, np.inf), (500, 503), (999, 2000), (2e6, 3e6)):
+        np.testing.assert_array_equal(
+            np.sort(segments.in_window(low, high)),
+            _segments_in_window(np.ones(1000, bool), times, low, high)[:, 0],
+        )
+
+
 def test_docstring():
     validate_all_params_in_docstring(Tracks)
     validate_kwargs_sorted(Tracks)
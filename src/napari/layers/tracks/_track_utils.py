@@ -1,16 +1,94 @@
+import itertools
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
 
-from napari.layers.utils.layer_utils import _FeatureTable
+from napari.layers.utils.layer_utils import _FeatureTable, _validate_features
 from napari.utils.events.custom_types import Array
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
     import pandas as pd
+    from scipy.sparse import spmatrix
     from scipy.spatial import cKDTree
 
+#: Maximum number of time points whose spatial index is kept.
+_MAX_TIME_KDTREES = 64
+
+
+class _TimeSortedSegments:
+    """Line segments between consecutive vertices, sorted by time.
+
+    Each segment joins the vertex at a start index to the next vertex. The
+    segments are grouped by duration, each group spanning a factor of two,
+    and sorted by the earliest time of their two vertices within a group, so
+    that those which overlap a time window are found by a binary search per
+    group and a scan of about the segments in the window only, however long
+    the segments of other groups are.
+
+    Parameters
+    ----------
+    times : array (N,)
+        Timestamp of each vertex.
+    starts : array (M,)
+        Index of the first vertex of each segment.
+    is_sorted : bool
+        Whether the segments are already sorted by time, which is the case
+        when the first vertex of each segment is also the earliest.
+    """
+
+    def __init__(
+        self, times: npt.NDArray, starts: npt.NDArray, is_sorted: bool = False
+    ) -> None:
+        starts = np.asarray(starts, dtype=np.intp)
+        first = np.minimum(times[starts], times[starts + 1])
+        duration = np.abs(times[starts + 1] - times[starts])
+        # durations of a group are in [2**(group - 1), 2**group), or are 0
+        group = np.frexp(duration.astype(np.float64))[1]
+        if is_sorted:
+            order = np.argsort(group, kind='stable')
+        else:
+            order = np.lexsort((first, group))
+        starts = starts[order]
+        group = group[order]
+        self._times = times
+        self._starts = starts
+        self._first = first[order]
+        changes = np.flatnonzero(group[1:] != group[:-1]) + 1
+        bounds = [0, *changes.tolist(), len(starts)] if len(starts) else []
+        #: Slices of the segments of each group.
+        self._groups = list(itertools.pairwise(bounds))
+        # the longest segment of a group bounds how early a segment of the
+        # group still in the window can start
+        self._max_durations = [
+            float(np.max(duration[order[begin:end]]))
+            for begin, end in self._groups
+        ]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def in_window(self, low: float, high: float) -> npt.NDArray[np.intp]:
+        """return the index of the first vertex of the segments with a time
+        after low, and a time no later than high"""
+        candidates = []
+        for (begin, end), max_duration in zip(
+            self._groups, self._max_durations, strict=True
+        ):
+            first = self._first[begin:end]
+            window_begin = np.searchsorted(
+                first, low - max_duration, side='right'
+            )
+            window_end = np.searchsorted(first, high, side='right')
+            candidates.append(
+                self._starts[begin + window_begin : begin + window_end]
+            )
+        starts = np.concatenate(candidates) if candidates else self._starts
+        last = np.maximum(self._times[starts], self._times[starts + 1])
+        return starts[last > low]
+
 
 class TrackManager:
     """Manage track data and simplify interactions with the Tracks layer.
@@ -38,7 +116,12 @@ class TrackManager:
         one (the track has one parent, and the parent has >=1 child) in the
         case of track splitting, or more than one (the track has multiple
         parents, but only one child) in the case of track merging.
+        It can also be set from an (E, 2) array of (track ID, parent ID)
+        edges, or from a scipy sparse matrix (e.g. CSR) whose non-zero
+        entries are at (track ID, parent ID), without building a dictionary.
         See examples/tracks_3d_with_graph.py
+    graph_edges : array (E, 2)
+        Edges of the graph, as (track ID, parent ID) pairs.
     ndim : int
         Number of spatiotemporal dimensions of the data.
     max_time: float, int
@@ -80,7 +163,11 @@ class TrackManager:
 
         self._data: npt.NDArray
         self._order: np.ndarray[tuple[int], np.dtype[np.integer]]
-        self._kdtree: cKDTree
+        # kd-trees of the points at the most recently queried time points,
+        # with the positions of the points in their time slice
+        self._time_kdtrees: OrderedDict[
+            float, tuple[npt.NDArray[np.intp], cKDTree]
+        ]
         self._points: npt.NDArray
         self._points_id: npt.NDArray
         self._points_lookup: dict[int, slice]
@@ -88,10 +175,16 @@ class TrackManager:
 
         self._track_vertices: npt.NDArray | None = None
         self._track_connex: npt.NDArray | None = None
+        self._track_segments: _TimeSortedSegments | None = None
 
         self._graph: dict[int, list[int]] | None = None
+        self._graph_edges: npt.NDArray | None = None
+        self._track_starts: npt.NDArray
+        self._track_stops: npt.NDArray
+        self._track_starts_ids: npt.NDArray
         self._graph_vertices: npt.NDArray | None = None
         self._graph_connex: npt.NDArray | None = None
+        self._graph_segments: _TimeSortedSegments | None = None
 
         # Parameters for hide_completed_tracks functionality
         self._hide_completed_tracks: bool = False
@@ -127,9 +220,6 @@ class TrackManager:
     @data.setter
     def data(self, data: list | np.ndarray) -> None:
         """set the vertex data and build the vispy arrays for display"""
-        from scipy.sparse import coo_matrix
-        from scipy.spatial import cKDTree
-
         # convert data to a numpy array if it is not already one
         data = np.asarray(data)
 
@@ -142,10 +232,87 @@ class TrackManager:
 
         # build the indices for sorting points by time
         self._ordered_points_idx = np.argsort(self._data[:, 1])
-        self._points = self._data[self._ordered_points_idx, 1:]
+        self._time_kdtrees = OrderedDict()
+        self._update_lookups()
+
+    def append(
+        self,
+        data: np.ndarray,
+        features: 'dict[str, np.ndarray] | pd.DataFrame | None' = None,
+    ) -> None:
+        """append vertices, merging them into the data sorted by ID then time
+
+        Only the new vertices are validated and sorted, so that appending a
+        few vertices to many does not sort all of them again.
+        """
+        data = self._validate_track_data(np.asarray(data))
+        if data.shape[1] != self._data.shape[1]:
+            raise ValueError(
+                trans._(
+                    'appended track vertices should be {ndim}-dimensional',
+                    deferred=True,
+                    ndim=self._data.shape[1],
+                )
+            )
+        n_data = len(self._data)
+        order = np.lexsort((data[:, 1], data[:, 0]))
+        new = data[order]
+
+        # complex numbers sort by their real then their imaginary part, so
+        # that (id, time) pairs are searched in the sorted data in one call
+        positions = np.searchsorted(
+            self._data[:, 0] + 1j * self._data[:, 1],
+            new[:, 0] + 1j * new[:, 1],
+            side='right',
+        )
+        dtype = np.result_type(self._data, new)
+        self._data = np.insert(
+            self._data.astype(dtype, copy=False), positions, new, axis=0
+        )
+        self._order = np.insert(self._order, positions, n_data + order)
+        # new indices of the previous vertices and of the new ones
+        inserted = positions + np.arange(len(new))
+        moved = np.arange(n_data)
+        moved += np.searchsorted(positions, moved, side='right')
+
+        # merge the new vertices in the points sorted by time
+        time_order = np.argsort(new[:, 1], kind='stable')
+        time_positions = np.searchsorted(
+            self._points[:, 0], new[time_order, 1], side='right'
+        )
+        self._ordered_points_idx = np.insert(
+            moved[self._ordered_points_idx],
+            time_positions,
+            inserted[time_order],
+        )
 
-        # build a tree of the track data to allow fast lookup of nearest track
-        self._kdtree = cKDTree(self._points)
+        # merge the features of the new vertices, which take the default
+        # values if not given
+        if features is None:
+            self._feature_table.resize(len(self._data))
+        else:
+            self._feature_table.append(
+                _validate_features(features, num_data=len(new))
+            )
+        self._feature_table.reorder(
+            np.insert(np.arange(n_data), positions, n_data + order)  # type: ignore[arg-type]
+        )
+        values = self._feature_table.values
+        if 'track_id' in values and (
+            features is None or 'track_id' not in features
+        ):
+            values.loc[inserted, 'track_id'] = self.track_ids[inserted]
+
+        # the points at the other time points are unchanged
+        changed = set(np.round(new[:, 1]).tolist())
+        for time in list(self._time_kdtrees):
+            if round(time) in changed:
+                del self._time_kdtrees[time]
+        self._update_lookups()
+
+    def _update_lookups(self) -> None:
+        """build the lookup tables of the sorted vertices"""
+        self._points = self._data[self._ordered_points_idx, 1:]
 
         # make the lookup table
         # NOTE(arl): it's important to convert the time index to an integer
@@ -155,18 +322,53 @@ class TrackManager:
         time = np.round(self._points[:, 0]).astype(np.uint)
         self._points_lookup = self._fast_points_lookup(time)
 
-        # make a second lookup table using a sparse matrix to convert track id
-        # to the vertex indices
-        self._id2idxs = coo_matrix(
-            (
-                np.broadcast_to(1, self.track_ids.size),  # just dummy ones
-                (self.track_ids, np.arange(self.track_ids.size)),
-            )
-        ).tocsr()
+        # index of the first vertex of each track, and id of the track, to
+        # find the vertices of many tracks at once
+        ids = self._data[:, 0]
+        self._track_starts = np.flatnonzero(
+            np.concatenate([[True], ids[1:] != ids[:-1]])
+        )
+        self._track_stops = np.append(self._track_starts[1:], len(ids))
+        self._track_starts_ids = ids[self._track_starts]
 
         # Invalidate cached track end times when data changes
         self._track_end_times = None
 
+    def _time_kdtree(
+        self, time: float
+    ) -> 'tuple[npt.NDArray[np.intp], cKDTree] | None':
+        """return the positions in their time slice of the points at a time
+        point, and a kd-tree of their spatial coordinates, or None if there
+        are no points at the time point
+
+        The kd-trees are built when first queried, and only those of the
+        most recently queried time points are kept.
+        """
+        if time in self._time_kdtrees:
+            self._time_kdtrees.move_to_end(time)
+            return self._time_kdtrees[time]
+
+        lookup = self._points_lookup.get(round(time)) if time >= 0 else None
+        if lookup is None:
+            return None
+        # the points of a time slice have times which round to the same
+        # integer, but only those at the exact time are looked up
+        # positions in the slice are kept when vertices are appended at other
+        # time points, unlike the start of the slice
+        positions = np.flatnonzero(self._points[lookup, 0] == time)
+        if len(positions) == 0:
+            return None
+
+        from scipy.spatial import cKDTree
+
+        self._time_kdtrees[time] = (
+            positions,
+            cKDTree(self._points[lookup][positions, 1:]),
+        )
+        if len(self._time_kdtrees) > _MAX_TIME_KDTREES:
+            self._time_kdtrees.popitem(last=False)
+        return self._time_kdtrees[time]
+
     @property
     def features(self) -> 'pd.DataFrame':
         """Dataframe-like features table.
@@ -208,12 +410,34 @@ class TrackManager:
     @property
     def graph(self) -> dict[int, list[int]] | None:
         """dict {int: list}: Graph representing associations between tracks."""
+        if self._graph is None and self._graph_edges is not None:
+            self._graph = self._graph_from_edges(self._graph_edges)
         return self._graph
 
     @graph.setter
-    def graph(self, graph: dict[int, int | list[int]]) -> None:
+    def graph(
+        self, graph: 'dict[int, int | list[int]] | npt.ArrayLike | spmatrix'
+    ) -> None:
         """set the track graph"""
-        self._graph = self._normalize_track_graph(graph)
+        from scipy.sparse import issparse
+
+        if isinstance(graph, dict):
+            self._graph = self._normalize_track_graph(graph)
+            self._graph_edges = self._edges_from_graph(self._graph)
+        else:
+            if issparse(graph):
+                coo = graph.tocoo()
+                graph = np.stack([coo.row, coo.col], axis=1)
+            self._graph = None
+            self._graph_edges = np.asarray(graph, dtype=np.int64).reshape(
+                -1, 2
+            )
+        self._validate_graph_edges(self._graph_edges)
+
+    @property
+    def graph_edges(self) -> npt.NDArray | None:
+        """array (E, 2): Edges of the graph, as (track ID, parent ID) pairs."""
+        return self._graph_edges
 
     @property
     def hide_completed_tracks(self) -> bool:
@@ -251,7 +475,12 @@ class TrackManager:
 
     def _vertex_indices_from_id(self, track_id: int) -> npt.NDArray:
         """return the vertices corresponding to a track id"""
-        return self._id2idxs[track_id].nonzero()[1]
+        position = self._track_positions([track_id])[0]
+        if position < 0:
+            return np.empty(0, dtype=np.intp)
+        return np.arange(
+            self._track_starts[position], self._track_stops[position]
+        )
 
     def _validate_track_data(self, data: np.ndarray) -> np.ndarray:
         """validate the coordinate data"""
@@ -288,33 +517,66 @@ class TrackManager:
     def _normalize_track_graph(
         self, graph: dict[int, int | list[int]]
     ) -> dict[int, list[int]]:
-        """validate the track graph"""
-        new_graph: dict[int, list[int]] = {}
-
-        # check that graph nodes are of correct format
-        for node_idx, parents_idx in graph.items():
-            # make sure parents are always a list
-            if isinstance(parents_idx, list):
-                new_graph[node_idx] = parents_idx
-            else:
-                new_graph[node_idx] = [parents_idx]
-
-        unique_track_ids = set(self.unique_track_ids)
-
-        # check that graph nodes exist in the track id lookup
-        for node_idx, parents_idx in new_graph.items():
-            nodes = [node_idx, *parents_idx]
-            for node in nodes:
-                if node not in unique_track_ids:
-                    raise ValueError(
-                        trans._(
-                            'graph node {node_idx} not found',
-                            deferred=True,
-                            node_idx=node_idx,
-                        )
-                    )
-
-        return new_graph
+        """make sure the parents of each node of the graph are a list"""
+        return {
+            node_idx: (
+                parents_idx if isinstance(parents_idx, list) else [parents_idx]
+            )
+            for node_idx, parents_idx in graph.items()
+        }
+
+    @staticmethod
+    def _edges_from_graph(graph: dict[int, list[int]]) -> npt.NDArray:
+        """return the (track ID, parent ID) edges of a graph dictionary"""
+        nodes = np.repeat(
+            np.fromiter(graph.keys(), dtype=np.int64, count=len(graph)),
+            [len(parents_idx) for parents_idx in graph.values()],
+        )
+        parents = np.fromiter(
+            itertools.chain.from_iterable(graph.values()),
+            dtype=np.int64,
+            count=len(nodes),
+        )
+        return np.stack([nodes, parents], axis=1)
+
+    @staticmethod
+    def _graph_from_edges(edges: npt.NDArray) -> dict[int, list[int]]:
+        """return the graph dictionary of (track ID, parent ID) edges"""
+        order = np.argsort(edges[:, 0], kind='stable')
+        nodes, parents = edges[order].T
+        starts = np.flatnonzero(
+            np.concatenate([[True], nodes[1:] != nodes[:-1]])
+        )
+        return dict(
+            zip(
+                nodes[starts].tolist(),
+                (p.tolist() for p in np.split(parents, starts[1:])),
+                strict=True,
+            )
+        )
+
+    def _track_positions(self, track_ids: npt.ArrayLike) -> npt.NDArray:
+        """return the positions of tracks in the sorted track ids, or -1 for
+        ids that are not tracks"""
+        track_ids = np.asarray(track_ids)
+        positions = np.searchsorted(self._track_starts_ids, track_ids)
+        positions = np.minimum(positions, len(self._track_starts_ids) - 1)
+        found = self._track_starts_ids[positions] == track_ids
+        return np.where(found, positions, -1)
+
+    def _validate_graph_edges(self, edges: npt.NDArray) -> None:
+        """check that the nodes of the graph are tracks"""
+        if len(edges) == 0:
+            return
+        missing = np.flatnonzero(np.any(self._track_positions(edges) < 0, 1))
+        if len(missing):
+            raise ValueError(
+                trans._(
+                    'graph node {node_idx} not found',
+                    deferred=True,
+                    node_idx=int(edges[missing[0], 0]),
+                )
+            )
 
     def build_tracks(self) -> None:
         """build the tracks"""
@@ -337,38 +599,46 @@ class TrackManager:
         self._points_id = points_id
         self._track_vertices = track_vertices
         self._track_connex = track_connex
+        # the vertices of a track are sorted by time, so the time-sorted
+        # vertices give the time-sorted segments
+        segment_starts = self._ordered_points_idx[
+            track_connex[self._ordered_points_idx]
+        ]
+        self._track_segments = _TimeSortedSegments(
+            self.data[:, 1], segment_starts, is_sorted=True
+        )
 
         # Invalidate cached track end times when tracks are rebuilt
         self._track_end_times = None
 
     def build_graph(self) -> None:
         """build the track graph"""
-
-        graph_vertices = []
-        graph_connex = []
-
-        assert self.graph is not None
-        for node_idx, parents_idx in self.graph.items():
-            # we join from the first observation of the node, to the last
-            # observation of the parent
-            node_start = self._vertex_indices_from_id(node_idx)[0]
-            node = self.data[node_start, 1:]
-
-            for parent_idx in parents_idx:
-                parent_stop = self._vertex_indices_from_id(parent_idx)[-1]
-                parent = self.data[parent_stop, 1:]
-
-                graph_vertices.append([node, parent])
-                graph_connex.append([True, False])
-
+        edges = self._graph_edges
         # if there is a graph, store the vertices and connection arrays,
         # otherwise, clear the vertex arrays
-        if graph_vertices:
-            self._graph_vertices = np.concatenate(graph_vertices, axis=0)
-            self._graph_connex = np.concatenate(graph_connex, axis=0)
-        else:
+        if edges is None or len(edges) == 0:
             self._graph_vertices = None
             self._graph_connex = None
+            self._graph_segments = None
+            return
+
+        # we join from the first observation of the node, to the last
+        # observation of the parent
+        node_starts = self._track_starts[self._track_positions(edges[:, 0])]
+        parent_stops = (
+            self._track_stops[self._track_positions(edges[:, 1])] - 1
+        )
+
+        graph_vertices = np.empty(
+            (2 * len(edges), self.ndim), dtype=self.data.dtype
+        )
+        graph_vertices[0::2] = self.data[node_starts, 1:]
+        graph_vertices[1::2] = self.data[parent_stops, 1:]
+        self._graph_vertices = graph_vertices
+        self._graph_connex = np.tile([True, False], len(edges))
+        self._graph_segments = _TimeSortedSegments(
+            graph_vertices[:, 0], np.arange(0, 2 * len(edges), 2)
+        )
 
     def vertex_properties(self, color_by: str) -> np.ndarray:
         """return the properties of tracks by vertex"""
@@ -385,21 +655,16 @@ class TrackManager:
         return self.properties[color_by]
 
     def get_value(self, coords: npt.NDArray) -> npt.NDArray | None:
-        """use a kd-tree to lookup the ID of the nearest tree"""
-        if self._kdtree is None:
+        """use a kd-tree of the points at the time of coords to lookup the ID
+        of the nearest track"""
+        time = float(coords[0])
+        found = self._time_kdtree(time)
+        if found is None or self._points_id is None:
             return None
-
-        # query can return indices to points that do not exist, trim that here
-        # then prune to only those in the current frame/time
-        # NOTE(arl): I don't like this!!!
-        _d, idx = self._kdtree.query(coords, k=10)
-        idx = [i for i in idx if 0 <= i < self._points.shape[0]]
-        pruned = [i for i in idx if self._points[i, 0] == coords[0]]
-
-        # if we have found a point, return it
-        if pruned and self._points_id is not None:
-            return self._points_id[pruned[0]]
-        return None  # return the track ID
+        positions, kdtree = found
+        _d, idx = kdtree.query(coords[1:])
+        start = self._points_lookup[round(time)].start
+        return self._points_id[start + positions[idx]]
 
     @property
     def ndim(self) -> int:
@@ -422,16 +687,8 @@ class TrackManager:
 
     def _compute_track_end_times(self) -> np.ndarray:
         """Compute the last timestamp for each track as 1D array (private method)"""
-        unique_ids = self.unique_track_ids
-        track_end_times = np.zeros(len(unique_ids), dtype=float)
-
-        for i, track_id in enumerate(unique_ids):
-            indices = self._vertex_indices_from_id(track_id)
-            track_end_times[i] = np.max(
-                self.data[indices, 1]
-            )  # max time for this track
-
-        return track_end_times
+        # vertices are sorted by time within each track
+        return self.data[self._track_stops - 1, 1].astype(float)
 
     def _get_completed_tracks_mask(self) -> np.ndarray:
         """Get boolean mask for vertices belonging to completed tracks"""
@@ -469,6 +726,26 @@ class TrackManager:
         completed_mask = self._get_completed_tracks_mask()
         return np.logical_and(self._track_connex, ~completed_mask)
 
+    def track_segments(
+        self, low: float = -np.inf, high: float = np.inf
+    ) -> npt.NDArray[np.intp] | None:
+        """vertex index pairs of the track segments in a time window
+
+        Only the segments with a time after low and a time no later than
+        high are returned, which are found without scanning all the
+        vertices. When hide_completed_tracks is enabled, the segments of
+        the tracks that have completed before the current time are left out.
+        """
+        if self._track_segments is None:
+            return None
+        starts = self._track_segments.in_window(low, high)
+        if self._hide_completed_tracks and self._current_time is not None:
+            # vertices are sorted by track, the same as track_end_times
+            tracks = np.searchsorted(self._track_starts, starts, side='right')
+            completed = self.track_end_times[tracks - 1] < self._current_time
+            starts = starts[~completed]
+        return np.column_stack([starts, starts + 1])
+
     @property
     def graph_vertices(self) -> np.ndarray | None:
         """return the graph vertices"""
@@ -479,6 +756,15 @@ class TrackManager:
         """vertex connections for drawing the graph"""
         return self._graph_connex
 
+    def graph_segments(
+        self, low: float = -np.inf, high: float = np.inf
+    ) -> npt.NDArray[np.intp] | None:
+        """vertex index pairs of the graph segments in a time window"""
+        if self._graph_segments is None:
+            return None
+        starts = self._graph_segments.in_window(low, high)
+        return np.column_stack([starts, starts + 1])
+
     @property
     def track_times(self) -> np.ndarray | None:
         """time points associated with each track vertex"""
@@ -15,7 +15,9 @@ from napari.utils.events import Event
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     import pandas as pd
+    from scipy.sparse import spmatrix
 
 
 class Tracks(Layer):
@@ -66,6 +68,10 @@ class Tracks(Layer):
         one (the track has one parent, and the parent has >=1 child) in the
         case of track splitting, or more than one (the track has multiple
         parents, but only one child) in the case of track merging.
+        The graph can also be an (E, 2) array of (track ID, parent ID) edges,
+        or a scipy sparse matrix (e.g. CSR) whose non-zero entries are at
+        (track ID, parent ID), which avoids building a dictionary for large
+        lineages.
         See examples/tracks_3d_with_graph.py
     head_length : float
         Length of the positive (forward in time) tails in units of time.
@@ -216,7 +222,7 @@ class Tracks(Layer):
             self.properties = properties
         else:
             self.features = features
-        self.graph = graph or {}
+        self.graph = {} if graph is None else graph
 
         self.color_by = color_by
         self.colormap = colormap
@@ -302,7 +308,8 @@ class Tracks(Layer):
         colormapped = np.zeros(self._thumbnail_shape)
         colormapped[..., 3] = 1
 
-        if self._view_data is not None and self.track_colors is not None:
+        view_data = self._view_data
+        if view_data is not None and self.track_colors is not None:
             de = self._extent_data
             min_vals = [de[0, i] for i in self._slice_input.displayed]
             shape = np.ceil(
@@ -311,14 +318,14 @@ class Tracks(Layer):
             zoom_factor = np.divide(
                 self._thumbnail_shape[:2], shape[-2:]
             ).min()
-            if len(self._view_data) > self._max_tracks_thumbnail:
+            if len(view_data) > self._max_tracks_thumbnail:
                 thumbnail_indices = np.random.randint(
-                    0, len(self._view_data), self._max_tracks_thumbnail
+                    0, len(view_data), self._max_tracks_thumbnail
                 )
-                points = self._view_data[thumbnail_indices]
+                points = view_data[thumbnail_indices]
             else:
-                points = self._view_data
-                thumbnail_indices = np.array(range(len(self._view_data)))
+                points = view_data
+                thumbnail_indices = np.array(range(len(view_data)))
 
             # get the track coords here
             coords = np.floor(
@@ -354,6 +361,34 @@ class Tracks(Layer):
         """return a view of the graph"""
         return self._slicing_state._view_graph
 
+    @property
+    def _time_window(self) -> tuple[float, float]:
+        """time window of the drawn track and graph segments
+
+        Segments outside of the tail and head of the tracks are faded out
+        entirely, so they are not drawn at all. When the tails are not faded,
+        all the segments are drawn.
+        """
+        current_time = self.current_time
+        if not self.use_fade or current_time is None:
+            return -np.inf, np.inf
+        return (
+            current_time - self.tail_length,
+            current_time + self.head_length,
+        )
+
+    @property
+    def _view_track_segments(self) -> np.ndarray | None:
+        """vertex index pairs of the track segments drawn in the view"""
+        self._manager.hide_completed_tracks = self._hide_completed_tracks
+        self._manager.current_time = self.current_time
+        return self._manager.track_segments(*self._time_window)
+
+    @property
+    def _view_graph_segments(self) -> np.ndarray | None:
+        """vertex index pairs of the graph segments drawn in the view"""
+        return self._manager.graph_segments(*self._time_window)
+
     @property
     def current_time(self) -> int | None:
         """current time according to the first dimension"""
@@ -400,6 +435,39 @@ class Tracks(Layer):
         self.events.data(value=self.data)
         self._reset_editable()
 
+    def append(
+        self,
+        data: np.ndarray,
+        features: 'dict[str, np.ndarray] | pd.DataFrame | None' = None,
+    ) -> None:
+        """Append vertices to existing or new tracks.
+
+        Unlike setting ``data`` with all the vertices, only the appended
+        vertices are validated and sorted, before being merged into the
+        sorted data, and the graph and the features of the previous vertices
+        are kept. This is intended for adding the detections of each new
+        frame of a live tracking session.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates of M vertices, ID,T,(Z),Y,X, with the same number of
+            dimensions as the layer data.
+        features : dict[str, array-like] or DataFrame, optional
+            Features of the appended vertices. By default, they take the
+            feature defaults.
+        """
+        self._manager.append(data, features=features)
+        self._manager.build_tracks()
+        # parents of the graph may have new last vertices
+        self._manager.build_graph()
+        self._recolor_tracks()
+
+        self._update_dims()
+        self.events.rebuild_tracks()
+        self.events.rebuild_graph()
+        self.events.data(value=self.data)
+
     @property
     def features(self) -> 'pd.DataFrame':
         """Dataframe-like features table.
@@ -448,7 +516,9 @@ class Tracks(Layer):
         return self._manager.graph
 
     @graph.setter
-    def graph(self, graph: dict[int, int | list[int]]) -> None:
+    def graph(
+        self, graph: 'dict[int, int | list[int]] | npt.ArrayLike | spmatrix'
+    ) -> None:
         """Set the track graph."""
         # Ignored type, because mypy can't handle different signatures
         # on getters and setters; see https://github.com/python/mypy/issues/3004
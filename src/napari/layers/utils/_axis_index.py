@@ -0,0 +1,97 @@
+"""Index of coordinates sorted along single axes.
+
+Point-like data (e.g. points or vectors) is usually sliced along a single
+not displayed axis, such as time or z. With the coordinates along that axis
+sorted once, the elements in a slice are found with two binary searches
+instead of a comparison of every coordinate. Indices of coordinates only pay
+off for many elements queried more than once, which
+:class:`_IndexUsePolicy` decides for all of them.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+#: Minimum number of elements for which indices are used.
+_MIN_INDEXED_ELEMENTS = 10_000
+
+
+class _IndexUsePolicy:
+    """Whether queries of coordinates should use an index.
+
+    Indices are used for many elements only, from the second query of the
+    same kind (e.g. along the same axes), so that coordinates edited between
+    every query (e.g. while dragging) are not indexed for nothing.
+
+    Parameters
+    ----------
+    n_elements : int
+        Number of indexed elements.
+    """
+
+    def __init__(self, n_elements: int) -> None:
+        self._n_elements = n_elements
+        self._queried: set[Hashable] = set()
+        # Queries may come from the slicing threads and the main thread.
+        self._lock = threading.Lock()
+
+    def use_index(self, key: Hashable) -> bool:
+        """Whether to use the index for a query of the given kind."""
+        if self._n_elements < _MIN_INDEXED_ELEMENTS:
+            return False
+        with self._lock:
+            if key in self._queried:
+                return True
+            self._queried.add(key)
+            return False
+
+
+class _SortedAxesIndex:
+    """Sort permutations of coordinates along single axes, built lazily.
+
+    The index does not track changes to the coordinates: its owner replaces
+    it by a new one when they change.
+
+    Parameters
+    ----------
+    coords : (N, D) array
+        Coordinates of the elements.
+    """
+
+    def __init__(self, coords: np.ndarray) -> None:
+        self._coords = coords
+        # {axis: (permutation sorting the coordinates, sorted coordinates)}
+        self._sorted: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self._policy = _IndexUsePolicy(len(coords))
+        # Queries may come from the slicing threads and the main thread.
+        self._lock = threading.Lock()
+
+    def use_index(self, axis: int) -> bool:
+        """Whether to use the index for a query along axis.
+
+        See :class:`_IndexUsePolicy`.
+        """
+        return self._policy.use_index(axis)
+
+    def _sorted_axis(self, axis: int) -> tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            if axis not in self._sorted:
+                order = np.argsort(self._coords[:, axis], kind='stable')
+                self._sorted[axis] = (order, self._coords[order, axis])
+            return self._sorted[axis]
+
+    def in_interval(
+        self, axis: int, low: float, high: float
+    ) -> npt.NDArray[np.intp]:
+        """Sorted indices of the elements with low <= coordinate <= high."""
+        order, values = self._sorted_axis(axis)
+        start = np.searchsorted(values, low, side='left')
+        stop = np.searchsorted(values, high, side='right')
+        return np.sort(order[start:stop])
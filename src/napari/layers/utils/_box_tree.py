@@ -0,0 +1,288 @@
+"""Bounding volume hierarchy over axis-aligned boxes.
+
+Hit-testing many objects (e.g. shapes under the cursor or in a selection
+box) compares a point, box or line to the bounding box of every object.
+:class:`_BoxTree` groups the boxes in a balanced binary tree of nested
+bounding boxes, so that queries only look at the boxes in the branches they
+reach.
+
+The tree is stored level by level in arrays and queried one level at a
+time, so that each query only runs a few vectorised steps.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from napari.utils._indexing import concatenated_ranges
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+#: Number of boxes in each leaf of the tree.
+_LEAF_SIZE = 16
+
+
+class _BoxTree:
+    """Balanced bounding volume hierarchy over axis-aligned boxes.
+
+    The boxes are identified by integer ids. Boxes can be moved, added and
+    removed after the tree is built: moved boxes enlarge the nodes
+    containing them, added boxes are kept aside and checked one by one, and
+    removed boxes are emptied, until enough of them accumulate for the tree
+    to be rebuilt.
+
+    Parameters
+    ----------
+    ids : (N,) array of int
+        Ids of the boxes.
+    mins, maxs : (N, D) array
+        Lower and upper corners of the boxes.
+    leaf_size : int
+        Number of boxes in each leaf of the tree.
+    """
+
+    def __init__(
+        self,
+        ids: npt.ArrayLike,
+        mins: npt.ArrayLike,
+        maxs: npt.ArrayLike,
+        leaf_size: int = _LEAF_SIZE,
+    ) -> None:
+        self.leaf_size = leaf_size
+        self._build(
+            np.asarray(ids, dtype=np.intp),
+            np.asarray(mins, dtype=float),
+            np.asarray(maxs, dtype=float),
+        )
+
+    def _build(self, ids: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+        n = len(ids)
+        ndim = mins.shape[1] if mins.ndim == 2 else 0
+        depth = 0
+        while n > self.leaf_size * 2**depth:
+            depth += 1
+        centers = (mins + maxs) / 2
+        # Split the boxes in two halves along the axis where their centers
+        # are the most spread, level by level.
+        order = np.arange(n)
+        for level in range(depth):
+            starts = (np.arange(2**level) * n) // 2**level
+            segment = np.repeat(np.arange(2**level), np.diff([*starts, n]))
+            c = centers[order]
+            spread = np.maximum.reduceat(c, starts) - np.minimum.reduceat(
+                c, starts
+            )
+            axis = np.argmax(spread, axis=1)[segment]
+            order = order[np.lexsort((c[np.arange(n), axis], segment))]
+        self._ids = ids[order]
+        self._mins = mins[order]
+        self._maxs = maxs[order]
+        self._depth = depth
+        # node k of a level contains the boxes from _starts[k] to
+        # _starts[k + 1] of the last level
+        self._starts = (np.arange(2**depth + 1) * n) // 2**depth
+        self._level_mins: list[np.ndarray] = []
+        self._level_maxs: list[np.ndarray] = []
+        if n:
+            level_mins = np.minimum.reduceat(self._mins, self._starts[:-1])
+            level_maxs = np.maximum.reduceat(self._maxs, self._starts[:-1])
+        else:
+            level_mins = level_maxs = np.empty((0, ndim))
+        for _ in range(depth + 1):
+            self._level_mins.insert(0, level_mins)
+            self._level_maxs.insert(0, level_maxs)
+            level_mins = np.minimum(level_mins[0::2], level_mins[1::2])
+            level_maxs = np.maximum(level_maxs[0::2], level_maxs[1::2])
+        # positions of the boxes in the tree sorted by id, to find them
+        self._id_order = np.argsort(self._ids, kind='stable')
+        self._removed = 0
+        self._extra_ids = np.empty(0, dtype=np.intp)
+        self._extra_mins = np.empty((0, ndim))
+        self._extra_maxs = np.empty((0, ndim))
+
+    def __len__(self) -> int:
+        return len(self._ids) - self._removed + len(self._extra_ids)
+
+    def _positions(self, ids: np.ndarray) -> npt.NDArray[np.intp]:
+        """Positions in the tree of the boxes with ids, -1 if missing."""
+        sorted_ids = self._ids[self._id_order]
+        if len(sorted_ids) == 0:
+            return np.full(len(ids), -1, dtype=np.intp)
+        found = np.searchsorted(sorted_ids, ids).clip(max=len(sorted_ids) - 1)
+        positions = self._id_order[found]
+        positions[sorted_ids[found] != ids] = -1
+        return positions
+
+    def _query(self, hit) -> npt.NDArray[np.intp]:
+        """Sorted ids of the boxes for which hit(mins, maxs) is True.
+
+        hit must be False for empty boxes, which removed boxes are.
+        """
+        found = []
+        if len(self._ids):
+            nodes = np.zeros(1, dtype=np.intp)
+            for level in range(self._depth + 1):
+                nodes = nodes[
+                    hit(
+                        self._level_mins[level][nodes],
+                        self._level_maxs[level][nodes],
+                    )
+                ]
+                if level < self._depth:
+                    nodes = np.stack([2 * nodes, 2 * nodes + 1], 1).ravel()
+            positions = concatenated_ranges(
+                self._starts[nodes], self._starts[nodes + 1]
+            )
+            positions = positions[
+                hit(self._mins[positions], self._maxs[positions])
+            ]
+            found.append(self._ids[positions])
+        if len(self._extra_ids):
+            found.append(
+                self._extra_ids[hit(self._extra_mins, self._extra_maxs)]
+            )
+        if not found:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(found))
+
+    def intersecting(
+        self, low: npt.ArrayLike, high: npt.ArrayLike
+    ) -> npt.NDArray[np.intp]:
+        """Sorted ids of the boxes intersecting the box from low to high."""
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+        return self._query(
+            lambda mins, maxs: np.all((mins <= high) & (maxs >= low), axis=1)
+        )
+
+    def containing(self, point: npt.ArrayLike) -> npt.NDArray[np.intp]:
+        """Sorted ids of the boxes containing point."""
+        return self.intersecting(point, point)
+
+    def along_line(
+        self, point: npt.ArrayLike, direction: npt.ArrayLike
+    ) -> npt.NDArray[np.intp]:
+        """Sorted ids of the boxes crossed by the line through point."""
+        point = np.asarray(point, dtype=float)
+        direction = np.asarray(direction, dtype=float)
+        moving = direction != 0
+        with np.errstate(divide='ignore'):
+            inverse = 1 / direction[moving]
+
+        def _hit(mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+            # along the axes the line is parallel to, the point must be in
+            # the box, and along the others, the line must enter all the
+            # slabs of the box before it leaves any of them
+            inside = np.all(
+                (mins[:, ~moving] <= point[~moving])
+                & (point[~moving] <= maxs[:, ~moving]),
+                axis=1,
+            )
+            t0 = (mins[:, moving] - point[moving]) * inverse
+            t1 = (maxs[:, moving] - point[moving]) * inverse
+            with np.errstate(invalid='ignore'):
+                enter = np.max(np.minimum(t0, t1), axis=1, initial=-np.inf)
+                leave = np.min(np.maximum(t0, t1), axis=1, initial=np.inf)
+            return inside & (enter <= leave) & np.all(mins <= maxs, axis=1)
+
+        return self._query(_hit)
+
+    def update(
+        self, ids: npt.ArrayLike, mins: npt.ArrayLike, maxs: npt.ArrayLike
+    ) -> None:
+        """Set the boxes with ids, adding those not in the tree.
+
+        Empty boxes (with mins above maxs) remove their ids from the tree.
+        """
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.intp))
+        if len(ids) == 0:
+            return
+        mins = np.asarray(mins, dtype=float).reshape(len(ids), -1)
+        maxs = np.asarray(maxs, dtype=float).reshape(len(ids), -1)
+        empty = np.any(mins > maxs, axis=1)
+        # boxes kept aside are replaced
+        keep = ~np.isin(self._extra_ids, ids)
+        self._extra_ids = self._extra_ids[keep]
+        self._extra_mins = self._extra_mins[keep]
+        self._extra_maxs = self._extra_maxs[keep]
+
+        positions = self._positions(ids)
+        in_tree = positions >= 0
+        removed = in_tree & empty
+        self._removed += int(
+            np.count_nonzero(
+                self._mins[positions[removed], 0]
+                <= self._maxs[positions[removed], 0]
+            )
+        )
+        moved = positions[in_tree]
+        self._mins[moved] = np.where(
+            empty[in_tree, None], np.inf, mins[in_tree]
+        )
+        self._maxs[moved] = np.where(
+            empty[in_tree, None], -np.inf, maxs[in_tree]
+        )
+        self._enlarge(moved)
+
+        added = ~in_tree & ~empty
+        self._extra_ids = np.concatenate([self._extra_ids, ids[added]])
+        self._extra_mins = np.concatenate([self._extra_mins, mins[added]])
+        self._extra_maxs = np.concatenate([self._extra_maxs, maxs[added]])
+        self._rebuild_if_stale()
+
+    def _enlarge(self, positions: np.ndarray) -> None:
+        """Enlarge the nodes containing the boxes at positions to fit them.
+
+        Nodes are not shrunk when boxes move away or are removed: they stay
+        valid bounds until the tree is rebuilt.
+        """
+        if len(positions) == 0:
+            return
+        nodes = np.searchsorted(self._starts, positions, side='right') - 1
+        mins = self._mins[positions]
+        maxs = self._maxs[positions]
+        for level in range(self._depth, -1, -1):
+            np.minimum.at(self._level_mins[level], nodes, mins)
+            np.maximum.at(self._level_maxs[level], nodes, maxs)
+            nodes = nodes // 2
+
+    def remove(self, ids: npt.ArrayLike) -> None:
+        """Remove the boxes with ids and renumber the others.
+
+        The ids of the remaining boxes are decreased by the number of
+        removed ids below them, like the indices of a list after deleting
+        items.
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.intp))
+        if len(ids) == 0:
+            return
+        ndim = self._mins.shape[1]
+        positions = self._positions(ids)
+        self.update(
+            ids, np.full((len(ids), ndim), np.inf), np.zeros((len(ids), ndim))
+        )
+        if self._removed == 0:
+            # the tree was rebuilt without the removed boxes
+            positions = positions[:0]
+        self._ids[positions[positions >= 0]] = -1
+        self._ids = self._ids - np.searchsorted(ids, self._ids)
+        self._id_order = np.argsort(self._ids, kind='stable')
+        self._extra_ids = self._extra_ids - np.searchsorted(
+            ids, self._extra_ids
+        )
+
+    def _rebuild_if_stale(self) -> None:
+        """Rebuild the tree if many boxes were added or removed since it
+        was built."""
+        stale = len(self._extra_ids) + self._removed
+        if stale <= max(self.leaf_size, len(self._ids) // 4):
+            return
+        kept = self._mins[:, 0] <= self._maxs[:, 0]
+        self._build(
+            np.concatenate([self._ids[kept], self._extra_ids]),
+            np.concatenate([self._mins[kept], self._extra_mins]),
+            np.concatenate([self._maxs[kept], self._extra_maxs]),
+        )
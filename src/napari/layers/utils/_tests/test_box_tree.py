@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from napari.layers.utils._box_tree import _BoxTree
+
+
+def _random_boxes(n, ndim=2, seed=0):
+    rng = np.random.default_rng(seed)
+    mins = rng.uniform(0, 100, size=(n, ndim))
+    return mins, mins + rng.uniform(0, 5, size=(n, ndim))
+
+
+def _intersecting(mins, maxs, low, high):
+    return np.flatnonzero(np.all((mins <= high) & (maxs >= low), axis=1))
+
+
+def _along_line(mins, maxs, point, direction):
+    hits = []
+    for i, (lo, hi) in enumerate(zip(mins, maxs, strict=True)):
+        enter, leave = -np.inf, np.inf
+        inside = True
+        for d in range(len(point)):
+            if direction[d] == 0:
+                inside &= lo[d] <= point[d] <= hi[d]
+                continue
+            t0 = (lo[d] - point[d]) / direction[d]
+            t1 = (hi[d] - point[d]) / direction[d]
+            enter = max(enter, min(t0, t1))
+            leave = min(leave, max(t0, t1))
+        if inside and enter <= leave:
+            hits.append(i)
+    return hits
+
+
+@pytest.mark.parametrize('n', [0, 1, 10, 1000])
+def test_intersecting(n):
+    mins, maxs = _random_boxes(n)
+    tree = _BoxTree(np.arange(n), mins, maxs, leaf_size=4)
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        low = rng.uniform(0, 100, 2)
+        high = low + rng.uniform(0, 20, 2)
+        np.testing.assert_array_equal(
+            tree.intersecting(low, high), _intersecting(mins, maxs, low, high)
+        )
+        np.testing.assert_array_equal(
+            tree.containing(low), _intersecting(mins, maxs, low, low)
+        )
+
+
+def test_along_line():
+    mins, maxs = _random_boxes(300, ndim=3)
+    tree = _BoxTree(np.arange(300), mins, maxs, leaf_size=4)
+    rng = np.random.default_rng(2)
+    for i in range(20):
+        point = rng.uniform(0, 100, 3)
+        direction = rng.normal(size=3)
+        if i % 4 == 0:
+            direction[i % 3] = 0
+        np.testing.assert_array_equal(
+            tree.along_line(point, direction),
+            _along_line(mins, maxs, point, direction),
+        )
+
+
+def test_update_add_and_remove():
+    n = 500
+    mins, maxs = _random_boxes(n)
+    tree = _BoxTree(np.arange(n), mins, maxs, leaf_size=4)
+    rng = np.random.default_rng(3)
+
+    moved = rng.choice(n, 50, replace=False)
+    mins[moved], maxs[moved] = _random_boxes(50, seed=4)
+    tree.update(moved, mins[moved], maxs[moved])
+
+    new_mins, new_maxs = _random_boxes(20, seed=5)
+    tree.update(np.arange(n, n + 20), new_mins, new_maxs)
+    mins = np.concatenate([mins, new_mins])
+    maxs = np.concatenate([maxs, new_maxs])
+
+    removed = rng.choice(n + 20, 30, replace=False)
+    tree.remove(removed)
+    mins = np.delete(mins, removed, axis=0)
+    maxs = np.delete(maxs, removed, axis=0)
+    assert len(tree) == len(mins)
+
+    for _ in range(20):
+        low = rng.uniform(0, 100, 2)
+        high = low + rng.uniform(0, 20, 2)
+        np.testing.assert_array_equal(
+            tree.intersecting(low, high), _intersecting(mins, maxs, low, high)
+        )
+
+
+def test_empty_boxes_are_removed():
+    mins, maxs = _random_boxes(100)
+    tree = _BoxTree(np.arange(100), mins, maxs)
+    tree.update([3], [np.inf, np.inf], [-np.inf, -np.inf])
+    assert len(tree) == 99
+    assert 3 not in tree.intersecting([0, 0], [200, 200])
+    assert 3 not in tree.along_line([50, 50], [1, 0])
@@ -1,4 +1,5 @@
 import time
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -15,6 +16,7 @@ from napari.layers.utils.layer_utils import (
     register_layer_attr_action,
     segment_normal,
 )
+from napari.utils._data_range import compute_data_range
 from napari.utils.key_bindings import KeymapHandler, KeymapProvider
 
 data_dask = da.random.random(
@@ -99,6 +101,90 @@ def test_calc_data_range_fast(data):
     assert elapsed < 5, 'test took too long, computation was likely not lazy'
 
 
+def _sparse_volume():
+    data = np.zeros((40, 512, 512), dtype=np.float32)
+    data[5, 10:12, 10:12] = 5
+    data[31, 500, 500] = -3
+    data[32, 0, 0] = np.nan
+    return data
+
+
+@pytest.mark.parametrize('mode', ['sampled', 'exact'])
+def test_calc_data_range_chunked_modes(mode):
+    data = da.from_array(_sparse_volume(), chunks=(8, 256, 256))
+    # the heuristic misses the values outside the planes it looks at
+    assert calc_data_range(data) == (0, 1)
+    assert calc_data_range(data, mode=mode) == (-3, 5)
+
+
+def test_calc_data_range_percentile_ignores_outliers():
+    data = np.random.default_rng(0).uniform(10, 20, size=(4, 100, 100))
+    data[0, 0, 0] = 1e6
+    data.flags.writeable = False
+    low, high = calc_data_range(data, mode='percentile')
+    assert 10 <= low < 10.5
+    assert 19.5 < high <= 20.5
+
+
+def test_calc_data_range_cached_per_data():
+    volume = _sparse_volume()
+    data = da.from_array(volume, chunks=(8, 256, 256))
+    with patch(
+        'napari.layers.utils.layer_utils.compute_data_range',
+        return_value=(-3, 5),
+    ) as compute:
+        assert calc_data_range(data, mode='exact') == (-3, 5)
+        assert calc_data_range(data, mode='exact') == (-3, 5)
+        assert compute.call_count == 1
+        calc_data_range(da.from_array(volume), mode='exact')
+        assert compute.call_count == 2
+
+    # in-memory arrays can change, so their range is not cached
+    assert calc_data_range(volume, mode='exact') == (-3, 5)
+    volume[0, 0, 0] = 10
+    assert calc_data_range(volume, mode='exact') == (-3, 10)
+
+
+def test_calc_data_range_cache_follows_dask_assignment():
+    data = da.from_array(_sparse_volume(), chunks=(8, 256, 256))
+    assert calc_data_range(data, mode='exact') == (-3, 5)
+    data[0, 0, 0] = 10
+    assert calc_data_range(data, mode='exact') == (-3, 10)
+
+
+def test_calc_data_range_cached_per_zarr_location(tmp_path):
+    zarr = pytest.importorskip('zarr')
+    path = str(tmp_path / 'data.zarr')
+    data = zarr.open_array(
+        path, mode='w', shape=(4, 64, 64), chunks=(1, 32, 32), dtype='f4'
+    )
+    data[0, 0, 0] = 5
+    with patch(
+        'napari.layers.utils.layer_utils.compute_data_range',
+        wraps=compute_data_range,
+    ) as compute:
+        assert calc_data_range(data, mode='exact') == (0, 5)
+        # opening the same array again does not scan it again
+        reopened = zarr.open_array(path, mode='r')
+        assert calc_data_range(reopened, mode='exact') == (0, 5)
+        assert compute.call_count == 1
+
+        # writing to it does
+        data[1, 40, 40] = 100
+        assert calc_data_range(reopened, mode='exact') == (0, 100)
+        assert compute.call_count == 2
+
+
+@pytest.mark.parametrize('mode', ['heuristic', 'exact'])
+def test_calc_data_range_not_cached_for_zarr_in_memory(mode):
+    zarr = pytest.importorskip('zarr')
+    data = zarr.zeros((4, 64, 64))
+    data[0, 0, 0] = 5
+    assert calc_data_range(data, mode=mode) == (0, 5)
+    data[0, 0, 0] = 100
+    assert calc_data_range(data, mode=mode) == (0, 100)
+
+
 def test_segment_normal_2d():
     a = np.array([1, 1])
     b = np.array([1, 10])
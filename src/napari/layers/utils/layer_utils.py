@@ -15,6 +15,11 @@ from typing import (
 import dask
 import numpy as np
 
+from napari.utils._data_range import (
+    DataRangeMode,
+    cached_data_range,
+    compute_data_range,
+)
 from napari.utils.action_manager import action_manager
 from napari.utils.events.custom_types import Array
 from napari.utils.transforms import Affine
@@ -243,7 +248,10 @@ def _nanmax(array):
 
 
 def calc_data_range(
-    data: LayerDataProtocol, rgb: bool = False, dtype: np.dtype | None = None
+    data: LayerDataProtocol,
+    rgb: bool = False,
+    dtype: np.dtype | None = None,
+    mode: DataRangeMode | str = DataRangeMode.heuristic,
 ) -> tuple[float, float]:
     """Calculate range of data values. If all values are equal return [0, 1].
 
@@ -255,6 +263,11 @@ def calc_data_range(
         Flag if data is rgb.
     dtype : np.dtype, optional
         Dtype of the layer data. If None, the dtype of the data is used.
+    mode : DataRangeMode or str
+        How the range is computed. ``heuristic`` only looks at a few planes
+        of large data. ``sampled``, ``exact`` and ``percentile`` look at a
+        random sample of the data chunks, at all of them, or estimate the
+        0.1 and 99.9 percentiles of all the values.
 
     Returns
     -------
@@ -264,18 +277,36 @@ def calc_data_range(
     Notes
     -----
     If the data type is uint8, no calculation is performed, and 0-255 is
-    returned.
+    returned. Ranges computed by the chunk-based modes for dask arrays are
+    cached until the values of the arrays change, so that they are not
+    computed again for the same data.
     """
     if (dtype is not None and dtype == np.uint8) or data.dtype == np.uint8:
         return (0, 255)
 
+    mode = DataRangeMode(mode)
+    if mode == DataRangeMode.heuristic:
+        return _full_data_range(*_heuristic_data_range(data, rgb))
+
+    return cached_data_range(
+        data,
+        str(mode),
+        lambda: _full_data_range(*compute_data_range(data, mode)),
+    )
+
+
+def _full_data_range(min_val: float, max_val: float) -> tuple[float, float]:
+    """Range of data values, [0, 1] or wider if all values are equal."""
+    if min_val == max_val:
+        min_val = min(min_val, 0)
+        max_val = max(max_val, 1)
+    return float(min_val), float(max_val)
+
+
+def _heuristic_data_range(data: LayerDataProtocol, rgb: bool) -> tuple:
+    """Range of data values, from a few planes of large data."""
     if isinstance(data, np.ndarray) and data.ndim < 3:
-        min_val = _nanmin(data)
-        max_val = _nanmax(data)
-        if min_val == max_val:
-            min_val = min(min_val, 0)
-            max_val = max(max_val, 1)
-        return float(min_val), float(max_val)
+        return _nanmin(data), _nanmax(data)
 
     center: int | list[int]
     reduced_data: list | LayerDataProtocol
@@ -322,13 +353,7 @@ def calc_data_range(
     else:
         reduced_data = data
 
-    min_val = _nanmin(reduced_data)
-    max_val = _nanmax(reduced_data)
-
-    if min_val == max_val:
-        min_val = min(min_val, 0)
-        max_val = max(max_val, 1)
-    return (float(min_val), float(max_val))
+    return _nanmin(reduced_data), _nanmax(reduced_data)
 
 
 def segment_normal(a, b, p=(0, 0, 1)) -> np.ndarray:
@@ -5,6 +5,7 @@ import numpy as np
 import numpy.typing as npt
 
 from napari.layers.base._slice import _next_request_id
+from napari.layers.utils._axis_index import _SortedAxesIndex
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.vectors._vectors_constants import VectorsProjectionMode
 
@@ -51,6 +52,10 @@ class _VectorSliceRequest:
         The layer's data field, which is the main input to slicing.
     data_slice : _ThickNDSlice
         The slicing coordinates and margins in data space.
+    sorted_axes : _SortedAxesIndex or None
+        Positions of the vectors sorted along each axis, used to find the
+        vectors in a slice along a single axis with binary searches when
+        there are many vectors and the axis was already queried.
     others
         See the corresponding attributes in `Layer` and `Vectors`.
     """
@@ -61,6 +66,7 @@ class _VectorSliceRequest:
     projection_mode: VectorsProjectionMode
     length: float = field(repr=False)
     out_of_slice_display: bool = field(repr=False)
+    sorted_axes: _SortedAxesIndex | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _VectorSliceResponse:
@@ -94,7 +100,6 @@ class _VectorSliceRequest:
         )
 
     def _get_slice_data(self, not_disp: list[int]) -> tuple[npt.NDArray, int]:
-        data = self.data[:, 0, not_disp]
         alphas = 1
 
         point, m_left, m_right = self.data_slice[not_disp].as_array()
@@ -112,10 +117,23 @@ class _VectorSliceRequest:
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
 
+        out_of_slice = self.out_of_slice_display and self.slice_input.ndim > 2
+        if (
+            self.sorted_axes is not None
+            and len(not_disp) == 1
+            and not out_of_slice
+            and self.sorted_axes.use_index(not_disp[0])
+        ):
+            slice_indices = self.sorted_axes.in_interval(
+                not_disp[0], float(low[0]), float(high[0])
+            )
+            return slice_indices.astype(int), alphas
+
+        data = self.data[:, 0, not_disp]
         inside_slice = np.all((data >= low) & (data <= high), axis=1)
         slice_indices = np.where(inside_slice)[0].astype(int)
 
-        if self.out_of_slice_display and self.slice_input.ndim > 2:
+        if out_of_slice:
             projected_lengths = abs(self.data[:, 1, not_disp] * self.length)
 
             # add out of slice points with progressively lower sizes
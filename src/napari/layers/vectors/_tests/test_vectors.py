@@ -1,3 +1,5 @@
+import dataclasses
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -9,6 +11,7 @@ from napari._tests.utils import (
 )
 from napari.components.dims import Dims
 from napari.layers import Vectors
+from napari.layers.utils import _axis_index
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -723,3 +726,64 @@ def test_empty_data_from_tuple():
 def test_docstring():
     validate_all_params_in_docstring(Vectors)
     validate_kwargs_sorted(Vectors)
+
+
+@pytest.mark.parametrize('projection_mode', ['none', 'all'])
+@pytest.mark.parametrize('point', [0, 3, 4.5, 9])
+def test_slicing_sorted_along_axis(monkeypatch, projection_mode, point):
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+    rng = np.random.default_rng(0)
+    data = rng.uniform(0, 10, size=(500, 2, 3))
+    data[:, 0, 0] = np.round(data[:, 0, 0])
+    layer = Vectors(data, projection_mode=projection_mode)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 10, 1),) * 3,
+        point=(point, 0, 0),
+        margin_left=(1, 0, 0),
+        margin_right=(1, 0, 0),
+    )
+    request = layer._slicing_state.make_slice_request(dims)
+    assert request.sorted_axes is not None
+    # the layer already sliced along the axis once, so this uses the index
+    response = request()
+    assert 0 in request.sorted_axes._sorted
+    # same slice with the full scan
+    expected = dataclasses.replace(request, sorted_axes=None)()
+    np.testing.assert_array_equal(response.indices, expected.indices)
+    assert len(response.indices) > 0
+
+
+def test_sorted_axes_not_built_for_few_vectors():
+    layer = Vectors(np.zeros((100, 2, 3)))
+    dims = Dims(ndim=3, ndisplay=2, range=((0, 10, 1),) * 3)
+    for _ in range(3):
+        layer._slicing_state.make_slice_request(dims)()
+    assert not layer._sorted_axes._sorted
+
+
+def test_sorted_axes_reset_on_data_change(monkeypatch):
+    monkeypatch.setattr(_axis_index, '_MIN_INDEXED_ELEMENTS', 0)
+    data = np.zeros((10, 2, 3))
+    layer = Vectors(data)
+    dims = Dims(ndim=3, ndisplay=2, range=((0, 10, 1),) * 3, point=(5, 0, 0))
+
+    def _sliced_indices():
+        # the second query of the same index uses the sorted axes
+        indices = [
+            layer._slicing_state.make_slice_request(dims)().indices
+            for _ in range(2)
+        ]
+        np.testing.assert_array_equal(indices[0], indices[1])
+        assert 0 in layer._sorted_axes._sorted
+        return indices[1]
+
+    assert len(_sliced_indices()) == 0
+
+    layer.data[:3, 0, 0] = 5
+    layer.refresh()
+    np.testing.assert_array_equal(_sliced_indices(), [0, 1, 2])
+
+    layer.data = np.full((4, 2, 3), 5.0)
+    np.testing.assert_array_equal(_sliced_indices(), [0, 1, 2, 3])
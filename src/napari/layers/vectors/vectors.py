@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Literal
 import numpy as np
 
 from napari.layers.base import Layer, _LayerSlicingState
+from napari.layers.utils._axis_index import _SortedAxesIndex
 from napari.layers.utils._color_manager_constants import ColorMode
 from napari.layers.utils._slice_input import (
     _SliceInput,
@@ -279,6 +280,7 @@ class Vectors(Layer):
         self._length = float(length)
 
         self._data = data
+        self._axis_index: _SortedAxesIndex | None = None
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
@@ -334,6 +336,7 @@ class Vectors(Layer):
         previous_n_vectors = len(self.data)
 
         self._data, _ = fix_data_vectors(vectors, self.ndim)
+        self._axis_index = None
         n_vectors = len(self.data)
 
         # Adjust the props/color arrays when the number of vectors has changed
@@ -360,6 +363,16 @@ class Vectors(Layer):
         self.events.data(value=self.data)
         self._reset_editable()
 
+    def _on_data_refresh(self) -> None:
+        self._axis_index = None
+
+    @property
+    def _sorted_axes(self) -> _SortedAxesIndex:
+        """Positions of the vectors sorted along each axis, built lazily."""
+        if self._axis_index is None:
+            self._axis_index = _SortedAxesIndex(self._data[:, 0])
+        return self._axis_index
+
     @property
     def features(self):
         """Dataframe-like features table.
@@ -829,6 +842,7 @@ class _VectorsSlicingState(_LayerSlicingState):
             projection_mode=self.layer.projection_mode,
             out_of_slice_display=self.layer.out_of_slice_display,
             length=self.layer.length,
+            sorted_axes=self.layer._sorted_axes,
         )
 
     def _update_slice_response(self, response: _VectorSliceResponse):
@@ -3,6 +3,8 @@ from typing import Any
 from pydantic import AliasChoices, Field
 
 from napari.settings._base import EventedSettings
+from napari.utils._data_range import DataRangeMode
+from napari.utils._slice_cache import resize_slice_cache
 from napari.utils.colormap_backend import (
     ColormapBackend,
     set_backend as set_colormap_backend,
@@ -27,6 +29,8 @@ class ExperimentalSettings(EventedSettings):
         self.events.triangulation_backend(value=self.triangulation_backend)
         self.events.colormap_backend.connect(_update_colormap_backend)
         self.events.colormap_backend(value=self.colormap_backend)
+        self.events.slice_cache_size.connect(_update_slice_cache_size)
+        self.events.slice_cache_size(value=self.slice_cache_size)
 
     async_: bool = Field(
         False,
@@ -37,6 +41,67 @@ class ExperimentalSettings(EventedSettings):
         validation_alias=AliasChoices('async_', 'async', 'napari_async'),
         json_schema_extra={'requires_restart': False},
     )
+    async_slicing_workers: int = Field(
+        4,
+        title=trans._('Number of asynchronous slicing threads'),
+        description=trans._(
+            'Maximum number of layers that can be sliced concurrently when asynchronous rendering is enabled.'
+        ),
+        ge=1,
+        json_schema_extra={'requires_restart': True},
+    )
+    slice_cache_size: float = Field(
+        0,
+        title=trans._('Slice cache size (GB)'),
+        description=trans._(
+            'Memory used to keep recently viewed image and labels slices, so that revisiting them does not load them again.\nSet to 0 to disable the cache.'
+        ),
+        ge=0,
+    )
+    slice_prefetch_planes: int = Field(
+        4,
+        title=trans._('Maximum number of planes to prefetch'),
+        description=trans._(
+            'When stepping through an axis, the next planes along that axis are loaded in the background into the slice cache.\nSet to 0 to disable prefetching.'
+        ),
+        ge=0,
+    )
+    tiled_multiscale: bool = Field(
+        False,
+        title=trans._('Load multiscale images in tiles'),
+        description=trans._(
+            'Load 2D multiscale images in fixed-size tiles aligned to the data chunks, and keep them in the slice cache, so that panning and zooming only loads the tiles that are not cached.\nRequires a slice cache size larger than 0.'
+        ),
+    )
+    progressive_multiscale: bool = Field(
+        True,
+        title=trans._('Show coarser levels while multiscale images load'),
+        description=trans._(
+            'With async slicing, when zooming a 2D multiscale image to a level that is not loaded yet, show the finest coarser level that is cached (or the thumbnail), then the levels in between as they load.'
+        ),
+    )
+    data_range_mode: DataRangeMode = Field(
+        DataRangeMode.heuristic,
+        title=trans._('Contrast range computation'),
+        description=trans._(
+            'How the contrast limits range of new image layers is computed.\n"heuristic" looks at a few planes of large data, "sampled" at a random sample of its chunks, "exact" at all its chunks, and "percentile" estimates the 0.1 and 99.9 percentiles of all the values.'
+        ),
+    )
+    slice_histogram: bool = Field(
+        False,
+        title=trans._('Compute histograms of image slices'),
+        description=trans._(
+            'Compute the histogram of each image slice while slicing it, e.g. for histogram widgets.\nHistograms are always computed for layers with continuous auto-contrast.'
+        ),
+    )
+    labels_history_memory: float = Field(
+        0.5,
+        title=trans._('Labels undo history memory (GB)'),
+        description=trans._(
+            'Memory used by the compressed undo and redo history of each labels layer. Older edits are moved to a temporary file on disk.'
+        ),
+        ge=0,
+    )
     autoswap_buffers: bool = Field(
         False,
         title=trans._('Enable autoswapping rendering buffers.'),
@@ -135,3 +200,9 @@ def _update_colormap_backend(event: Event) -> None:
     experimental: ExperimentalSettings = event.source
 
     set_colormap_backend(experimental.colormap_backend)
+
+
+def _update_slice_cache_size(event: Event) -> None:
+    experimental: ExperimentalSettings = event.source
+
+    resize_slice_cache(int(experimental.slice_cache_size * 1e9))
@@ -0,0 +1,436 @@
+"""Computation of the range of values of large, possibly chunked, arrays.
+
+The default heuristic used by
+:func:`napari.layers.utils.layer_utils.calc_data_range` only looks at a few
+planes of large arrays, which can give bad contrast limits, e.g. on sparse
+volumes. The other modes defined here look at chunks of the data instead
+(the chunks of dask or zarr arrays, or blocks of in-memory arrays):
+
+- ``sampled`` reads a stratified random sample of chunks,
+- ``exact`` reads all the chunks, in a thread pool, with a progress bar,
+- ``percentile`` reads all the chunks and estimates percentiles of the
+  values from a mergeable histogram sketch, ignoring outliers.
+
+Ranges computed by these modes are cached, so that adding the same data
+again does not scan it again. Dask arrays are cached by identity, keyed on
+their dask token, which changes when values are assigned to them. Zarr
+arrays in local or fsspec stores are cached by location, keyed on the
+modification stamps of their files. The ranges of other arrays (e.g. numpy
+arrays or zarr arrays in memory), whose values can change in place without
+notice, are not cached.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import dask
+import numpy as np
+
+from napari.utils._indexing import chunk_bounds
+from napari.utils.compat import StrEnum
+from napari.utils.progress import progress
+from napari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Sequence
+
+_T = TypeVar('_T')
+
+#: Number of chunks read by the sampled mode.
+_SAMPLED_CHUNKS = 64
+#: Minimum number of chunks for which a progress bar is shown.
+_PROGRESS_MIN_CHUNKS = 16
+#: Percentiles of the values returned by the percentile mode.
+_PERCENTILES = (0.1, 99.9)
+
+
+class DataRangeMode(StrEnum):
+    """How the range of the values of layer data is computed."""
+
+    heuristic = 'heuristic'
+    """Look at a few planes (or a central patch) of large data."""
+    sampled = 'sampled'
+    """Look at a stratified random sample of the chunks of the data."""
+    exact = 'exact'
+    """Look at all the chunks of the data."""
+    percentile = 'percentile'
+    """Estimate percentiles of all the values, ignoring outliers."""
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+def _chunk_slices(
+    bounds: Sequence[np.ndarray], index: Iterable[int]
+) -> tuple[slice, ...]:
+    return tuple(
+        slice(int(b[i]), int(b[i + 1]))
+        for b, i in zip(bounds, index, strict=True)
+    )
+
+
+def _map_chunks(
+    func: Callable[[np.ndarray], _T],
+    data: Any,
+    indices: Sequence[tuple[int, ...]],
+    bounds: Sequence[np.ndarray],
+) -> list[_T]:
+    """Apply func to the given chunks of data in a thread pool.
+
+    A progress bar is shown when many chunks are read.
+    """
+
+    def _read(index: tuple[int, ...]) -> _T:
+        return func(np.asarray(data[_chunk_slices(bounds, index)]))
+
+    max_workers = min(8, os.cpu_count() or 1)
+    results = []
+    pbar = (
+        progress(
+            total=len(indices),
+            desc=trans._('Computing data range'),
+        )
+        if len(indices) >= _PROGRESS_MIN_CHUNKS
+        else None
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in as_completed(
+                executor.submit(_read, index) for index in indices
+            ):
+                results.append(future.result())
+                if pbar is not None:
+                    pbar.update(1)
+    finally:
+        if pbar is not None:
+            pbar.close()
+    return results
+
+
+def _finite_min_max(block: np.ndarray) -> tuple[float, float] | None:
+    """Minimum and maximum of the finite values of block, or None."""
+    if block.size == 0:
+        return None
+    min_val, max_val = np.min(block), np.max(block)
+    if not (np.isfinite(min_val) and np.isfinite(max_val)):
+        block = block[np.isfinite(block)]
+        if block.size == 0:
+            return None
+        min_val, max_val = np.min(block), np.max(block)
+    return float(min_val), float(max_val)
+
+
+def _combine_min_max(
+    ranges: Iterable[tuple[float, float] | None],
+) -> tuple[float, float]:
+    valid = [r for r in ranges if r is not None]
+    if not valid:
+        return 0.0, 1.0
+    return min(r[0] for r in valid), max(r[1] for r in valid)
+
+
+def _all_chunks(bounds: Sequence[np.ndarray]) -> list[tuple[int, ...]]:
+    return list(itertools.product(*(range(len(b) - 1) for b in bounds)))
+
+
+def _sampled_chunks(
+    bounds: Sequence[np.ndarray], n_chunks: int, seed: int = 0
+) -> list[tuple[int, ...]]:
+    """Pick one random chunk in each of n_chunks equal strata of the chunks.
+
+    Strata are contiguous in C order, so the sample is spread over the
+    leading (e.g. plane) axes of the data.
+    """
+    grid = tuple(len(b) - 1 for b in bounds)
+    total = int(np.prod(grid))
+    if total <= n_chunks:
+        return _all_chunks(bounds)
+    rng = np.random.default_rng(seed)
+    edges = np.linspace(0, total, n_chunks + 1).astype(np.int64)
+    flat = rng.integers(edges[:-1], edges[1:])
+    return [
+        tuple(int(i) for i in index)
+        for index in zip(*np.unravel_index(flat, grid), strict=True)
+    ]
+
+
+class _HistogramSketch:
+    """Mergeable histogram with bins of bounded relative width.
+
+    Values are binned on a logarithmic scale, so that any quantile is
+    estimated with a relative error of at most ``relative_accuracy``,
+    whatever the range of the values, and sketches of different chunks can
+    be merged by adding their counts.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        # counts of the positive values and of the magnitude of the negative
+        # values, indexed from the offset of each
+        self._positive = (0, np.zeros(0, dtype=np.int64))
+        self._negative = (0, np.zeros(0, dtype=np.int64))
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, values: np.ndarray) -> None:
+        """Add the finite values of an array to the sketch."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        self.count += values.size
+        self.zeros += int(np.count_nonzero(values == 0))
+        self._positive = self._merge_counts(
+            self._positive, self._bin(values[values > 0])
+        )
+        self._negative = self._merge_counts(
+            self._negative, self._bin(-values[values < 0])
+        )
+
+    def merge(self, other: _HistogramSketch) -> None:
+        """Add the values of another sketch to this one."""
+        self.count += other.count
+        self.zeros += other.zeros
+        self._positive = self._merge_counts(self._positive, other._positive)
+        self._negative = self._merge_counts(self._negative, other._negative)
+
+    def _bin(self, magnitudes: np.ndarray) -> tuple[int, np.ndarray]:
+        if magnitudes.size == 0:
+            return 0, np.zeros(0, dtype=np.int64)
+        bins = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        offset = int(bins.min())
+        return offset, np.bincount(bins - offset)
+
+    @staticmethod
+    def _merge_counts(
+        a: tuple[int, np.ndarray], b: tuple[int, np.ndarray]
+    ) -> tuple[int, np.ndarray]:
+        if a[1].size == 0:
+            return b
+        if b[1].size == 0:
+            return a
+        offset = min(a[0], b[0])
+        size = max(a[0] + a[1].size, b[0] + b[1].size) - offset
+        counts = np.zeros(size, dtype=np.int64)
+        for start, c in (a, b):
+            counts[start - offset : start - offset + c.size] += c
+        return offset, counts
+
+    def _bin_value(self, index: int) -> float:
+        return 2 * self.gamma**index / (self.gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-th quantile (0 <= q <= 1) of the values."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        offset, counts = self._negative
+        # negative values in increasing order are decreasing magnitudes
+        for i in range(counts.size - 1, -1, -1):
+            rank -= counts[i]
+            if rank < 0:
+                return -self._bin_value(offset + i)
+        rank -= self.zeros
+        if rank < 0:
+            return 0.0
+        offset, counts = self._positive
+        cumulative = np.cumsum(counts)
+        i = int(np.searchsorted(cumulative, rank, side='right'))
+        return self._bin_value(offset + min(i, counts.size - 1))
+
+
+def _sketch(block: np.ndarray) -> _HistogramSketch:
+    sketch = _HistogramSketch()
+    sketch.add(block)
+    return sketch
+
+
+def compute_data_range(
+    data: Any, mode: DataRangeMode | str
+) -> tuple[float, float]:
+    """Compute the range of the values of data by reading its chunks.
+
+    Parameters
+    ----------
+    data : array
+        Data to calculate the range of values over.
+    mode : DataRangeMode
+        One of the chunk-based modes: sampled, exact or percentile.
+
+    Returns
+    -------
+    values : pair of floats
+        Minimum and maximum values in that order. (0, 1) if the data has no
+        finite values.
+    """
+    mode = DataRangeMode(mode)
+    bounds = chunk_bounds(data)
+    if mode == DataRangeMode.sampled:
+        indices = _sampled_chunks(bounds, _SAMPLED_CHUNKS)
+        return _combine_min_max(
+            _map_chunks(_finite_min_max, data, indices, bounds)
+        )
+    if mode == DataRangeMode.exact:
+        return _combine_min_max(
+            _map_chunks(_finite_min_max, data, _all_chunks(bounds), bounds)
+        )
+    if mode == DataRangeMode.percentile:
+        sketch = _HistogramSketch()
+        for chunk_sketch in _map_chunks(
+            _sketch, data, _all_chunks(bounds), bounds
+        ):
+            sketch.merge(chunk_sketch)
+        if sketch.count == 0:
+            return 0.0, 1.0
+        low, high = _PERCENTILES
+        return sketch.quantile(low / 100), sketch.quantile(high / 100)
+    raise ValueError(
+        trans._(
+            'mode must be one of sampled, exact or percentile, got {mode!r}',
+            deferred=True,
+            mode=str(mode),
+        )
+    )
+
+
+#: Maximum number of ranges cached for arrays identified by their location.
+_MAX_LOCATED_RANGES = 256
+
+# Cached ranges of dask arrays, by data identity:
+# {(id(data), key): (weakref to data, token of the values, range)},
+# and of zarr arrays in local or fsspec stores, by location:
+# {(store, path, key): (None, token of the files, range)}.
+_RANGE_CACHE: dict[
+    tuple, tuple[weakref.ref | None, Hashable, tuple[float, float]]
+] = {}
+
+
+def _values_token(data: Any) -> Hashable | None:
+    """Token identifying the values of a dask collection, or None.
+
+    The token changes when values are assigned to the collection.
+    """
+    if not dask.is_dask_collection(data):
+        return None
+    return dask.base.tokenize(data)
+
+
+def _zarr_location(data: Any) -> tuple[str, str] | None:
+    """Store and path of a zarr array in a local or fsspec store, or None.
+
+    Other stores (e.g. in-memory ones) are not identified: their arrays can
+    change without a trace in the store.
+    """
+    if not type(data).__module__.startswith('zarr'):
+        return None
+    store = getattr(data, 'store', None)
+    path = str(getattr(data, 'path', '') or '').strip('/')
+    if getattr(store, 'fs', None) is not None:
+        return f'{store.fs.protocol}::{store.path}', path
+    root = getattr(store, 'root', None)
+    if root is None and isinstance(getattr(store, 'path', None), str):
+        # zarr 2 DirectoryStore
+        root = store.path
+    if root is None:
+        return None
+    return os.fspath(root), path
+
+
+def _files_token(data: Any, location: tuple[str, str]) -> Hashable | None:
+    """Token of the files of a zarr array, or None if it cannot be made.
+
+    The token changes when files are written or removed: zarr writes chunks
+    to new files, so each write changes the inode or modification time of
+    the chunk file.
+    """
+    store_root, path = location
+    fs = getattr(data.store, 'fs', None)
+    if fs is None:
+        stamps = set()
+        for directory, _, files in os.walk(os.path.join(store_root, path)):
+            for name in files:
+                stat = os.stat(os.path.join(directory, name))
+                stamps.add((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return hash(frozenset(stamps))
+    root = f'{data.store.path}/{path}'
+    try:
+        if getattr(fs, 'asynchronous', False):
+            # zarr 3 fsspec stores use asynchronous file systems, bound to
+            # the event loop of zarr
+            from zarr.core.sync import sync
+
+            infos = sync(fs._find(root, detail=True))
+        else:
+            infos = fs.find(root, detail=True)
+    except (OSError, ValueError, ImportError):
+        return None
+    stamps = set()
+    for name, info in infos.items():
+        stamp = next(
+            (
+                info[field]
+                for field in ('ETag', 'etag', 'LastModified', 'mtime')
+                if info.get(field) is not None
+            ),
+            None,
+        )
+        if stamp is None:
+            return None
+        stamps.add((name, info.get('size'), info.get('ino'), str(stamp)))
+    return hash(frozenset(stamps))
+
+
+def cached_data_range(
+    data: Any,
+    key: Hashable,
+    compute: Callable[[], tuple[float, float]],
+) -> tuple[float, float]:
+    """Return the range of data for key, computed with compute if not cached.
+
+    Ranges of dask arrays are cached until the data is garbage collected or
+    values are assigned to it. Ranges of zarr arrays in local or fsspec
+    stores are cached by location, so that opening the same array again
+    does not scan it again, until its files change. Ranges of other arrays
+    are not cached.
+    """
+    location = _zarr_location(data)
+    if location is not None:
+        cache_key: tuple = (*location, key)
+        ref = None
+        token = _files_token(data, location)
+    else:
+        cache_key = (id(data), key)
+        token = _values_token(data)
+        try:
+            ref = weakref.ref(data)
+        except TypeError:
+            token = None
+    if token is None:
+        return compute()
+    entry = _RANGE_CACHE.get(cache_key)
+    if (
+        entry is not None
+        and (entry[0] is None or entry[0]() is data)
+        and entry[1] == token
+    ):
+        return entry[2]
+
+    data_range = compute()
+    if ref is not None and cache_key not in _RANGE_CACHE:
+        weakref.finalize(data, _RANGE_CACHE.pop, cache_key, None)
+    _RANGE_CACHE.pop(cache_key, None)
+    _RANGE_CACHE[cache_key] = (ref, token, data_range)
+    if ref is None:
+        located = [k for k, e in _RANGE_CACHE.items() if e[0] is None]
+        for oldest in located[: len(located) - _MAX_LOCATED_RANGES]:
+            del _RANGE_CACHE[oldest]
+    return data_range
+
+
+def clear_data_range_cache() -> None:
+    """Forget all the cached ranges."""
+    _RANGE_CACHE.clear()
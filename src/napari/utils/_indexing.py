@@ -1,6 +1,11 @@
+from typing import Any
+
 import numpy as np
 import numpy.typing as npt
 
+#: Number of elements of the blocks in which unchunked arrays are split.
+_BLOCK_SIZE = 2**22
+
 
 def elements_in_slice(
     index: tuple[npt.NDArray[np.int_], ...], position_in_axes: dict[int, int]
@@ -72,3 +77,76 @@ def index_in_slice(
         for i in indices_order
         if i not in position_in_axes
     )
+
+
+def concatenated_ranges(
+    starts: npt.NDArray[np.integer], stops: npt.NDArray[np.integer]
+) -> npt.NDArray[np.intp]:
+    """Concatenate the ranges between starts and stops into one array.
+
+    This is equivalent to concatenating ``np.arange(start, stop)`` for each
+    pair of start and stop, without a loop over the pairs.
+
+    Parameters
+    ----------
+    starts, stops : array of int
+        Starts (included) and stops (excluded) of the ranges.
+
+    Returns
+    -------
+    indices : array of int
+        The concatenated ranges.
+
+    Examples
+    --------
+    >>> concatenated_ranges(np.array([0, 5]), np.array([2, 8]))
+    array([0, 1, 5, 6, 7])
+    """
+    counts = np.asarray(stops) - np.asarray(starts)
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.intp)
+    offsets = np.repeat(np.asarray(stops) - np.cumsum(counts), counts)
+    return np.arange(total, dtype=np.intp) + offsets
+
+
+def chunk_bounds(data: Any) -> list[npt.NDArray[np.intp]]:
+    """Return the boundaries of the chunks of data along each axis.
+
+    Dask and xarray arrays give the size of each chunk along each axis, and
+    zarr arrays give the regular chunk shape. Other arrays are split in
+    blocks of about ``_BLOCK_SIZE`` elements along their leading axes.
+
+    Parameters
+    ----------
+    data : array
+        Array with a shape and, optionally, chunks.
+
+    Returns
+    -------
+    bounds : list of array of int
+        For each axis, the start of each chunk followed by the size of the
+        axis.
+
+    Examples
+    --------
+    >>> chunk_bounds(np.zeros((3, 4096, 2048), dtype=np.uint8))
+    [array([0, 1, 2, 3]), array([   0, 2048, 4096]), array([   0, 2048])]
+    """
+    shape = data.shape
+    chunks = getattr(data, 'chunks', None)
+    if chunks is None:
+        chunks = []
+        remaining = _BLOCK_SIZE
+        for size in reversed(shape):
+            chunk = max(1, min(size, remaining))
+            chunks.append(chunk)
+            remaining = max(1, remaining // max(size, 1))
+        chunks = chunks[::-1]
+    bounds = []
+    for size, chunk in zip(shape, chunks, strict=True):
+        if isinstance(chunk, tuple):
+            bounds.append(np.cumsum((0, *chunk)))
+        else:
+            bounds.append(np.append(np.arange(0, size, chunk), size))
+    return bounds
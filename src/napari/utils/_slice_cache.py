@@ -0,0 +1,167 @@
+"""Memory-bounded cache of computed layer slices.
+
+Slicing lazy or remote data (e.g. dask or zarr arrays) can be slow, so
+revisiting a plane that was recently sliced should not fetch it again.
+The cache is global (all layers use it) and disabled by default. Use
+:func:`resize_slice_cache` to give it a memory budget.
+
+Keys are tuples whose first element identifies the data of a layer,
+which allows all entries of a layer to be dropped at once when its data
+changes (see :meth:`_SliceCache.discard_owner`).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+logger = logging.getLogger('napari.utils._slice_cache')
+
+# Identifiers of the data owners in the cache keys. A new identifier is used
+# every time the data of a layer changes, so that stale entries can never be
+# looked up, even if they have not been evicted yet.
+_owner_ids = count()
+
+
+def _next_owner_id() -> int:
+    """Returns a new identifier for the data of a layer."""
+    return next(_owner_ids)
+
+
+class _SliceCache:
+    """Thread-safe least-recently-used cache with a memory budget.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size in bytes of the cached values. If 0, the cache
+        is disabled and nothing is stored.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found a value.
+    misses : int
+        Number of lookups that did not find a value.
+    nbytes : int
+        Total size in bytes of the cached values.
+    """
+
+    def __init__(self, max_bytes: int = 0) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        # keys of the entries of each owner, to discard them without a scan
+        self._owner_keys: dict[Hashable, set[tuple]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if the cache can store values, False otherwise."""
+        return self._max_bytes > 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size in bytes of the cached values."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that found a value, or 0 if none were made."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def get(self, key: tuple) -> Any | None:
+        """Returns the value cached for the key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.debug('Slice cache hit (hit rate %.2f)', self.hit_rate)
+        return entry[0]
+
+    def put(self, key: tuple, value: Any, nbytes: int) -> None:
+        """Caches a value of the given size, evicting the oldest values.
+
+        Values larger than the whole budget are not cached.
+        """
+        if nbytes > self._max_bytes:
+            return
+        with self._lock:
+            if (old := self._entries.pop(key, None)) is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self._owner_keys.setdefault(key[0], set()).add(key)
+            self.nbytes += nbytes
+            self._evict()
+
+    def discard_owner(self, owner: Hashable) -> None:
+        """Removes all the values whose key starts with the given owner."""
+        with self._lock:
+            for key in self._owner_keys.pop(owner, ()):
+                self.nbytes -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        """Removes all values and resets the hit statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._owner_keys.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self) -> None:
+        while self.nbytes > self._max_bytes and self._entries:
+            key, (_, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+            owner_keys = self._owner_keys[key[0]]
+            owner_keys.discard(key)
+            if not owner_keys:
+                del self._owner_keys[key[0]]
+
+
+#: The cache of computed slices shared by all layers.
+#: Use :func:`resize_slice_cache` to enable it and change its size.
+_SLICE_CACHE = _SliceCache()
+
+
+def resize_slice_cache(nbytes: int) -> _SliceCache:
+    """Resize the cache of computed slices.
+
+    Parameters
+    ----------
+    nbytes : int
+        The desired size of the cache, in bytes. If 0, the cache is turned off.
+
+    Returns
+    -------
+    slice_cache : _SliceCache
+        The cache of computed slices shared by all layers.
+    """
+    _SLICE_CACHE.max_bytes = nbytes
+    if nbytes == 0:
+        _SLICE_CACHE.clear()
+    return _SLICE_CACHE
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from napari.utils._data_range import (
+    _HistogramSketch,
+    _sampled_chunks,
+)
+
+
+def test_sampled_chunks_are_stratified():
+    bounds = [np.arange(0, 101, 1), np.array([0, 10])]
+    chunks = _sampled_chunks(bounds, 10)
+    assert [c[0] // 10 for c in chunks] == list(range(10))
+    assert _sampled_chunks(bounds, 200) == [(i, 0) for i in range(100)]
+
+
+def test_histogram_sketch_quantiles():
+    values = np.random.default_rng(0).normal(size=20_000) * 100
+    values[:10] = 0
+    sketch = _HistogramSketch(relative_accuracy=0.01)
+    other = _HistogramSketch(relative_accuracy=0.01)
+    sketch.add(values[:5000])
+    other.add(np.append(values[5000:], [np.nan, np.inf]))
+    sketch.merge(other)
+
+    assert sketch.count == values.size
+    assert sketch.zeros == 10
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        expected = np.quantile(values, q, method='nearest')
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.02, abs=1)
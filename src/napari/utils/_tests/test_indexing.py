@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from napari.utils._indexing import chunk_bounds
+
+
+def test_chunk_bounds():
+    da = pytest.importorskip('dask.array')
+    data = da.zeros((5, 10), chunks=(2, 10))
+    bounds = chunk_bounds(data)
+    np.testing.assert_array_equal(bounds[0], [0, 2, 4, 5])
+    np.testing.assert_array_equal(bounds[1], [0, 10])
+
+    # in-memory arrays are split along their leading axes
+    bounds = chunk_bounds(np.zeros((3, 4096, 2048), dtype=np.uint8))
+    np.testing.assert_array_equal(bounds[0], [0, 1, 2, 3])
+    np.testing.assert_array_equal(bounds[1], [0, 2048, 4096])
+    np.testing.assert_array_equal(bounds[2], [0, 2048])
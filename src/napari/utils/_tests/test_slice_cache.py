@@ -0,0 +1,70 @@
+from napari.utils._slice_cache import _SliceCache
+
+
+def test_slice_cache_disabled_by_default():
+    cache = _SliceCache()
+    assert not cache.enabled
+    cache.put((0, 'a'), 'value', nbytes=1)
+    assert len(cache) == 0
+
+
+def test_slice_cache_get_and_hit_rate():
+    cache = _SliceCache(max_bytes=10)
+    assert cache.get((0, 'a')) is None
+    cache.put((0, 'a'), 'value', nbytes=4)
+    assert cache.get((0, 'a')) == 'value'
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_slice_cache_evicts_least_recently_used():
+    cache = _SliceCache(max_bytes=10)
+    cache.put((0, 'a'), 'a', nbytes=4)
+    cache.put((0, 'b'), 'b', nbytes=4)
+    cache.get((0, 'a'))
+    cache.put((0, 'c'), 'c', nbytes=4)
+    assert (0, 'a') in cache
+    assert (0, 'b') not in cache
+    assert (0, 'c') in cache
+    assert cache.nbytes == 8
+
+
+def test_slice_cache_skips_values_larger_than_budget():
+    cache = _SliceCache(max_bytes=10)
+    cache.put((0, 'a'), 'a', nbytes=4)
+    cache.put((0, 'b'), 'b', nbytes=11)
+    assert (0, 'a') in cache
+    assert (0, 'b') not in cache
+
+
+def test_slice_cache_discard_owner():
+    cache = _SliceCache(max_bytes=10)
+    cache.put((0, 'a'), 'a', nbytes=2)
+    cache.put((1, 'a'), 'a', nbytes=2)
+    cache.discard_owner(0)
+    assert (0, 'a') not in cache
+    assert (1, 'a') in cache
+    assert cache.nbytes == 2
+
+
+def test_slice_cache_discard_owner_after_eviction():
+    cache = _SliceCache(max_bytes=5)
+    cache.put((0, 'a'), 'a', nbytes=2)
+    cache.put((0, 'b'), 'b', nbytes=2)
+    cache.put((1, 'a'), 'a', nbytes=2)
+    assert (0, 'a') not in cache
+    cache.discard_owner(0)
+    cache.discard_owner(2)
+    assert len(cache) == 1
+    assert cache.nbytes == 2
+    assert list(cache._owner_keys) == [1]
+
+
+def test_slice_cache_shrink_evicts():
+    cache = _SliceCache(max_bytes=10)
+    cache.put((0, 'a'), 'a', nbytes=4)
+    cache.put((0, 'b'), 'b', nbytes=4)
+    cache.max_bytes = 5
+    assert len(cache) == 1
+    assert (0, 'b') in cache